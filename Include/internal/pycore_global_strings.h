@@ -288,6 +288,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(all)
         STRUCT_FOR_ID(all_threads)
         STRUCT_FOR_ID(allow_code)
+        STRUCT_FOR_ID(allowed_globals)
         STRUCT_FOR_ID(any)
         STRUCT_FOR_ID(append)
         STRUCT_FOR_ID(arg)
@@ -461,6 +462,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(format)
         STRUCT_FOR_ID(format_spec)
         STRUCT_FOR_ID(frame_buffer)
+        STRUCT_FOR_ID(framed)
         STRUCT_FOR_ID(from_param)
         STRUCT_FOR_ID(fromlist)
         STRUCT_FOR_ID(fromtimestamp)
@@ -577,6 +579,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(maxvalue)
         STRUCT_FOR_ID(memLevel)
         STRUCT_FOR_ID(memlimit)
+        STRUCT_FOR_ID(memoize)
         STRUCT_FOR_ID(message)
         STRUCT_FOR_ID(metaclass)
         STRUCT_FOR_ID(metadata)
@@ -795,6 +795,7 @@ extern "C" {
     INIT_ID(all), \
     INIT_ID(all_threads), \
     INIT_ID(allow_code), \
+    INIT_ID(allowed_globals), \
     INIT_ID(any), \
     INIT_ID(append), \
     INIT_ID(arg), \
@@ -968,6 +969,7 @@ extern "C" {
     INIT_ID(format), \
     INIT_ID(format_spec), \
     INIT_ID(frame_buffer), \
+    INIT_ID(framed), \
     INIT_ID(from_param), \
     INIT_ID(fromlist), \
     INIT_ID(fromtimestamp), \
@@ -1084,6 +1086,7 @@ extern "C" {
     INIT_ID(maxvalue), \
     INIT_ID(memLevel), \
     INIT_ID(memlimit), \
+    INIT_ID(memoize), \
     INIT_ID(message), \
     INIT_ID(metaclass), \
     INIT_ID(metadata), \
@@ -16,11 +16,14 @@
 import py_compile
 import struct
 import filecmp
+import json
+import marshal
+import time
 
 from functools import partial
 from pathlib import Path
 
-__all__ = ["compile_dir","compile_file","compile_path"]
+__all__ = ["compile_bundle","compile_dir","compile_file","compile_path"]
 
 def _walk_dir(dir, maxlevels, quiet=0):
     if quiet < 2 and isinstance(dir, os.PathLike):
@@ -45,10 +48,184 @@ def _walk_dir(dir, maxlevels, quiet=0):
             yield from _walk_dir(fullname, maxlevels=maxlevels - 1,
                                  quiet=quiet)
 
+# In parallel mode, the files are sent to the workers in batches of about
+# _BATCH_SIZE bytes of source, so that many small files do not cost one
+# round trip each.  A batch is smaller if there are few files, so that each
+# worker gets several batches.  Each file counts for _FILE_COST bytes more,
+# for opening it and checking its bytecode.
+_BATCH_SIZE = 256 * 1024
+_FILE_COST = 1024
+
+
+def _file_weight(fullname):
+    try:
+        return _FILE_COST + os.stat(fullname).st_size
+    except OSError:
+        return _FILE_COST
+
+
+def _batches(items, weights, workers):
+    workers = workers or os.process_cpu_count() or 1
+    target = min(_BATCH_SIZE, sum(weights) // (workers * 4))
+    batch = []
+    batch_weight = 0
+    for item, weight in zip(items, weights):
+        batch.append(item)
+        batch_weight += weight
+        if batch_weight >= target:
+            yield batch
+            batch = []
+            batch_weight = 0
+    if batch:
+        yield batch
+
+
+def _make_pool(workers, executor):
+    """Return an executor for the parallel workers, or None if the files
+    must be compiled sequentially.
+    """
+    if workers == 1:
+        return None
+    # If workers == 0, let the executor choose
+    max_workers = workers or None
+    if executor == 'interpreter':
+        try:
+            from concurrent.futures import InterpreterPoolExecutor
+        except ImportError:
+            # Fall back to processes.
+            pass
+        else:
+            return InterpreterPoolExecutor(max_workers=max_workers)
+    # Check if this is a system where ProcessPoolExecutor can function.
+    from concurrent.futures.process import _check_system_limits
+    try:
+        _check_system_limits()
+    except NotImplementedError:
+        return None
+    from concurrent.futures import ProcessPoolExecutor
+    if ProcessPoolExecutor is None:
+        return None
+    import multiprocessing
+    if multiprocessing.get_start_method() == 'fork':
+        mp_context = multiprocessing.get_context('forkserver')
+    else:
+        mp_context = None
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+
+def _compile_batch(batch, **kwargs):
+    return [(fullname, *_compile_file(fullname, entry=entry, **kwargs))
+            for fullname, entry in batch]
+
+
+class _Manifest:
+    """The source hashes of the files compiled by the previous runs.
+
+    The manifest is a JSON file mapping the absolute paths of the source
+    files to lists [mtime_ns, size, source_hash, options], where options
+    are the dfile, the bytecode files and the invalidation mode with which
+    the source was compiled.
+    """
+
+    def __init__(self, filename):
+        self.filename = os.fspath(filename)
+        self.files = {}
+        try:
+            with open(self.filename, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (isinstance(data, dict)
+                and data.get('magic') == importlib.util.MAGIC_NUMBER.hex()
+                and isinstance(data.get('files'), dict)):
+            self.files = data['files']
+
+    def get(self, fullname):
+        return self.files.get(os.path.abspath(fullname))
+
+    def update(self, fullname, entry):
+        key = os.path.abspath(fullname)
+        if entry is None:
+            self.files.pop(key, None)
+        else:
+            self.files[key] = entry
+
+    def save(self):
+        data = {'magic': importlib.util.MAGIC_NUMBER.hex(),
+                'files': self.files}
+        tmp = '{}.{}'.format(self.filename, os.getpid())
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp, self.filename)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+# A source modified less than _RACY_NS nanoseconds ago may be modified again
+# without changing its mtime, so its hash is always checked.
+_RACY_NS = 2 * 10**9
+
+
+def _make_entry(st, source_hash, options):
+    mtime_ns = st.st_mtime_ns
+    if time.time_ns() - mtime_ns < _RACY_NS:
+        mtime_ns = -1
+    return [mtime_ns, st.st_size, source_hash, options]
+
+
+def _source_entry(fullname, options):
+    with open(fullname, 'rb') as f:
+        st = os.fstat(f.fileno())
+        source_hash = importlib.util.source_hash(f.read())
+    return _make_entry(st, source_hash.hex(), options)
+
+
+def _check_entry(fullname, entry, options):
+    """Return the updated manifest entry of fullname if its bytecode files
+    are up to date, or None.
+    """
+    if not entry or entry[3] != options:
+        return None
+    try:
+        st = os.stat(fullname)
+        if entry[:2] == [st.st_mtime_ns, st.st_size]:
+            for cfile in options[1]:
+                os.stat(cfile)
+            return entry
+        if entry[1] != st.st_size:
+            return None
+        with open(fullname, 'rb') as f:
+            source_hash = importlib.util.source_hash(f.read())
+        if source_hash.hex() != entry[2]:
+            return None
+        # The source was touched but not changed: only the timestamp of
+        # the timestamp-based pyc files is updated.
+        stamp = struct.pack('<LL', int(st.st_mtime) & 0xFFFF_FFFF,
+                            st.st_size & 0xFFFF_FFFF)
+        for cfile in options[1]:
+            with open(cfile, 'r+b') as chandle:
+                header = chandle.read(16)
+                if (len(header) != 16
+                        or header[:4] != importlib.util.MAGIC_NUMBER):
+                    return None
+                if header[4:8] == b'\0\0\0\0' and header[8:] != stamp:
+                    chandle.seek(8)
+                    chandle.write(stamp)
+    except OSError:
+        return None
+    return _make_entry(st, entry[2], options)
+
+
 def compile_dir(dir, maxlevels=None, ddir=None, force=False,
                 rx=None, quiet=0, legacy=False, optimize=-1, workers=1,
                 invalidation_mode=None, *, stripdir=None,
-                prependdir=None, limit_sl_dest=None, hardlink_dupes=False):
+                prependdir=None, limit_sl_dest=None, hardlink_dupes=False,
+                manifest=None, executor='process'):
     """Byte-compile all modules in the given directory tree.
 
     Arguments (only dir is required):
@@ -72,8 +249,15 @@ def compile_dir(dir, maxlevels=None, ddir=None, force=False,
     limit_sl_dest: ignore symlinks if they are pointing outside of
                    the defined path
     hardlink_dupes: hardlink duplicated pyc files
+    manifest:  path of a manifest of the source hashes; if given, only the
+               files whose content changed since they were compiled are
+               compiled again
+    executor:  'process' to run the parallel workers in processes, or
+               'interpreter' to run them in interpreters of this process
     """
-    ProcessPoolExecutor = None
+    if executor not in ('process', 'interpreter'):
+        raise ValueError(f"executor must be 'process' or 'interpreter', "
+                         f"not {executor!r}")
     if ddir is not None and (stripdir is not None or prependdir is not None):
         raise ValueError(("Destination dir (ddir) cannot be used "
                           "in combination with stripdir or prependdir"))
@@ -83,42 +267,58 @@ def compile_dir(dir, maxlevels=None, ddir=None, force=False,
         ddir = None
     if workers < 0:
         raise ValueError('workers must be greater or equal to 0')
-    if workers != 1:
-        # Check if this is a system where ProcessPoolExecutor can function.
-        from concurrent.futures.process import _check_system_limits
-        try:
-            _check_system_limits()
-        except NotImplementedError:
-            workers = 1
-        else:
-            from concurrent.futures import ProcessPoolExecutor
     if maxlevels is None:
         maxlevels = sys.getrecursionlimit()
+    if manifest is not None:
+        manifest = _Manifest(manifest)
+        # Resolve the default mode here, the workers may not see the same
+        # environment variables.
+        if invalidation_mode is None:
+            invalidation_mode = py_compile._get_default_invalidation_mode()
     files = _walk_dir(dir, quiet=quiet, maxlevels=maxlevels)
     success = True
-    if workers != 1 and ProcessPoolExecutor is not None:
-        import multiprocessing
-        if multiprocessing.get_start_method() == 'fork':
-            mp_context = multiprocessing.get_context('forkserver')
+    pool = _make_pool(workers, executor)
+    if pool is not None:
+        if manifest is not None:
+            items = [(file, manifest.get(file)) for file in files]
         else:
-            mp_context = None
-        # If workers == 0, let ProcessPoolExecutor choose
-        workers = workers or None
-        with ProcessPoolExecutor(max_workers=workers,
-                                 mp_context=mp_context) as executor:
-            results = executor.map(partial(compile_file,
-                                           ddir=ddir, force=force,
-                                           rx=rx, quiet=quiet,
-                                           legacy=legacy,
-                                           optimize=optimize,
-                                           invalidation_mode=invalidation_mode,
-                                           stripdir=stripdir,
-                                           prependdir=prependdir,
-                                           limit_sl_dest=limit_sl_dest,
-                                           hardlink_dupes=hardlink_dupes),
-                                   files,
-                                   chunksize=4)
-            success = min(results, default=True)
+            items = [(file, None) for file in files]
+        # A file in the manifest is probably unchanged since the previous
+        # run.
+        weights = [_FILE_COST if entry else _file_weight(file)
+                   for file, entry in items]
+        with pool:
+            results = pool.map(partial(_compile_batch,
+                                       ddir=ddir, force=force,
+                                       rx=rx, quiet=quiet,
+                                       legacy=legacy,
+                                       optimize=optimize,
+                                       invalidation_mode=invalidation_mode,
+                                       stripdir=stripdir,
+                                       prependdir=prependdir,
+                                       limit_sl_dest=limit_sl_dest,
+                                       hardlink_dupes=hardlink_dupes,
+                                       incremental=manifest is not None),
+                               _batches(items, weights, workers))
+            for batch in results:
+                for file, ok, entry in batch:
+                    if not ok:
+                        success = False
+                    if manifest is not None:
+                        manifest.update(file, entry)
+    elif manifest is not None:
+        for file in files:
+            ok, entry = _compile_file(file, ddir, force, rx, quiet,
+                                      legacy, optimize, invalidation_mode,
+                                      stripdir=stripdir,
+                                      prependdir=prependdir,
+                                      limit_sl_dest=limit_sl_dest,
+                                      hardlink_dupes=hardlink_dupes,
+                                      incremental=True,
+                                      entry=manifest.get(file))
+            if not ok:
+                success = False
+            manifest.update(file, entry)
     else:
         for file in files:
             if not compile_file(file, ddir, force, rx, quiet,
@@ -127,12 +327,14 @@ def compile_dir(dir, maxlevels=None, ddir=None, force=False,
                                 limit_sl_dest=limit_sl_dest,
                                 hardlink_dupes=hardlink_dupes):
                 success = False
+    if manifest is not None:
+        manifest.save()
     return success
 
 def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
                  legacy=False, optimize=-1,
                  invalidation_mode=None, *, stripdir=None, prependdir=None,
-                 limit_sl_dest=None, hardlink_dupes=False):
+                 limit_sl_dest=None, hardlink_dupes=False, manifest=None):
     """Byte-compile one file.
 
     Arguments (only fullname is required):
@@ -154,38 +356,44 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
     limit_sl_dest: ignore symlinks if they are pointing outside of
                    the defined path.
     hardlink_dupes: hardlink duplicated pyc files
+    manifest:  path of a manifest of the source hashes; if given, the file
+               is only compiled again if its content changed
     """
+    if manifest is None:
+        success, _ = _compile_file(fullname, ddir, force, rx, quiet, legacy,
+                                   optimize, invalidation_mode,
+                                   stripdir=stripdir, prependdir=prependdir,
+                                   limit_sl_dest=limit_sl_dest,
+                                   hardlink_dupes=hardlink_dupes)
+        return success
+    manifest = _Manifest(manifest)
+    success, entry = _compile_file(fullname, ddir, force, rx, quiet, legacy,
+                                   optimize, invalidation_mode,
+                                   stripdir=stripdir, prependdir=prependdir,
+                                   limit_sl_dest=limit_sl_dest,
+                                   hardlink_dupes=hardlink_dupes,
+                                   incremental=True,
+                                   entry=manifest.get(fullname))
+    manifest.update(fullname, entry)
+    manifest.save()
+    return success
 
+def _compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
+                  legacy=False, optimize=-1,
+                  invalidation_mode=None, *, stripdir=None, prependdir=None,
+                  limit_sl_dest=None, hardlink_dupes=False,
+                  incremental=False, entry=None):
+    # Return a tuple (success, entry), where entry is the manifest entry of
+    # the file in incremental mode, given the previous one.
+    previous, entry = entry, None
     if ddir is not None and (stripdir is not None or prependdir is not None):
         raise ValueError(("Destination dir (ddir) cannot be used "
                           "in combination with stripdir or prependdir"))
 
     success = True
     fullname = os.fspath(fullname)
-    stripdir = os.fspath(stripdir) if stripdir is not None else None
     name = os.path.basename(fullname)
-
-    dfile = None
-
-    if ddir is not None:
-        dfile = os.path.join(ddir, name)
-
-    if stripdir is not None:
-        fullname_parts = fullname.split(os.path.sep)
-        stripdir_parts = stripdir.split(os.path.sep)
-
-        if stripdir_parts != fullname_parts[:len(stripdir_parts)]:
-            if quiet < 2:
-                print("The stripdir path {!r} is not a valid prefix for "
-                      "source path {!r}; ignoring".format(stripdir, fullname))
-        else:
-            dfile = os.path.join(*fullname_parts[len(stripdir_parts):])
-
-    if prependdir is not None:
-        if dfile is None:
-            dfile = os.path.join(prependdir, fullname)
-        else:
-            dfile = os.path.join(prependdir, dfile)
+    dfile = _dfile(fullname, ddir, stripdir, prependdir, quiet)
 
     if isinstance(optimize, int):
         optimize = [optimize]
@@ -201,11 +409,11 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
     if rx is not None:
         mo = rx.search(fullname)
         if mo:
-            return success
+            return success, None
 
     if limit_sl_dest is not None and os.path.islink(fullname):
         if Path(limit_sl_dest).resolve() not in Path(fullname).resolve().parents:
-            return success
+            return success, None
 
     opt_cfiles = {}
 
@@ -225,7 +433,17 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
 
         head, tail = name[:-3], name[-3:]
         if tail == '.py':
-            if not force:
+            if incremental:
+                mode = (invalidation_mode or
+                        py_compile._get_default_invalidation_mode())
+                options = [dfile, list(opt_cfiles.values()), mode.name]
+                if not force:
+                    entry = _check_entry(fullname, previous, options)
+                    if entry is not None:
+                        return success, entry
+            # In incremental mode, the timestamps of the pyc files are
+            # only trusted for the files which are not in the manifest.
+            if not force and not previous:
                 try:
                     mtime = int(os.stat(fullname).st_mtime)
                     expect = struct.pack('<4sLL', importlib.util.MAGIC_NUMBER,
@@ -236,7 +454,9 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
                         if expect != actual:
                             break
                     else:
-                        return success
+                        if incremental:
+                            entry = _source_entry(fullname, options)
+                        return success, entry
                 except OSError:
                     pass
             if not quiet:
@@ -255,7 +475,7 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
             except py_compile.PyCompileError as err:
                 success = False
                 if quiet >= 2:
-                    return success
+                    return success, None
                 elif quiet:
                     print('*** Error compiling {!r}...'.format(fullname))
                 else:
@@ -267,7 +487,7 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
             except (SyntaxError, UnicodeError, OSError) as e:
                 success = False
                 if quiet >= 2:
-                    return success
+                    return success, None
                 elif quiet:
                     print('*** Error compiling {!r}...'.format(fullname))
                 else:
@@ -276,7 +496,144 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
             else:
                 if ok == 0:
                     success = False
-    return success
+                elif incremental:
+                    try:
+                        entry = _source_entry(fullname, options)
+                    except OSError:
+                        pass
+    return success, entry
+
+def _module_name(fullname, dir):
+    # Return the name of the module whose source is fullname in the tree
+    # dir and whether it is a package, or (None, False) if the source cannot
+    # be imported.
+    parts = os.path.relpath(fullname, dir)[:-3].split(os.path.sep)
+    is_package = parts[-1] == '__init__'
+    if is_package:
+        del parts[-1]
+    if not parts or not all(part.isidentifier() for part in parts):
+        return None, False
+    return '.'.join(parts), is_package
+
+def _compile_code(fullname, name, is_package, dfile, optimize, quiet):
+    # Return the bundle entry of the module compiled from fullname, or None.
+    if not quiet:
+        print('Compiling {!r}...'.format(fullname))
+    try:
+        with open(fullname, 'rb') as f:
+            st = os.fstat(f.fileno())
+            source = f.read()
+        code = compile(source, dfile or fullname, 'exec', dont_inherit=True,
+                       optimize=optimize)
+    except (SyntaxError, UnicodeError, ValueError, OSError) as e:
+        if quiet < 2:
+            if quiet:
+                print('*** Error compiling {!r}...'.format(fullname))
+            else:
+                print('*** ', end='')
+            print(e.__class__.__name__ + ':', e)
+        return None
+    origin = dfile or fullname
+    locations = (os.path.dirname(origin),) if is_package else None
+    return (name, marshal.dumps(code), origin, locations,
+            int(st.st_mtime) & 0xFFFF_FFFF, st.st_size & 0xFFFF_FFFF)
+
+def _compile_code_batch(batch, optimize, quiet):
+    return [_compile_code(*item, optimize, quiet) for item in batch]
+
+def compile_bundle(dir, bundle, maxlevels=None, ddir=None, rx=None, quiet=0,
+                   optimize=-1, workers=1, *, stripdir=None, prependdir=None,
+                   limit_sl_dest=None, executor='process'):
+    """Byte-compile all modules in the given directory tree into a bundle.
+
+    The bundle is a single file holding the code of all the modules, indexed
+    by module name, which importlib.snapshot can import them from.  The
+    top-level modules are the ones directly in dir, like in a sys.path
+    entry.
+
+    Arguments (only dir and bundle are required):
+
+    dir:       the directory to byte-compile
+    bundle:    the bundle file to write
+    optimize:  optimization level or -1 for level of the interpreter
+
+    The other arguments are as for compile_dir().
+    """
+    if executor not in ('process', 'interpreter'):
+        raise ValueError(f"executor must be 'process' or 'interpreter', "
+                         f"not {executor!r}")
+    if ddir is not None and (stripdir is not None or prependdir is not None):
+        raise ValueError(("Destination dir (ddir) cannot be used "
+                          "in combination with stripdir or prependdir"))
+    if ddir is not None:
+        stripdir = dir
+        prependdir = ddir
+    if workers < 0:
+        raise ValueError('workers must be greater or equal to 0')
+    if maxlevels is None:
+        maxlevels = sys.getrecursionlimit()
+    dir = os.fspath(dir)
+    items = []
+    seen = set()
+    for fullname in _walk_dir(dir, quiet=quiet, maxlevels=maxlevels):
+        if not fullname.endswith('.py'):
+            continue
+        if rx is not None and rx.search(fullname):
+            continue
+        if limit_sl_dest is not None and os.path.islink(fullname):
+            if Path(limit_sl_dest).resolve() not in Path(fullname).resolve().parents:
+                continue
+        name, is_package = _module_name(fullname, dir)
+        # A package is listed before a module with the same name, and
+        # shadows it like on import.
+        if name is None or name in seen:
+            continue
+        seen.add(name)
+        dfile = _dfile(fullname, None, stripdir, prependdir, quiet)
+        items.append((fullname, name, is_package, dfile))
+
+    pool = _make_pool(workers, executor)
+    if pool is not None:
+        weights = [_file_weight(item[0]) for item in items]
+        with pool:
+            results = pool.map(partial(_compile_code_batch,
+                                       optimize=optimize, quiet=quiet),
+                               _batches(items, weights, workers))
+            entries = [entry for batch in results for entry in batch]
+    else:
+        entries = [_compile_code(*item, optimize, quiet) for item in items]
+
+    from importlib import snapshot
+    snapshot._write(bundle, [entry for entry in entries if entry is not None])
+    return None not in entries
+
+def _dfile(fullname, ddir, stripdir, prependdir, quiet):
+    # Return the path of fullname compiled in to the byte-code, or None.
+    stripdir = os.fspath(stripdir) if stripdir is not None else None
+    name = os.path.basename(fullname)
+
+    dfile = None
+
+    if ddir is not None:
+        dfile = os.path.join(ddir, name)
+
+    if stripdir is not None:
+        fullname_parts = fullname.split(os.path.sep)
+        stripdir_parts = stripdir.split(os.path.sep)
+
+        if stripdir_parts != fullname_parts[:len(stripdir_parts)]:
+            if quiet < 2:
+                print("The stripdir path {!r} is not a valid prefix for "
+                      "source path {!r}; ignoring".format(stripdir, fullname))
+        else:
+            dfile = os.path.join(*fullname_parts[len(stripdir_parts):])
+
+    if prependdir is not None:
+        if dfile is None:
+            dfile = os.path.join(prependdir, fullname)
+        else:
+            dfile = os.path.join(prependdir, dfile)
+    return dfile
 
 def compile_path(skip_curdir=1, maxlevels=0, force=False, quiet=0,
                  legacy=False, optimize=-1,
@@ -384,6 +741,21 @@ def main():
     parser.add_argument('--hardlink-dupes', action='store_true',
                         dest='hardlink_dupes',
                         help='Hardlink duplicated pyc files')
+    parser.add_argument('--manifest', metavar='FILE', dest='manifest',
+                        default=None,
+                        help=('record the hashes of the sources in FILE and '
+                              'only compile again the files whose content '
+                              'changed since they were recorded'))
+    parser.add_argument('--executor', choices=['process', 'interpreter'],
+                        default='process',
+                        help=('run the workers of -j in processes (the '
+                              'default) or in interpreters of the current '
+                              'process'))
+    parser.add_argument('--bundle', metavar='FILE', dest='bundle',
+                        default=None,
+                        help=('write the code of all the modules of the '
+                              'directory to the single bundle FILE instead '
+                              'of writing .pyc files'))
 
     args = parser.parse_args()
     compile_dests = args.compile_dest
@@ -412,6 +784,16 @@ def main():
     ):
         parser.error("-d cannot be used in combination with -s or -p")
 
+    if args.bundle is not None:
+        if (args.legacy or args.hardlink_dupes or args.manifest
+                or args.invalidation_mode or args.flist
+                or len(args.opt_levels) > 1):
+            parser.error("--bundle cannot be used in combination with -b, "
+                         "-i, -o several times, --hardlink-dupes, "
+                         "--invalidation-mode or --manifest")
+        if len(compile_dests) != 1 or not os.path.isdir(compile_dests[0]):
+            parser.error("--bundle requires a single directory")
+
     # if flist is provided then load it
     if args.flist:
         try:
@@ -432,6 +814,14 @@ def main():
 
     success = True
     try:
+        if args.bundle is not None:
+            return compile_bundle(compile_dests[0], args.bundle, maxlevels,
+                                  args.ddir, args.rx, args.quiet,
+                                  args.opt_levels[0], args.workers,
+                                  stripdir=args.stripdir,
+                                  prependdir=args.prependdir,
+                                  limit_sl_dest=args.limit_sl_dest,
+                                  executor=args.executor)
         if compile_dests:
             for dest in compile_dests:
                 if os.path.isfile(dest):
@@ -442,7 +832,8 @@ def main():
                                         prependdir=args.prependdir,
                                         optimize=args.opt_levels,
                                         limit_sl_dest=args.limit_sl_dest,
-                                        hardlink_dupes=args.hardlink_dupes):
+                                        hardlink_dupes=args.hardlink_dupes,
+                                        manifest=args.manifest):
                         success = False
                 else:
                     if not compile_dir(dest, maxlevels, args.ddir,
@@ -453,7 +844,9 @@ def main():
                                        prependdir=args.prependdir,
                                        optimize=args.opt_levels,
                                        limit_sl_dest=args.limit_sl_dest,
-                                       hardlink_dupes=args.hardlink_dupes):
+                                       hardlink_dupes=args.hardlink_dupes,
+                                       manifest=args.manifest,
+                                       executor=args.executor):
                         success = False
             return success
         else:
@@ -1,10 +1,31 @@
 """Internal classes used by compression modules"""
 
 import io
+import os
 import sys
+from collections import deque
 
 BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE  # Compressed data read chunk size
 
+# Largest uncompressed size of a segment that ParallelDecompressReader
+# is used for; longer segments are decompressed on the calling thread.
+PARALLEL_SEGMENT_LIMIT = 64 * 1024 * 1024
+
+
+def thread_count(threads):
+    """Return the number of worker threads for a *threads* argument.
+
+    None means that (de)compression happens on the calling thread and
+    returns 0.  0 means one thread per CPU.
+    """
+    if threads is None:
+        return 0
+    if threads < 0:
+        raise ValueError("threads must be a non-negative integer or None")
+    if threads == 0:
+        return os.process_cpu_count() or 1
+    return threads
+
 
 class BaseStream(io.BufferedIOBase):
     """Mode-checking helper functions."""
@@ -160,3 +181,146 @@ def seek(self, offset, whence=io.SEEK_SET):
     def tell(self):
         """Return the current file position."""
         return self._pos
+
+
+class ParallelCompressor:
+    """Compressor object that compresses fixed-size blocks on worker threads.
+
+    compress_block(data, previous, final) is called on a worker thread for
+    each block of *block_size* bytes; *previous* is the uncompressed data of
+    the preceding block, or None for the first block, and *final* is true
+    for the last block.  The compressed blocks are returned in order by
+    compress() and flush(), so that the object can replace the compressor
+    object of a single-threaded writer.
+    """
+
+    def __init__(self, compress_block, threads, block_size):
+        from concurrent.futures import ThreadPoolExecutor
+        self._compress_block = compress_block
+        self._block_size = block_size
+        self._max_pending = 2 * threads
+        self._executor = ThreadPoolExecutor(threads)
+        self._pending = deque()
+        self._buffer = bytearray()
+        self._previous = None
+
+    def _submit(self, final):
+        data = bytes(self._buffer[:self._block_size])
+        del self._buffer[:self._block_size]
+        self._pending.append(self._executor.submit(
+            self._compress_block, data, self._previous, final))
+        self._previous = data
+
+    def _collect(self, limit):
+        output = []
+        while len(self._pending) > limit or (self._pending and
+                                              self._pending[0].done()):
+            output.append(self._pending.popleft().result())
+        return output
+
+    def compress(self, data):
+        self._buffer += data
+        output = []
+        while len(self._buffer) >= self._block_size:
+            self._submit(False)
+            # Bound the memory held by blocks in flight.
+            output += self._collect(self._max_pending)
+        output += self._collect(self._max_pending)
+        return b"".join(output)
+
+    def flush(self, final=True):
+        """Compress the buffered data and return all pending output.
+
+        If *final* is true, the last block is finished and the object
+        cannot be used afterwards.
+        """
+        if self._buffer or final:
+            self._submit(final)
+        output = self._collect(0)
+        if final:
+            self.close()
+        return b"".join(output)
+
+    def close(self):
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown()
+
+
+class ParallelDecompressReader(DecompressReader):
+    """Decompresses independent segments of a file on worker threads.
+
+    *segments* is a sequence of (offset, size) pairs, each the position of
+    a complete compressed stream in *fp*, and decompress(data) returns the
+    uncompressed contents of one segment.  Segments are read on the calling
+    thread and decompressed ahead of the reader, at most 2 * *threads* at a
+    time.
+    """
+
+    def __init__(self, fp, segments, decompress, threads):
+        from concurrent.futures import ThreadPoolExecutor
+        self._fp = fp
+        self._eof = False
+        self._pos = 0  # Current offset in decompressed stream
+        self._size = -1
+        self._segments = segments
+        self._decompress = decompress
+        self._max_pending = 2 * threads
+        self._executor = ThreadPoolExecutor(threads)
+        self._start()
+
+    def _start(self):
+        self._next_segment = 0
+        self._pending = deque()
+        self._chunk = b""
+        self._chunk_pos = 0
+
+    def _cancel(self):
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+
+    def close(self):
+        if self._executor is not None:
+            self._cancel()
+            self._executor.shutdown()
+            self._executor = None
+        return io.RawIOBase.close(self)
+
+    def _fill(self):
+        while (len(self._pending) < self._max_pending and
+               self._next_segment < len(self._segments)):
+            offset, size = self._segments[self._next_segment]
+            self._next_segment += 1
+            self._fp.seek(offset)
+            data = self._fp.read(size)
+            if len(data) < size:
+                raise EOFError("Compressed file ended before the "
+                               "end-of-stream marker was reached")
+            self._pending.append(self._executor.submit(self._decompress, data))
+
+    def read(self, size=-1):
+        if size < 0:
+            return self.readall()
+
+        if not size or self._eof:
+            return b""
+        while self._chunk_pos >= len(self._chunk):
+            self._fill()
+            if not self._pending:
+                self._eof = True
+                self._size = self._pos
+                return b""
+            self._chunk = self._pending.popleft().result()
+            self._chunk_pos = 0
+        data = self._chunk[self._chunk_pos:self._chunk_pos + size]
+        self._chunk_pos += len(data)
+        self._pos += len(data)
+        return data
+
+    def _rewind(self):
+        self._cancel()
+        self._eof = False
+        self._pos = 0
+        self._start()
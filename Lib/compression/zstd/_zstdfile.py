@@ -1,6 +1,7 @@
 import io
 from os import PathLike
-from _zstd import ZstdCompressor, ZstdDecompressor, ZSTD_DStreamOutSize
+from _zstd import (ZstdCompressor, ZstdDecompressor, ZSTD_DStreamOutSize,
+                   ZSTD_c_nbWorkers)
 from compression._common import _streams
 
 __all__ = ('ZstdFile', 'open')
@@ -9,6 +10,10 @@
 _MODE_READ = 1
 _MODE_WRITE = 2
 
+# Magic numbers of the seek table of the Zstandard seekable format.
+_SEEK_TABLE_FRAME_MAGIC = 0x184D2A5E
+_SEEKABLE_MAGIC = 0x8F92EAB1
+
 
 def _nbytes(dat, /):
     if isinstance(dat, (bytes, bytearray)):
@@ -17,6 +22,67 @@ def _nbytes(dat, /):
         return mv.nbytes
 
 
+def _decompress_frame(data, zstd_dict, options):
+    decompressor = ZstdDecompressor(zstd_dict=zstd_dict, options=options)
+    result = decompressor.decompress(data)
+    if not decompressor.eof:
+        raise EOFError('Compressed file ended before the '
+                       'end-of-stream marker was reached')
+    return result
+
+
+def _seekable_frames(fp):
+    """Read the seek table of a file in the Zstandard seekable format.
+
+    Return a list of (offset, size) pairs of the frames, or None if the
+    file is not seekable, has no seek table, has a single frame, or has a
+    frame that is too large to decompress in memory.
+    """
+    try:
+        if not fp.seekable():
+            return None
+        start = fp.tell()
+        end = fp.seek(0, io.SEEK_END)
+    except (AttributeError, OSError):
+        return None
+    try:
+        if end - start < 17:
+            return None
+        fp.seek(end - 9)
+        footer = fp.read(9)
+        count = int.from_bytes(footer[:4], 'little')
+        descriptor = footer[4]
+        if (int.from_bytes(footer[5:], 'little') != _SEEKABLE_MAGIC
+                or descriptor & 0x7C):
+            return None
+        entry_size = 12 if descriptor & 0x80 else 8
+        table_size = count * entry_size + 9
+        table_start = end - table_size - 8
+        if table_start < start:
+            return None
+        fp.seek(table_start)
+        table = fp.read(8 + table_size)
+        if (int.from_bytes(table[:4], 'little') != _SEEK_TABLE_FRAME_MAGIC
+                or int.from_bytes(table[4:8], 'little') != table_size):
+            return None
+        frames = []
+        offset = start
+        for pos in range(8, 8 + count * entry_size, entry_size):
+            size = int.from_bytes(table[pos:pos + 4], 'little')
+            decompressed_size = int.from_bytes(table[pos + 4:pos + 8], 'little')
+            if decompressed_size > _streams.PARALLEL_SEGMENT_LIMIT:
+                return None
+            frames.append((offset, size))
+            offset += size
+        if offset != table_start:
+            return None
+    finally:
+        fp.seek(start)
+    if len(frames) < 2:
+        return None
+    return frames
+
+
 class ZstdFile(_streams.BaseStream):
     """A file-like object providing transparent Zstandard (de)compression.
 
@@ -31,7 +97,7 @@ class ZstdFile(_streams.BaseStream):
     FLUSH_FRAME = ZstdCompressor.FLUSH_FRAME
 
     def __init__(self, file, /, mode='r', *,
-                 level=None, options=None, zstd_dict=None):
+                 level=None, options=None, zstd_dict=None, threads=None):
         """Open a Zstandard compressed file in binary mode.
 
         *file* can be either an file-like object, or a file name to open.
@@ -49,6 +115,12 @@ def __init__(self, file, /, mode='r', *,
 
         *zstd_dict* is an optional ZstdDict object, a pre-trained Zstandard
         dictionary. See train_dict() to train ZstdDict on sample data.
+
+        *threads* is an optional number of worker threads, or 0 for one per
+        CPU. When writing, it sets CompressionParameter.nb_workers so that
+        libzstd compresses on its own worker threads. When reading a file
+        in the Zstandard seekable format, its frames are decompressed in
+        parallel.
         """
         self._fp = None
         self._close_fp = False
@@ -68,6 +140,12 @@ def __init__(self, file, /, mode='r', *,
             if level is not None and not isinstance(level, int):
                 raise TypeError('level must be int or None')
             self._mode = _MODE_WRITE
+            threads = _streams.thread_count(threads)
+            if threads:
+                if options is not None and ZSTD_c_nbWorkers in options:
+                    raise ValueError('threads and the nb_workers option '
+                                     'cannot be used together')
+                options = {**(options or {}), ZSTD_c_nbWorkers: threads}
             self._compressor = ZstdCompressor(level=level, options=options,
                                               zstd_dict=zstd_dict)
             self._pos = 0
@@ -85,12 +163,25 @@ def __init__(self, file, /, mode='r', *,
                             'or a str, bytes, or PathLike object')
 
         if self._mode == _MODE_READ:
-            raw = _streams.DecompressReader(
-                self._fp,
-                ZstdDecompressor,
-                zstd_dict=zstd_dict,
-                options=options,
-            )
+            raw = None
+            threads = _streams.thread_count(threads)
+            if threads:
+                frames = _seekable_frames(self._fp)
+                if frames is not None:
+                    raw = _streams.ParallelDecompressReader(
+                        self._fp,
+                        frames,
+                        lambda data: _decompress_frame(data, zstd_dict,
+                                                       options),
+                        threads,
+                    )
+            if raw is None:
+                raw = _streams.DecompressReader(
+                    self._fp,
+                    ZstdDecompressor,
+                    zstd_dict=zstd_dict,
+                    options=options,
+                )
             self._buffer = io.BufferedReader(raw)
 
     def close(self):
@@ -293,7 +384,7 @@ def writable(self):
 
 
 def open(file, /, mode='rb', *, level=None, options=None, zstd_dict=None,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, threads=None):
     """Open a Zstandard compressed file in binary or text mode.
 
     file can be either a file name (given as a str, bytes, or PathLike object),
@@ -303,8 +394,8 @@ def open(file, /, mode='rb', *, level=None, options=None, zstd_dict=None,
     The mode parameter can be 'r', 'rb' (default), 'w', 'wb', 'x', 'xb', 'a',
     'ab' for binary mode, or 'rt', 'wt', 'xt', 'at' for text mode.
 
-    The level, options, and zstd_dict parameters specify the settings the same
-    as ZstdFile.
+    The level, options, zstd_dict and threads parameters specify the settings
+    the same as ZstdFile.
 
     When using read mode (decompression), the options parameter is a dict
     representing advanced decompression options. The level parameter is not
@@ -337,7 +428,7 @@ def open(file, /, mode='rb', *, level=None, options=None, zstd_dict=None,
             raise ValueError('Argument "newline" not supported in binary mode')
 
     binary_file = ZstdFile(file, mode, level=level, options=options,
-                           zstd_dict=zstd_dict)
+                           zstd_dict=zstd_dict, threads=threads)
 
     if text_mode:
         return io.TextIOWrapper(binary_file, encoding, errors, newline)
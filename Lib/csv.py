@@ -64,6 +64,8 @@ class excel:
 """
 
 import types
+from itertools import repeat
+from operator import attrgetter
 from _csv import Error, writer, reader, register_dialect, \
                  unregister_dialect, get_dialect, list_dialects, \
                  field_size_limit, \
@@ -198,8 +200,6 @@ def __next__(self):
 class DictWriter:
     def __init__(self, f, fieldnames, restval="", extrasaction="raise",
                  dialect="excel", *args, **kwds):
-        if fieldnames is not None and iter(fieldnames) is fieldnames:
-            fieldnames = list(fieldnames)
         self.fieldnames = fieldnames    # list of keys for the dict
         self.restval = restval          # for writing short dicts
         extrasaction = extrasaction.lower()
@@ -209,17 +209,55 @@ def __init__(self, f, fieldnames, restval="", extrasaction="raise",
         self.extrasaction = extrasaction
         self.writer = writer(f, dialect, *args, **kwds)
 
+    @property
+    def fieldnames(self):
+        return self._fieldnames
+
+    @fieldnames.setter
+    def fieldnames(self, value):
+        if value is not None and iter(value) is value:
+            value = list(value)
+        self._fieldnames = value
+        # Field extractors for dataclasses, compiled on first use.
+        self._getters = {}
+
     def writeheader(self):
         header = dict(zip(self.fieldnames, self.fieldnames))
         return self.writerow(header)
 
+    def _dataclass_getter(self, cls):
+        from dataclasses import fields
+        names = [f.name for f in fields(cls)]
+        if self.extrasaction == "raise":
+            wrong_fields = [name for name in names
+                            if name not in self.fieldnames]
+            if wrong_fields:
+                raise ValueError("dataclass contains fields not in "
+                                 "fieldnames: "
+                                 + ", ".join([repr(x) for x in wrong_fields]))
+        fieldnames = list(self.fieldnames)
+        if len(fieldnames) > 1 and all(key in names for key in fieldnames):
+            getter = attrgetter(*fieldnames)
+        else:
+            def getter(obj):
+                return [getattr(obj, key) if key in names else self.restval
+                        for key in fieldnames]
+        self._getters[cls] = getter
+        return getter
+
     def _dict_to_list(self, rowdict):
+        cls = type(rowdict)
+        if hasattr(cls, "__dataclass_fields__"):
+            getter = self._getters.get(cls)
+            if getter is None:
+                getter = self._dataclass_getter(cls)
+            return getter(rowdict)
         if self.extrasaction == "raise":
             wrong_fields = rowdict.keys() - self.fieldnames
             if wrong_fields:
                 raise ValueError("dict contains fields not in fieldnames: "
                                  + ", ".join([repr(x) for x in wrong_fields]))
-        return (rowdict.get(key, self.restval) for key in self.fieldnames)
+        return map(rowdict.get, self.fieldnames, repeat(self.restval))
 
     def writerow(self, rowdict):
         return self.writer.writerow(self._dict_to_list(rowdict))
@@ -1,8 +1,8 @@
 import os
 import sqlite3
 from pathlib import Path
-from contextlib import suppress, closing
-from collections.abc import MutableMapping
+from contextlib import suppress, closing, contextmanager
+from collections.abc import Mapping, MutableMapping, ItemsView, ValuesView
 
 BUILD_TABLE = """
   CREATE TABLE IF NOT EXISTS Dict (
@@ -15,6 +15,8 @@
 STORE_KV = "REPLACE INTO Dict (key, value) VALUES (CAST(? AS BLOB), CAST(? AS BLOB))"
 DELETE_KEY = "DELETE FROM Dict WHERE key = CAST(? AS BLOB)"
 ITER_KEYS = "SELECT key FROM Dict"
+ITER_ITEMS = "SELECT key, value FROM Dict"
+ITER_VALUES = "SELECT value FROM Dict"
 REORGANIZE = "VACUUM"
 
 
@@ -25,6 +27,9 @@ class error(OSError):
 _ERR_CLOSED = "DBM object has already been closed"
 _ERR_REINIT = "DBM object does not support reinitialization"
 
+# Let SQLite read the database through a memory map of up to this size.
+MMAP_SIZE = 256 * 1024 * 1024
+
 
 def _normalize_uri(path):
     path = Path(path)
@@ -66,9 +71,12 @@ def __init__(self, path, /, *, flag, mode):
         except sqlite3.Error as exc:
             raise error(str(exc))
 
-        # This is an optimization only; it's ok if it fails.
+        # These are optimizations only; it's ok if they fail.
         with suppress(sqlite3.OperationalError):
             self._cx.execute("PRAGMA journal_mode = wal")
+        with suppress(sqlite3.OperationalError):
+            self._cx.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        self._batch_depth = 0
 
         if flag == "rwc":
             self._execute(BUILD_TABLE)
@@ -101,18 +109,74 @@ def __delitem__(self, key):
             if not cu.rowcount:
                 raise KeyError(key)
 
-    def __iter__(self):
+    def _iterate(self, query):
         try:
-            with self._execute(ITER_KEYS) as cu:
-                for row in cu:
-                    yield row[0]
+            with self._execute(query) as cu:
+                yield from cu
         except sqlite3.Error as exc:
             raise error(str(exc))
 
+    def __iter__(self):
+        for key, in self._iterate(ITER_KEYS):
+            yield key
+
+    def items(self):
+        return _ItemsView(self)
+
+    def values(self):
+        return _ValuesView(self)
+
+    @contextmanager
+    def batch(self):
+        """Group the changes made in the with block into one transaction.
+
+        The changes are committed when the block exits, or rolled back if
+        it raises an exception.  Nested blocks join the outer transaction.
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            return
+        self._execute("BEGIN")
+        self._batch_depth = 1
+        try:
+            yield self
+            self._execute("COMMIT")
+        except BaseException:
+            if self._cx and self._cx.in_transaction:
+                self._execute("ROLLBACK")
+            raise
+        finally:
+            self._batch_depth = 0
+
+    def bulk_update(self, other=(), /):
+        """Store many items in a single transaction.
+
+        'other' is a mapping or an iterable of key/value pairs.
+        """
+        if isinstance(other, Mapping):
+            other = other.items()
+        elif hasattr(other, "keys"):
+            other = ((key, other[key]) for key in other.keys())
+        with self.batch():
+            try:
+                self._cx.executemany(STORE_KV, other)
+            except sqlite3.Error as exc:
+                raise error(str(exc))
+
+    def update(self, other=(), /, **kwds):
+        self.bulk_update(other)
+        if kwds:
+            self.bulk_update(kwds)
+
     def close(self):
         if self._cx:
             self._cx.close()
             self._cx = None
+            self._batch_depth = 0
 
     def keys(self):
         return list(super().keys())
@@ -127,6 +191,18 @@ def reorganize(self):
         self._execute(REORGANIZE)
 
 
+class _ItemsView(ItemsView):
+    # Stream the pairs with a single query instead of one lookup per key.
+    def __iter__(self):
+        yield from self._mapping._iterate(ITER_ITEMS)
+
+
+class _ValuesView(ValuesView):
+    def __iter__(self):
+        for value, in self._mapping._iterate(ITER_VALUES):
+            yield value
+
+
 def open(filename, /, flag="r", mode=0o666):
     """Open a dbm.sqlite3 database and return the dbm object.
 
@@ -28,10 +28,11 @@
 
 READ_BUFFER_SIZE = 128 * 1024
 _WRITE_BUFFER_SIZE = 4 * io.DEFAULT_BUFFER_SIZE
+_PARALLEL_BLOCK_SIZE = 128 * 1024
 
 
 def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, threads=None):
     """Open a gzip-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes object), or
@@ -42,8 +43,8 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
     "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the GzipFile constructor:
-    GzipFile(filename, mode, compresslevel). In this case, the encoding, errors
-    and newline arguments must not be provided.
+    GzipFile(filename, mode, compresslevel, threads=threads). In this case, the
+    encoding, errors and newline arguments must not be provided.
 
     For text mode, a GzipFile object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error handling
@@ -63,9 +64,11 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
 
     gz_mode = mode.replace("t", "")
     if isinstance(filename, (str, bytes, os.PathLike)):
-        binary_file = GzipFile(filename, gz_mode, compresslevel)
+        binary_file = GzipFile(filename, gz_mode, compresslevel,
+                               threads=threads)
     elif hasattr(filename, "read") or hasattr(filename, "write"):
-        binary_file = GzipFile(None, gz_mode, compresslevel, filename)
+        binary_file = GzipFile(None, gz_mode, compresslevel, filename,
+                               threads=threads)
     else:
         raise TypeError("filename must be a str or bytes object, or a file")
 
@@ -126,6 +129,39 @@ class BadGzipFile(OSError):
     """Exception raised in some cases for invalid gzip files."""
 
 
+def _deflate_block(compresslevel, data, previous, final):
+    # Compress one block of a parallel deflate stream.  Like pigz, prime the
+    # compressor with the end of the previous block so that matches can reach
+    # back into it, and end every block but the last with a sync flush so the
+    # raw deflate streams can be concatenated.
+    if previous:
+        compress = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                    -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 0,
+                                    previous[-32768:])
+    else:
+        compress = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                    -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 0)
+    mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+    return compress.compress(data) + compress.flush(mode)
+
+
+class _ParallelDeflate(_streams.ParallelCompressor):
+    """Compressor object producing a single deflate stream from blocks
+    compressed on worker threads."""
+
+    def __init__(self, compresslevel, threads):
+        super().__init__(lambda *args: _deflate_block(compresslevel, *args),
+                         threads, _PARALLEL_BLOCK_SIZE)
+
+    def flush(self, mode=zlib.Z_FINISH):
+        data = super().flush(mode == zlib.Z_FINISH)
+        if mode == zlib.Z_FULL_FLUSH:
+            # Decompression can restart here, so the next block must not
+            # refer back to the data before it.
+            self._previous = None
+        return data
+
+
 class _WriteBufferStream(io.RawIOBase):
     """Minimal object to pass WriteBuffer flushes into GzipFile"""
     def __init__(self, gzip_file):
@@ -158,7 +194,8 @@ class GzipFile(_streams.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None):
+                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None,
+                 *, threads=None):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -191,6 +228,12 @@ def __init__(self, filename=None, mode=None,
         If mtime is omitted or None, the current time is used. Use mtime = 0
         to generate a compressed stream that does not depend on creation time.
 
+        The threads argument is the number of worker threads to compress
+        with when writing, or 0 for one per CPU.  The data is then split into
+        blocks which are deflated in parallel into a single gzip member.  If
+        threads is None (the default), data is compressed on the calling
+        thread.  It has no effect when reading.
+
         """
 
         # Ensure attributes exist at __del__
@@ -233,11 +276,15 @@ def __init__(self, filename=None, mode=None,
                         FutureWarning, 2)
                 self.mode = WRITE
                 self._init_write(filename)
-                self.compress = zlib.compressobj(compresslevel,
-                                                 zlib.DEFLATED,
-                                                 -zlib.MAX_WBITS,
-                                                 zlib.DEF_MEM_LEVEL,
-                                                 0)
+                threads = _streams.thread_count(threads)
+                if threads:
+                    self.compress = _ParallelDeflate(compresslevel, threads)
+                else:
+                    self.compress = zlib.compressobj(compresslevel,
+                                                     zlib.DEFLATED,
+                                                     -zlib.MAX_WBITS,
+                                                     zlib.DEF_MEM_LEVEL,
+                                                     0)
                 self._write_mtime = mtime
                 self._buffer_size = _WRITE_BUFFER_SIZE
                 self._buffer = io.BufferedWriter(_WriteBufferStream(self),
@@ -398,6 +445,8 @@ def close(self):
 
     def _close(self):
         self.fileobj = None
+        if isinstance(getattr(self, 'compress', None), _ParallelDeflate):
+            self.compress.close()
         myfileobj = self.myfileobj
         if myfileobj is not None:
             self.myfileobj = None
@@ -1,5 +1,6 @@
 """A pure Python implementation of import."""
-__all__ = ['__import__', 'import_module', 'invalidate_caches', 'reload']
+__all__ = ['__import__', 'import_module', 'import_parallel',
+           'invalidate_caches', 'reload']
 
 # Bootstrap help #####################################################
 
@@ -88,6 +89,64 @@ def import_module(name, package=None):
     return _bootstrap._gcd_import(name[level:], package, level)
 
 
+def import_parallel(names, package=None, *, max_workers=None):
+    """Import several modules concurrently and return them as a list.
+
+    The modules are imported by up to 'max_workers' threads, which overlap
+    the reads of the module files, and on the free-threaded build also the
+    unmarshalling and execution of their code.  'package' is used to resolve
+    relative names, as by import_module().
+
+    Each module is still imported under its module lock, so a module needed
+    by several imports is executed once.  The imports which failed because
+    of a circular import between two threads are done again in the calling
+    thread once the other imports are done.  If an import fails, the
+    exception of the first name whose import failed is raised.
+
+    """
+    names = list(names)
+    if max_workers is None:
+        import os
+        max_workers = min(32, (os.process_cpu_count() or 1) + 4)
+    elif max_workers <= 0:
+        raise ValueError("max_workers must be greater than 0")
+    workers = min(max_workers, len(names))
+    if workers <= 1:
+        return [import_module(name, package) for name in names]
+
+    import threading
+    modules = [None] * len(names)
+    errors = [None] * len(names)
+    indices = iter(range(len(names)))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                index = next(indices, None)
+            if index is None:
+                return
+            try:
+                modules[index] = import_module(names[index], package)
+            except BaseException as exc:
+                errors[index] = exc
+
+    threads = [threading.Thread(target=worker, name=f'import_parallel_{n}')
+               for n in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for index, error in enumerate(errors):
+        if error is None:
+            continue
+        if isinstance(error, _bootstrap._DeadlockError):
+            modules[index] = import_module(names[index], package)
+        else:
+            raise error
+    return modules
+
+
 _RELOADING = {}
 
 
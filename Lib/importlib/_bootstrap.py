@@ -935,6 +935,8 @@ def _load_unlocked(spec):
                     raise ImportError('missing loader', name=spec.name)
                 # A namespace package so do nothing.
             else:
+                if _profiler is not None:
+                    _profiler._phase(spec.name, 'exec')
                 spec.loader.exec_module(module)
         except:
             try:
@@ -1330,19 +1332,17 @@ def _find_and_load_unlocked(name, import_):
         if module is not None:
             return module
         child = name.rpartition('.')[2]
-    spec = _find_spec(name, path)
-    if spec is None:
-        raise ModuleNotFoundError(f'{_ERR_MSG_PREFIX}{name!r}', name=name)
+    profiler = _profiler
+    if profiler is None:
+        module = _find_spec_and_load(name, path, parent_spec)
     else:
-        if parent_spec:
-            # Temporarily add child we are currently importing to parent's
-            # _uninitialized_submodules for circular import tracking.
-            parent_spec._uninitialized_submodules.append(child)
+        profiler._enter(name)
         try:
-            module = _load_unlocked(spec)
-        finally:
-            if parent_spec:
-                parent_spec._uninitialized_submodules.pop()
+            module = _find_spec_and_load(name, path, parent_spec)
+        except BaseException:
+            profiler._exit(name, False)
+            raise
+        profiler._exit(name, True)
     if parent:
         # Set the module as an attribute on its parent.
         parent_module = sys.modules[parent]
@@ -1354,6 +1354,31 @@ def _find_and_load_unlocked(name, import_):
     return module
 
 
+# The active importlib.profile.ImportProfiler, if any.  It is told when the
+# import of a module starts and ends, and when it starts loading and
+# executing the module.  Loaders which get the code of the module in
+# exec_module() tell it when they start executing the code.
+_profiler = None
+
+
+def _find_spec_and_load(name, path, parent_spec):
+    spec = _find_spec(name, path)
+    if spec is None:
+        raise ModuleNotFoundError(f'{_ERR_MSG_PREFIX}{name!r}', name=name)
+    if _profiler is not None:
+        _profiler._phase(name, 'load')
+    if parent_spec:
+        # Temporarily add child we are currently importing to parent's
+        # _uninitialized_submodules for circular import tracking.
+        child = name.rpartition('.')[2]
+        parent_spec._uninitialized_submodules.append(child)
+    try:
+        return _load_unlocked(spec)
+    finally:
+        if parent_spec:
+            parent_spec._uninitialized_submodules.pop()
+
+
 _NEEDS_LOADING = object()
 
 
@@ -755,10 +755,15 @@ def create_module(self, spec):
 
     def exec_module(self, module):
         """Execute the module."""
+        profiler = _bootstrap._profiler
+        if profiler is not None:
+            profiler._phase(module.__name__, 'load')
         code = self.get_code(module.__name__)
         if code is None:
             raise ImportError(f'cannot load module {module.__name__!r} when '
                               'get_code() returns None')
+        if profiler is not None:
+            profiler._phase(module.__name__, 'exec')
         _bootstrap._call_with_frames_removed(exec, code, module.__dict__)
 
     def load_module(self, fullname):
@@ -1322,6 +1327,100 @@ def find_distributions(*args, **kwargs):
         return MetadataPathFinder.find_distributions(*args, **kwargs)
 
 
+# Format of the persistent directory cache.
+_DIRECTORY_CACHE_VERSION = 1
+# A directory modified less than this number of seconds before it is listed is
+# not stored in the persistent cache, since another change made within the
+# resolution of its mtime would not be noticed by later runs.
+_DIRECTORY_CACHE_MIN_AGE = 2
+
+_directory_cache = None
+
+
+class _DirectoryCache:
+
+    """Persistent cache of the directory listings made by FileFinder.
+
+    The listings are stored in a file shared by successive runs of the
+    interpreter, with the mtime of each directory.  A listing is only used
+    if the directory still has the same mtime.  The site module stores the
+    .pth files of the site directories under ('site', path) keys, and
+    zipimport the directory index of archives under ('zipimport', path) keys.
+
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._entries = None
+        self._changed = set()
+
+    def _read(self):
+        try:
+            with _io.FileIO(self.filename, 'r') as file:
+                data = file.readall()
+            version, entries = marshal.loads(data, allow_code=False)
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+        if version != _DIRECTORY_CACHE_VERSION or type(entries) is not dict:
+            return {}
+        for path, entry in entries.items():
+            if (type(path) not in (str, tuple) or type(entry) is not tuple
+                    or len(entry) != 2 or type(entry[1]) is not tuple):
+                return {}
+        return entries
+
+    def get(self, path, mtime):
+        """Return the cached contents of a directory, or None."""
+        if self._entries is None:
+            self._entries = self._read()
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        return None
+
+    def get_entry(self, path):
+        """Return the cached (mtime, contents) of a directory, or None."""
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries.get(path)
+
+    def put(self, path, mtime, contents):
+        """Store the contents of a directory listed by the caller."""
+        import time
+        if time.time() - mtime < _DIRECTORY_CACHE_MIN_AGE:
+            return
+        if self._entries is None:
+            self._entries = self._read()
+        self._entries[path] = (mtime, tuple(contents))
+        self._changed.add(path)
+
+    def discard(self, path):
+        if self._entries is not None and path in self._entries:
+            del self._entries[path]
+            self._changed.add(path)
+
+    def save(self):
+        """Write the changed listings to the cache file.
+
+        The listings stored by other processes in the meantime are kept.
+        """
+        if not self._changed:
+            return
+        entries = self._read()
+        for path in self._changed:
+            try:
+                entries[path] = self._entries[path]
+            except KeyError:
+                entries.pop(path, None)
+        self._changed.clear()
+        data = marshal.dumps((_DIRECTORY_CACHE_VERSION, entries))
+        try:
+            _write_atomic(self.filename, data)
+        except OSError:
+            # The cache is only an optimization.
+            pass
+
+
 class FileFinder:
 
     """File-based finder.
@@ -1351,6 +1450,8 @@ def __init__(self, path, *loader_details):
     def invalidate_caches(self):
         """Invalidate the directory mtime."""
         self._path_mtime = -1
+        if _directory_cache is not None:
+            _directory_cache.discard(self.path)
 
     def _get_spec(self, loader_class, fullname, path, smsl, target):
         loader = loader_class(fullname, path)
@@ -1369,7 +1470,7 @@ def find_spec(self, fullname, target=None):
         except OSError:
             mtime = -1
         if mtime != self._path_mtime:
-            self._fill_cache()
+            self._fill_cache(mtime)
             self._path_mtime = mtime
         # tail_module keeps the original casing, for __file__ and friends
         if _relax_case():
@@ -1408,15 +1509,23 @@ def find_spec(self, fullname, target=None):
             return spec
         return None
 
-    def _fill_cache(self):
+    def _fill_cache(self, mtime=-1):
         """Fill the cache of potential modules and packages for this directory."""
         path = self.path
-        try:
-            contents = _os.listdir(path or _os.getcwd())
-        except (FileNotFoundError, PermissionError, NotADirectoryError):
-            # Directory has either been removed, turned into a file, or made
-            # unreadable.
-            contents = []
+        directory_cache = _directory_cache if mtime != -1 else None
+        contents = None
+        if directory_cache is not None:
+            contents = directory_cache.get(path, mtime)
+        if contents is None:
+            try:
+                contents = _os.listdir(path or _os.getcwd())
+            except (FileNotFoundError, PermissionError, NotADirectoryError):
+                # Directory has either been removed, turned into a file, or made
+                # unreadable.
+                contents = []
+            else:
+                if directory_cache is not None:
+                    directory_cache.put(path, mtime, contents)
         # We store two cached versions, to handle runtime changes of the
         # PYTHONCASEOK environment variable.
         if not sys.platform.startswith('win'):
@@ -1551,9 +1660,33 @@ def _set_bootstrap_module(_bootstrap_module):
     _bootstrap = _bootstrap_module
 
 
+def _directory_cache_filename():
+    """Return the file of the persistent directory cache, or None.
+
+    It is set by the -X importcache=FILE option or the PYTHONIMPORTCACHE
+    environment variable.
+    """
+    filename = sys._xoptions.get('importcache')
+    if filename is None and not sys.flags.ignore_environment:
+        key = 'PYTHONIMPORTCACHE' if _MS_WINDOWS else b'PYTHONIMPORTCACHE'
+        filename = _os.environ.get(key)
+        if isinstance(filename, bytes):
+            filename = filename.decode(sys.getfilesystemencoding(),
+                                       sys.getfilesystemencodeerrors())
+    if not filename or not isinstance(filename, str):
+        return None
+    return _path_abspath(filename)
+
+
 def _install(_bootstrap_module):
     """Install the path-based import components."""
+    global _directory_cache
     _set_bootstrap_module(_bootstrap_module)
+    filename = _directory_cache_filename()
+    if filename is not None:
+        import atexit
+        _directory_cache = _DirectoryCache(filename)
+        atexit.register(_directory_cache.save)
     supported_loaders = _get_supported_file_loaders()
     sys.path_hooks.extend([FileFinder.path_hook(*supported_loaders)])
     sys.meta_path.append(PathFinder)
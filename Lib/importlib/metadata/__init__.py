@@ -12,6 +12,7 @@
 import zipfile
 import operator
 import textwrap
+import weakref
 import warnings
 import functools
 import itertools
@@ -332,14 +333,7 @@ def __repr__(self) -> str:
 class DeprecatedNonAbstract:
     # Required until Python 3.14
     def __new__(cls, *args, **kwargs):
-        all_names = {
-            name for subclass in inspect.getmro(cls) for name in vars(subclass)
-        }
-        abstract = {
-            name
-            for name in all_names
-            if getattr(getattr(cls, name), '__isabstractmethod__', False)
-        }
+        abstract = _abstract_methods(cls)
         if abstract:
             warnings.warn(
                 f"Unimplemented abstract methods {abstract}",
@@ -349,6 +343,25 @@ def __new__(cls, *args, **kwargs):
         return super().__new__(cls)
 
 
+# The unimplemented abstract methods of the classes instantiated, which are
+# computed once per class (a distribution is created per metadata path).
+_abstract_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _abstract_methods(cls):
+    try:
+        return _abstract_cache[cls]
+    except KeyError:
+        pass
+    all_names = {name for subclass in inspect.getmro(cls) for name in vars(subclass)}
+    abstract = _abstract_cache[cls] = frozenset(
+        name
+        for name in all_names
+        if getattr(getattr(cls, name), '__isabstractmethod__', False)
+    )
+    return abstract
+
+
 class Distribution(DeprecatedNonAbstract):
     """
     An abstract Python distribution package.
@@ -495,6 +508,14 @@ def entry_points(self) -> EntryPoints:
         """
         return EntryPoints._from_text_for(self.read_text('entry_points.txt'), self)
 
+    def _select_entry_points(self, group=None):
+        """
+        Return the EntryPoints for this distribution in group
+        (or all of them if ``None`` indicated).
+        """
+        eps = self.entry_points
+        return eps if group is None else eps.select(group=group)
+
     @property
     def files(self) -> Optional[List[PackagePath]]:
         """Files in this distribution.
@@ -756,6 +777,9 @@ def zip_children(self):
     def search(self, name):
         return self.lookup(self.mtime).search(name)
 
+    def distributions(self, prepared):
+        return self.lookup(self.mtime).distributions(prepared)
+
     @property
     def mtime(self):
         with suppress(OSError):
@@ -801,6 +825,11 @@ def __init__(self, path: FastPath):
         self.infos.freeze()
         self.eggs.freeze()
 
+        # The metadata read from the distributions found, kept as long as
+        # the lookup is current (the mtime of the root is unchanged).
+        self._texts = {}
+        self._entry_points = {}
+
     def search(self, prepared: Prepared):
         """
         Yield all infos and eggs matching the Prepared query.
@@ -817,6 +846,43 @@ def search(self, prepared: Prepared):
         )
         return itertools.chain(infos, eggs)
 
+    def distributions(self, prepared: Prepared):
+        """
+        Yield a PathDistribution for all infos and eggs matching the
+        Prepared query, sharing the metadata cached by this lookup.
+        """
+        for path in self.search(prepared):
+            yield PathDistribution(path, _lookup=self)
+
+    def read_text(self, dist, filename):
+        """
+        Return the text of filename in the metadata of dist, read once.
+        """
+        key = str(dist._path), filename
+        try:
+            return self._texts[key]
+        except KeyError:
+            pass
+        text = self._texts[key] = dist._read_text(filename)
+        return text
+
+    def entry_points(self, dist):
+        """
+        Return the entry points of dist as a dict mapping the groups
+        to lists of (name, value) pairs, parsed once.
+        """
+        key = str(dist._path)
+        try:
+            return self._entry_points[key]
+        except KeyError:
+            pass
+        groups = {}
+        text = dist.read_text('entry_points.txt') or ''
+        for item in Sectioned.section_pairs(text):
+            groups.setdefault(item.name, []).append(item.value)
+        self._entry_points[key] = groups
+        return groups
+
 
 class Prepared:
     """
@@ -880,8 +946,10 @@ def find_distributions(
         (or all names if ``None`` indicated) along the paths in the list
         of directories ``context.path``.
         """
-        found = cls._search_paths(context.name, context.path)
-        return map(PathDistribution, found)
+        prepared = Prepared(context.name)
+        return itertools.chain.from_iterable(
+            path.distributions(prepared) for path in map(FastPath, context.path)
+        )
 
     @classmethod
     def _search_paths(cls, name, paths):
@@ -897,14 +965,25 @@ def invalidate_caches(cls) -> None:
 
 
 class PathDistribution(Distribution):
-    def __init__(self, path: SimplePath) -> None:
+    # The metadata files read through the lookup of the path entry.
+    _cached_files = frozenset({'METADATA', 'PKG-INFO', 'entry_points.txt', ''})
+
+    def __init__(self, path: SimplePath, _lookup=None) -> None:
         """Construct a distribution.
 
         :param path: SimplePath indicating the metadata directory.
         """
         self._path = path
+        self._lookup = _lookup
 
     def read_text(self, filename: str | os.PathLike[str]) -> Optional[str]:
+        if self._lookup is not None and filename in self._cached_files:
+            return self._lookup.read_text(self, filename)
+        return self._read_text(filename)
+
+    read_text.__doc__ = Distribution.read_text.__doc__
+
+    def _read_text(self, filename):
         with suppress(
             FileNotFoundError,
             IsADirectoryError,
@@ -916,7 +995,22 @@ def read_text(self, filename: str | os.PathLike[str]) -> Optional[str]:
 
         return None
 
-    read_text.__doc__ = Distribution.read_text.__doc__
+    def _select_entry_points(self, group=None):
+        """
+        Performance optimization: build the EntryPoint objects of
+        group only, from the entry points parsed by the lookup.
+        """
+        if self._lookup is None or type(self).entry_points is not (
+            Distribution.entry_points
+        ):
+            return super()._select_entry_points(group)
+        groups = self._lookup.entry_points(self)
+        selected = groups.items() if group is None else [(group, groups.get(group, ()))]
+        return EntryPoints(
+            EntryPoint(pair.name, pair.value, name)._for(self)
+            for name, pairs in selected
+            for pair in pairs
+        )
 
     def locate_file(self, path: str | os.PathLike[str]) -> SimplePath:
         return self._path.parent / path
@@ -1005,8 +1099,9 @@ def entry_points(**params) -> EntryPoints:
 
     :return: EntryPoints for all installed packages.
     """
+    group = params.get('group')
     eps = itertools.chain.from_iterable(
-        dist.entry_points for dist in _unique(distributions())
+        dist._select_entry_points(group) for dist in _unique(distributions())
     )
     return EntryPoints(eps).select(**params)
 
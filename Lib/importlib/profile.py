@@ -0,0 +1,311 @@
+"""Profiling of imports.
+
+ImportProfiler records the time spent finding, loading and executing each
+module imported while it is active, optionally the memory allocated by
+each import, and which module imported which.  The profile can be printed
+as a tree, exported in the collapsed stack format of flame graph tools, or
+written as a pstats file.
+
+"""
+from . import _bootstrap
+
+import _thread
+import marshal
+import sys
+from time import perf_counter
+
+
+__all__ = ['ImportProfiler', 'ImportRecord']
+
+
+class ImportRecord:
+
+    """The profile of the import of a module.
+
+    find_time, load_time and exec_time are the times in seconds spent
+    finding the spec of the module, creating the module and loading its
+    code, and executing it, excluding the imports nested in them.
+    total_time includes the nested imports.  memory is the size in bytes of
+    the memory allocated by the import, nested imports included, and not
+    freed at its end; it is None if memory was not traced.
+
+    """
+
+    def __init__(self, name, parent):
+        self.name = name
+        self.parent = parent
+        self.children = []
+        self.origin = None
+        self.succeeded = False
+        self.find_time = 0.0
+        self.load_time = 0.0
+        self.exec_time = 0.0
+        self.total_time = 0.0
+        self.memory = None
+
+    @property
+    def self_time(self):
+        """The time in seconds spent in this import, excluding the imports
+        nested in it."""
+        return self.find_time + self.load_time + self.exec_time
+
+    @property
+    def path(self):
+        """The list of the names of the imports from the first import to
+        this one."""
+        names = []
+        record = self
+        while record is not None:
+            names.append(record.name)
+            record = record.parent
+        names.reverse()
+        return names
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__} {self.name!r} '
+                f'total_time={self.total_time:.6f}>')
+
+
+class _Frame:
+
+    # An import in progress in a thread.
+    __slots__ = ('record', 'phase', 'phase_start', 'nested', 'start',
+                 'memory')
+
+    def __init__(self, record, now, memory):
+        self.record = record
+        self.phase = 'find'
+        self.phase_start = now
+        self.nested = 0.0
+        self.start = now
+        self.memory = memory
+
+
+class ImportProfiler:
+
+    """Profile the imports done while it is active.
+
+    If trace_memory is true, the memory allocated by each import is traced
+    with tracemalloc, which is started if it is not tracing yet.
+
+    """
+
+    def __init__(self, *, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.records = []
+        self.roots = []
+        self.stats = {}
+        self._stacks = {}
+        self._get_traced_memory = None
+        self._stop_tracemalloc = False
+
+    def start(self):
+        """Start profiling the imports of all the threads."""
+        if _bootstrap._profiler is not None:
+            raise RuntimeError('another import profiler is active')
+        if self.trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._stop_tracemalloc = True
+            self._get_traced_memory = tracemalloc.get_traced_memory
+        _bootstrap._profiler = self
+
+    def stop(self):
+        """Stop profiling.  The imports in progress are not recorded."""
+        if _bootstrap._profiler is self:
+            _bootstrap._profiler = None
+        self._stacks.clear()
+        if self._stop_tracemalloc:
+            import tracemalloc
+            tracemalloc.stop()
+            self._stop_tracemalloc = False
+        self._get_traced_memory = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _memory(self):
+        get_traced_memory = self._get_traced_memory
+        if get_traced_memory is None:
+            return None
+        return get_traced_memory()[0]
+
+    # The methods called by the import system.
+
+    def _enter(self, name):
+        memory = self._memory()
+        stack = self._stacks.setdefault(_thread.get_ident(), [])
+        parent = stack[-1].record if stack else None
+        record = ImportRecord(name, parent)
+        stack.append(_Frame(record, perf_counter(), memory))
+
+    def _close_phase(self, frame, now):
+        elapsed = now - frame.phase_start - frame.nested
+        record = frame.record
+        if frame.phase == 'find':
+            record.find_time += elapsed
+        elif frame.phase == 'load':
+            record.load_time += elapsed
+        else:
+            record.exec_time += elapsed
+        frame.phase_start = now
+        frame.nested = 0.0
+
+    def _phase(self, name, phase):
+        now = perf_counter()
+        stack = self._stacks.get(_thread.get_ident())
+        if not stack or stack[-1].record.name != name:
+            return
+        frame = stack[-1]
+        self._close_phase(frame, now)
+        frame.phase = phase
+
+    def _exit(self, name, succeeded):
+        now = perf_counter()
+        stack = self._stacks.get(_thread.get_ident())
+        if not stack or stack[-1].record.name != name:
+            return
+        frame = stack.pop()
+        self._close_phase(frame, now)
+        record = frame.record
+        record.succeeded = succeeded
+        record.total_time = now - frame.start
+        if frame.memory is not None:
+            memory = self._memory()
+            if memory is not None:
+                record.memory = memory - frame.memory
+        if succeeded:
+            spec = getattr(sys.modules.get(name), '__spec__', None)
+            record.origin = getattr(spec, 'origin', None)
+        self.records.append(record)
+        if stack:
+            stack[-1].nested += record.total_time
+            stack[-1].record.children.append(record)
+        else:
+            self.roots.append(record)
+
+    # Exports.
+
+    def print_tree(self, file=None):
+        """Print the imports as a tree, with their self and cumulative
+        times in microseconds, and their memory in bytes if it was traced.
+        """
+        if file is None:
+            file = sys.stdout
+        memory = self.trace_memory
+        header = 'self [us] | cumulative | '
+        if memory:
+            header += ' memory [B] | '
+        print(header + 'imported package', file=file)
+
+        def print_record(record, level):
+            line = (f'{record.self_time * 1e6:9.0f} | '
+                    f'{record.total_time * 1e6:10.0f} | ')
+            if memory:
+                line += f'{record.memory or 0:11} | '
+            line += '  ' * level + record.name
+            if not record.succeeded:
+                line += ' (failed)'
+            print(line, file=file)
+            for child in record.children:
+                print_record(child, level + 1)
+
+        for root in self.roots:
+            print_record(root, 0)
+
+    def collapsed(self, *, memory=False):
+        """Return the imports in the collapsed stack format.
+
+        Each line holds the names of the nested imports separated by
+        semicolons and the self time of the last one in microseconds, or
+        its memory in bytes excluding the nested imports if memory is
+        true.
+        """
+        lines = []
+        for record in self.records:
+            if memory:
+                if record.memory is None:
+                    continue
+                nested = sum(child.memory or 0 for child in record.children)
+                value = record.memory - nested
+            else:
+                value = round(record.self_time * 1e6)
+            lines.append(f'{";".join(record.path)} {value}\n')
+        return ''.join(lines)
+
+    @staticmethod
+    def _label(record):
+        return (record.origin or '~', 0, f'<import {record.name}>')
+
+    def create_stats(self):
+        """Set the stats attribute to the profile in the format of the
+        pstats module.  pstats.Stats() accepts the profiler directly.
+        """
+        stats = {}
+        for record in self.records:
+            label = self._label(record)
+            cc, nc, tt, ct, callers = stats.get(label, (0, 0, 0.0, 0.0, {}))
+            if record.parent is not None:
+                caller = self._label(record.parent)
+                c_cc, c_nc, c_tt, c_ct = callers.get(caller, (0, 0, 0.0, 0.0))
+                callers[caller] = (c_cc + 1, c_nc + 1,
+                                   c_tt + record.self_time,
+                                   c_ct + record.total_time)
+            stats[label] = (cc + 1, nc + 1, tt + record.self_time,
+                            ct + record.total_time, callers)
+        self.stats = stats
+
+    def dump_stats(self, file):
+        """Write the profile to file in the format of the pstats module."""
+        self.create_stats()
+        with open(file, 'wb') as f:
+            marshal.dump(self.stats, f)
+
+
+def _main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m importlib.profile',
+        description='Import modules and profile their imports.')
+    parser.add_argument('-o', '--output', metavar='FILE',
+                        help='write the profile to FILE instead of stdout')
+    parser.add_argument('-f', '--format', default='tree',
+                        choices=['tree', 'collapsed', 'pstats'],
+                        help='the format of the profile (default: tree); '
+                             'pstats requires -o')
+    parser.add_argument('--memory', action='store_true',
+                        help='trace the memory allocated by the imports')
+    parser.add_argument('modules', nargs='+', metavar='module',
+                        help='the modules to import')
+    args = parser.parse_args(argv)
+    if args.format == 'pstats' and args.output is None:
+        parser.error('the pstats format requires -o')
+    profiler = ImportProfiler(trace_memory=args.memory)
+    with profiler:
+        for name in args.modules:
+            __import__(name)
+    if args.format == 'pstats':
+        profiler.dump_stats(args.output)
+        return
+    if args.output is None:
+        output = sys.stdout
+    else:
+        output = open(args.output, 'w', encoding='utf-8')
+    try:
+        if args.format == 'tree':
+            profiler.print_tree(output)
+        else:
+            output.write(profiler.collapsed(memory=args.memory))
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == '__main__':
+    _main()
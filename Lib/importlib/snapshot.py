@@ -0,0 +1,283 @@
+"""Snapshots of the code of imported modules.
+
+A snapshot is a single file holding the code objects of the modules
+imported by an application, indexed by module name.  SnapshotFinder serves
+these modules from the snapshot, which it maps into memory, so that
+importing them neither searches sys.path nor reads their bytecode cache.
+
+"""
+from ._bootstrap import ModuleSpec
+from ._bootstrap_external import MAGIC_NUMBER
+from ._bootstrap_external import ExtensionFileLoader
+from ._bootstrap_external import _write_atomic
+from ._bootstrap_external import decode_source
+
+import marshal
+import os
+import sys
+
+
+__all__ = ['SnapshotError', 'SnapshotFinder', 'SnapshotLoader',
+           'create', 'install']
+
+
+# The snapshot file starts with a header made of SNAPSHOT_MAGIC, the magic
+# number of the bytecode, and the offset and the size of the index.  The
+# index is a marshalled dict mapping the module names to tuples
+#     (offset, size, origin, search_locations, source_mtime, source_size)
+# where offset and size locate the marshalled code object of the module.
+SNAPSHOT_MAGIC = b'PYSNAP\r\n'
+_HEADER_SIZE = len(SNAPSHOT_MAGIC) + len(MAGIC_NUMBER) + 16
+
+
+class SnapshotError(ImportError):
+
+    """Raised when a snapshot cannot be read."""
+
+
+def _source_stamp(origin):
+    st = os.stat(origin)
+    return int(st.st_mtime) & 0xFFFFFFFF, st.st_size & 0xFFFFFFFF
+
+
+def _snapshot_modules(modules):
+    seen = set()
+    for module in modules:
+        spec = getattr(module, '__spec__', None)
+        if spec is None or spec.name in seen or spec.name == '__main__':
+            continue
+        loader = spec.loader
+        # Only the modules loaded from a file have code which can be
+        # checked against their source.
+        if (not spec.has_location or spec.origin is None
+                or not hasattr(loader, 'get_code')
+                or isinstance(loader, ExtensionFileLoader)):
+            continue
+        try:
+            code = loader.get_code(spec.name)
+            stamp = _source_stamp(spec.origin)
+        except (ImportError, OSError):
+            continue
+        if code is None:
+            continue
+        seen.add(spec.name)
+        yield spec, code, stamp
+
+
+def create(filename, modules=None):
+    """Write a snapshot of the code of modules to filename.
+
+    modules is an iterable of module objects, sys.modules.values() by
+    default.  Only the modules loaded from a file are included.  Return the
+    list of the names of the included modules.
+
+    """
+    if modules is None:
+        modules = list(sys.modules.values())
+    entries = []
+    for spec, code, (mtime, size) in _snapshot_modules(modules):
+        locations = spec.submodule_search_locations
+        if locations is not None:
+            locations = tuple(locations)
+        entries.append((spec.name, marshal.dumps(code), spec.origin,
+                        locations, mtime, size))
+    return _write(filename, entries)
+
+
+def _write(filename, entries):
+    # Write the snapshot of entries
+    #     (name, marshalled code, origin, search_locations, mtime, size)
+    # and return the list of the names.
+    index = {}
+    chunks = []
+    offset = _HEADER_SIZE
+    for name, data, origin, locations, mtime, size in entries:
+        index[name] = (offset, len(data), origin, locations, mtime, size)
+        chunks.append(data)
+        offset += len(data)
+    index_data = marshal.dumps(index)
+    header = (SNAPSHOT_MAGIC + MAGIC_NUMBER +
+              offset.to_bytes(8, 'little') +
+              len(index_data).to_bytes(8, 'little'))
+    _write_atomic(os.fspath(filename),
+                  b''.join([header, *chunks, index_data]))
+    return list(index)
+
+
+class SnapshotLoader:
+
+    """Loader for the modules of a snapshot."""
+
+    def __init__(self, finder, name, entry):
+        self._finder = finder
+        self.name = name
+        self._entry = entry
+        self.path = entry[2]
+
+    def create_module(self, spec):
+        """Use default semantics for module creation."""
+
+    def exec_module(self, module):
+        """Execute the module from its code in the snapshot."""
+        code = self.get_code(module.__spec__.name)
+        exec(code, module.__dict__)
+
+    def _check_name(self, fullname):
+        if fullname != self.name:
+            raise ImportError(f'loader for {self.name} cannot handle '
+                              f'{fullname}', name=fullname)
+
+    def get_code(self, fullname):
+        """Return the code object of the module from the snapshot."""
+        self._check_name(fullname)
+        offset, size = self._entry[:2]
+        return self._finder._load_code(fullname, offset, size)
+
+    def get_source(self, fullname):
+        """Return the source of the module, or None if it cannot be read."""
+        self._check_name(fullname)
+        try:
+            with open(self.path, 'rb') as file:
+                return decode_source(file.read())
+        except OSError:
+            return None
+
+    def get_filename(self, fullname):
+        """Return the path of the source of the module."""
+        self._check_name(fullname)
+        return self.path
+
+    def is_package(self, fullname):
+        """Return whether the module is a package."""
+        self._check_name(fullname)
+        return self._entry[3] is not None
+
+
+class SnapshotFinder:
+
+    """Meta path finder for the modules of a snapshot.
+
+    If check_source is true, a module is only served from the snapshot if
+    its source file has the modification time and size it had when the
+    snapshot was created; otherwise it is left to the following finders.
+
+    """
+
+    def __init__(self, filename, *, check_source=True):
+        self.filename = os.fspath(filename)
+        self.check_source = check_source
+        with open(self.filename, 'rb') as file:
+            try:
+                import mmap
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ImportError, OSError, ValueError):
+                data = file.read()
+        self._data = data
+        self._view = memoryview(data)
+        try:
+            self._index = self._read_index()
+        except BaseException:
+            self.close()
+            raise
+
+    def _read_index(self):
+        header = bytes(self._view[:_HEADER_SIZE])
+        magic_end = len(SNAPSHOT_MAGIC)
+        if (len(header) != _HEADER_SIZE
+                or header[:magic_end] != SNAPSHOT_MAGIC):
+            raise SnapshotError(f'not a snapshot: {self.filename!r}',
+                                path=self.filename)
+        pos = magic_end + len(MAGIC_NUMBER)
+        if header[magic_end:pos] != MAGIC_NUMBER:
+            raise SnapshotError(f'snapshot {self.filename!r} was created by '
+                                f'another version of Python',
+                                path=self.filename)
+        offset = int.from_bytes(header[pos:pos+8], 'little')
+        size = int.from_bytes(header[pos+8:pos+16], 'little')
+        if offset + size != len(self._view):
+            raise SnapshotError(f'truncated snapshot: {self.filename!r}',
+                                path=self.filename)
+        try:
+            index = marshal.loads(self._view[offset:offset+size])
+        except (ValueError, EOFError, TypeError):
+            index = None
+        if not isinstance(index, dict):
+            raise SnapshotError(f'bad snapshot index: {self.filename!r}',
+                                path=self.filename)
+        return index
+
+    def close(self):
+        """Release the snapshot.  Its modules cannot be imported anymore."""
+        self._index = {}
+        self._view.release()
+        if hasattr(self._data, 'close'):
+            self._data.close()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.filename!r})'
+
+    def _load_code(self, fullname, offset, size):
+        try:
+            code = marshal.loads(self._view[offset:offset+size])
+        except (ValueError, EOFError, TypeError) as exc:
+            raise SnapshotError(f'bad code of {fullname!r} in snapshot '
+                                f'{self.filename!r}', name=fullname,
+                                path=self.filename) from exc
+        return code
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Return the spec of the module if it is in the snapshot."""
+        entry = self._index.get(fullname)
+        if entry is None:
+            return None
+        origin, locations, mtime, size = entry[2:]
+        if self.check_source:
+            try:
+                if _source_stamp(origin) != (mtime, size):
+                    return None
+            except OSError:
+                return None
+        loader = SnapshotLoader(self, fullname, entry)
+        spec = ModuleSpec(fullname, loader, origin=origin,
+                          is_package=locations is not None)
+        spec.has_location = True
+        if locations is not None:
+            spec.submodule_search_locations.extend(locations)
+        return spec
+
+    def modules(self):
+        """Return the names of the modules in the snapshot."""
+        return list(self._index)
+
+
+def install(filename, *, check_source=True):
+    """Serve the modules of the snapshot filename before the other finders.
+
+    Return the SnapshotFinder added to sys.meta_path.
+
+    """
+    finder = SnapshotFinder(filename, check_source=check_source)
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+def _main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m importlib.snapshot',
+        description='Import modules and write a snapshot of the code of all '
+                    'the modules imported.')
+    parser.add_argument('-o', '--output', required=True,
+                        help='the snapshot file to write')
+    parser.add_argument('modules', nargs='+', metavar='module',
+                        help='the modules to import')
+    args = parser.parse_args(argv)
+    for name in args.modules:
+        __import__(name)
+    names = create(args.output, list(sys.modules.values()))
+    print(f'{len(names)} modules written to {args.output}')
+
+
+if __name__ == '__main__':
+    _main()
@@ -4,11 +4,14 @@
 from ._bootstrap import _resolve_name
 from ._bootstrap import spec_from_loader
 from ._bootstrap import _find_spec
+from ._bootstrap import _verbose_message
+from ._bootstrap import BuiltinImporter
 from ._bootstrap_external import MAGIC_NUMBER
 from ._bootstrap_external import cache_from_source
 from ._bootstrap_external import decode_source
 from ._bootstrap_external import source_from_cache
 from ._bootstrap_external import spec_from_file_location
+from ._bootstrap_external import ExtensionFileLoader
 
 import _imp
 import sys
@@ -172,6 +175,21 @@ def __getattribute__(self, attr):
         """Trigger the load of the module and return the attribute."""
         __spec__ = object.__getattribute__(self, '__spec__')
         loader_state = __spec__.loader_state
+        # The import system looks up __spec__ and __path__ to import the
+        # module again or to import its submodules, which does not need the
+        # module to be executed.  Neither do the attributes set on the module
+        # since it was made lazy, as they are restored after the load.
+        if attr == '__spec__':
+            return __spec__
+        if attr == '__path__' and __spec__.submodule_search_locations is None:
+            raise AttributeError(f'module {__spec__.name!r} has no attribute '
+                                 f"'__path__'")
+        __dict__ = object.__getattribute__(self, '__dict__')
+        if attr in __dict__:
+            attrs_then = loader_state['__dict__']
+            if (attr == '__path__' or attr not in attrs_then
+                    or __dict__[attr] is not attrs_then[attr]):
+                return __dict__[attr]
         with loader_state['lock']:
             # Only the first thread to get the lock should trigger the load
             # and reset the module's class. The rest can now getattr().
@@ -185,6 +203,10 @@ def __getattribute__(self, attr):
                 if loader_state['is_loading']:
                     return __class__.__getattribute__(self, attr)
                 loader_state['is_loading'] = True
+                if loader_state.get('report'):
+                    _report_eager_import(__spec__.name,
+                                         f'attribute {attr!r} accessed'
+                                         f'{_caller_location()}')
 
                 __dict__ = __class__.__getattribute__(self, '__dict__')
 
@@ -273,7 +295,133 @@ def exec_module(self, module):
         module.__class__ = _LazyModule
 
 
+def _caller_location():
+    """Return where the code outside importlib accessing a module is."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        name = frame.f_globals.get('__name__', '')
+        if name != 'importlib' and not name.startswith('importlib.'):
+            return f' at {frame.f_code.co_filename}:{frame.f_lineno}'
+        frame = frame.f_back
+    return ''
+
+
+_eager_imports = {}
+
+
+def _report_eager_import(name, reason):
+    _eager_imports.setdefault(name, reason)
+    _verbose_message('lazy import {!r} made eager: {}', name, reason)
+
+
+class _LazyImportLoader(LazyLoader):
+
+    """A lazy loader which reports the load of the module."""
+
+    def exec_module(self, module):
+        spec = module.__spec__
+        super().exec_module(module)
+        spec.loader_state['report'] = True
+
+
+class _LazyImportFinder:
+
+    """A meta path finder which makes the imports of some modules lazy."""
+
+    def __init__(self):
+        self.modules = set()
+        self.exclude = set()
+
+    def _is_lazy(self, name):
+        # The longest matching prefix decides.
+        while name:
+            if name in self.exclude:
+                return False
+            if name in self.modules:
+                return True
+            name = name.rpartition('.')[0]
+        return False
+
+    def find_spec(self, name, path=None, target=None):
+        if target is not None or not self._is_lazy(name):
+            return None
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            try:
+                find_spec = finder.find_spec
+            except AttributeError:
+                continue
+            spec = find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        if loader is None or isinstance(loader, LazyLoader):
+            pass
+        elif not hasattr(loader, 'exec_module'):
+            _report_eager_import(name, 'the loader does not define '
+                                       'exec_module()')
+        elif (loader is BuiltinImporter
+                or isinstance(loader, ExtensionFileLoader)):
+            _report_eager_import(name, 'extension module')
+        else:
+            spec.loader = _LazyImportLoader(loader)
+        return spec
+
+
+_lazy_import_finder = None
+
+
+def enable_lazy_imports(*modules, exclude=()):
+    """Make the imports of the named modules and of their submodules lazy.
+
+    The modules are created on import and executed on the first access to
+    one of their attributes, as with LazyLoader.  The submodules of the
+    modules named in 'exclude' are imported eagerly; the longest matching
+    name decides.  Calling the function again adds to the names.
+
+    """
+    global _lazy_import_finder
+    for name in (*modules, *exclude):
+        if not isinstance(name, str):
+            raise TypeError(f'module names must be str, not '
+                            f'{type(name).__name__}')
+    finder = _lazy_import_finder
+    if finder is None:
+        finder = _lazy_import_finder = _LazyImportFinder()
+    for name in modules:
+        finder.exclude.discard(name)
+        finder.modules.add(name)
+    for name in exclude:
+        finder.modules.discard(name)
+        finder.exclude.add(name)
+    if finder not in sys.meta_path:
+        sys.meta_path.insert(0, finder)
+
+
+def disable_lazy_imports():
+    """Stop making imports lazy.
+
+    The modules which are already lazy stay lazy.
+
+    """
+    global _lazy_import_finder
+    finder = _lazy_import_finder
+    _lazy_import_finder = None
+    if finder in sys.meta_path:
+        sys.meta_path.remove(finder)
+
+
+def eager_imports():
+    """Return a dict mapping the modules selected by enable_lazy_imports()
+    which were executed to the reason why."""
+    return dict(_eager_imports)
+
+
 __all__ = ['LazyLoader', 'Loader', 'MAGIC_NUMBER',
-           'cache_from_source', 'decode_source', 'find_spec',
+           'cache_from_source', 'decode_source', 'disable_lazy_imports',
+           'eager_imports', 'enable_lazy_imports', 'find_spec',
            'module_from_spec', 'resolve_name', 'source_from_cache',
            'source_hash', 'spec_from_file_location', 'spec_from_loader']
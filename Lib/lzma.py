@@ -34,6 +34,8 @@
 # Value 2 no longer used
 _MODE_WRITE    = 3
 
+_PARALLEL_BLOCK_SIZE = 4 * 1024 * 1024
+
 
 class LZMAFile(_streams.BaseStream):
 
@@ -47,7 +49,8 @@ class LZMAFile(_streams.BaseStream):
     """
 
     def __init__(self, filename=None, mode="r", *,
-                 format=None, check=-1, preset=None, filters=None):
+                 format=None, check=-1, preset=None, filters=None,
+                 threads=None):
         """Open an LZMA-compressed file in binary mode.
 
         filename can be either an actual file name (given as a str,
@@ -89,6 +92,12 @@ def __init__(self, filename=None, mode="r", *,
         filters (if provided) should be a sequence of dicts. Each dict
         should have an entry for "id" indicating ID of the filter, plus
         additional entries for options to the filter.
+
+        threads (if provided) is the number of worker threads to use, or 0
+        for one per CPU. When writing, the data is split into blocks that
+        are compressed in parallel as separate .xz streams; this requires
+        FORMAT_XZ. When reading a seekable .xz file consisting of several
+        streams, the streams are decompressed in parallel.
         """
         self._fp = None
         self._closefp = False
@@ -108,8 +117,19 @@ def __init__(self, filename=None, mode="r", *,
             if format is None:
                 format = FORMAT_XZ
             mode_code = _MODE_WRITE
-            self._compressor = LZMACompressor(format=format, check=check,
-                                              preset=preset, filters=filters)
+            threads = _streams.thread_count(threads)
+            if threads:
+                if format != FORMAT_XZ:
+                    raise ValueError("threads is only supported for FORMAT_XZ")
+                self._compressor = _streams.ParallelCompressor(
+                    lambda data, previous, final:
+                        _compress_stream(data, previous, check, preset,
+                                         filters),
+                    threads, _PARALLEL_BLOCK_SIZE)
+            else:
+                self._compressor = LZMACompressor(format=format, check=check,
+                                                  preset=preset,
+                                                  filters=filters)
             self._pos = 0
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
@@ -127,8 +147,16 @@ def __init__(self, filename=None, mode="r", *,
             raise TypeError("filename must be a str, bytes, file or PathLike object")
 
         if self._mode == _MODE_READ:
-            raw = _streams.DecompressReader(self._fp, LZMADecompressor,
-                trailing_error=LZMAError, format=format, filters=filters)
+            raw = None
+            threads = _streams.thread_count(threads)
+            if threads and format in (FORMAT_AUTO, FORMAT_XZ):
+                segments = _xz_streams(self._fp)
+                if segments is not None:
+                    raw = _streams.ParallelDecompressReader(self._fp,
+                        segments, _decompress_stream, threads)
+            if raw is None:
+                raw = _streams.DecompressReader(self._fp, LZMADecompressor,
+                    trailing_error=LZMAError, format=format, filters=filters)
             self._buffer = io.BufferedReader(raw)
 
     def close(self):
@@ -144,8 +172,13 @@ def close(self):
                 self._buffer.close()
                 self._buffer = None
             elif self._mode == _MODE_WRITE:
-                self._fp.write(self._compressor.flush())
-                self._compressor = None
+                try:
+                    self._fp.write(self._compressor.flush())
+                finally:
+                    if isinstance(self._compressor,
+                                  _streams.ParallelCompressor):
+                        self._compressor.close()
+                    self._compressor = None
         finally:
             try:
                 if self._closefp:
@@ -278,7 +311,7 @@ def tell(self):
 
 def open(filename, mode="rb", *,
          format=None, check=-1, preset=None, filters=None,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, threads=None):
     """Open an LZMA-compressed file in binary or text mode.
 
     filename can be either an actual file name (given as a str, bytes,
@@ -291,7 +324,7 @@ def open(filename, mode="rb", *,
 
     The format, check, preset and filters arguments specify the
     compression settings, as for LZMACompressor, LZMADecompressor and
-    LZMAFile.
+    LZMAFile. The threads argument is passed to LZMAFile.
 
     For binary mode, this function is equivalent to the LZMAFile
     constructor: LZMAFile(filename, mode, ...). In this case, the
@@ -315,7 +348,7 @@ def open(filename, mode="rb", *,
 
     lz_mode = mode.replace("t", "")
     binary_file = LZMAFile(filename, lz_mode, format=format, check=check,
-                           preset=preset, filters=filters)
+                           preset=preset, filters=filters, threads=threads)
 
     if "t" in mode:
         encoding = io.text_encoding(encoding)
@@ -362,3 +395,95 @@ def decompress(data, format=FORMAT_AUTO, memlimit=None, filters=None):
         if not data:
             break
     return b"".join(results)
+
+
+def _compress_stream(data, previous, check, preset, filters):
+    # Compress one block written by a multi-threaded LZMAFile as a complete
+    # .xz stream. Only an otherwise empty file needs an empty stream.
+    if not data and previous is not None:
+        return b""
+    return compress(data, FORMAT_XZ, check, preset, filters)
+
+
+def _decompress_stream(data):
+    decomp = LZMADecompressor(FORMAT_XZ)
+    result = decomp.decompress(data)
+    if not decomp.eof:
+        raise EOFError("Compressed file ended before the "
+                       "end-of-stream marker was reached")
+    return result
+
+
+def _read_vli(buf, pos):
+    # Decode a variable-length integer of an .xz index.
+    value = 0
+    for shift in range(0, 63, 7):
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+    raise ValueError("invalid variable-length integer")
+
+
+def _xz_streams(fp):
+    """Locate the streams of a seekable .xz file.
+
+    The stream footers and indexes are walked backwards from the end of
+    the file. Return a list of (offset, size) pairs, or None if the file
+    is not seekable, has a single stream, has a stream that is too large
+    to decompress in memory, or cannot be parsed this way.
+    """
+    try:
+        if not fp.seekable():
+            return None
+        start = fp.tell()
+        end = fp.seek(0, io.SEEK_END)
+    except (AttributeError, OSError):
+        return None
+    streams = []
+    try:
+        while end > start:
+            # Skip stream padding.
+            while end - start >= 4:
+                fp.seek(end - 4)
+                if fp.read(4) != bytes(4):
+                    break
+                end -= 4
+            if end - start < 24:
+                return None
+            fp.seek(end - 12)
+            footer = fp.read(12)
+            if footer[10:] != b"YZ":
+                return None
+            index_size = (int.from_bytes(footer[4:8], "little") + 1) * 4
+            index_start = end - 12 - index_size
+            if index_start < start + 12:
+                return None
+            fp.seek(index_start)
+            index = fp.read(index_size)
+            if index[0] != 0:
+                return None
+            count, pos = _read_vli(index, 1)
+            blocks_size = size = 0
+            for _ in range(count):
+                unpadded_size, pos = _read_vli(index, pos)
+                uncompressed_size, pos = _read_vli(index, pos)
+                blocks_size += (unpadded_size + 3) & ~3
+                size += uncompressed_size
+            offset = index_start - blocks_size - 12
+            if offset < start or size > _streams.PARALLEL_SEGMENT_LIMIT:
+                return None
+            fp.seek(offset)
+            if fp.read(6) != b"\xfd7zXZ\x00":
+                return None
+            streams.append((offset, end - offset))
+            end = offset
+    except (IndexError, ValueError):
+        return None
+    finally:
+        fp.seek(start)
+    if len(streams) < 2:
+        return None
+    streams.reverse()
+    return streams
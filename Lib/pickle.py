@@ -30,13 +30,14 @@
 from functools import partial
 import sys
 from sys import maxsize
-from struct import pack, unpack
+from struct import pack, unpack, unpack_from, calcsize
 import io
 import codecs
 import _compat_pickle
 
 __all__ = ["PickleError", "PicklingError", "UnpicklingError", "Pickler",
-           "Unpickler", "dump", "dumps", "load", "loads"]
+           "Unpickler", "dump", "dumps", "load", "loads", "dump_stream",
+           "dump_mapped", "load_mapped"]
 
 try:
     from _pickle import PickleBuffer
@@ -418,7 +419,7 @@ def _T(obj):
 class _Pickler:
 
     def __init__(self, file, protocol=None, *, fix_imports=True,
-                 buffer_callback=None):
+                 buffer_callback=None, memoize=True):
         """This takes a binary file for writing a pickle data stream.
 
         The optional *protocol* argument tells the pickler to use the
@@ -451,6 +452,11 @@ def __init__(self, file, protocol=None, *, fix_imports=True,
 
         It is an error if *buffer_callback* is not None and *protocol*
         is None or smaller than 5.
+
+        If *memoize* is false, the pickler does not keep track of the
+        objects already pickled: shared objects are pickled again each
+        time they are seen, and recursive objects cannot be pickled.
+        This is faster for large acyclic data without shared references.
         """
         if protocol is None:
             protocol = DEFAULT_PROTOCOL
@@ -471,7 +477,7 @@ def __init__(self, file, protocol=None, *, fix_imports=True,
         self.memo = {}
         self.proto = int(protocol)
         self.bin = protocol >= 1
-        self.fast = 0
+        self.fast = not memoize
         self.fix_imports = fix_imports and protocol < 3
 
     def clear_memo(self):
@@ -1247,10 +1253,40 @@ def save_type(self, obj):
 
 # Unpickling machinery
 
+def _map_2to3_names(module, name):
+    # Map the names used in Python 2 to the names used in Python 3.
+    if (module, name) in _compat_pickle.NAME_MAPPING:
+        return _compat_pickle.NAME_MAPPING[(module, name)]
+    if module in _compat_pickle.IMPORT_MAPPING:
+        return _compat_pickle.IMPORT_MAPPING[module], name
+    return module, name
+
+def _allowed_globals_dict(allowed):
+    if allowed is None:
+        return None
+    if hasattr(allowed, 'keys'):
+        result = dict(allowed)
+        for key in result:
+            if (type(key) is not tuple or len(key) != 2
+                    or not isinstance(key[0], str)
+                    or not isinstance(key[1], str)):
+                raise TypeError(f"allowed_globals keys must be pairs of str, "
+                                f"not {key!r}")
+        return result
+    result = {}
+    for obj in allowed:
+        module, qualname = obj.__module__, obj.__qualname__
+        if not isinstance(module, str) or not isinstance(qualname, str):
+            raise TypeError(f"cannot allow {obj!r}: its __module__ and "
+                            f"__qualname__ must be str")
+        result[module, qualname] = obj
+    return result
+
 class _Unpickler:
 
     def __init__(self, file, *, fix_imports=True,
-                 encoding="ASCII", errors="strict", buffers=None):
+                 encoding="ASCII", errors="strict", buffers=None,
+                 allowed_globals=None):
         """This takes a binary file for reading a pickle data stream.
 
         The protocol version of the pickle is detected automatically, so
@@ -1287,8 +1323,15 @@ def __init__(self, file, *, fix_imports=True,
         to decode 8-bit string instances pickled by Python 2; these
         default to 'ASCII' and 'strict', respectively. *encoding* can be
         'bytes' to read these 8-bit string instances as bytes objects.
+
+        If *allowed_globals* is not None, it is a mapping of (module,
+        qualname) pairs to the only classes and functions which can be
+        loaded, or an iterable of these objects.  They are looked up in it
+        instead of being imported by find_class(), and any other global
+        is forbidden.
         """
         self._buffers = iter(buffers) if buffers is not None else None
+        self._allowed_globals = _allowed_globals_dict(allowed_globals)
         self._file_readline = file.readline
         self._file_read = file.read
         self.memo = {}
@@ -1610,7 +1653,7 @@ def _instantiate(self, klass, args):
     def load_inst(self):
         module = self.readline()[:-1].decode("ascii")
         name = self.readline()[:-1].decode("ascii")
-        klass = self.find_class(module, name)
+        klass = self._find_global(module, name)
         self._instantiate(klass, self.pop_mark())
     dispatch[INST[0]] = load_inst
 
@@ -1639,7 +1682,7 @@ def load_newobj_ex(self):
     def load_global(self):
         module = self.readline()[:-1].decode("utf-8")
         name = self.readline()[:-1].decode("utf-8")
-        klass = self.find_class(module, name)
+        klass = self._find_global(module, name)
         self.append(klass)
     dispatch[GLOBAL[0]] = load_global
 
@@ -1648,7 +1691,7 @@ def load_stack_global(self):
         module = self.stack.pop()
         if type(name) is not str or type(module) is not str:
             raise UnpicklingError("STACK_GLOBAL requires str")
-        self.append(self.find_class(module, name))
+        self.append(self._find_global(module, name))
     dispatch[STACK_GLOBAL[0]] = load_stack_global
 
     def load_ext1(self):
@@ -1667,28 +1710,41 @@ def load_ext4(self):
     dispatch[EXT4[0]] = load_ext4
 
     def get_extension(self, code):
-        obj = _extension_cache.get(code, _NoValue)
-        if obj is not _NoValue:
-            self.append(obj)
-            return
+        # The cache is shared by all unpicklers, so it is neither read nor
+        # written with allowed globals.
+        if self._allowed_globals is None:
+            obj = _extension_cache.get(code, _NoValue)
+            if obj is not _NoValue:
+                self.append(obj)
+                return
         key = _inverted_registry.get(code)
         if not key:
             if code <= 0: # note that 0 is forbidden
                 # Corrupt or hostile pickle.
                 raise UnpicklingError("EXT specifies code <= 0")
             raise ValueError("unregistered extension code %d" % code)
-        obj = self.find_class(*key)
-        _extension_cache[code] = obj
+        obj = self._find_global(*key)
+        if self._allowed_globals is None:
+            _extension_cache[code] = obj
         self.append(obj)
 
+    def _find_global(self, module, name):
+        if self._allowed_globals is None:
+            return self.find_class(module, name)
+        sys.audit('pickle.find_class', module, name)
+        if self.proto < 3 and self.fix_imports:
+            module, name = _map_2to3_names(module, name)
+        try:
+            return self._allowed_globals[module, name]
+        except KeyError:
+            raise UnpicklingError(
+                f"global '{module}.{name}' is forbidden") from None
+
     def find_class(self, module, name):
         # Subclasses may override this.
         sys.audit('pickle.find_class', module, name)
         if self.proto < 3 and self.fix_imports:
-            if (module, name) in _compat_pickle.NAME_MAPPING:
-                module, name = _compat_pickle.NAME_MAPPING[(module, name)]
-            elif module in _compat_pickle.IMPORT_MAPPING:
-                module = _compat_pickle.IMPORT_MAPPING[module]
+            module, name = _map_2to3_names(module, name)
         __import__(module, level=0)
         if self.proto >= 4 and '.' in name:
             dotted_path = name.split('.')
@@ -1864,30 +1920,34 @@ def load_stop(self):
 
 # Shorthands
 
-def _dump(obj, file, protocol=None, *, fix_imports=True, buffer_callback=None):
+def _dump(obj, file, protocol=None, *, fix_imports=True, buffer_callback=None,
+          memoize=True):
     _Pickler(file, protocol, fix_imports=fix_imports,
-             buffer_callback=buffer_callback).dump(obj)
+             buffer_callback=buffer_callback, memoize=memoize).dump(obj)
 
-def _dumps(obj, protocol=None, *, fix_imports=True, buffer_callback=None):
+def _dumps(obj, protocol=None, *, fix_imports=True, buffer_callback=None,
+           memoize=True):
     f = io.BytesIO()
     _Pickler(f, protocol, fix_imports=fix_imports,
-             buffer_callback=buffer_callback).dump(obj)
+             buffer_callback=buffer_callback, memoize=memoize).dump(obj)
     res = f.getvalue()
     assert isinstance(res, bytes_types)
     return res
 
 def _load(file, *, fix_imports=True, encoding="ASCII", errors="strict",
-          buffers=None):
+          buffers=None, allowed_globals=None):
     return _Unpickler(file, fix_imports=fix_imports, buffers=buffers,
-                     encoding=encoding, errors=errors).load()
+                      encoding=encoding, errors=errors,
+                      allowed_globals=allowed_globals).load()
 
 def _loads(s, /, *, fix_imports=True, encoding="ASCII", errors="strict",
-           buffers=None):
+           buffers=None, allowed_globals=None):
     if isinstance(s, str):
         raise TypeError("Can't load pickle from unicode string")
     file = io.BytesIO(s)
     return _Unpickler(file, fix_imports=fix_imports, buffers=buffers,
-                      encoding=encoding, errors=errors).load()
+                      encoding=encoding, errors=errors,
+                      allowed_globals=allowed_globals).load()
 
 # Use the faster _pickle if possible
 try:
@@ -1907,6 +1967,293 @@ def _loads(s, /, *, fix_imports=True, encoding="ASCII", errors="strict",
     dump, dumps, load, loads = _dump, _dumps, _load, _loads
 
 
+# Streaming and parallel pickling
+
+def _opcode_size(data, pos):
+    # Size of the opcode at data[pos] and of its argument.
+    import pickletools
+    arg = pickletools.code2op[chr(data[pos])].arg
+    if arg is None:
+        return 1
+    n = arg.n
+    if n >= 0:
+        return 1 + n
+    # Protocol 4 and higher only use binary opcodes.
+    size = {pickletools.TAKEN_FROM_ARGUMENT1: 1,
+            pickletools.TAKEN_FROM_ARGUMENT4: 4,
+            pickletools.TAKEN_FROM_ARGUMENT4U: 4,
+            pickletools.TAKEN_FROM_ARGUMENT8U: 8}[n]
+    return 1 + size + int.from_bytes(data[pos + 1:pos + 1 + size], 'little')
+
+def _segments(data):
+    """Split the body of a protocol 4+ pickle into its frames.
+
+    Yield (framed, view) pairs, where view is the payload of a frame, or a
+    single opcode written outside frames (a large bytes or str object, or
+    a frame too small to be worth a header).
+    """
+    pos = 0
+    end = len(data)
+    while pos < end:
+        if data[pos] == FRAME[0]:
+            size, = unpack('<Q', data[pos + 1:pos + 9])
+            pos += 9
+            yield True, data[pos:pos + size]
+        else:
+            size = _opcode_size(data, pos)
+            yield False, data[pos:pos + size]
+        pos += size
+
+def _pickle_chunk(chunk, protocol, fix_imports):
+    # Pickle a list or dict without memo, so that its items can be spliced
+    # into another pickle: the result does not refer to memo indices.
+    f = io.BytesIO()
+    Pickler(f, protocol, fix_imports=fix_imports, memoize=False).dump(chunk)
+    return f.getbuffer()
+
+def _write_chunk(write, data, protocol):
+    # Write the items of a pickled list or dict, without its PROTO opcode,
+    # its EMPTY_LIST or EMPTY_DICT opcode and its STOP opcode.
+    if protocol < 4:
+        write(data[3:-1])
+        return
+    segments = list(_segments(data[2:]))
+    last = len(segments) - 1
+    for i, (framed, view) in enumerate(segments):
+        if i == 0:
+            view = view[1:]
+        if i == last:
+            view = view[:-1]
+        if framed and len(view) >= _Framer._FRAME_SIZE_MIN:
+            write(FRAME + pack('<Q', len(view)))
+        if view:
+            write(view)
+
+def dump_stream(obj, file, protocol=None, *, fix_imports=True,
+                threads=None, chunk_size=10_000):
+    """Write a pickled representation of obj to file as it is produced.
+
+    file can be a file object or a socket.  The pickle is written in
+    frames, so that only a bounded part of it is held in memory.
+
+    If threads is not None, a list or dict with more than chunk_size items
+    is split into chunks of chunk_size items that are pickled concurrently
+    by that many threads (the number of CPUs if 0), and written in order.
+    Shared references between items, and cycles through them, cannot be
+    pickled this way.
+    """
+    write = getattr(file, 'write', None)
+    if write is None:
+        try:
+            write = file.sendall
+        except AttributeError:
+            raise TypeError("file must have a 'write' or 'sendall' "
+                            "attribute") from None
+    if protocol is None:
+        protocol = DEFAULT_PROTOCOL
+    elif protocol < 0:
+        protocol = HIGHEST_PROTOCOL
+    if threads is not None and threads < 0:
+        raise ValueError("threads must be a non-negative integer")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    if (threads is None or protocol < 2
+            or type(obj) not in (list, dict) or len(obj) <= chunk_size):
+        Pickler(_StreamWriter(write), protocol,
+                fix_imports=fix_imports).dump(obj)
+        return
+
+    import os
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    from itertools import islice
+
+    if type(obj) is list:
+        container = EMPTY_LIST
+        chunks = (obj[i:i + chunk_size] for i in range(0, len(obj), chunk_size))
+    else:
+        container = EMPTY_DICT
+        items = iter(obj.items())
+        chunks = iter(lambda: dict(islice(items, chunk_size)), {})
+    threads = threads or os.process_cpu_count() or 1
+
+    write(PROTO + pack('<B', protocol) + container)
+    with ThreadPoolExecutor(threads) as executor:
+        # Keep a bounded number of pickled chunks in memory.
+        pending = deque()
+        for chunk in chunks:
+            if len(pending) >= 2 * threads:
+                _write_chunk(write, pending.popleft().result(), protocol)
+            pending.append(executor.submit(_pickle_chunk, chunk,
+                                           protocol, fix_imports))
+            del chunk
+        while pending:
+            _write_chunk(write, pending.popleft().result(), protocol)
+    write(STOP)
+
+class _StreamWriter:
+    # Pickler only needs a write() method.
+    def __init__(self, write):
+        self.write = write
+
+
+# Pickles with memory-mapped out-of-band buffers
+#
+# A file written by dump_mapped() contains, with little-endian integers:
+#
+#   header      magic (8 bytes), alignment (4 bytes), number of buffers
+#               (4 bytes), size of the pickle (8 bytes)
+#   table       offset and size (8 bytes each) of every buffer, in the
+#               order of the buffers argument of loads()
+#   pickle      the protocol 5+ pickle
+#   buffers     the buffers, each at an offset that is a multiple of the
+#               alignment; offsets are relative to the start of the header
+
+_MAPPED_MAGIC = b'\x80PKLBUF\n'
+_MAPPED_HEADER = '<8sIIQ'
+_MAPPED_ENTRY = '<QQ'
+# Smaller arrays are pickled in-band.
+_MAPPED_MIN_SIZE = 4096
+
+def _array_frombuffer(typecode, buffer):
+    # Reconstructor for the arrays pickled out-of-band by dump_mapped().
+    from array import array
+    result = array(typecode)
+    result.frombytes(buffer)
+    return result
+
+class _MappedPickler(Pickler):
+    # Pickle large arrays out-of-band, so that they are loaded with a
+    # single copy from the mapping.  bytearrays are pickled in-band, which
+    # also copies them only once when loading from the mapping.
+
+    def reducer_override(self, obj):
+        if not _HAVE_PICKLE_BUFFER:
+            return NotImplemented
+        cls = type(obj)
+        if (cls.__module__ == 'array' and cls.__qualname__ == 'array'
+                and obj.itemsize * len(obj) >= _MAPPED_MIN_SIZE):
+            return _array_frombuffer, (obj.typecode, PickleBuffer(obj))
+        return NotImplemented
+
+def dump_mapped(obj, file, protocol=None, *, fix_imports=True, alignment=64):
+    """Write obj to file with its out-of-band buffers, for load_mapped().
+
+    file is a path or a binary file object.  The pickle uses protocol 5
+    or higher, and the contiguous buffers of PickleBuffer objects and of
+    large arrays are written after it, each aligned to a multiple of
+    alignment bytes, so that they can be loaded without copying them.
+    """
+    if protocol is None:
+        protocol = DEFAULT_PROTOCOL
+    elif protocol < 0:
+        protocol = HIGHEST_PROTOCOL
+    if protocol < 5:
+        raise ValueError("dump_mapped() needs protocol >= 5")
+    if alignment < 1 or alignment & (alignment - 1):
+        raise ValueError("alignment must be a power of 2")
+
+    buffers = []
+    def buffer_callback(buffer):
+        try:
+            view = buffer.raw()
+        except BufferError:
+            # Not contiguous; pickled in-band.
+            return True
+        buffers.append(view)
+        return False
+
+    f = io.BytesIO()
+    _MappedPickler(f, protocol, fix_imports=fix_imports,
+                   buffer_callback=buffer_callback).dump(obj)
+    data = f.getbuffer()
+
+    # The offsets in the table are relative to the start of the record,
+    # but the buffers are aligned in the file, which is mapped whole.
+    start = 0
+    if hasattr(file, 'write'):
+        try:
+            start = file.tell()
+        except (AttributeError, OSError):
+            pass
+    table = []
+    offset = calcsize(_MAPPED_HEADER) + calcsize(_MAPPED_ENTRY) * len(buffers)
+    offset += len(data)
+    for view in buffers:
+        offset = -(-(start + offset) // alignment) * alignment - start
+        table.append((offset, view.nbytes))
+        offset += view.nbytes
+
+    if hasattr(file, 'write'):
+        _write_mapped(file.write, alignment, table, data, buffers)
+    else:
+        with open(file, 'wb') as f:
+            _write_mapped(f.write, alignment, table, data, buffers)
+
+def _write_mapped(write, alignment, table, data, buffers):
+    write(pack(_MAPPED_HEADER, _MAPPED_MAGIC, alignment, len(table),
+               len(data)))
+    for entry in table:
+        write(pack(_MAPPED_ENTRY, *entry))
+    write(data)
+    pos = calcsize(_MAPPED_HEADER) + calcsize(_MAPPED_ENTRY) * len(table)
+    pos += len(data)
+    for (offset, size), view in zip(table, buffers):
+        write(bytes(offset - pos))
+        write(view)
+        pos = offset + size
+
+def load_mapped(file, *, fix_imports=True, encoding="ASCII",
+                errors="strict"):
+    """Read an object written by dump_mapped().
+
+    file is a path or a binary file object with a fileno() method.  The
+    file is memory-mapped and the out-of-band buffers are passed to the
+    unpickler as memoryview slices of the mapping, without copying them.
+    The mapping is private: changes to writable buffers are not written
+    to the file.  It stays open as long as the buffers are referenced.
+    """
+    if hasattr(file, 'fileno'):
+        return _load_mapped(file, fix_imports, encoding, errors)
+    with open(file, 'rb') as f:
+        return _load_mapped(f, fix_imports, encoding, errors)
+
+def _load_mapped(file, fix_imports, encoding, errors):
+    import mmap
+    start = file.tell()
+    try:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    except ValueError:
+        # An empty file cannot be mapped.
+        raise UnpicklingError("not a dump_mapped() file") from None
+    view = memoryview(mapping)[start:]
+    header_size = calcsize(_MAPPED_HEADER)
+    entry_size = calcsize(_MAPPED_ENTRY)
+    if (len(view) < header_size or
+            view[:len(_MAPPED_MAGIC)] != _MAPPED_MAGIC):
+        raise UnpicklingError("not a dump_mapped() file")
+    magic, alignment, count, size = unpack_from(_MAPPED_HEADER, view)
+    pos = header_size + entry_size * count
+    end = pos + size
+    if len(view) < end:
+        raise UnpicklingError("dump_mapped() file is truncated")
+    buffers = []
+    for i in range(count):
+        offset, length = unpack_from(_MAPPED_ENTRY, view,
+                                     header_size + entry_size * i)
+        if offset < pos + size:
+            raise UnpicklingError("invalid dump_mapped() buffer offset")
+        if len(view) < offset + length:
+            raise UnpicklingError("dump_mapped() file is truncated")
+        buffers.append(view[offset:offset + length])
+        end = max(end, offset + length)
+    obj = loads(view[pos:pos + size], fix_imports=fix_imports,
+                encoding=encoding, errors=errors, buffers=buffers)
+    file.seek(start + end)
+    return obj
+
+
 def _main(args=None):
     import argparse
     import pprint
@@ -53,7 +53,16 @@
 actually mutate, so it must cache, and write back at close, all of the
 entries that you access.  You can call d.sync() to write back all the
 entries in the cache, and empty the cache (d.sync() also synchronizes
-the persistent dictionary on disk, if feasible).
+the persistent dictionary on disk, if feasible).  Only the entries whose
+pickle has changed are written back.  The keyword argument cache_size
+bounds the cache: the least recently used entries are written back and
+dropped when it is full.
+
+Without writeback, cache_size=N keeps the N most recently used entries
+in memory, so that reading them again does not unpickle them; note that
+d[key] then returns the cached object rather than a copy.  With
+lazy=True, the cache holds the pickled entries instead, and d[key]
+unpickles a new copy on each access without reading the database.
 """
 
 from pickle import DEFAULT_PROTOCOL, dumps, loads
@@ -87,13 +96,23 @@ class Shelf(collections.abc.MutableMapping):
     """
 
     def __init__(self, dict, protocol=None, writeback=False,
-                 keyencoding="utf-8", *, serializer=None, deserializer=None):
+                 keyencoding="utf-8", *, serializer=None, deserializer=None,
+                 cache_size=None, lazy=False):
+        if cache_size is not None and cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+        if lazy and writeback:
+            raise ValueError("lazy and writeback cannot be used together")
         self.dict = dict
         if protocol is None:
             protocol = DEFAULT_PROTOCOL
         self._protocol = protocol
         self.writeback = writeback
         self.cache = {}
+        # Serialized value of the cached entries when they were last read
+        # or written, to find the entries that need to be written back.
+        self._stored = {}
+        self._cache_size = cache_size
+        self._lazy = lazy
         self.keyencoding = keyencoding
 
         if serializer is None and deserializer is None:
@@ -114,12 +133,31 @@ def __len__(self):
         return len(self.dict)
 
     def __contains__(self, key):
-        return key.encode(self.keyencoding) in self.dict
+        return key in self.cache or key.encode(self.keyencoding) in self.dict
 
     def get(self, key, default=None):
-        if key.encode(self.keyencoding) in self.dict:
+        try:
             return self[key]
-        return default
+        except KeyError:
+            return default
+
+    def _caching(self):
+        return self.writeback or self._lazy or self._cache_size is not None
+
+    def _cache_put(self, key, value):
+        cache = self.cache
+        cache[key] = value
+        if self._cache_size is not None:
+            while len(cache) > self._cache_size:
+                self._evict(next(iter(cache)))
+
+    def _evict(self, key):
+        value = self.cache.pop(key)
+        if self.writeback:
+            stored = self._stored.pop(key, None)
+            serialized_value = self.serializer(value, self._protocol)
+            if serialized_value != stored:
+                self.dict[key.encode(self.keyencoding)] = serialized_value
 
     def __getitem__(self, key):
         try:
@@ -127,22 +165,37 @@ def __getitem__(self, key):
         except KeyError:
             f = self.dict[key.encode(self.keyencoding)]
             value = self.deserializer(f)
-            if self.writeback:
-                self.cache[key] = value
+            if self._lazy:
+                self._cache_put(key, f)
+            elif self._caching():
+                if self.writeback:
+                    self._stored[key] = f
+                self._cache_put(key, value)
+            return value
+        if self._cache_size is not None:
+            # Mark the entry as most recently used.
+            del self.cache[key]
+            self.cache[key] = value
+        if self._lazy:
+            value = self.deserializer(value)
         return value
 
     def __setitem__(self, key, value):
-        if self.writeback:
-            self.cache[key] = value
         serialized_value = self.serializer(value, self._protocol)
         self.dict[key.encode(self.keyencoding)] = serialized_value
+        if self.writeback:
+            self._stored[key] = serialized_value
+            self._cache_put(key, value)
+        elif self._lazy:
+            self._cache_put(key, serialized_value)
+        else:
+            # The caller may still change value; read it back when needed.
+            self.cache.pop(key, None)
 
     def __delitem__(self, key):
         del self.dict[key.encode(self.keyencoding)]
-        try:
-            del self.cache[key]
-        except KeyError:
-            pass
+        self.cache.pop(key, None)
+        self._stored.pop(key, None)
 
     def __enter__(self):
         return self
@@ -166,6 +219,9 @@ def close(self):
                 self.dict = _ClosedDict()
             except:
                 self.dict = None
+            # Don't answer from the read caches once closed.
+            self.cache = {}
+            self._stored = {}
 
     def __del__(self):
         if not hasattr(self, 'writeback'):
@@ -176,11 +232,22 @@ def __del__(self):
 
     def sync(self):
         if self.writeback and self.cache:
-            self.writeback = False
+            changed = []
             for key, entry in self.cache.items():
-                self[key] = entry
-            self.writeback = True
+                serialized_value = self.serializer(entry, self._protocol)
+                if serialized_value != self._stored.get(key):
+                    changed.append((key.encode(self.keyencoding),
+                                    serialized_value))
+            if not changed:
+                pass
+            elif hasattr(self.dict, 'bulk_update'):
+                # Store all entries in one batch, e.g. one transaction.
+                self.dict.bulk_update(changed)
+            else:
+                for key, serialized_value in changed:
+                    self.dict[key] = serialized_value
             self.cache = {}
+            self._stored = {}
         if hasattr(self.dict, 'sync'):
             self.dict.sync()
 
@@ -204,9 +271,11 @@ class BsdDbShelf(Shelf):
     """
 
     def __init__(self, dict, protocol=None, writeback=False,
-                 keyencoding="utf-8", *, serializer=None, deserializer=None):
+                 keyencoding="utf-8", *, serializer=None, deserializer=None,
+                 cache_size=None, lazy=False):
         Shelf.__init__(self, dict, protocol, writeback, keyencoding,
-                       serializer=serializer, deserializer=deserializer)
+                       serializer=serializer, deserializer=deserializer,
+                       cache_size=cache_size, lazy=lazy)
 
     def set_location(self, key):
         (key, value) = self.dict.set_location(key)
@@ -237,20 +306,23 @@ class DbfilenameShelf(Shelf):
     """
 
     def __init__(self, filename, flag='c', protocol=None, writeback=False, *,
-                 serializer=None, deserializer=None):
+                 serializer=None, deserializer=None, cache_size=None,
+                 lazy=False):
         import dbm
         Shelf.__init__(self, dbm.open(filename, flag), protocol, writeback,
-                       serializer=serializer, deserializer=deserializer)
+                       serializer=serializer, deserializer=deserializer,
+                       cache_size=cache_size, lazy=lazy)
 
     def clear(self):
         """Remove all items from the shelf."""
         # Call through to the clear method on dbm-backed shelves.
         # see https://github.com/python/cpython/issues/107089
         self.cache.clear()
+        self._stored.clear()
         self.dict.clear()
 
 def open(filename, flag='c', protocol=None, writeback=False, *,
-         serializer=None, deserializer=None):
+         serializer=None, deserializer=None, cache_size=None, lazy=False):
     """Open a persistent dictionary for reading and writing.
 
     The filename parameter is the base filename for the underlying
@@ -258,10 +330,12 @@ def open(filename, flag='c', protocol=None, writeback=False, *,
     filename and more than one file may be created.  The optional flag
     parameter has the same interpretation as the flag parameter of
     dbm.open(). The optional protocol parameter specifies the
-    version of the pickle protocol.
+    version of the pickle protocol.  The optional cache_size and lazy
+    parameters control the cache of entries.
 
     See the module's __doc__ string for an overview of the interface.
     """
 
     return DbfilenameShelf(filename, flag, protocol, writeback,
-                           serializer=serializer, deserializer=deserializer)
+                           serializer=serializer, deserializer=deserializer,
+                           cache_size=cache_size, lazy=lazy)
@@ -165,31 +165,46 @@ def _init_pathinfo():
     return d
 
 
-def addpackage(sitedir, name, known_paths):
-    """Process a .pth file within the site-packages directory:
-       For each line in the file, either combine it with sitedir to a path
-       and add that to known_paths, or execute it if it starts with 'import '.
+def _import_cache():
+    """Return the persistent cache of the import system and the minimum
+    age of the files it stores, or (None, None).
+
+    The cache is enabled by the -X importcache option or PYTHONIMPORTCACHE.
     """
-    if known_paths is None:
-        known_paths = _init_pathinfo()
-        reset = True
-    else:
-        reset = False
-    fullname = os.path.join(sitedir, name)
+    external = sys.modules.get('_frozen_importlib_external')
+    cache = getattr(external, '_directory_cache', None)
+    if cache is None:
+        return None, None
+    return cache, external._DIRECTORY_CACHE_MIN_AGE
+
+
+def _pth_timing():
+    """Return whether the time spent on each .pth file is printed."""
+    if 'importtime' in sys._xoptions:
+        return True
+    return (not sys.flags.ignore_environment
+            and bool(os.environ.get('PYTHONPROFILEIMPORTTIME')))
+
+
+def _stat_pth(fullname):
     try:
         st = os.lstat(fullname)
     except OSError:
-        return
+        return None
     if ((getattr(st, 'st_flags', 0) & stat.UF_HIDDEN) or
         (getattr(st, 'st_file_attributes', 0) & stat.FILE_ATTRIBUTE_HIDDEN)):
         _trace(f"Skipping hidden .pth file: {fullname!r}")
-        return
-    _trace(f"Processing .pth file: {fullname!r}")
+        return None
+    return st
+
+
+def _read_pth(fullname):
+    """Return the lines of a .pth file, or None if it cannot be read."""
     try:
         with io.open_code(fullname) as f:
             pth_content = f.read()
     except OSError:
-        return
+        return None
 
     try:
         # Accept BOM markers in .pth files as we do in source files
@@ -202,8 +217,11 @@ def addpackage(sitedir, name, known_paths):
         pth_content = pth_content.decode(locale.getencoding())
         _trace(f"Cannot read {fullname!r} as UTF-8. "
                f"Using fallback encoding {locale.getencoding()!r}")
+    return pth_content.splitlines()
 
-    for n, line in enumerate(pth_content.splitlines(), 1):
+
+def _process_pth(sitedir, fullname, lines, known_paths):
+    for n, line in enumerate(lines, 1):
         if line.startswith("#"):
             continue
         if line.strip() == "":
@@ -226,11 +244,99 @@ def addpackage(sitedir, name, known_paths):
                     print('  '+line, file=sys.stderr)
             print("\nRemainder of file ignored", file=sys.stderr)
             break
+
+
+def addpackage(sitedir, name, known_paths):
+    """Process a .pth file within the site-packages directory:
+       For each line in the file, either combine it with sitedir to a path
+       and add that to known_paths, or execute it if it starts with 'import '.
+    """
+    if known_paths is None:
+        known_paths = _init_pathinfo()
+        reset = True
+    else:
+        reset = False
+    fullname = os.path.join(sitedir, name)
+    if _stat_pth(fullname) is None:
+        return
+    _trace(f"Processing .pth file: {fullname!r}")
+    lines = _read_pth(fullname)
+    if lines is None:
+        return
+    _process_pth(sitedir, fullname, lines, known_paths)
     if reset:
         known_paths = None
     return known_paths
 
 
+def _addpackages(sitedir, known_paths):
+    """Process the .pth files of sitedir.
+
+    With the import cache, the names and the lines of the .pth files are
+    stored with the mtime of sitedir, and with the mtime and the size of
+    each file.  Later runs only list sitedir if its mtime changed, and only
+    read the .pth files which changed; the import lines of all the files
+    are executed again.
+    """
+    cache, min_age = _import_cache()
+    timing = _pth_timing()
+    key = ('site', sitedir)
+    manifest = {}
+    names = None
+    if cache is not None:
+        try:
+            dir_mtime = os.stat(sitedir).st_mtime
+        except OSError:
+            cache = None
+        else:
+            entry = cache.get_entry(key)
+            if entry is not None:
+                # The stored files are still used if they are unchanged.
+                manifest = {item[0]: item[1:] for item in entry[1]}
+                if entry[0] == dir_mtime:
+                    names = [item[0] for item in entry[1]]
+    if names is None:
+        try:
+            names = os.listdir(sitedir)
+        except OSError:
+            return False
+        names = sorted(name for name in names
+                       if name.endswith(".pth") and not name.startswith("."))
+    if timing and names:
+        import time
+        print("pth time: self [us] | .pth file", file=sys.stderr)
+    new_manifest = []
+    for name in names:
+        if timing:
+            start = time.perf_counter_ns()
+        fullname = os.path.join(sitedir, name)
+        st = _stat_pth(fullname)
+        if st is None:
+            continue
+        _trace(f"Processing .pth file: {fullname!r}")
+        stamp = (st.st_mtime, st.st_size)
+        entry = manifest.get(name)
+        if entry is not None and entry[:2] == stamp:
+            lines = entry[2]
+        else:
+            lines = _read_pth(fullname)
+            if lines is None:
+                continue
+        new_manifest.append((name, *stamp, tuple(lines)))
+        _process_pth(sitedir, fullname, lines, known_paths)
+        if timing:
+            elapsed = (time.perf_counter_ns() - start) // 1000
+            print(f"pth time: {elapsed:>10} | {fullname}", file=sys.stderr)
+    if cache is not None:
+        import time
+        # A file changed within the resolution of its mtime could be
+        # mistaken for the stored one.
+        recent = time.time() - min_age
+        if all(entry[1] < recent for entry in new_manifest):
+            cache.put(key, dir_mtime, new_manifest)
+    return True
+
+
 def addsitedir(sitedir, known_paths=None):
     """Add 'sitedir' argument to sys.path if missing and handle .pth files in
     'sitedir'"""
@@ -244,14 +350,8 @@ def addsitedir(sitedir, known_paths=None):
     if not sitedircase in known_paths:
         sys.path.append(sitedir)        # Add path component
         known_paths.add(sitedircase)
-    try:
-        names = os.listdir(sitedir)
-    except OSError:
+    if not _addpackages(sitedir, known_paths):
         return
-    names = [name for name in names
-             if name.endswith(".pth") and not name.startswith(".")]
-    for name in sorted(names):
-        addpackage(sitedir, name, known_paths)
     if reset:
         known_paths = None
     return known_paths
@@ -647,6 +747,31 @@ def venv(known_paths):
     return known_paths
 
 
+def enablelazyimports():
+    """Enable the lazy imports requested by -X lazyimports or
+    PYTHONLAZYIMPORTS.
+
+    The value is a comma-separated list of module names; a name prefixed
+    with '-' is excluded.
+    """
+    value = sys._xoptions.get('lazyimports')
+    if value is None and not sys.flags.ignore_environment:
+        value = os.environ.get('PYTHONLAZYIMPORTS')
+    if not isinstance(value, str):
+        return
+    modules = []
+    exclude = []
+    for name in value.split(','):
+        name = name.strip()
+        if name.startswith('-'):
+            exclude.append(name[1:].strip())
+        elif name:
+            modules.append(name)
+    if modules:
+        import importlib.util
+        importlib.util.enable_lazy_imports(*modules, exclude=exclude)
+
+
 def execsitecustomize():
     """Run custom site specific code, if available."""
     try:
@@ -702,6 +827,7 @@ def main():
         # fix __file__ and __cached__ of already imported modules too.
         abs_paths()
 
+    enablelazyimports()
     known_paths = venv(known_paths)
     if ENABLE_USER_SITE is None:
         ENABLE_USER_SITE = check_enableusersite()
@@ -0,0 +1,308 @@
+"""An asyncio interface to sqlite3.
+
+Each connection is owned by a dedicated worker thread, which runs all of
+its calls in order; coroutines submit calls to it and await the result.
+Rows are transferred in batches, so that iterating over a cursor only
+switches threads once per batch:
+
+    async with await sqlite3.aio.connect("app.db") as cx:
+        cursor = await cx.execute("SELECT * FROM log")
+        async for row in cursor:
+            print(row)
+
+Cancelling a task that waits for a call interrupts the call with
+Connection.interrupt().
+"""
+
+import asyncio
+import collections
+import functools
+import queue
+import sqlite3
+import threading
+
+__all__ = ["connect", "AsyncConnection", "AsyncCursor"]
+
+
+def _set_result(future, result):
+    if not future.done():
+        future.set_result(result)
+
+def _set_exception(future, exc):
+    if not future.done():
+        future.set_exception(exc)
+
+def _post(loop, callback, future, value):
+    try:
+        loop.call_soon_threadsafe(callback, future, value)
+    except RuntimeError:
+        # The event loop has been closed.
+        pass
+
+
+class _Worker:
+    """Thread running the calls submitted for one connection."""
+
+    def __init__(self, name):
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._running = None
+        self._thread = threading.Thread(target=self._run, name=name,
+                                        daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            loop, future, func, args = job
+            with self._lock:
+                if future.cancelled():
+                    continue
+                self._running = future
+            try:
+                result = func(*args)
+            except BaseException as exc:
+                _post(loop, _set_exception, future, exc)
+            else:
+                _post(loop, _set_result, future, result)
+            finally:
+                with self._lock:
+                    self._running = None
+            del job, loop, future, func, args
+
+    async def call(self, interrupt, func, *args):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put((loop, future, func, args))
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # Only interrupt the connection if it is still running this call.
+            with self._lock:
+                if self._running is future and interrupt is not None:
+                    interrupt()
+            raise
+
+    def stop(self):
+        self._queue.put(None)
+
+    def join(self):
+        self._thread.join()
+
+
+class AsyncConnection:
+    """Asynchronous wrapper of a sqlite3.Connection.
+
+    Use connect() to create instances.  *chunk_size* is the default
+    number of rows transferred at a time by cursors.
+    """
+
+    def __init__(self, worker, connection, chunk_size):
+        self._worker = worker
+        self._cx = connection
+        self._closed = False
+        self.chunk_size = chunk_size
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self._cx!r}>"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _check_closed(self):
+        if self._closed:
+            raise sqlite3.ProgrammingError(
+                "Cannot operate on a closed database.")
+
+    async def _call(self, func, *args):
+        self._check_closed()
+        return await self._worker.call(self._cx.interrupt, func, *args)
+
+    @property
+    def connection(self):
+        """The underlying sqlite3.Connection.
+
+        It can only be used in the worker thread, for example from a
+        function passed to call().
+        """
+        return self._cx
+
+    async def call(self, func, /, *args, **kwargs):
+        """Call func(connection, *args, **kwargs) in the worker thread."""
+        return await self._call(lambda: func(self._cx, *args, **kwargs))
+
+    async def cursor(self):
+        """Return a new AsyncCursor."""
+        return AsyncCursor(self, await self._call(self._cx.cursor))
+
+    async def execute(self, sql, parameters=(), /):
+        """Execute an SQL statement and return an AsyncCursor."""
+        cursor = await self.cursor()
+        await cursor.execute(sql, parameters)
+        return cursor
+
+    async def executemany(self, sql, parameters, /):
+        """Execute an SQL statement for each set of parameters."""
+        cursor = await self.cursor()
+        await cursor.executemany(sql, parameters)
+        return cursor
+
+    async def executescript(self, sql_script, /):
+        """Execute multiple SQL statements."""
+        cursor = await self.cursor()
+        await cursor.executescript(sql_script)
+        return cursor
+
+    async def commit(self):
+        await self._call(self._cx.commit)
+
+    async def rollback(self):
+        await self._call(self._cx.rollback)
+
+    def interrupt(self):
+        """Abort any query running in the worker thread."""
+        self._cx.interrupt()
+
+    async def close(self):
+        """Close the connection and stop the worker thread."""
+        if self._closed:
+            return
+        try:
+            await self._call(self._cx.close)
+        finally:
+            self._closed = True
+            self._worker.stop()
+        # Do not block the event loop while the thread exits.
+        await asyncio.to_thread(self._worker.join)
+
+
+class AsyncCursor:
+    """Asynchronous wrapper of a sqlite3.Cursor.
+
+    Rows are fetched from the worker thread *arraysize* at a time: the
+    first batch together with execute(), the following ones by fetchone()
+    and by iterating with ``async for``.
+    """
+
+    def __init__(self, connection, cursor):
+        self._connection = connection
+        self._cursor = cursor
+        self._rows = collections.deque()
+        self._exhausted = True
+        self.arraysize = connection.chunk_size
+        self.description = cursor.description
+        self.rowcount = cursor.rowcount
+        self.lastrowid = cursor.lastrowid
+
+    @property
+    def connection(self):
+        return self._connection
+
+    async def _call(self, func, *args):
+        description, rowcount, lastrowid, result = \
+            await self._connection._call(self._run, func, *args)
+        self.description = description
+        self.rowcount = rowcount
+        self.lastrowid = lastrowid
+        return result
+
+    def _run(self, func, *args):
+        # Called in the worker thread.
+        cursor = self._cursor
+        result = func(*args)
+        return cursor.description, cursor.rowcount, cursor.lastrowid, result
+
+    def _execute(self, size, method, *args):
+        # Called in the worker thread: execute and fetch the first batch.
+        method(*args)
+        if self._cursor.description is None:
+            return []
+        return self._cursor.fetchmany(size)
+
+    async def _executed(self, method, *args):
+        self._rows.clear()
+        size = max(self.arraysize, 1)
+        rows = await self._call(self._execute, size, method, *args)
+        self._rows.extend(rows)
+        self._exhausted = len(rows) < size
+        return self
+
+    async def execute(self, sql, parameters=(), /):
+        return await self._executed(self._cursor.execute, sql, parameters)
+
+    async def executemany(self, sql, parameters, /):
+        return await self._executed(self._cursor.executemany, sql, parameters)
+
+    async def executescript(self, sql_script, /):
+        return await self._executed(self._cursor.executescript, sql_script)
+
+    async def _fetch(self, size):
+        rows = await self._call(self._cursor.fetchmany, size)
+        if len(rows) < size:
+            self._exhausted = True
+        return rows
+
+    async def _fill(self):
+        self._connection._check_closed()
+        if not self._rows and not self._exhausted:
+            self._rows.extend(await self._fetch(max(self.arraysize, 1)))
+        return bool(self._rows)
+
+    async def fetchone(self):
+        return self._rows.popleft() if await self._fill() else None
+
+    async def fetchmany(self, size=None):
+        """Return the next *size* rows (arraysize if None) as a list."""
+        self._connection._check_closed()
+        if size is None:
+            size = self.arraysize
+        rows = self._rows
+        result = [rows.popleft() for _ in range(min(size, len(rows)))]
+        if len(result) < size and not self._exhausted:
+            result += await self._fetch(size - len(result))
+        return result
+
+    async def fetchall(self):
+        self._connection._check_closed()
+        result = list(self._rows)
+        self._rows.clear()
+        if not self._exhausted:
+            result += await self._call(self._cursor.fetchall)
+            self._exhausted = True
+        return result
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not await self._fill():
+            raise StopAsyncIteration
+        return self._rows.popleft()
+
+    async def close(self):
+        self._rows.clear()
+        self._exhausted = True
+        await self._call(self._cursor.close)
+
+
+async def connect(database, *, chunk_size=256, **kwargs):
+    """Open a connection in a new worker thread and return an AsyncConnection.
+
+    The arguments are passed to sqlite3.connect(), except *chunk_size*,
+    the default number of rows fetched at a time by cursors.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    worker = _Worker(f"sqlite3-{database}")
+    try:
+        cx = await worker.call(
+            None, functools.partial(sqlite3.connect, database, **kwargs))
+    except:
+        worker.stop()
+        raise
+    return AsyncConnection(worker, cx, chunk_size)
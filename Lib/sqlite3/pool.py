@@ -0,0 +1,290 @@
+"""A thread-safe pool of connections to one SQLite database.
+
+The database is switched to write-ahead logging (WAL), so that readers do
+not block each other or the writer.  Every thread or asyncio task that
+reads gets its own read-only connection for the duration of a reader()
+block; writes go through a single connection, one transaction at a time:
+
+    pool = ConnectionPool("app.db")
+    with pool.writer() as cx:
+        cx.execute("INSERT INTO log VALUES (?)", (message,))
+    with pool.reader() as cx:
+        rows = cx.execute("SELECT * FROM log").fetchall()
+    pool.close()
+"""
+
+import contextvars
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+__all__ = ["ConnectionPool"]
+
+
+class ConnectionPool:
+    """Pool of read-only connections and one writer connection.
+
+    *database* is the path of the database file; other keyword arguments
+    are passed to sqlite3.connect().  At most *max_readers* read
+    connections are open at a time (no limit if None); reader() waits up
+    to *acquire_timeout* seconds for one to become free.  A connection that
+    has been idle for more than *check_interval* seconds is checked before
+    it is handed out, and reopened if it no longer works.
+
+    The statements in *warmup_reads* and *warmup_writes* are run once on
+    each new reader or writer connection, inside a savepoint that is rolled
+    back, so that they are already compiled in the connection's statement
+    cache when they are first used.  Each item is either an SQL string or
+    an (sql, parameters) pair.
+    """
+
+    def __init__(self, database, *, max_readers=None, acquire_timeout=None,
+                 check_interval=30.0, warmup_reads=(), warmup_writes=(),
+                 **kwargs):
+        if database == ":memory:":
+            raise ValueError("a connection pool needs a database file")
+        if "check_same_thread" in kwargs:
+            raise TypeError("check_same_thread cannot be used with "
+                            "a connection pool")
+        if max_readers is not None and max_readers < 1:
+            raise ValueError("max_readers must be at least 1")
+        self._database = database
+        self._kwargs = kwargs
+        self._max_readers = max_readers
+        self._acquire_timeout = acquire_timeout
+        self._check_interval = check_interval
+        self._warmup_reads = list(warmup_reads)
+        self._warmup_writes = list(warmup_writes)
+
+        self._cond = threading.Condition()
+        self._idle = []             # (connection, last used) of free readers
+        self._readers = 0           # number of open reader connections
+        # Per thread and per asyncio task.
+        self._current = contextvars.ContextVar(f"sqlite3.pool.{id(self)}",
+                                               default=None)
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
+        self._closed = False
+
+        # The journal mode cannot be changed inside a transaction, which
+        # connections opened with autocommit=False always have.
+        cx = sqlite3.connect(database, uri=kwargs.get("uri", False),
+                             timeout=kwargs.get("timeout", 5.0))
+        try:
+            cx.execute("PRAGMA journal_mode = WAL")
+        finally:
+            cx.close()
+        self._writer = self._connect(readonly=False)
+        self._writer_used = time.monotonic()
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__} {self._database!r} "
+                f"readers={self._readers} closed={self._closed}>")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _check_closed(self):
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed pool.")
+
+    def _connect(self, readonly):
+        cx = sqlite3.connect(self._database, check_same_thread=False,
+                             **self._kwargs)
+        try:
+            if readonly:
+                cx.execute("PRAGMA query_only = ON")
+            if readonly:
+                statements = self._warmup_reads
+            else:
+                statements = self._warmup_writes
+            if statements:
+                self._warmup(cx, statements)
+        except:
+            cx.close()
+            raise
+        return cx
+
+    @staticmethod
+    def _warmup(cx, statements):
+        cx.execute("SAVEPOINT _pool_warmup")
+        try:
+            for statement in statements:
+                if isinstance(statement, str):
+                    cx.execute(statement)
+                else:
+                    cx.execute(*statement)
+        finally:
+            cx.execute("ROLLBACK TO _pool_warmup")
+            cx.execute("RELEASE _pool_warmup")
+
+    @staticmethod
+    def _healthy(cx):
+        try:
+            cx.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return True
+
+    @staticmethod
+    def _end_transaction(cx):
+        # Return False if the connection cannot be reused.
+        try:
+            if cx.in_transaction:
+                if cx.autocommit is True:
+                    cx.execute("ROLLBACK")
+                else:
+                    cx.rollback()
+        except sqlite3.Error:
+            return False
+        return True
+
+    def _acquire(self):
+        deadline = None
+        if self._acquire_timeout is not None:
+            deadline = time.monotonic() + self._acquire_timeout
+        with self._cond:
+            while True:
+                self._check_closed()
+                if self._idle:
+                    cx, last_used = self._idle.pop()
+                    break
+                if (self._max_readers is None
+                        or self._readers < self._max_readers):
+                    self._readers += 1
+                    cx = last_used = None
+                    break
+                if deadline is None:
+                    self._cond.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("no reader connection available")
+                    self._cond.wait(remaining)
+
+        try:
+            if cx is not None:
+                if (time.monotonic() - last_used <= self._check_interval
+                        or self._healthy(cx)):
+                    return cx
+                cx.close()
+            return self._connect(readonly=True)
+        except:
+            with self._cond:
+                self._readers -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, cx):
+        reusable = self._end_transaction(cx)
+        with self._cond:
+            if reusable and not self._closed:
+                self._idle.append((cx, time.monotonic()))
+                self._cond.notify()
+                return
+            self._readers -= 1
+            self._cond.notify()
+        cx.close()
+
+    @contextmanager
+    def reader(self):
+        """Return a context manager providing a read-only connection.
+
+        The connection is only for the current thread or asyncio task and
+        is returned to the pool at the end of the block; nested reader()
+        blocks in the same thread or task share it.  Any transaction left
+        open is rolled back.
+        """
+        cx = self._current.get()
+        if cx is not None:
+            yield cx
+            return
+        cx = self._acquire()
+        token = self._current.set(cx)
+        try:
+            yield cx
+        finally:
+            self._current.reset(token)
+            self._release(cx)
+
+    @contextmanager
+    def writer(self):
+        """Return a context manager providing the writer connection.
+
+        Only one thread at a time can use the writer.  The block runs in a
+        transaction that is committed when it exits normally and rolled back
+        if it raises an exception; nested writer() blocks in the same thread
+        take part in the outermost transaction.
+        """
+        with self._write_lock:
+            self._check_closed()
+            if self._write_depth:
+                self._write_depth += 1
+                try:
+                    yield self._writer
+                finally:
+                    self._write_depth -= 1
+                return
+            if (time.monotonic() - self._writer_used > self._check_interval
+                    and not self._healthy(self._writer)):
+                self._writer.close()
+                self._writer = self._connect(readonly=False)
+            self._write_depth = 1
+            try:
+                with self._writer:
+                    yield self._writer
+            finally:
+                self._write_depth = 0
+                self._writer_used = time.monotonic()
+
+    def check(self):
+        """Check every connection that is not in use.
+
+        Idle readers that fail the check are closed, and the writer is
+        reopened.  Return the number of connections that failed.
+        """
+        failed = []
+        with self._cond:
+            self._check_closed()
+            idle = []
+            for cx, last_used in self._idle:
+                if self._healthy(cx):
+                    idle.append((cx, time.monotonic()))
+                else:
+                    failed.append(cx)
+            self._idle = idle
+            self._readers -= len(failed)
+            self._cond.notify_all()
+        for cx in failed:
+            cx.close()
+        with self._write_lock:
+            self._check_closed()
+            if not self._write_depth and not self._healthy(self._writer):
+                failed.append(self._writer)
+                self._writer.close()
+                self._writer = self._connect(readonly=False)
+            self._writer_used = time.monotonic()
+        return len(failed)
+
+    def close(self):
+        """Close the pool.
+
+        Idle connections and the writer are closed at once; readers in use
+        are closed when they are returned.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            idle = [cx for cx, last_used in self._idle]
+            self._readers -= len(idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for cx in idle:
+            cx.close()
+        with self._write_lock:
+            self._writer.close()
@@ -45,6 +45,7 @@
 import struct
 import copy
 import re
+import bisect
 
 try:
     import pwd
@@ -67,7 +68,7 @@
            "DEFAULT_FORMAT", "open","fully_trusted_filter", "data_filter",
            "tar_filter", "FilterError", "AbsoluteLinkError",
            "OutsideDestinationError", "SpecialFileError", "AbsolutePathError",
-           "LinkOutsideDestinationError", "LinkFallbackError"]
+           "LinkOutsideDestinationError", "LinkFallbackError", "TarIndex"]
 
 
 #---------------------------------------------------------
@@ -595,21 +596,197 @@ def read(self, size):
         return self.buf
 
     def getcomptype(self):
-        if self.buf.startswith(b"\x1f\x8b\x08"):
-            return "gz"
-        elif self.buf[0:3] == b"BZh" and self.buf[4:10] == b"1AY&SY":
-            return "bz2"
-        elif self.buf.startswith((b"\x5d\x00\x00\x80", b"\xfd7zXZ")):
-            return "xz"
-        elif self.buf.startswith(b"\x28\xb5\x2f\xfd"):
-            return "zst"
-        else:
-            return "tar"
+        return _detect_comptype(self.buf)
 
     def close(self):
         self.fileobj.close()
 # class StreamProxy
 
+def _detect_comptype(buf):
+    """Guess the compression of an archive from its first bytes.
+    """
+    if buf.startswith(b"\x1f\x8b\x08"):
+        return "gz"
+    elif buf[0:3] == b"BZh" and buf[4:10] == b"1AY&SY":
+        return "bz2"
+    elif buf.startswith((b"\x5d\x00\x00\x80", b"\xfd7zXZ")):
+        return "xz"
+    elif buf.startswith(b"\x28\xb5\x2f\xfd"):
+        return "zst"
+    else:
+        return "tar"
+
+class _BlockWriter:
+    """File object that compresses an archive as a sequence of
+       independent blocks. A new gzip member, bzip2 stream, xz stream or
+       zstd frame is started at the first member header after each
+       'block_size' bytes of uncompressed data, and the start of every
+       block is recorded in 'checkpoints' as a pair of uncompressed and
+       compressed offsets. The result is an ordinary compressed archive,
+       since all decompressors read concatenated streams transparently.
+    """
+
+    def __init__(self, fileobj, comptype, block_size, compresslevel=9,
+                 preset=None, level=None, closefd=False):
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        try:
+            if comptype == "gz":
+                import zlib
+                self._compressor = lambda: zlib.compressobj(
+                    compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            elif comptype == "bz2":
+                from bz2 import BZ2Compressor
+                self._compressor = lambda: BZ2Compressor(compresslevel)
+            elif comptype == "xz":
+                from lzma import LZMACompressor
+                self._compressor = lambda: LZMACompressor(preset=preset)
+            elif comptype == "zst":
+                from compression.zstd import ZstdCompressor
+                self._compressor = lambda: ZstdCompressor(level=level)
+            else:
+                raise CompressionError("unknown compression type %r" % comptype)
+        except ImportError:
+            raise CompressionError("%s compression is not available"
+                                   % comptype) from None
+
+        self.name = getattr(fileobj, "name", None)
+        self.fileobj = fileobj
+        self.comptype = comptype
+        self.block_size = block_size
+        self.closefd = closefd
+        self.closed = False
+        self.pos = 0            # uncompressed bytes written
+        self.cpos = 0           # compressed bytes written
+        self.checkpoints = [(0, 0)]
+        self.cmp = self._compressor()
+
+    def _write(self, data):
+        if data:
+            self.fileobj.write(data)
+            self.cpos += len(data)
+
+    def write(self, data):
+        self._write(self.cmp.compress(data))
+        self.pos += len(data)
+
+    def tell(self):
+        return self.pos
+
+    def checkpoint(self):
+        """Start a new block if the current one is full. This is called
+           by TarFile before each member header.
+        """
+        if self.pos - self.checkpoints[-1][0] >= self.block_size:
+            self._write(self.cmp.flush())
+            self.cmp = self._compressor()
+            self.checkpoints.append((self.pos, self.cpos))
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._write(self.cmp.flush())
+        finally:
+            if self.closefd:
+                self.fileobj.close()
+# class _BlockWriter
+
+class _BlockReader:
+    """Seekable read-only file object for a compressed archive. Seeking
+       restarts decompression at the nearest preceding checkpoint, as
+       recorded by _BlockWriter, instead of at the start of the file.
+       Forward seeks within a block decompress and discard the data in
+       between.
+    """
+
+    def __init__(self, fileobj, comptype, checkpoints=((0, 0),),
+                 closefd=False):
+        try:
+            if comptype == "gz":
+                from gzip import GzipFile
+                self._decompressor = lambda f: GzipFile(fileobj=f, mode="rb")
+            elif comptype == "bz2":
+                from bz2 import BZ2File
+                self._decompressor = BZ2File
+            elif comptype == "xz":
+                from lzma import LZMAFile
+                self._decompressor = LZMAFile
+            elif comptype == "zst":
+                from compression.zstd import ZstdFile
+                self._decompressor = ZstdFile
+            else:
+                raise CompressionError("unknown compression type %r" % comptype)
+        except ImportError:
+            raise CompressionError("%s compression is not available"
+                                   % comptype) from None
+
+        self.name = getattr(fileobj, "name", None)
+        self.fileobj = fileobj
+        self.comptype = comptype
+        self.checkpoints = list(checkpoints)
+        self.closefd = closefd
+        self.closed = False
+        self._offsets = [offset for offset, _ in self.checkpoints]
+        self._base = fileobj.tell()
+        self._dec = None
+        self._block = None
+        self._start = 0
+        self.pos = 0
+        self._restart(0)
+
+    def _restart(self, block):
+        if self._dec is not None:
+            self._dec.close()
+        offset, coffset = self.checkpoints[block]
+        self.fileobj.seek(self._base + coffset)
+        self._dec = self._decompressor(self.fileobj)
+        self._block = block
+        self._start = self.pos = offset
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.pos
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            pos += self.pos
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("can only seek relative to the "
+                                          "start or the current position")
+        if pos < 0:
+            raise ValueError("negative seek position %d" % pos)
+        if pos == self.pos:
+            return pos
+        block = bisect.bisect_right(self._offsets, pos) - 1
+        if block != self._block or pos < self.pos:
+            self._restart(block)
+        self._dec.seek(pos - self._start)
+        self.pos = self._start + self._dec.tell()
+        return self.pos
+
+    def read(self, size=-1):
+        data = self._dec.read(size)
+        self.pos += len(data)
+        return data
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._dec.close()
+        finally:
+            if self.closefd:
+                self.fileobj.close()
+# class _BlockReader
+
 #------------------------
 # Extraction file object
 #------------------------
@@ -1692,6 +1869,67 @@ def isdev(self):
         return self.type in (CHRTYPE, BLKTYPE, FIFOTYPE)
 # class TarInfo
 
+class TarIndex:
+    """Random access index of a tar archive. 'members' is a list of
+       (name, offset) pairs giving the position of each member's header in
+       the uncompressed archive. 'checkpoints' is a sorted list of
+       (offset, compressed_offset) pairs at which decompression of a
+       compressed archive can be restarted.
+    """
+
+    version = 1
+
+    def __init__(self, members=(), checkpoints=((0, 0),)):
+        self.members = [(name, offset) for name, offset in members]
+        self.checkpoints = [(offset, coffset) for offset, coffset in checkpoints]
+        self._offsets = None
+
+    def __repr__(self):
+        return "<%s %d members, %d checkpoints>" % (self.__class__.__name__,
+                len(self.members), len(self.checkpoints))
+
+    def getoffset(self, name):
+        """Return the header offset of the last member called 'name' or
+           None if there is no such member.
+        """
+        if self._offsets is None:
+            self._offsets = dict(self.members)
+        return self._offsets.get(name)
+
+    def save(self, file):
+        """Write the index to 'file', a path or a binary file object.
+        """
+        import json
+        data = json.dumps({"version": self.version,
+                           "members": self.members,
+                           "checkpoints": self.checkpoints}).encode("ascii")
+        if hasattr(file, "write"):
+            file.write(data)
+        else:
+            with bltn_open(file, "wb") as f:
+                f.write(data)
+
+    @classmethod
+    def load(cls, file):
+        """Read an index written by save() from 'file', a path or a binary
+           file object.
+        """
+        import json
+        if hasattr(file, "read"):
+            data = file.read()
+        else:
+            with bltn_open(file, "rb") as f:
+                data = f.read()
+        try:
+            obj = json.loads(data)
+            if obj["version"] != cls.version:
+                raise ValueError("unsupported tar index version %r"
+                                 % obj["version"])
+            return cls(obj["members"], obj["checkpoints"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ReadError("invalid tar index: %s" % e) from None
+
+
 class TarFile(object):
     """The TarFile Class provides an interface to tar archives.
     """
@@ -1723,7 +1961,7 @@ class TarFile(object):
     def __init__(self, name=None, mode="r", fileobj=None, format=None,
             tarinfo=None, dereference=None, ignore_zeros=None, encoding=None,
             errors="surrogateescape", pax_headers=None, debug=None,
-            errorlevel=None, copybufsize=None, stream=False):
+            errorlevel=None, copybufsize=None, stream=False, index=None):
         """Open an (uncompressed) tar archive 'name'. 'mode' is either 'r' to
            read from an existing archive, 'a' to append data to an existing
            file or 'w' to create a new file overwriting an existing one. 'mode'
@@ -1731,6 +1969,8 @@ def __init__(self, name=None, mode="r", fileobj=None, format=None,
            If 'fileobj' is given, it is used for reading or writing data. If it
            can be determined, 'mode' is overridden by 'fileobj's mode.
            'fileobj' is not closed, when TarFile is closed.
+           If 'index' is a TarIndex, getmember() uses it to locate members
+           without reading through the archive.
         """
         modes = {"r": "rb", "a": "r+b", "w": "wb", "x": "xb"}
         if mode not in modes:
@@ -1791,6 +2031,8 @@ def __init__(self, name=None, mode="r", fileobj=None, format=None,
                                 # archive members already added
         self._unames = {}       # Cached mappings of uid -> uname
         self._gnames = {}       # Cached mappings of gid -> gname
+        self._index = index     # TarIndex used by getmember()
+        self._indexed = {}      # members read through the index by offset
 
         try:
             if self.mode == "r":
@@ -1881,6 +2123,10 @@ def open(cls, name=None, mode="r", fileobj=None, bufsize=RECORDSIZE, **kwargs):
         if not name and not fileobj:
             raise ValueError("nothing to open")
 
+        if (kwargs.get("block_size") is not None or
+            kwargs.get("index") is not None):
+            return cls._blockopen(name, mode, fileobj, **kwargs)
+
         if mode in ("r", "r:*"):
             # Find out which *open() is appropriate for opening the file.
             def not_compressed(comptype):
@@ -2076,6 +2322,79 @@ def zstopen(cls, name, mode="r", fileobj=None, level=None, options=None,
         t._extfileobj = False
         return t
 
+    @classmethod
+    def _blockopen(cls, name, mode, fileobj, block_size=None, index=None,
+                   compresslevel=9, preset=None, level=None, **kwargs):
+        """Open a tar archive for random access. For reading, 'index' is a
+           TarIndex whose checkpoints allow seeking in a compressed archive.
+           For writing, the archive is compressed in independent blocks of
+           about 'block_size' bytes, so that a later index of it has a
+           checkpoint at the start of every block.
+        """
+        if "|" in mode:
+            raise ValueError("block_size and index are not supported "
+                             "in stream mode")
+        filemode, _, comptype = mode.partition(":")
+        if filemode not in ("r", "a", "w", "x"):
+            raise ValueError("undiscernible mode")
+
+        if filemode == "r":
+            if block_size is not None:
+                raise ValueError("block_size is only valid for writing")
+            raw = fileobj
+            if raw is None:
+                raw = bltn_open(name, "rb")
+            try:
+                if comptype in ("", "*"):
+                    pos = raw.tell()
+                    comptype = _detect_comptype(raw.read(BLOCKSIZE))
+                    raw.seek(pos)
+                if comptype in ("", "tar"):
+                    t = cls.taropen(name, "r", raw, index=index, **kwargs)
+                    t._extfileobj = fileobj is not None
+                    return t
+                fileobj = _BlockReader(raw, comptype, index.checkpoints,
+                                       closefd=fileobj is None)
+            except:
+                if fileobj is None:
+                    raw.close()
+                raise
+            try:
+                t = cls.taropen(name, "r", fileobj, index=index, **kwargs)
+            except (OSError, EOFError) as e:
+                fileobj.close()
+                raise ReadError("not a %s file" % comptype) from e
+            except:
+                fileobj.close()
+                raise
+            t._extfileobj = False
+            return t
+
+        if index is not None:
+            raise ValueError("index is only valid for reading")
+        if filemode == "a" or comptype in ("", "tar"):
+            raise ValueError("block_size is only valid for writing "
+                             "compressed archives")
+        if comptype not in cls.OPEN_METH:
+            raise CompressionError("unknown compression type %r" % comptype)
+        raw = fileobj
+        if raw is None:
+            raw = bltn_open(name, filemode + "b")
+        try:
+            fileobj = _BlockWriter(raw, comptype, block_size, compresslevel,
+                                   preset, level, closefd=fileobj is None)
+        except:
+            if fileobj is None:
+                raw.close()
+            raise
+        try:
+            t = cls.taropen(name, filemode, fileobj, **kwargs)
+        except:
+            fileobj.close()
+            raise
+        t._extfileobj = False
+        return t
+
     # All *open() methods are registered here.
     OPEN_METH = {
         "tar": "taropen",   # uncompressed tar
@@ -2115,7 +2434,10 @@ def getmember(self, name):
            than once in the archive, its last occurrence is assumed to be the
            most up-to-date version.
         """
-        tarinfo = self._getmember(name.rstrip('/'))
+        if self._index is not None and not self._loaded:
+            tarinfo = self._getindexed(name.rstrip('/'))
+        else:
+            tarinfo = self._getmember(name.rstrip('/'))
         if tarinfo is None:
             raise KeyError("filename %r not found" % name)
         return tarinfo
@@ -2130,6 +2452,20 @@ def getmembers(self):
                                 # scan the whole archive.
         return self.members
 
+    def build_index(self):
+        """Return a TarIndex of the members of the archive. In read mode the
+           whole archive is scanned first. For an archive written with
+           'block_size', the index includes a checkpoint for every block.
+        """
+        if not self._loaded:
+            self.getmembers()
+        if isinstance(self.fileobj, (_BlockWriter, _BlockReader)):
+            checkpoints = self.fileobj.checkpoints
+        else:
+            checkpoints = [(0, 0)]
+        return TarIndex([(tarinfo.name, tarinfo.offset)
+                         for tarinfo in self.members], checkpoints)
+
     def getnames(self):
         """Return the members of the archive as a list of their names. It has
            the same order as the list returned by getmembers().
@@ -2350,6 +2686,10 @@ def addfile(self, tarinfo, fileobj=None):
         tarinfo = copy.copy(tarinfo)
 
         buf = tarinfo.tobuf(self.format, self.encoding, self.errors)
+        if isinstance(self.fileobj, _BlockWriter):
+            self.fileobj.checkpoint()
+        tarinfo.offset = self.offset
+        tarinfo.offset_data = self.offset + len(buf)
         self.fileobj.write(buf)
         self.offset += len(buf)
         bufsize=self.copybufsize
@@ -2915,6 +3255,28 @@ def _getmember(self, name, tarinfo=None, normalize=False):
             # Starting point was not found
             raise ValueError(tarinfo)
 
+    def _getindexed(self, name):
+        """Read the member called 'name' at the offset recorded in the
+           index.
+        """
+        self._check()
+        offset = self._index.getoffset(name)
+        if offset is None:
+            return None
+        tarinfo = self._indexed.get(offset)
+        if tarinfo is None:
+            saved_offset = self.offset
+            try:
+                self.fileobj.seek(offset)
+                tarinfo = self.tarinfo.fromtarfile(self)
+            except HeaderError as e:
+                raise ReadError("invalid index entry for %r: %s"
+                                % (name, e)) from None
+            finally:
+                self.offset = saved_offset
+            self._indexed[offset] = tarinfo
+        return tarinfo
+
     def _load(self):
         """Read through the entire archive file and look for readable
            members. This should not run if the file is set to stream.
@@ -152,6 +152,10 @@ def __reduce_ex__(self, p):
             pickle.loads(payload_1)
         # pickles with no globals are okay
         pickle.loads(payload_2)
+        # allowed globals are audited too
+        for loads in pickle.loads, pickle._loads:
+            with assertRaises(RuntimeError):
+                loads(payload_1, allowed_globals=[str])
 
 
 def test_monkeypatch():
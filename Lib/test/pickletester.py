@@ -1335,6 +1335,75 @@ def find_class(module_name, global_name):
         self.assertEqual(loads(b'cmath\nlog\n.'), ('math', 'log'))
         self.assertEqual(loads(b'\x8c\x04math\x8c\x03log\x93.'), ('math', 'log'))
 
+    def test_allowed_globals(self):
+        allowed = {('math', 'log'): math.log, ('spam', 'ham'): 42}
+        for data in (b'cmath\nlog\n.', b'\x8c\x04math\x8c\x03log\x93.'):
+            self.assertIs(self.loads(data, allowed_globals=allowed), math.log)
+            self.assertIs(self.loads(data, allowed_globals=[math.log]),
+                          math.log)
+        # The allowed objects are not imported.
+        self.assertEqual(self.loads(b'cspam\nham\n.', allowed_globals=allowed),
+                         42)
+        self.assertEqual(self.loads(b'\x80\x04\x8c\x04spam\x8c\x03ham\x93.',
+                                    allowed_globals=allowed), 42)
+        # INST and OBJ.
+        od = collections.OrderedDict
+        self.assertIs(type(self.loads(b'(icollections\nOrderedDict\n.',
+                                      allowed_globals=[od])), od)
+        self.assertIs(type(self.loads(b'(ccollections\nOrderedDict\no.',
+                                      allowed_globals=[od])), od)
+
+        for data in (b'cmath\nexp\n.', b'\x8c\x04math\x8c\x03exp\x93.',
+                     b'(cos\nsystem\nS"echo"\ntR.', b'(ios\nsystem\n.'):
+            with self.assertRaisesRegex(pickle.UnpicklingError, 'forbidden'):
+                self.loads(data, allowed_globals=allowed)
+            with self.assertRaisesRegex(pickle.UnpicklingError, 'forbidden'):
+                self.loads(data, allowed_globals=())
+
+        # Python 2 names are mapped before the lookup.
+        data = b'\x80\x02c__builtin__\nset\n.'
+        self.assertIs(self.loads(data, allowed_globals=[set]), set)
+        self.assertRaises(pickle.UnpicklingError, self.loads, data,
+                          allowed_globals=[set], fix_imports=False)
+        self.assertIs(self.loads(data, allowed_globals={('__builtin__', 'set'): set},
+                                 fix_imports=False), set)
+
+        self.assertRaises(TypeError, self.loads, b'N.',
+                          allowed_globals={'math.log': math.log})
+        self.assertRaises(TypeError, self.loads, b'N.',
+                          allowed_globals={('math', b'log'): math.log})
+        self.assertRaises(TypeError, self.loads, b'N.',
+                          allowed_globals={('math', 'log', ''): math.log})
+        class Key(tuple):
+            pass
+        self.assertRaises(TypeError, self.loads, b'N.',
+                          allowed_globals={Key(('math', 'log')): math.log})
+        self.assertRaises((TypeError, AttributeError), self.loads, b'N.',
+                          allowed_globals=[42])
+        self.assertRaises(TypeError, self.loads, b'N.', allowed_globals=42)
+
+    def test_allowed_globals_ext(self):
+        code = 0xfff0
+        data = b'\x83\xf0\xff.'
+        e = ExtensionSaver(code)
+        try:
+            copyreg.add_extension(__name__, 'MyList', code)
+            copyreg.clear_extension_cache()
+            # The allowed globals are not stored in the extension cache.
+            self.assertIs(self.loads(data,
+                    allowed_globals={(__name__, 'MyList'): list}), list)
+            self.assertIs(self.loads(data), MyList)
+            # Nor are they looked up in it.
+            self.assertIs(self.loads(data, allowed_globals=[MyList]), MyList)
+            self.assertIs(self.loads(data,
+                    allowed_globals={(__name__, 'MyList'): list}), list)
+            with self.assertRaisesRegex(pickle.UnpicklingError, 'forbidden'):
+                self.loads(data, allowed_globals=[])
+            self.assertIs(self.loads(data), MyList)
+        finally:
+            e.restore()
+            copyreg.clear_extension_cache()
+
     def test_bad_ext_code(self):
         # unregistered extension code
         self.check_unpickling_error(ValueError, b'\x82\x01.')
@@ -2819,6 +2888,62 @@ def test_recursive_tuple_and_inst_state(self):
             self.assertEqual(len(x.state), 1)
             self.assertIs(x.state[0], x)
 
+    def test_no_memoize(self):
+        shared = ['shared']
+        obj = {'rows': [(i, i / 2, str(i)) for i in range(50)],
+               'a': shared, 'b': shared}
+        memo_ops = {'PUT', 'BINPUT', 'LONG_BINPUT', 'MEMOIZE',
+                    'GET', 'BINGET', 'LONG_BINGET'}
+        for proto in protocols:
+            with self.subTest(proto=proto):
+                s = self.dumps(obj, proto, memoize=False)
+                ops = {op.name for op, arg, pos in pickletools.genops(s)}
+                self.assertFalse(ops & memo_ops)
+                if proto >= 4:
+                    self.check_frame_opcodes(s)
+                x = self.loads(s)
+                self.assertEqual(x, obj)
+                # Shared objects are pickled twice.
+                self.assertIsNot(x['a'], x['b'])
+
+    def test_no_memoize_recursive(self):
+        l = [1, 2]
+        l.append(l)
+        for proto in protocols:
+            with self.subTest(proto=proto):
+                with support.infinite_recursion(25):
+                    with self.assertRaises((ValueError, RecursionError)):
+                        self.dumps(l, proto, memoize=False)
+
+    def test_homogeneous_lists(self):
+        # Items of lists of ints, floats or strs are written directly,
+        # they must be pickled as by save(), i.e. as the items of a tuple.
+        def items(s):
+            skip = {'PROTO', 'FRAME', 'MARK', 'EMPTY_LIST', 'LIST', 'APPEND',
+                    'APPENDS', 'TUPLE', 'STOP', 'PUT', 'BINPUT',
+                    'LONG_BINPUT', 'MEMOIZE'}
+            return [(op.name, arg) for op, arg, pos in pickletools.genops(s)
+                    if op.name not in skip]
+
+        ints = [0, 1, -1, 255, 256, 65535, 65536, 2**30 - 1, 2**30,
+                2**31 - 1, 2**31, -2**31, -2**31 - 1, 2**64, -2**100,
+                10**400] * 3
+        floats = [0.0, -0.0, 1.5, 1e300, -1e-300, math.inf, -math.inf]
+        strs = ['', 'a', 'abc' * 100, '\u20ac', '\U0001f40d', '\udc80',
+                'x' * 70000]
+        mixed = [1, 'a', 2.0, None, 3, (4,), b'5', [6], 7]
+        for obj in ints, floats, strs, mixed, list(range(2500)):
+            for memoize in True, False:
+                for proto in protocols:
+                    with self.subTest(obj=obj[:3], memoize=memoize,
+                                      proto=proto):
+                        s = self.dumps(obj, proto, memoize=memoize)
+                        if proto >= 4:
+                            self.check_frame_opcodes(s)
+                        self.assertEqual(items(s), items(
+                            self.dumps(tuple(obj), proto, memoize=memoize)))
+                        self.assertEqual(self.loads(s), obj)
+
     def test_unicode(self):
         endcases = ['', '<\\u>', '<\\\u1234>', '<\n>',
                     '<\\>', '<\\\U00012345>',
@@ -26,6 +26,7 @@
     _have_multiprocessing = False
 
 from test import support
+from test.support import import_helper
 from test.support import os_helper
 from test.support import script_helper
 from test.test_py_compile import without_source_date_epoch
@@ -279,6 +280,107 @@ def test_compile_missing_multiprocessing(self, compile_file_mock):
         compileall.compile_dir(self.directory, quiet=True, workers=5)
         self.assertTrue(compile_file_mock.called)
 
+    def test_compile_executor_invalid(self):
+        with self.assertRaisesRegex(ValueError, "executor must be"):
+            compileall.compile_dir(self.directory, executor='thread')
+
+    def test_compile_executor_interpreter(self):
+        try:
+            from concurrent.futures import InterpreterPoolExecutor  # noqa: F401
+        except ImportError:
+            self.skipTest('requires InterpreterPoolExecutor')
+        self.assertTrue(compileall.compile_dir(self.directory, quiet=2,
+                                               workers=2,
+                                               executor='interpreter'))
+        self.assertTrue(os.path.isfile(self.bc_path))
+        self.assertTrue(os.path.isfile(
+            importlib.util.cache_from_source(self.source_path3)))
+
+    def compile_with_manifest(self, manifest, **kwargs):
+        with mock.patch('py_compile.compile',
+                        wraps=py_compile.compile) as compile_mock:
+            self.assertTrue(compileall.compile_dir(self.directory, quiet=2,
+                                                   manifest=manifest,
+                                                   **kwargs))
+        return sorted(call.args[0] for call in compile_mock.call_args_list)
+
+    def test_compile_dir_manifest(self):
+        manifest = os.path.join(self.directory, 'manifest.json')
+        sources = sorted([self.source_path, self.source_path2,
+                          self.source_path3])
+        self.assertEqual(self.compile_with_manifest(manifest, force=True),
+                         sources)
+        self.assertTrue(os.path.isfile(manifest))
+        # Nothing changed.
+        self.assertEqual(self.compile_with_manifest(manifest), [])
+
+        # Touching a source does not recompile it, the timestamp-based
+        # pyc is updated instead.
+        os.utime(self.source_path, (2**31 - 1, 2**31 - 1))
+        self.assertEqual(self.compile_with_manifest(manifest), [])
+        with open(self.bc_path, 'rb') as file:
+            flags = int.from_bytes(file.read(8)[4:], 'little')
+        if flags == 0:
+            self.assertEqual(*self.timestamp_metadata())
+
+        # Changed sources and removed pycs are recompiled.
+        with open(self.source_path2, 'w', encoding="utf-8") as file:
+            file.write('x = 456\n')
+        os.unlink(importlib.util.cache_from_source(self.source_path3))
+        self.assertEqual(self.compile_with_manifest(manifest),
+                         sorted([self.source_path2, self.source_path3]))
+        self.assertEqual(self.compile_with_manifest(manifest), [])
+
+        # Other compilation options recompile everything.
+        self.assertEqual(self.compile_with_manifest(manifest, ddir='ddir'),
+                         sources)
+
+    def test_compile_dir_manifest_bad_file(self):
+        manifest = os.path.join(self.directory, 'manifest.json')
+        with open(manifest, 'w', encoding='utf-8') as file:
+            file.write('{bad json')
+        self.assertEqual(len(self.compile_with_manifest(manifest)), 3)
+        self.assertEqual(self.compile_with_manifest(manifest), [])
+        self.add_bad_source_file()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertFalse(compileall.compile_dir(self.directory, quiet=1,
+                                                    manifest=manifest))
+            # Failed files are not recorded.
+            self.assertFalse(compileall.compile_dir(self.directory, quiet=1,
+                                                    manifest=manifest))
+
+    def test_compile_file_manifest(self):
+        manifest = os.path.join(self.directory, 'manifest.json')
+        self.assertTrue(compileall.compile_file(self.source_path, quiet=2,
+                                                manifest=manifest))
+        self.assertTrue(os.path.isfile(self.bc_path))
+        with mock.patch('py_compile.compile') as compile_mock:
+            self.assertTrue(compileall.compile_file(self.source_path, quiet=2,
+                                                    manifest=manifest))
+        self.assertFalse(compile_mock.called)
+
+    @skipUnless(_have_multiprocessing, "requires multiprocessing")
+    def test_compile_dir_manifest_workers(self):
+        manifest = os.path.join(self.directory, 'manifest.json')
+        self.assertTrue(compileall.compile_dir(self.directory, quiet=2,
+                                               workers=2, manifest=manifest))
+        self.assertTrue(os.path.isfile(self.bc_path))
+        self.assertEqual(self.compile_with_manifest(manifest), [])
+        with open(self.source_path, 'w', encoding="utf-8") as file:
+            file.write('x = 456\n')
+        self.assertTrue(compileall.compile_dir(self.directory, quiet=2,
+                                               workers=2, manifest=manifest))
+        self.assertEqual(self.compile_with_manifest(manifest), [])
+
+    def test_batches(self):
+        files = [(os.path.join(self.directory, f'{i}.py'), None)
+                 for i in range(100)]
+        weights = [compileall._file_weight(file) for file, _ in files]
+        batches = list(compileall._batches(files, weights, 2))
+        self.assertEqual([item for batch in batches for item in batch], files)
+        self.assertGreater(len(batches), 2)
+        self.assertLess(len(batches), 100)
+
     def test_compile_dir_maxlevels(self):
         # Test the actual impact of maxlevels parameter
         depth = 3
@@ -491,6 +593,131 @@ class CompileallTestsWithoutSourceEpoch(CompileallTestsBase,
     pass
 
 
+class CompileBundleTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(os_helper.rmtree, self.directory)
+        self.tree = os.path.join(self.directory, 'tree')
+        self.bundle = os.path.join(self.directory, 'bundle.snap')
+        self.pkgdir = os.path.join(self.tree, 'bundlepkg')
+        os.makedirs(os.path.join(self.pkgdir, 'sub'))
+        os.mkdir(os.path.join(self.tree, 'bundlens'))
+        self.write('bundlemod.py', 'x = 1\n')
+        self.write('bundlepkg/__init__.py', 'from . import sub\n')
+        self.write('bundlepkg/sub/__init__.py', 'y = 2\n')
+        self.write('bundlepkg/sub/leaf.py', 'z = 3\n')
+        self.write('bundlens/mod.py', 'w = 4\n')
+        self.write('not-a-module.py', 'v = 5\n')
+        self.write('data.txt', 'not python\n')
+
+    def write(self, name, source):
+        with open(os.path.join(self.tree, name), 'w', encoding='utf-8') as f:
+            f.write(source)
+
+    def modules(self, **kwargs):
+        from importlib import snapshot
+        finder = snapshot.SnapshotFinder(self.bundle, **kwargs)
+        self.addCleanup(finder.close)
+        return finder
+
+    def check_bundle(self):
+        finder = self.modules()
+        self.assertEqual(sorted(finder.modules()),
+                         ['bundlemod', 'bundlens.mod', 'bundlepkg',
+                          'bundlepkg.sub', 'bundlepkg.sub.leaf'])
+        spec = finder.find_spec('bundlepkg.sub')
+        self.assertEqual(spec.origin,
+                         os.path.join(self.pkgdir, 'sub', '__init__.py'))
+        self.assertEqual(spec.submodule_search_locations,
+                         [os.path.join(self.pkgdir, 'sub')])
+        spec = finder.find_spec('bundlepkg.sub.leaf')
+        self.assertIsNone(spec.submodule_search_locations)
+        code = spec.loader.get_code('bundlepkg.sub.leaf')
+        self.assertEqual(code.co_filename, spec.origin)
+        namespace = {}
+        exec(code, namespace)
+        self.assertEqual(namespace['z'], 3)
+        # No pyc files are written.
+        self.assertFalse(os.path.exists(
+            importlib.util.cache_from_source(spec.origin)))
+
+    def test_compile_bundle(self):
+        self.assertTrue(compileall.compile_bundle(self.tree, self.bundle,
+                                                  quiet=2))
+        self.check_bundle()
+
+    @skipUnless(_have_multiprocessing, "requires multiprocessing")
+    def test_compile_bundle_workers(self):
+        self.assertTrue(compileall.compile_bundle(self.tree, self.bundle,
+                                                  quiet=2, workers=2))
+        self.check_bundle()
+
+    def test_import_from_bundle(self):
+        self.assertTrue(compileall.compile_bundle(self.tree, self.bundle,
+                                                  quiet=2))
+        finder = self.modules(check_source=False)
+        # The sources are not used.
+        os.unlink(os.path.join(self.pkgdir, 'sub', 'leaf.py'))
+        with test.test_importlib.util.uncache('bundlepkg', 'bundlepkg.sub',
+                                              'bundlepkg.sub.leaf'), \
+             import_helper.DirsOnSysPath(self.tree), \
+             support.swap_attr(sys, 'meta_path', [finder, *sys.meta_path]):
+            import bundlepkg.sub.leaf
+            from importlib import snapshot
+            self.assertIsInstance(bundlepkg.sub.leaf.__spec__.loader,
+                                  snapshot.SnapshotLoader)
+            self.assertEqual(bundlepkg.sub.leaf.z, 3)
+
+    def test_ddir_and_rx(self):
+        import re
+        self.assertTrue(compileall.compile_bundle(
+            self.tree, self.bundle, quiet=2, ddir='/deployed',
+            rx=re.compile('leaf')))
+        finder = self.modules(check_source=False)
+        self.assertNotIn('bundlepkg.sub.leaf', finder.modules())
+        spec = finder.find_spec('bundlepkg.sub')
+        self.assertEqual(spec.origin,
+                         os.path.join('/deployed', 'bundlepkg', 'sub',
+                                      '__init__.py'))
+        self.assertEqual(spec.loader.get_code('bundlepkg.sub').co_filename,
+                         spec.origin)
+
+    def test_package_shadows_module(self):
+        self.write('bundlepkg.py', 'shadowed = True\n')
+        self.assertTrue(compileall.compile_bundle(self.tree, self.bundle,
+                                                  quiet=2))
+        finder = self.modules()
+        spec = finder.find_spec('bundlepkg')
+        self.assertEqual(spec.origin,
+                         os.path.join(self.pkgdir, '__init__.py'))
+
+    def test_bad_source(self):
+        self.write('bundlebad.py', 'x (\n')
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            self.assertFalse(compileall.compile_bundle(self.tree,
+                                                       self.bundle,
+                                                       quiet=1))
+        self.assertIn('bundlebad.py', stdout.getvalue())
+        self.assertIn('SyntaxError', stdout.getvalue())
+        finder = self.modules()
+        self.assertNotIn('bundlebad', finder.modules())
+        self.assertIn('bundlemod', finder.modules())
+
+    def test_cli(self):
+        rc, out, err = script_helper.assert_python_ok(
+            '-m', 'compileall', '-q', '--bundle', self.bundle, self.tree)
+        self.assertEqual(err, b'')
+        self.check_bundle()
+        rc, out, err = script_helper.assert_python_failure(
+            '-m', 'compileall', '--bundle', self.bundle, self.tree,
+            self.directory)
+        self.assertIn(b'--bundle requires a single directory', err)
+        rc, out, err = script_helper.assert_python_failure(
+            '-m', 'compileall', '-b', '--bundle', self.bundle, self.tree)
+        self.assertIn(b'--bundle cannot be used', err)
+
+
 # WASI does not have a temp directory and uses cwd instead. The cwd contains
 # non-ASCII chars, so _walk_dir() fails to encode self.directory.
 @unittest.skipIf(support.is_wasi, "tempdir is not encodable on WASI")
@@ -866,6 +1093,26 @@ def test_workers(self):
         for file in files:
             self.assertCompiled(file)
 
+    def test_manifest(self):
+        manifest = os.path.join(self.directory, 'manifest.json')
+        self.assertRunOK('-q', '--manifest', manifest, self.pkgdir)
+        self.assertCompiled(self.initfn)
+        self.assertCompiled(self.barfn)
+        self.assertTrue(os.path.isfile(manifest))
+        os.unlink(importlib.util.cache_from_source(self.barfn))
+        out = self.assertRunOK('--manifest', manifest, self.pkgdir)
+        self.assertIn(b'Compiling', out)
+        self.assertIn(b'bar.py', out)
+        self.assertNotIn(b'__init__.py', out)
+        self.assertCompiled(self.barfn)
+
+    @mock.patch('compileall.compile_dir')
+    def test_executor(self, compile_dir):
+        with mock.patch("sys.argv", new=[sys.executable, self.directory,
+                                         "-j2", "--executor", "interpreter"]):
+            compileall.main()
+        self.assertEqual(compile_dir.call_args[-1]['executor'], 'interpreter')
+
     @mock.patch('compileall.compile_dir')
     def test_workers_available_cores(self, compile_dir):
         with mock.patch("sys.argv",
@@ -362,6 +362,80 @@ def test_writerows_errors(self):
             self.assertRaises(TypeError, writer.writerows, None)
             self.assertRaises(OSError, writer.writerows, BadIterable())
 
+    def test_writerows_batched(self):
+        writes = []
+        class File:
+            def write(self, buf):
+                writes.append(buf)
+        writer = csv.writer(File())
+        writer.writerows([['a', i, i / 2] for i in range(1000)])
+        self.assertLess(len(writes), 10)
+        self.assertEqual(''.join(writes),
+                         ''.join(f'a,{i},{i / 2}\r\n' for i in range(1000)))
+
+    def test_writerows_error_writes_previous_rows(self):
+        fileobj = StringIO()
+        writer = csv.writer(fileobj)
+        rows = [['a', 1], ['b', 2], BadIterable(), ['c', 3]]
+        self.assertRaises(OSError, writer.writerows, rows)
+        self.assertEqual(fileobj.getvalue(), 'a,1\r\nb,2\r\n')
+
+        fileobj = StringIO()
+        writer = csv.writer(fileobj)
+        self.assertRaises(csv.Error, writer.writerows, [['a'], 1, ['b']])
+        self.assertEqual(fileobj.getvalue(), 'a\r\n')
+
+    def test_write_numbers(self):
+        class MyInt(int):
+            def __str__(self):
+                return 'myint'
+        class MyFloat(float):
+            def __str__(self):
+                return 'myfloat'
+        values = [0, -1, 2**63 - 1, -2**63, 2**64, 10**30,
+                  0.0, -0.0, 1.5, 1e100, 1e-7, 2.0**70,
+                  float('inf'), float('-inf'), float('nan'), True, False]
+        self._write_test(values, ','.join(map(str, values)))
+        self._write_test([MyInt(1), MyFloat(2.0)], 'myint,myfloat')
+        self._write_test([1, 2.5], '1,2.5', quoting=csv.QUOTE_NONNUMERIC)
+        self._write_test([1, 2.5], '"1","2.5"', quoting=csv.QUOTE_ALL)
+        self._write_test([1.5], '"1.5"', delimiter='.')
+        self._write_test([-1], '-1', quoting=csv.QUOTE_STRINGS)
+        self._write_error_test(csv.Error, [1.5], delimiter='.',
+                               quoting=csv.QUOTE_NONE)
+
+    def test_writecolumns(self):
+        fileobj = StringIO()
+        writer = csv.writer(fileobj)
+        self.assertIsNone(writer.writecolumns([[1, 2, 3], ('a', 'b,c', None),
+                                               iter([1.5, 'x', ''])]))
+        self.assertEqual(fileobj.getvalue(),
+                         '1,a,1.5\r\n2,"b,c",x\r\n3,,\r\n')
+
+        fileobj = StringIO()
+        writer = csv.writer(fileobj)
+        writer.writecolumns([])
+        writer.writecolumns([[], []])
+        writer.writecolumns([[None]])
+        self.assertEqual(fileobj.getvalue(), '""\r\n')
+
+    def test_writecolumns_errors(self):
+        fileobj = StringIO()
+        writer = csv.writer(fileobj)
+        self.assertRaises(csv.Error, writer.writecolumns, None)
+        self.assertRaises(csv.Error, writer.writecolumns, [[1], 2])
+        self.assertRaises(OSError, writer.writecolumns, BadIterable())
+        with self.assertRaisesRegex(ValueError, 'column 1 has length 1'):
+            writer.writecolumns([[1, 2], [3]])
+        self.assertEqual(fileobj.getvalue(), '')
+
+        class BadItem:
+            def __str__(self):
+                raise OSError
+        self.assertRaises(OSError, writer.writecolumns,
+                          [['a', 'b', 'c'], [1, BadItem(), 3]])
+        self.assertEqual(fileobj.getvalue(), 'a,1\r\n')
+
     def _read_test(self, input, expect, **kwargs):
         reader = csv.reader(input, **kwargs)
         result = list(reader)
@@ -906,6 +980,44 @@ def test_write_field_not_in_field_names_ignore(self):
         writer = csv.DictWriter(fileobj, ['f1', 'f2'], extrasaction="IGNORE")
         csv.DictWriter.writerow(writer, dictrow)
 
+    def test_write_dataclass_rows(self):
+        from dataclasses import dataclass, field
+        from typing import ClassVar
+
+        @dataclass
+        class Point:
+            x: int
+            y: float
+            label: str = 'p'
+            kind: ClassVar[str] = 'point'
+
+        fileobj = StringIO()
+        writer = csv.DictWriter(fileobj, ['label', 'x', 'y'])
+        writer.writerow(Point(1, 2.5))
+        writer.writerows([Point(3, 4.0, 'q,r'), {'x': 5, 'y': 6}])
+        self.assertEqual(fileobj.getvalue(),
+                         'p,1,2.5\r\n"q,r",3,4.0\r\n,5,6\r\n')
+
+        fileobj = StringIO()
+        writer = csv.DictWriter(fileobj, ['x', 'z'], restval='-',
+                                extrasaction='ignore')
+        writer.writerows([Point(1, 2.0), Point(3, 4.0)])
+        self.assertEqual(fileobj.getvalue(), '1,-\r\n3,-\r\n')
+
+        fileobj = StringIO()
+        writer = csv.DictWriter(fileobj, ['x'])
+        with self.assertRaises(ValueError) as cx:
+            writer.writerow(Point(1, 2.0))
+        exception = str(cx.exception)
+        self.assertIn("'y'", exception)
+        self.assertIn("'label'", exception)
+        self.assertNotIn("'x'", exception)
+        self.assertNotIn("'kind'", exception)
+
+        writer.fieldnames = ['y', 'x', 'label']
+        writer.writerow(Point(1, 2.0))
+        self.assertEqual(fileobj.getvalue(), '2.0,1,p\r\n')
+
     def test_dict_reader_fieldnames_accepts_iter(self):
         fieldnames = ["a", "b", "c"]
         f = StringIO()
@@ -89,6 +89,17 @@ def test_readonly_keys(self):
     def test_readonly_iter(self):
         self.assertEqual([k for k in self.db], [b"key1", b"key2"])
 
+    def test_readonly_items(self):
+        self.assertEqual(list(self.db.items()),
+                         [(b"key1", b"value1"), (b"key2", b"value2")])
+        self.assertEqual(list(self.db.values()), [b"value1", b"value2"])
+        self.assertIn((b"key1", b"value1"), self.db.items())
+
+    def test_readonly_bulk_update(self):
+        with self.assertRaises(dbm_sqlite3.error):
+            self.db.bulk_update({b"new": b"value"})
+        self.assertNotIn(b"new", self.db)
+
 
 class ReadWrite(_SQLiteDbmTests):
 
@@ -135,6 +146,45 @@ def test_readwrite_null_value(self):
         with self.assertRaises(dbm_sqlite3.error):
             self.db[b"key"] = None
 
+    def test_readwrite_pragmas(self):
+        cx = self.db._cx
+        self.assertEqual(cx.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(cx.execute("PRAGMA mmap_size").fetchone()[0],
+                         dbm_sqlite3.MMAP_SIZE)
+
+    def test_readwrite_batch(self):
+        with self.db.batch() as db:
+            self.assertIs(db, self.db)
+            db["a"] = "1"
+            with db.batch():
+                db["b"] = "2"
+            # Not visible from another connection until committed.
+            self.assertEqual(self.db_content(), ([], []))
+        self.assertEqual(self.db_content(), ([b"a", b"b"], [b"1", b"2"]))
+
+    def test_readwrite_batch_rollback(self):
+        self.db["a"] = "1"
+        with self.assertRaises(ZeroDivisionError):
+            with self.db.batch():
+                self.db["a"] = "2"
+                del self.db["a"]
+                1/0
+        self.assertEqual(self.db_content(), ([b"a"], [b"1"]))
+        # The connection is usable again.
+        self.db["b"] = "3"
+        self.assertEqual(self.db_content(), ([b"a", b"b"], [b"1", b"3"]))
+
+    def test_readwrite_bulk_update(self):
+        self.db.bulk_update({"a": "1", b"b": b"2"})
+        self.db.bulk_update([("c", "3"), ("a", "4")])
+        self.db.update({"d": "5"}, e="6")
+        self.assertEqual(dict(self.db.items()),
+                         {b"a": b"4", b"b": b"2", b"c": b"3",
+                          b"d": b"5", b"e": b"6"})
+        with self.assertRaises(dbm_sqlite3.error):
+            self.db.bulk_update([("f", "7"), ("g", None)])
+        self.assertNotIn(b"f", self.db)
+
 
 class Misuse(_SQLiteDbmTests):
 
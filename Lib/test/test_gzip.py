@@ -892,6 +892,32 @@ def test_write_seek_write(self):
         data = b.getvalue()
         self.assertEqual(gzip.decompress(data), message * 2)
 
+    def test_write_threads(self):
+        uncompressed = os.urandom(200_000) + data1 * 20_000
+        b = io.BytesIO()
+        with gzip.GzipFile(fileobj=b, mode='wb', threads=3, mtime=0) as f:
+            f.write(uncompressed[:1000])
+            f.flush()
+            f.write(uncompressed[1000:500_000])
+            f.flush(zlib.Z_FULL_FLUSH)
+            f.write(uncompressed[500_000:])
+        # The result is a single gzip member.
+        d = zlib.decompressobj(31)
+        self.assertEqual(d.decompress(b.getvalue()), uncompressed)
+        self.assertTrue(d.eof)
+        self.assertEqual(d.unused_data, b'')
+        # Blocks are primed with the preceding data, so repetition across
+        # block boundaries is still found.
+        self.assertLess(len(b.getvalue()), 250_000)
+
+        with gzip.open(self.filename, 'wb', threads=0) as f:
+            pass
+        with gzip.open(self.filename, 'rb', threads=2) as f:
+            self.assertEqual(f.read(), b'')
+
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(), mode='wb', threads=-1)
+
 
     def test_refloop_unraisable(self):
         # Ensure a GzipFile referring to a temporary fileobj deletes cleanly.
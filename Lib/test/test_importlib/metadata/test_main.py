@@ -1,3 +1,4 @@
+import os
 import re
 import pickle
 import unittest
@@ -5,6 +6,7 @@
 import importlib
 import importlib.metadata
 import contextlib
+import unittest.mock
 from test.support import os_helper
 
 try:
@@ -146,6 +148,80 @@ def test_unique_distributions(self):
         assert len(after) == len(before)
 
 
+class DiscoveryCacheTests(fixtures.OnSysPath, fixtures.SiteDir, unittest.TestCase):
+    @staticmethod
+    def make_pkg(name, version='1.0'):
+        return {
+            f'{name}.dist-info': {
+                'METADATA': f'Name: {name}\nVersion: {version}\n',
+                'entry_points.txt': f'[plugins]\n{name} = {name}:main\n'
+                '[console_scripts]\n'
+                f'{name}-cli = {name}.cli:run\n',
+            },
+        }
+
+    def count_reads(self):
+        reads = []
+        orig = importlib.metadata.PathDistribution._read_text
+
+        def _read_text(dist, filename):
+            reads.append(filename)
+            return orig(dist, filename)
+
+        self.fixtures.enter_context(
+            unittest.mock.patch.object(
+                importlib.metadata.PathDistribution, '_read_text', _read_text
+            )
+        )
+        return reads
+
+    def touch_site_dir(self):
+        # Ensure the mtime of the site dir changes even with a coarse
+        # timestamp resolution.
+        st = os.stat(self.site_dir)
+        os.utime(self.site_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    def test_metadata_read_once(self):
+        fixtures.build_files(self.make_pkg('cached_pkg'), self.site_dir)
+        reads = self.count_reads()
+        for _ in range(3):
+            assert version('cached-pkg') == '1.0'
+            eps = entry_points(group='plugins')
+            assert eps['cached_pkg'].value == 'cached_pkg:main'
+        assert reads.count('METADATA') == 1
+        assert reads.count('entry_points.txt') == 1
+
+    def test_entry_points_by_group(self):
+        fixtures.build_files(self.make_pkg('pkg_a'), self.site_dir)
+        fixtures.build_files(self.make_pkg('pkg_b'), self.site_dir)
+        eps = entry_points(group='plugins')
+        assert eps.names == {'pkg_a', 'pkg_b'}
+        assert {ep.dist.name for ep in eps} == {'pkg_a', 'pkg_b'}
+        assert entry_points(group='missing') == importlib.metadata.EntryPoints()
+        all_eps = entry_points()
+        assert all_eps.select(group='plugins') == eps
+        assert all_eps.select(group='console_scripts').names == {
+            'pkg_a-cli',
+            'pkg_b-cli',
+        }
+        assert entry_points(group='plugins', name='pkg_b').names == {'pkg_b'}
+
+    def test_invalidated_by_mtime(self):
+        fixtures.build_files(self.make_pkg('pkg_a'), self.site_dir)
+        assert entry_points(group='plugins').names == {'pkg_a'}
+        fixtures.build_files(self.make_pkg('pkg_b'), self.site_dir)
+        self.touch_site_dir()
+        assert entry_points(group='plugins').names == {'pkg_a', 'pkg_b'}
+        assert version('pkg-b') == '1.0'
+
+    def test_invalidate_caches(self):
+        fixtures.build_files(self.make_pkg('pkg_a'), self.site_dir)
+        assert version('pkg-a') == '1.0'
+        fixtures.build_files(self.make_pkg('pkg_a', '2.0'), self.site_dir)
+        importlib.invalidate_caches()
+        assert version('pkg-a') == '2.0'
+
+
 class NonASCIITests(fixtures.OnSysPath, fixtures.SiteDir, unittest.TestCase):
     @staticmethod
     def pkg_with_non_ascii_description(site_dir):
@@ -3,12 +3,16 @@
 machinery = util.import_importlib('importlib.machinery')
 
 import errno
+import marshal
 import os
 import py_compile
 import stat
 import sys
 import tempfile
+import time
+from test.support import os_helper, swap_item
 from test.support.import_helper import make_legacy_pyc
+from test.support.script_helper import assert_python_ok
 import unittest
 
 
@@ -208,5 +212,120 @@ def _find(self, finder, name, loader_only=False):
  ) = util.test_both(FinderTestsPEP420, machinery=machinery)
 
 
+class DirectoryCacheTests:
+
+    def setUp(self):
+        self.namespace = self.machinery.FileFinder._fill_cache.__globals__
+        tempdir = tempfile.TemporaryDirectory()
+        self.enterContext(tempdir)
+        self.root = os.path.join(tempdir.name, 'root')
+        os.mkdir(self.root)
+        self.filename = os.path.join(tempdir.name, 'importcache')
+        self.add_module('mod')
+
+    def add_module(self, name, *, age=60):
+        with open(os.path.join(self.root, name + '.py'), 'w',
+                  encoding='utf-8'):
+            pass
+        # Set an old mtime, so that the listing can be cached.
+        mtime = time.time() - age
+        os.utime(self.root, (mtime, mtime))
+
+    def new_cache(self):
+        cache = self.namespace['_DirectoryCache'](self.filename)
+        self.enterContext(swap_item(self.namespace, '_directory_cache', cache))
+        return cache
+
+    def find(self, name):
+        finder = self.machinery.FileFinder(
+            self.root,
+            (self.machinery.SourceFileLoader, self.machinery.SOURCE_SUFFIXES))
+        return finder.find_spec(name)
+
+    def test_listing_is_reused(self):
+        cache = self.new_cache()
+        self.assertIsNotNone(self.find('mod'))
+        cache.save()
+        self.assertTrue(os.path.exists(self.filename))
+
+        # Add a module without changing the mtime of the directory: the
+        # cached listing does not contain it.
+        mtime = os.stat(self.root).st_mtime_ns
+        self.add_module('other')
+        os.utime(self.root, ns=(mtime, mtime))
+        self.new_cache()
+        self.assertIsNotNone(self.find('mod'))
+        self.assertIsNone(self.find('other'))
+
+    def test_mtime_change(self):
+        cache = self.new_cache()
+        self.assertIsNone(self.find('other'))
+        cache.save()
+        self.add_module('other', age=30)
+        cache = self.new_cache()
+        self.assertIsNotNone(self.find('other'))
+        cache.save()
+        self.new_cache()
+        self.assertIsNotNone(self.find('other'))
+
+    def test_recent_directory(self):
+        self.add_module('other', age=0)
+        cache = self.new_cache()
+        self.assertIsNotNone(self.find('other'))
+        cache.save()
+        self.assertFalse(os.path.exists(self.filename))
+
+    def test_invalidate_caches(self):
+        cache = self.new_cache()
+        finder = self.machinery.FileFinder(
+            self.root,
+            (self.machinery.SourceFileLoader, self.machinery.SOURCE_SUFFIXES))
+        self.assertIsNotNone(finder.find_spec('mod'))
+        mtime = os.stat(self.root).st_mtime
+        self.assertIsNotNone(cache.get(self.root, mtime))
+        finder.invalidate_caches()
+        self.assertIsNone(cache.get(self.root, mtime))
+
+    def test_concurrent_save(self):
+        other_root = os.path.join(os.path.dirname(self.root), 'other')
+        os.mkdir(other_root)
+        cache1 = self.namespace['_DirectoryCache'](self.filename)
+        cache2 = self.namespace['_DirectoryCache'](self.filename)
+        cache1.put(self.root, 1.0, ['a.py'])
+        cache2.put(other_root, 2.0, ['b.py'])
+        cache1.save()
+        cache2.save()
+        cache = self.namespace['_DirectoryCache'](self.filename)
+        self.assertEqual(cache.get(self.root, 1.0), ('a.py',))
+        self.assertEqual(cache.get(other_root, 2.0), ('b.py',))
+        self.assertIsNone(cache.get(other_root, 3.0))
+
+    def test_bad_file(self):
+        for data in (b'', b'spam', marshal.dumps(42), marshal.dumps((0, {})),
+                     marshal.dumps((1, {'a': 1})),
+                     marshal.dumps((1, {'a': (1.0, ['a.py'])}))):
+            with self.subTest(data=data):
+                with open(self.filename, 'wb') as f:
+                    f.write(data)
+                self.new_cache()
+                self.assertIsNotNone(self.find('mod'))
+
+    def test_options(self):
+        code = 'import os.path'
+        assert_python_ok('-E', '-c', code, PYTHONIMPORTCACHE=self.filename)
+        self.assertFalse(os.path.exists(self.filename))
+        assert_python_ok('-c', code, PYTHONIMPORTCACHE=self.filename)
+        self.assertTrue(os.path.exists(self.filename))
+        os_helper.unlink(self.filename)
+        assert_python_ok('-X', f'importcache={self.filename}', '-c', code)
+        self.assertTrue(os.path.exists(self.filename))
+
+
+(Frozen_DirectoryCacheTests,
+ Source_DirectoryCacheTests
+ ) = util.test_both(DirectoryCacheTests, unittest.TestCase,
+                    machinery=machinery)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,6 +9,8 @@
 from test import support
 from test.support import import_helper
 from test.support import os_helper
+from test.support import threading_helper
+import threading
 import traceback
 import types
 import unittest
@@ -100,6 +102,97 @@ def load_b():
      ImportModuleTests, init=init, util=util, machinery=machinery)
 
 
+class ImportParallelTests:
+
+    """Test importlib.import_parallel."""
+
+    def test_import(self):
+        modules = ['a', 'b.__init__', 'b.c', 'd']
+        for max_workers in (None, 1, 2):
+            with self.subTest(max_workers=max_workers):
+                with test_util.mock_spec(*modules) as mock:
+                    with test_util.import_state(meta_path=[mock]):
+                        result = self.init.import_parallel(
+                            ['d', 'b.c', 'a', '.c'], 'b',
+                            max_workers=max_workers)
+                        self.assertEqual(result, [mock['d'], mock['b.c'],
+                                                  mock['a'], mock['b.c']])
+
+    def test_empty(self):
+        self.assertEqual(self.init.import_parallel([]), [])
+        self.assertEqual(self.init.import_parallel(iter([])), [])
+
+    def test_bad_max_workers(self):
+        with self.assertRaises(ValueError):
+            self.init.import_parallel(['a'], max_workers=0)
+
+    @threading_helper.requires_working_threading()
+    def test_concurrent(self):
+        # The two modules can only be executed if they are executed at the
+        # same time.
+        barrier = threading.Barrier(2, timeout=support.SHORT_TIMEOUT)
+        code = {'a': barrier.wait, 'b': barrier.wait}
+        with test_util.mock_spec('a', 'b', module_code=code) as mock:
+            with test_util.import_state(meta_path=[mock]):
+                result = self.init.import_parallel(['a', 'b'], max_workers=2)
+        self.assertEqual(result, [mock['a'], mock['b']])
+
+    @threading_helper.requires_working_threading()
+    def test_loaded_once(self):
+        # The parent package is executed once, although two threads import
+        # its submodules.
+        load_count = 0
+        def load_pkg():
+            nonlocal load_count
+            load_count += 1
+        code = {'pkg': load_pkg}
+        modules = ['pkg.__init__', 'pkg.a', 'pkg.b']
+        with test_util.mock_spec(*modules, module_code=code) as mock:
+            with test_util.import_state(meta_path=[mock]):
+                self.init.import_parallel(['pkg.a', 'pkg.b'], max_workers=2)
+        self.assertEqual(load_count, 1)
+
+    @threading_helper.requires_working_threading()
+    def test_circular_import(self):
+        # Each module imports the other one once both threads hold the lock
+        # of their module.
+        barrier = threading.Barrier(2, timeout=support.SHORT_TIMEOUT)
+        loaded = set()
+        def load(name, other):
+            # A module can be executed again after a deadlock.
+            if name not in loaded:
+                loaded.add(name)
+                barrier.wait()
+            self.init.import_module(other)
+        code = {'a': lambda: load('a', 'b'), 'b': lambda: load('b', 'a')}
+        with test_util.mock_spec('a', 'b', module_code=code) as mock:
+            with test_util.import_state(meta_path=[mock]):
+                result = self.init.import_parallel(['a', 'b'], max_workers=2)
+        self.assertEqual(result, [mock['a'], mock['b']])
+
+    @threading_helper.requires_working_threading()
+    def test_error(self):
+        loaded = []
+        def fail(name):
+            raise ValueError(name)
+        code = {'a': lambda: loaded.append('a'),
+                'b': lambda: fail('b'),
+                'c': lambda: fail('c')}
+        with test_util.mock_spec('a', 'b', 'c', module_code=code) as mock:
+            with test_util.import_state(meta_path=[mock]):
+                with self.assertRaisesRegex(ValueError, '^b$'):
+                    self.init.import_parallel(['a', 'b', 'c'], max_workers=3)
+                with self.assertRaises(ModuleNotFoundError):
+                    self.init.import_parallel(['a', 'missing'], max_workers=2)
+        self.assertEqual(loaded, ['a'])
+
+
+(Frozen_ImportParallelTests,
+ Source_ImportParallelTests
+ ) = test_util.test_both(
+     ImportParallelTests, init=init, util=util, machinery=machinery)
+
+
 class FindLoaderTests:
 
     FakeMetaFinder = None
@@ -1,13 +1,15 @@
 import importlib
 from importlib import abc
 from importlib import util
+import os
 import sys
 import time
 import threading
 import types
 import unittest
 
-from test.support import threading_helper
+from test.support import import_helper, os_helper, threading_helper
+from test.support.script_helper import assert_python_ok
 from test.test_importlib import util as test_util
 
 
@@ -225,5 +227,156 @@ def __delattr__(self, name):
             del module.CONSTANT
 
 
+class LazyImportsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(util.disable_lazy_imports)
+        self.addCleanup(util._eager_imports.clear)
+        self.dir = self.enterContext(os_helper.temp_dir())
+        self.enterContext(import_helper.DirsOnSysPath(self.dir))
+        self.enterContext(test_util.uncache('lazypkg', 'lazypkg.sub',
+                                            'lazypkg.eager', 'lazymod'))
+        self.write('lazymod.py', 'attr = 42')
+        os.mkdir(os.path.join(self.dir, 'lazypkg'))
+        self.write('lazypkg/__init__.py', 'attr = 1')
+        self.write('lazypkg/sub.py', 'attr = 2')
+        self.write('lazypkg/eager.py', 'attr = 3')
+        importlib.invalidate_caches()
+
+    def write(self, name, source):
+        with open(os.path.join(self.dir, name), 'w', encoding='utf-8') as f:
+            f.write(source)
+
+    def assertLazy(self, name):
+        self.assertIs(type(sys.modules[name]), util._LazyModule)
+
+    def assertLoaded(self, name):
+        self.assertIsNot(type(sys.modules[name]), util._LazyModule)
+
+    def test_import(self):
+        util.enable_lazy_imports('lazymod')
+        import lazymod
+        import lazymod
+        self.assertLazy('lazymod')
+        self.assertEqual(lazymod.attr, 42)
+        self.assertLoaded('lazymod')
+        reason = util.eager_imports()['lazymod']
+        self.assertIn("attribute 'attr' accessed at", reason)
+        self.assertIn(__file__, reason)
+
+    def test_import_submodule(self):
+        util.enable_lazy_imports('lazypkg')
+        import lazypkg.sub
+        self.assertLazy('lazypkg')
+        self.assertLazy('lazypkg.sub')
+        self.assertIs(lazypkg.sub, sys.modules['lazypkg.sub'])
+        self.assertLazy('lazypkg')
+        self.assertEqual(lazypkg.sub.attr, 2)
+        self.assertLazy('lazypkg')
+        self.assertEqual(lazypkg.attr, 1)
+        self.assertIs(lazypkg.sub, sys.modules['lazypkg.sub'])
+        self.assertEqual(util.eager_imports().keys(), {'lazypkg', 'lazypkg.sub'})
+
+    def test_from_import_submodule(self):
+        util.enable_lazy_imports('lazypkg')
+        from lazypkg import sub
+        self.assertLoaded('lazypkg')
+        self.assertLazy('lazypkg.sub')
+        self.assertEqual(sub.attr, 2)
+
+    def test_from_import_attribute_shadowing_submodule(self):
+        # The package's attribute wins over the submodule of the same name,
+        # as with eager imports.
+        self.write('lazypkg/__init__.py', "sub = 'attr'")
+        util.enable_lazy_imports('lazypkg')
+        from lazypkg import sub
+        self.assertEqual(sub, 'attr')
+        self.assertNotIn('lazypkg.sub', sys.modules)
+
+    def test_from_import_attribute(self):
+        util.enable_lazy_imports('lazymod', 'lazypkg')
+        from lazymod import attr
+        self.assertEqual(attr, 42)
+        self.assertLoaded('lazymod')
+        from lazypkg import attr
+        self.assertEqual(attr, 1)
+        self.assertLoaded('lazypkg')
+        self.assertNotIn('lazypkg.attr', sys.modules)
+        with self.assertRaises(ImportError):
+            from lazypkg import missing
+        reasons = util.eager_imports()
+        self.assertIn("attribute 'attr' accessed", reasons['lazymod'])
+        self.assertIn("attribute 'attr' accessed", reasons['lazypkg'])
+
+    def test_exclude(self):
+        util.enable_lazy_imports('lazypkg', exclude=['lazypkg.eager'])
+        import lazypkg.sub
+        import lazypkg.eager
+        self.assertLazy('lazypkg')
+        self.assertLazy('lazypkg.sub')
+        self.assertLoaded('lazypkg.eager')
+        self.assertEqual(util.eager_imports(), {})
+
+    def test_prefix(self):
+        util.enable_lazy_imports('lazypkg.sub', 'lazy')
+        import lazymod
+        import lazypkg.sub
+        self.assertLoaded('lazymod')
+        self.assertLoaded('lazypkg')
+        self.assertLazy('lazypkg.sub')
+
+    def test_extension_module(self):
+        name = '_testsinglephase'
+        try:
+            util.find_spec(name)
+        except ImportError:
+            self.skipTest('requires an extension module')
+        with test_util.uncache(name):
+            util.enable_lazy_imports(name)
+            importlib.import_module(name)
+            self.assertLoaded(name)
+        self.assertEqual(util.eager_imports(), {name: 'extension module'})
+
+    def test_disable(self):
+        util.enable_lazy_imports('lazymod')
+        util.disable_lazy_imports()
+        import lazymod
+        self.assertLoaded('lazymod')
+        util.disable_lazy_imports()
+
+    def test_bad_name(self):
+        with self.assertRaises(TypeError):
+            util.enable_lazy_imports(b'lazymod')
+        with self.assertRaises(TypeError):
+            util.enable_lazy_imports('lazymod', exclude=[None])
+
+    def test_options(self):
+        code = f"""if 1:
+            import sys
+            sys.path.insert(0, {self.dir!r})
+            import lazymod, lazypkg.sub, lazypkg.eager
+            print(type(lazymod).__name__, type(lazypkg).__name__,
+                  type(lazypkg.sub).__name__, type(lazypkg.eager).__name__)
+            """
+        res = assert_python_ok('-c', code,
+                               PYTHONLAZYIMPORTS='lazymod,lazypkg')
+        self.assertEqual(res.out.split(),
+                         [b'_LazyModule', b'_LazyModule', b'_LazyModule',
+                          b'_LazyModule'])
+        res = assert_python_ok('-X', 'lazyimports=lazypkg, -lazypkg.eager',
+                               '-c', code)
+        self.assertEqual(res.out.split(),
+                         [b'module', b'_LazyModule', b'_LazyModule',
+                          b'module'])
+        res = assert_python_ok('-E', '-c', code,
+                               PYTHONLAZYIMPORTS='lazymod,lazypkg')
+        self.assertEqual(res.out.split(), [b'module'] * 4)
+        res = assert_python_ok('-v', '-c', code + 'lazymod.attr',
+                               PYTHONLAZYIMPORTS='lazymod')
+        self.assertIn(b"# lazy import 'lazymod' made eager: "
+                      b"attribute 'attr' accessed at <string>:7",
+                      res.err)
+
+
 if __name__ == '__main__':
     unittest.main()
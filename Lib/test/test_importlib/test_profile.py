@@ -0,0 +1,156 @@
+import importlib
+from importlib import _bootstrap
+from importlib.profile import ImportProfiler
+import io
+import os
+import pstats
+import sys
+import unittest
+
+from test.support import import_helper, os_helper
+from test.support.script_helper import assert_python_ok
+from test.test_importlib import util as test_util
+
+
+class ImportProfilerTests(unittest.TestCase):
+
+    names = ('profmod', 'profpkg', 'profpkg.sub', 'profbad')
+
+    def setUp(self):
+        self.dir = self.enterContext(os_helper.temp_dir())
+        self.enterContext(import_helper.DirsOnSysPath(self.dir))
+        self.enterContext(test_util.uncache(*self.names))
+        os.mkdir(os.path.join(self.dir, 'profpkg'))
+        self.write('profmod.py', 'import profpkg\ndata = [0] * 100_000')
+        self.write('profpkg/__init__.py', 'from . import sub')
+        self.write('profpkg/sub.py', 'attr = 1')
+        self.write('profbad.py', 'raise ValueError("bad")')
+        importlib.invalidate_caches()
+
+    def write(self, name, source):
+        with open(os.path.join(self.dir, name), 'w', encoding='utf-8') as f:
+            f.write(source)
+
+    def profile(self, *names, **kwargs):
+        with ImportProfiler(**kwargs) as profiler:
+            for name in names:
+                importlib.import_module(name)
+        return profiler
+
+    def test_tree(self):
+        profiler = self.profile('profmod')
+        self.assertIsNone(_bootstrap._profiler)
+        [root] = profiler.roots
+        self.assertEqual(root.name, 'profmod')
+        self.assertIsNone(root.parent)
+        self.assertTrue(root.succeeded)
+        self.assertEqual(root.origin, os.path.join(self.dir, 'profmod.py'))
+        [pkg] = root.children
+        self.assertEqual(pkg.name, 'profpkg')
+        self.assertIs(pkg.parent, root)
+        [sub] = pkg.children
+        self.assertEqual(sub.name, 'profpkg.sub')
+        self.assertEqual(sub.path, ['profmod', 'profpkg', 'profpkg.sub'])
+        self.assertEqual(profiler.records, [sub, pkg, root])
+        # Modules already imported are not recorded.
+        profiler = self.profile('profmod', 'profpkg.sub')
+        self.assertEqual(profiler.records, [])
+
+    def test_times(self):
+        profiler = self.profile('profmod')
+        for record in profiler.records:
+            self.assertGreater(record.find_time, 0)
+            self.assertGreater(record.load_time, 0)
+            self.assertGreater(record.exec_time, 0)
+            self.assertLessEqual(record.self_time, record.total_time)
+        root = profiler.roots[0]
+        nested = sum(child.total_time for child in root.children)
+        self.assertAlmostEqual(root.self_time + nested, root.total_time,
+                               delta=1e-3)
+
+    def test_failed_import(self):
+        with ImportProfiler() as profiler:
+            with self.assertRaises(ValueError):
+                import profbad
+            with self.assertRaises(ModuleNotFoundError):
+                import profmissing
+        bad, missing = profiler.records
+        self.assertEqual(bad.name, 'profbad')
+        self.assertFalse(bad.succeeded)
+        self.assertIsNone(bad.origin)
+        self.assertEqual(missing.name, 'profmissing')
+        self.assertFalse(missing.succeeded)
+        self.assertEqual(missing.load_time, 0)
+        self.assertEqual(profiler.roots, [bad, missing])
+
+    def test_memory(self):
+        profiler = self.profile('profmod')
+        for record in profiler.records:
+            self.assertIsNone(record.memory)
+        for name in 'profmod', 'profpkg', 'profpkg.sub':
+            del sys.modules[name]
+        profiler = self.profile('profmod', trace_memory=True)
+        root = profiler.roots[0]
+        self.assertGreater(root.memory, 100_000 * 8)
+        for record in profiler.records:
+            self.assertIsNotNone(record.memory)
+        collapsed = profiler.collapsed(memory=True)
+        self.assertIn('profmod;profpkg;profpkg.sub ', collapsed)
+
+    def test_single_profiler(self):
+        with ImportProfiler():
+            with self.assertRaises(RuntimeError):
+                ImportProfiler().start()
+        self.assertIsNone(_bootstrap._profiler)
+
+    def test_print_tree(self):
+        profiler = self.profile('profmod')
+        output = io.StringIO()
+        profiler.print_tree(output)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[0].endswith('imported package'))
+        self.assertTrue(lines[1].endswith('| profmod'))
+        self.assertTrue(lines[2].endswith('|   profpkg'))
+        self.assertTrue(lines[3].endswith('|     profpkg.sub'))
+
+    def test_collapsed(self):
+        profiler = self.profile('profmod')
+        lines = profiler.collapsed().splitlines()
+        stacks = [line.rpartition(' ')[0] for line in lines]
+        self.assertEqual(stacks, ['profmod;profpkg;profpkg.sub',
+                                  'profmod;profpkg', 'profmod'])
+        for line in lines:
+            self.assertGreaterEqual(int(line.rpartition(' ')[2]), 0)
+
+    def test_pstats(self):
+        profiler = self.profile('profmod')
+        stats = pstats.Stats(profiler)
+        origin = os.path.join(self.dir, 'profmod.py')
+        key = (origin, 0, '<import profmod>')
+        self.assertIn(key, stats.stats)
+        sub_key = (os.path.join(self.dir, 'profpkg', 'sub.py'), 0,
+                   '<import profpkg.sub>')
+        cc, nc, tt, ct, callers = stats.stats[sub_key]
+        self.assertEqual(nc, 1)
+        self.assertEqual(list(callers), [
+            (os.path.join(self.dir, 'profpkg', '__init__.py'), 0,
+             '<import profpkg>')])
+
+        filename = os.path.join(self.dir, 'imports.pstats')
+        profiler.dump_stats(filename)
+        self.assertEqual(pstats.Stats(filename).stats, stats.stats)
+
+    def test_cli(self):
+        output = os.path.join(self.dir, 'out.txt')
+        assert_python_ok('-m', 'importlib.profile', '-f', 'collapsed',
+                         '-o', output, 'profmod', PYTHONPATH=self.dir)
+        with open(output, encoding='utf-8') as f:
+            self.assertIn('profmod;profpkg;profpkg.sub ', f.read())
+        rc, out, err = assert_python_ok('-m', 'importlib.profile', 'profmod',
+                                        PYTHONPATH=self.dir)
+        self.assertIn(b'profpkg.sub', out)
+
+
+if __name__ == '__main__':
+    unittest.main()
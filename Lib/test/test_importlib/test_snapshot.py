@@ -0,0 +1,129 @@
+import importlib
+from importlib import snapshot
+import os
+import sys
+import unittest
+
+from test.support import import_helper, os_helper
+from test.support.script_helper import assert_python_ok
+from test.test_importlib import util as test_util
+
+
+class SnapshotTests(unittest.TestCase):
+
+    names = ('snapmod', 'snappkg', 'snappkg.sub', 'snappkg.other')
+
+    def setUp(self):
+        self.dir = self.enterContext(os_helper.temp_dir())
+        self.enterContext(import_helper.DirsOnSysPath(self.dir))
+        self.enterContext(test_util.uncache(*self.names))
+        self.snapshot = os.path.join(self.dir, 'app.snap')
+        os.mkdir(os.path.join(self.dir, 'snappkg'))
+        self.write('snapmod.py', 'attr = "snapmod"')
+        self.write('snappkg/__init__.py', 'attr = "snappkg"')
+        self.write('snappkg/sub.py', 'attr = "snappkg.sub"')
+        self.write('snappkg/other.py', 'attr = "snappkg.other"')
+        importlib.invalidate_caches()
+
+    def write(self, name, source):
+        with open(os.path.join(self.dir, name), 'w', encoding='utf-8') as f:
+            f.write(source)
+
+    def create(self, *names):
+        modules = [importlib.import_module(name) for name in names]
+        modules.append(sys)
+        result = snapshot.create(self.snapshot, modules)
+        self.assertEqual(result, list(names))
+        for name in self.names:
+            sys.modules.pop(name, None)
+
+    def install(self, **kwargs):
+        finder = snapshot.install(self.snapshot, **kwargs)
+        self.addCleanup(finder.close)
+        self.addCleanup(sys.meta_path.remove, finder)
+        return finder
+
+    def assertFromSnapshot(self, module):
+        self.assertIsInstance(module.__spec__.loader, snapshot.SnapshotLoader)
+        self.assertIsInstance(module.__loader__, snapshot.SnapshotLoader)
+
+    def test_import(self):
+        self.create('snapmod', 'snappkg', 'snappkg.sub')
+        finder = self.install()
+        self.assertEqual(finder.modules(), ['snapmod', 'snappkg', 'snappkg.sub'])
+        import snapmod, snappkg.sub, snappkg.other
+        self.assertFromSnapshot(snapmod)
+        self.assertFromSnapshot(snappkg)
+        self.assertFromSnapshot(snappkg.sub)
+        self.assertEqual(snapmod.attr, 'snapmod')
+        self.assertEqual(snappkg.attr, 'snappkg')
+        self.assertEqual(snappkg.sub.attr, 'snappkg.sub')
+        self.assertEqual(snapmod.__file__, os.path.join(self.dir, 'snapmod.py'))
+        self.assertEqual(snappkg.__path__, [os.path.join(self.dir, 'snappkg')])
+        # Submodules which are not in the snapshot are found in __path__.
+        self.assertEqual(snappkg.other.attr, 'snappkg.other')
+        self.assertNotIsInstance(snappkg.other.__loader__,
+                                 snapshot.SnapshotLoader)
+
+    def test_loader(self):
+        self.create('snapmod', 'snappkg')
+        finder = self.install()
+        loader = finder.find_spec('snappkg').loader
+        self.assertTrue(loader.is_package('snappkg'))
+        self.assertEqual(loader.get_source('snappkg'), 'attr = "snappkg"')
+        self.assertEqual(loader.get_filename('snappkg'),
+                         os.path.join(self.dir, 'snappkg', '__init__.py'))
+        code = loader.get_code('snappkg')
+        self.assertEqual(code.co_filename, loader.get_filename('snappkg'))
+        with self.assertRaises(ImportError):
+            loader.get_code('snapmod')
+        loader = finder.find_spec('snapmod').loader
+        self.assertFalse(loader.is_package('snapmod'))
+        self.assertIsNone(finder.find_spec('snappkg.sub'))
+        self.assertIsNone(finder.find_spec('sys'))
+
+    def test_check_source(self):
+        self.create('snapmod')
+        self.write('snapmod.py', 'attr = "changed source"')
+        importlib.invalidate_caches()
+        self.install()
+        import snapmod
+        self.assertEqual(snapmod.attr, 'changed source')
+        self.assertNotIsInstance(snapmod.__loader__, snapshot.SnapshotLoader)
+
+    def test_no_check_source(self):
+        self.create('snapmod')
+        os.unlink(os.path.join(self.dir, 'snapmod.py'))
+        importlib.invalidate_caches()
+        self.install(check_source=False)
+        import snapmod
+        self.assertEqual(snapmod.attr, 'snapmod')
+        self.assertFromSnapshot(snapmod)
+
+    def test_bad_snapshot(self):
+        self.create('snapmod')
+        with open(self.snapshot, 'rb') as f:
+            data = f.read()
+        magic_size = len(snapshot.SNAPSHOT_MAGIC)
+        for bad in (b'', data[:10], b'X' + data[1:],
+                    data[:magic_size] + b'\0\0\0\0' + data[magic_size+4:],
+                    data[:-1], data[:-1] + b'\0'):
+            with open(self.snapshot, 'wb') as f:
+                f.write(bad)
+            with self.subTest(bad=bad[:20]):
+                with self.assertRaises(snapshot.SnapshotError):
+                    snapshot.SnapshotFinder(self.snapshot)
+
+    def test_cli(self):
+        code = f'import sys; sys.path.insert(0, {self.dir!r})'
+        assert_python_ok('-c', f'{code}; from importlib.snapshot import _main; '
+                               f'_main(["-o", {self.snapshot!r}, "snappkg.sub"])')
+        finder = snapshot.SnapshotFinder(self.snapshot)
+        self.addCleanup(finder.close)
+        self.assertIn('snappkg', finder.modules())
+        self.assertIn('snappkg.sub', finder.modules())
+        self.assertNotIn('snapmod', finder.modules())
+
+
+if __name__ == '__main__':
+    unittest.main()
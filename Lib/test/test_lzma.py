@@ -879,6 +879,27 @@ def test_read_multistream_trailing_junk(self):
         with LZMAFile(BytesIO(COMPRESSED_XZ * 5 + COMPRESSED_BOGUS)) as f:
             self.assertEqual(f.read(), INPUT * 5)
 
+    def test_read_multistream_threads(self):
+        data = COMPRESSED_XZ * 5 + b"\0" * 8 + COMPRESSED_XZ
+        with LZMAFile(BytesIO(data), threads=2) as f:
+            self.assertIsInstance(f._buffer.raw,
+                                  _streams.ParallelDecompressReader)
+            self.assertEqual(f.read(len(INPUT) + 10), INPUT + INPUT[:10])
+            f.seek(len(INPUT) * 3)
+            self.assertEqual(f.read(), INPUT * 3)
+            f.seek(5)
+            self.assertEqual(f.read(10), INPUT[5:15])
+            f.seek(0, 2)
+            self.assertEqual(f.tell(), len(INPUT) * 6)
+        # Files that cannot be split are read on the calling thread.
+        for data in (COMPRESSED_XZ, COMPRESSED_XZ * 5 + COMPRESSED_BOGUS,
+                     COMPRESSED_XZ + COMPRESSED_ALONE):
+            with LZMAFile(BytesIO(data), threads=2) as f:
+                self.assertIsInstance(f._buffer.raw, _streams.DecompressReader)
+                self.assertNotIsInstance(f._buffer.raw,
+                                         _streams.ParallelDecompressReader)
+                self.assertTrue(f.read().startswith(INPUT))
+
     def test_read_from_file(self):
         with TempFile(TESTFN, COMPRESSED_XZ):
             with LZMAFile(TESTFN) as f:
@@ -1240,6 +1261,34 @@ def test_write_append_to_file(self):
         finally:
             unlink(TESTFN)
 
+    def test_write_threads(self):
+        data = INPUT * 3000
+        saved_block_size = lzma._PARALLEL_BLOCK_SIZE
+        lzma._PARALLEL_BLOCK_SIZE = 100_000
+        try:
+            with BytesIO() as dst:
+                with LZMAFile(dst, "w", threads=3, preset=1) as f:
+                    f.write(data[:1000])
+                    f.write(data[1000:])
+                compressed = dst.getvalue()
+        finally:
+            lzma._PARALLEL_BLOCK_SIZE = saved_block_size
+        self.assertEqual(lzma.decompress(compressed), data)
+        # Each block is a separate stream.
+        segments = lzma._xz_streams(BytesIO(compressed))
+        self.assertEqual(len(segments), -(-len(data) // 100_000))
+        with LZMAFile(BytesIO(compressed), threads=2) as f:
+            self.assertEqual(f.read(), data)
+
+        with BytesIO() as dst:
+            with lzma.open(dst, "wb", threads=0):
+                pass
+            self.assertEqual(lzma.decompress(dst.getvalue()), b"")
+        with self.assertRaises(ValueError):
+            LZMAFile(BytesIO(), "w", format=lzma.FORMAT_ALONE, threads=2)
+        with self.assertRaises(ValueError):
+            LZMAFile(BytesIO(), "w", threads=-1)
+
     def test_write_bad_args(self):
         f = LZMAFile(BytesIO(), "w")
         f.close()
@@ -614,6 +614,119 @@ def test_slice(self):
                     with self.assertRaises(ValueError):
                         marshal.dumps(obj, version)
 
+class FramedTestCase(unittest.TestCase):
+    sample = {'a': [1, 2**100, 1.5, None, True, 'é', b'b', (1, 'a')],
+              'b': {}}
+
+    def test_dumps(self):
+        data = marshal.dumps(self.sample, framed=True)
+        payload = marshal.dumps(self.sample)
+        self.assertEqual(data, len(payload).to_bytes(4, 'little') + payload)
+        self.assertEqual(marshal.loads(data, framed=True), self.sample)
+        # Extra bytes after the frame are ignored.
+        self.assertEqual(marshal.loads(data + b'spam', framed=True),
+                         self.sample)
+        for version in range(marshal.version + 1):
+            data = marshal.dumps([1, 'a'], version, framed=True)
+            self.assertEqual(marshal.loads(data, framed=True), [1, 'a'])
+
+    def test_dump(self):
+        f = io.BytesIO()
+        for i in range(3):
+            marshal.dump([self.sample] * i, f, framed=True)
+        marshal.dump(None, f, 2, framed=True)
+        f.seek(0)
+        for i in range(3):
+            self.assertEqual(marshal.load(f, framed=True), [self.sample] * i)
+        self.assertIsNone(marshal.load(f, framed=True))
+        self.assertRaises(EOFError, marshal.load, f, framed=True)
+
+    def test_iterload(self):
+        f = io.BytesIO()
+        values = [i * [self.sample] for i in range(5)]
+        for value in values:
+            marshal.dump(value, f, framed=True)
+        f.seek(0)
+        it = marshal.iterload(f)
+        self.assertIs(iter(it), it)
+        self.assertEqual(list(it), values)
+        self.assertEqual(list(it), [])
+        self.assertEqual(list(marshal.iterload(io.BytesIO())), [])
+
+    def test_truncated(self):
+        data = marshal.dumps(self.sample, framed=True)
+        for size in (1, 3, 4, len(data) - 1):
+            with self.subTest(size=size):
+                self.assertRaises(EOFError, marshal.loads, data[:size],
+                                  framed=True)
+                self.assertRaises(EOFError, marshal.load,
+                                  io.BytesIO(data[:size]), framed=True)
+                it = marshal.iterload(io.BytesIO(data + data[:size]))
+                self.assertEqual(next(it), self.sample)
+                self.assertRaises(EOFError, next, it)
+                self.assertRaises(StopIteration, next, it)
+
+    def test_huge_frame_size(self):
+        # The payload is read as it arrives, not allocated from the header.
+        class Reader(io.BytesIO):
+            largest = 0
+            def readinto(self, b):
+                Reader.largest = max(Reader.largest, len(b))
+                return super().readinto(b)
+        for data in (b'\xff\xff\xff\xff', b'\xff\xff\xff\xff' + b'x' * 1000):
+            with self.subTest(size=len(data)):
+                Reader.largest = 0
+                self.assertRaises(EOFError, marshal.load, Reader(data),
+                                  framed=True)
+                self.assertLessEqual(Reader.largest, 1 << 20)
+        # A large frame is still read whole.
+        value = b'x' * 1_000_000
+        data = marshal.dumps(value, framed=True)
+        self.assertEqual(marshal.load(io.BytesIO(data), framed=True), value)
+
+    def test_bad_frame_size(self):
+        payload = marshal.dumps(self.sample)
+        # The value is shorter than the frame.
+        data = (len(payload) + 1).to_bytes(4, 'little') + payload + b'0'
+        self.assertRaises(ValueError, marshal.loads, data, framed=True)
+        self.assertRaises(ValueError, marshal.load, io.BytesIO(data),
+                          framed=True)
+        # The frame is shorter than the value.
+        data = (len(payload) - 1).to_bytes(4, 'little') + payload
+        self.assertRaises(EOFError, marshal.loads, data, framed=True)
+        self.assertRaises(EOFError, marshal.load, io.BytesIO(data),
+                          framed=True)
+
+    def test_short_reads(self):
+        # Like a socket, readinto() returns at most a few bytes at a time.
+        class Reader(io.RawIOBase):
+            def __init__(self, data):
+                self.data = data
+            def readable(self):
+                return True
+            def readinto(self, b):
+                n = min(len(b), 3, len(self.data))
+                b[:n] = self.data[:n]
+                self.data = self.data[n:]
+                return n
+        data = marshal.dumps(self.sample, framed=True) * 2
+        self.assertEqual(marshal.load(Reader(data), framed=True), self.sample)
+        self.assertEqual(list(marshal.iterload(Reader(data))),
+                         [self.sample] * 2)
+
+    def test_allow_code(self):
+        code = self.test_dumps.__code__
+        data = marshal.dumps(code, framed=True)
+        self.assertEqual(marshal.loads(data, framed=True), code)
+        self.assertRaises(ValueError, marshal.dumps, code,
+                          allow_code=False, framed=True)
+        self.assertRaises(ValueError, marshal.loads, data,
+                          allow_code=False, framed=True)
+        self.assertRaises(ValueError, marshal.load, io.BytesIO(data),
+                          allow_code=False, framed=True)
+        it = marshal.iterload(io.BytesIO(data), allow_code=False)
+        self.assertRaises(ValueError, next, it)
+
 @support.cpython_only
 @unittest.skipUnless(_testcapi, 'requires _testcapi')
 class CAPI_TestCase(unittest.TestCase, HelperMixin):
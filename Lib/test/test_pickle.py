@@ -1,13 +1,17 @@
 from _compat_pickle import (IMPORT_MAPPING, REVERSE_IMPORT_MAPPING,
                             NAME_MAPPING, REVERSE_NAME_MAPPING)
+import array
 import builtins
 import collections
 import contextlib
 import io
+import mmap
 import pickle
+import pickletools
 import struct
 import sys
 import tempfile
+import threading
 import warnings
 import weakref
 from textwrap import dedent
@@ -16,6 +20,7 @@
 import unittest
 from test import support
 from test.support import cpython_only, import_helper, os_helper
+from test.support import threading_helper
 from test.support.import_helper import ensure_lazy_imports
 
 from test.pickletester import AbstractHookTests
@@ -29,6 +34,7 @@
 from test.pickletester import AbstractDispatchTableTests
 from test.pickletester import AbstractCustomPicklerClass
 from test.pickletester import BigmemPickleTests
+from test.pickletester import protocols
 
 try:
     import _pickle
@@ -478,7 +484,7 @@ def test_pickler(self):
                 0)  # Write buffer is cleared after every dump().
 
         def test_unpickler(self):
-            basesize = support.calcobjsize('2P2n2P 2P2n2i5P 2P3n8P2n2i')
+            basesize = support.calcobjsize('2P2n2P 2P2n2i5P 2P3n8P2n2iP')
             unpickler = _pickle.Unpickler
             P = struct.calcsize('P')  # Size of memo table entry.
             n = struct.calcsize('n')  # Size of mark table entry.
@@ -524,6 +530,219 @@ def recurse(deep):
             check(u, stdsize + 32 * P + 2 + 1)
 
 
+class DumpStreamTests(unittest.TestCase):
+
+    def check(self, obj, protocol, **kwargs):
+        f = io.BytesIO()
+        pickle.dump_stream(obj, f, protocol, **kwargs)
+        data = f.getvalue()
+        self.assertEqual(pickle.loads(data), obj)
+        self.assertEqual(pickle._loads(data), obj)
+        # The stream is well-formed.
+        for opcode, arg, pos in pickletools.genops(data):
+            pass
+        self.assertEqual(opcode.name, 'STOP')
+        self.assertEqual(pos, len(data) - 1)
+        return data
+
+    def test_sequential(self):
+        obj = {'a': [1, 2.5, 'x' * 100_000], 'b': (None, True)}
+        for proto in protocols:
+            with self.subTest(proto=proto):
+                data = self.check(obj, proto)
+                self.assertEqual(data, pickle.dumps(obj, proto))
+
+    def test_parallel(self):
+        # Some items are large enough to be written outside frames.
+        items = [(i, str(i), i / 3, b'y' * (70_000 if i % 150 == 0 else 3))
+                 for i in range(400)]
+        values = [None, [], {1: 2}, 1.5, 'x' * 70_000]
+        objs = [items, dict(enumerate(items)), list(range(100)),
+                {str(i): values[i % 5] for i in range(300)}]
+        for proto in protocols:
+            for obj in objs:
+                for threads in (0, 3):
+                    with self.subTest(proto=proto, type=type(obj),
+                                      threads=threads):
+                        self.check(obj, proto, threads=threads,
+                                   chunk_size=64)
+
+    def test_parallel_empty_chunks(self):
+        obj = [[] for _ in range(10)]
+        for proto in protocols:
+            with self.subTest(proto=proto):
+                self.check(obj, proto, threads=2, chunk_size=1)
+
+    def test_parallel_shared_references(self):
+        shared = [1, 2]
+        obj = [shared] * 10
+        f = io.BytesIO()
+        pickle.dump_stream(obj, f, threads=2, chunk_size=3)
+        result = pickle.loads(f.getvalue())
+        self.assertEqual(result, obj)
+        # The items are pickled independently.
+        self.assertIsNot(result[0], result[1])
+
+    def test_bounded_writes(self):
+        writes = []
+        class Writer:
+            def write(self, data):
+                writes.append(len(data))
+        obj = list(range(200_000))
+        for threads in (None, 2):
+            writes.clear()
+            pickle.dump_stream(obj, Writer(), 5, threads=threads)
+            self.assertGreater(len(writes), 10)
+            self.assertLessEqual(max(writes), 2 * 64 * 1024)
+
+    @support.requires_working_socket()
+    def test_socket(self):
+        import socket
+        obj = {str(i): i for i in range(50_000)}
+        a, b = socket.socketpair()
+        with a, b:
+            with b.makefile('rb') as f:
+                t = threading.Thread(target=pickle.dump_stream, args=(obj, a),
+                                     kwargs={'threads': 2})
+                with threading_helper.start_threads([t]):
+                    result = pickle.load(f)
+        self.assertEqual(result, obj)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            pickle.dump_stream([], object())
+        with self.assertRaises(ValueError):
+            pickle.dump_stream([], io.BytesIO(), threads=-1)
+        with self.assertRaises(ValueError):
+            pickle.dump_stream([], io.BytesIO(), chunk_size=0)
+
+
+class MappedPickleTests(unittest.TestCase):
+
+    def setUp(self):
+        self.filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, self.filename)
+
+    def table(self):
+        with open(self.filename, 'rb') as f:
+            data = f.read()
+        magic, alignment, count, size = struct.unpack_from('<8sIIQ', data)
+        return alignment, [struct.unpack_from('<QQ', data, 24 + 16 * i)
+                           for i in range(count)]
+
+    def test_round_trip(self):
+        big = bytearray(b'x' * 10_000)
+        obj = {'bytearray': big, 'same': big,
+               'array': array.array('d', range(1000)),
+               'small array': array.array('i', [1, 2, 3]),
+               'bytes': b'y' * 10_000,
+               'readonly': pickle.PickleBuffer(b'r' * 5000),
+               'writable': pickle.PickleBuffer(bytearray(b'w' * 100))}
+        pickle.dump_mapped(obj, self.filename)
+        result = pickle.load_mapped(self.filename)
+        self.assertEqual(result.keys(), obj.keys())
+        for key in 'bytearray', 'array', 'small array', 'bytes':
+            with self.subTest(key=key):
+                self.assertIs(type(result[key]), type(obj[key]))
+                self.assertEqual(result[key], obj[key])
+        self.assertIs(result['same'], result['bytearray'])
+        # PickleBuffer objects are loaded as views of the mapping.
+        readonly, writable = result['readonly'], result['writable']
+        self.assertIsInstance(readonly.obj, mmap.mmap)
+        self.assertTrue(readonly.readonly)
+        self.assertEqual(readonly, b'r' * 5000)
+        self.assertFalse(writable.readonly)
+        self.assertEqual(writable, b'w' * 100)
+        # Changes are not written to the file.
+        writable[0] = ord('z')
+        self.assertEqual(pickle.load_mapped(self.filename)['writable'][0],
+                         ord('w'))
+        # The large array and the PickleBuffer objects are out-of-band.
+        alignment, table = self.table()
+        self.assertEqual([size for offset, size in table],
+                         [8000, 5000, 100])
+
+    def test_alignment(self):
+        obj = [pickle.PickleBuffer(bytes(range(n))) for n in (1, 3, 200)]
+        for alignment in 1, 8, 4096:
+            with self.subTest(alignment=alignment):
+                pickle.dump_mapped(obj, self.filename, alignment=alignment)
+                self.assertEqual(pickle.load_mapped(self.filename), obj)
+                align, table = self.table()
+                self.assertEqual(align, alignment)
+                for offset, size in table:
+                    self.assertEqual(offset % alignment, 0)
+
+    def test_file_objects(self):
+        with open(self.filename, 'wb') as f:
+            pickle.dump_mapped([1, pickle.PickleBuffer(b'a' * 100)], f)
+            pickle.dump_mapped('second', f)
+            f.write(b'trailer')
+        with open(self.filename, 'rb') as f:
+            first = pickle.load_mapped(f)
+            self.assertEqual(first[0], 1)
+            self.assertEqual(first[1], b'a' * 100)
+            self.assertEqual(pickle.load_mapped(f), 'second')
+            self.assertEqual(f.read(), b'trailer')
+
+    def test_file_object_alignment(self):
+        obj = [pickle.PickleBuffer(bytes(range(n))) for n in (1, 3, 200)]
+        with open(self.filename, 'wb') as f:
+            f.write(b'x' * 42)
+            pickle.dump_mapped(obj, f, alignment=64)
+        with open(self.filename, 'rb') as f:
+            data = f.read()
+            f.seek(42)
+            self.assertEqual(pickle.load_mapped(f), obj)
+        count, = struct.unpack_from('<I', data, 42 + 12)
+        for i in range(count):
+            offset, size = struct.unpack_from('<QQ', data, 42 + 24 + 16 * i)
+            self.assertEqual((42 + offset) % 64, 0)
+            self.assertEqual(data[42 + offset:42 + offset + size],
+                             obj[i].raw())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            pickle.dump_mapped([], self.filename, protocol=4)
+        with self.assertRaises(ValueError):
+            pickle.dump_mapped([], self.filename, alignment=24)
+        with self.assertRaises(ValueError):
+            pickle.dump_mapped([], self.filename, alignment=0)
+
+    def test_invalid_file(self):
+        for data in b'', pickle.dumps([1, 2, 3], 5):
+            with self.subTest(data=data):
+                with open(self.filename, 'wb') as f:
+                    f.write(data)
+                with self.assertRaises(pickle.UnpicklingError):
+                    pickle.load_mapped(self.filename)
+
+    def test_invalid_offset(self):
+        pickle.dump_mapped([pickle.PickleBuffer(b'a' * 1000)], self.filename)
+        with open(self.filename, 'rb') as f:
+            data = bytearray(f.read())
+        size, = struct.unpack_from('<Q', data, 16)
+        # The buffer cannot overlap the header, the table or the pickle.
+        for offset in 0, 24, 24 + 16 + size - 1:
+            with self.subTest(offset=offset):
+                struct.pack_into('<Q', data, 24, offset)
+                with open(self.filename, 'wb') as f:
+                    f.write(data)
+                with self.assertRaises(pickle.UnpicklingError):
+                    pickle.load_mapped(self.filename)
+
+    def test_truncated_file(self):
+        pickle.dump_mapped([pickle.PickleBuffer(b'a' * 1000)], self.filename)
+        with open(self.filename, 'rb') as f:
+            data = f.read()
+        for size in 30, 100, len(data) - 1:
+            with self.subTest(size=size):
+                with open(self.filename, 'wb') as f:
+                    f.write(data[:size])
+                with self.assertRaises(pickle.UnpicklingError):
+                    pickle.load_mapped(self.filename)
+
+
 ALT_IMPORT_MAPPING = {
     ('_elementtree', 'xml.etree.ElementTree'),
     ('cPickle', 'pickle'),
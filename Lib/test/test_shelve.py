@@ -148,6 +148,118 @@ def test_writeback_also_writes_immediately(self):
         p2 = d[encodedkey]
         self.assertNotEqual(p1, p2)  # Write creates new object in store
 
+    def test_writeback_bulk_update(self):
+        class BulkDict(dict):
+            def bulk_update(self, items):
+                self.batches.append(list(items))
+                self.update(self.batches[-1])
+        d = BulkDict()
+        d.batches = []
+        with shelve.Shelf(d, writeback=True) as s:
+            s['a'] = [1]
+            s['b'] = [2]
+            s['a'].append(3)
+            self.assertEqual(d.batches, [])
+        # Only the entry changed since it was stored is written back.
+        self.assertEqual(len(d.batches), 1)
+        self.assertEqual([k for k, v in d.batches[0]], [b'a'])
+        self.assertEqual(pickle.loads(d[b'a']), [1, 3])
+        self.assertEqual(pickle.loads(d[b'b']), [2])
+
+    def test_writeback_unchanged(self):
+        d = {}
+        with shelve.Shelf(d, writeback=True) as s:
+            s['a'] = [1]
+            s['b'] = [2]
+        stored = d.copy()
+        class LoggingDict(dict):
+            def __setitem__(self, key, value):
+                writes.append(key)
+                super().__setitem__(key, value)
+        writes = []
+        d = LoggingDict(stored)
+        with shelve.Shelf(d, writeback=True) as s:
+            self.assertEqual(s['a'], [1])
+            s['b'].append(3)
+        self.assertEqual(writes, [b'b'])
+        self.assertEqual(pickle.loads(d[b'b']), [2, 3])
+
+    def test_writeback_cache_size(self):
+        d = {}
+        with shelve.Shelf(d, writeback=True, cache_size=2) as s:
+            for key in 'abc':
+                s[key] = [key]
+            s['a'].append(1)        # reloaded, evicts 'b'
+            s['c'].append(2)        # still cached
+            s['b'].append(3)        # evicts 'a', which is written back
+            self.assertEqual(list(s.cache), ['c', 'b'])
+            self.assertEqual(pickle.loads(d[b'a']), ['a', 1])
+        self.assertEqual(pickle.loads(d[b'b']), ['b', 3])
+        self.assertEqual(pickle.loads(d[b'c']), ['c', 2])
+
+    def test_read_cache(self):
+        d = {}
+        loads = 0
+        def deserializer(data):
+            nonlocal loads
+            loads += 1
+            return pickle.loads(data)
+        with shelve.Shelf(d, cache_size=2, deserializer=deserializer,
+                          serializer=pickle.dumps) as s:
+            for key in 'abc':
+                s[key] = [key]
+            self.assertEqual(s.cache, {})
+            a = s['a']
+            self.assertIs(s['a'], a)
+            self.assertEqual(loads, 1)
+            s['b'], s['c']
+            self.assertEqual(list(s.cache), ['b', 'c'])
+            self.assertIsNot(s['a'], a)
+            self.assertEqual(loads, 4)
+            # Changes are not written back.
+            s['a'].append(1)
+            s['a'] = ['new']
+            self.assertNotIn('a', s.cache)
+            self.assertEqual(s['a'], ['new'])
+            del s['a']
+            self.assertNotIn('a', s)
+            self.assertNotIn('a', s.cache)
+
+    def test_lazy(self):
+        class CountingDict(dict):
+            def __getitem__(self, key):
+                reads.append(key)
+                return super().__getitem__(key)
+        reads = []
+        d = CountingDict()
+        with shelve.Shelf(d, lazy=True, cache_size=10) as s:
+            s['a'] = [1]
+            x = s['a']
+            x.append(2)
+            self.assertEqual(s['a'], [1])
+            self.assertIsNot(s['a'], x)
+            self.assertIsInstance(s.cache['a'], bytes)
+            self.assertIn('a', s)
+        self.assertEqual(reads, [])
+
+    def test_close_read_cache(self):
+        for kwargs in dict(cache_size=10), dict(lazy=True):
+            with self.subTest(**kwargs):
+                s = shelve.Shelf({}, **kwargs)
+                s['a'] = [1]
+                self.assertEqual(s['a'], [1])
+                s.close()
+                with self.assertRaises(ValueError):
+                    s['a']
+                with self.assertRaises(ValueError):
+                    'a' in s
+
+    def test_cache_arguments(self):
+        with self.assertRaises(ValueError):
+            shelve.Shelf({}, cache_size=0)
+        with self.assertRaises(ValueError):
+            shelve.Shelf({}, writeback=True, lazy=True)
+
     def test_with(self):
         d1 = {}
         with shelve.Shelf(d1, protocol=2, writeback=False) as s:
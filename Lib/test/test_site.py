@@ -25,6 +25,7 @@
 import sys
 import sysconfig
 import tempfile
+import time
 import urllib.error
 import urllib.request
 from unittest import mock
@@ -236,6 +237,72 @@ def test_addsitedir_hidden_file_attribute(self):
         finally:
             pth_file.cleanup()
 
+    def test_addsitedir_import_cache(self):
+        from importlib import _bootstrap_external
+        base_dir = self.enterContext(os_helper.temp_dir())
+        cache_file = os.path.join(base_dir, 'import.cache')
+        site_dir = os.path.join(base_dir, 'site-packages')
+        os.mkdir(site_dir)
+        os.mkdir(os.path.join(site_dir, 'pkgs'))
+
+        def write(name, contents, age):
+            # Files changed in place do not change the mtime of site_dir.
+            path = os.path.join(site_dir, name)
+            new = not os.path.exists(path)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(contents)
+            past = time.time() - age
+            os.utime(path, (past, past))
+            if new:
+                os.utime(site_dir, (past, past))
+
+        def addsitedir():
+            cache = _bootstrap_external._DirectoryCache(cache_file)
+            read_pth = site._read_pth
+            with (mock.patch('site._import_cache', return_value=(cache, 2)),
+                  mock.patch('site._read_pth', wraps=read_pth) as read,
+                  mock.patch('os.listdir', wraps=os.listdir) as listdir):
+                site.addsitedir(site_dir, set())
+            cache.save()
+            read_names = [os.path.basename(args[0])
+                          for args, kwargs in read.call_args_list]
+            return read_names, listdir.call_count
+
+        write('paths.pth', 'pkgs\n', 10)
+        write('imports.pth', 'import sys; sys.pth_runs += 1\n', 10)
+        self.enterContext(support.swap_attr(sys, 'pth_runs', 0))
+        self.assertEqual(addsitedir(), (['imports.pth', 'paths.pth'], 1))
+        self.assertEqual(sys.pth_runs, 1)
+        self.assertIn(os.path.join(site_dir, 'pkgs'), sys.path)
+
+        sys.path[:] = self.sys_path
+        # Only the import lines are executed again.
+        self.assertEqual(addsitedir(), ([], 0))
+        self.assertEqual(sys.pth_runs, 2)
+        self.assertIn(os.path.join(site_dir, 'pkgs'), sys.path)
+
+        write('paths.pth', 'pkgs\nmissing\n', 20)
+        self.assertEqual(addsitedir(), (['paths.pth'], 0))
+        self.assertEqual(sys.pth_runs, 3)
+        write('new.pth', '', 30)
+        self.assertEqual(addsitedir(), (['new.pth'], 1))
+        self.assertEqual(addsitedir(), ([], 0))
+        # Recently modified files are not stored.
+        write('new.pth', '\n', 0)
+        self.assertEqual(addsitedir(), (['new.pth'], 0))
+        self.assertEqual(addsitedir(), (['new.pth'], 0))
+
+    def test_addsitedir_timing(self):
+        site_dir = self.enterContext(os_helper.temp_dir())
+        pth_dir, pth_fn = self.make_pth("randompath\n", site_dir)
+        with (support.swap_item(sys._xoptions, 'importtime', True),
+              captured_stderr() as err):
+            site.addsitedir(site_dir, set())
+        self.assertEqual(err.getvalue().splitlines()[0],
+                         'pth time: self [us] | .pth file')
+        self.assertRegex(err.getvalue(), r'pth time: +\d+ \| ' +
+                         re.escape(os.path.join(pth_dir, pth_fn)))
+
     # This tests _getuserbase, hence the double underline
     # to distinguish from a test for getuserbase
     def test__getuserbase(self):
@@ -0,0 +1,123 @@
+import asyncio
+import sqlite3
+import threading
+import unittest
+
+from sqlite3 import aio
+from test.support import threading_helper
+
+threading_helper.requires_working_threading(module=True)
+
+
+def tearDownModule():
+    asyncio.events._set_event_loop_policy(None)
+
+
+class AsyncConnectionTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.cx = await aio.connect(":memory:", chunk_size=3)
+        self.addAsyncCleanup(self.cx.close)
+        await self.cx.execute("CREATE TABLE t (x)")
+        await self.cx.executemany("INSERT INTO t VALUES (?)",
+                                  [(i,) for i in range(10)])
+        await self.cx.commit()
+
+    async def test_worker_thread(self):
+        thread = await self.cx.call(lambda cx: threading.current_thread())
+        self.assertIsNot(thread, threading.current_thread())
+        self.assertIs(await self.cx.call(lambda cx: threading.current_thread()),
+                      thread)
+        # The connection is bound to the worker thread.
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.cx.connection.execute("SELECT 1")
+
+    async def test_execute(self):
+        cursor = await self.cx.execute("SELECT x FROM t WHERE x < ?", (2,))
+        self.assertIsInstance(cursor, aio.AsyncCursor)
+        self.assertEqual(cursor.description[0][0], "x")
+        self.assertEqual(await cursor.fetchall(), [(0,), (1,)])
+        cursor = await self.cx.execute("INSERT INTO t VALUES (?)", (10,))
+        self.assertEqual(cursor.rowcount, 1)
+        self.assertEqual(cursor.lastrowid, 11)
+        self.assertIsNone(cursor.description)
+        self.assertIsNone(await cursor.fetchone())
+        await self.cx.rollback()
+        cursor = await self.cx.execute("SELECT count(*) FROM t")
+        self.assertEqual(await cursor.fetchone(), (10,))
+
+    async def test_fetch(self):
+        cursor = await self.cx.execute("SELECT x FROM t ORDER BY x")
+        self.assertEqual(await cursor.fetchone(), (0,))
+        self.assertEqual(await cursor.fetchmany(), [(1,), (2,), (3,)])
+        self.assertEqual(await cursor.fetchmany(5),
+                         [(4,), (5,), (6,), (7,), (8,)])
+        self.assertEqual(await cursor.fetchall(), [(9,)])
+        self.assertIsNone(await cursor.fetchone())
+        self.assertEqual(await cursor.fetchmany(), [])
+
+    async def test_async_iteration(self):
+        cursor = await self.cx.cursor()
+        cursor.arraysize = 4
+        await cursor.execute("SELECT x FROM t ORDER BY x")
+        calls = 0
+        call = cursor._connection._call
+        async def counting_call(*args):
+            nonlocal calls
+            calls += 1
+            return await call(*args)
+        cursor._connection._call = counting_call
+        rows = [row async for row in cursor]
+        self.assertEqual(rows, [(i,) for i in range(10)])
+        # The first batch came with execute(); two more were needed.
+        self.assertEqual(calls, 2)
+
+    async def test_errors(self):
+        with self.assertRaises(sqlite3.OperationalError):
+            await self.cx.execute("SELECT * FROM missing")
+        with self.assertRaises(sqlite3.OperationalError):
+            await aio.connect("/nonexistent/dir/db.sqlite")
+        with self.assertRaises(ValueError):
+            await aio.connect(":memory:", chunk_size=0)
+
+    async def test_connect_arguments(self):
+        cx = await aio.connect(":memory:", timeout=1.0, isolation_level=None)
+        async with cx:
+            self.assertIsNone(cx.connection.isolation_level)
+            await cx.execute("CREATE TABLE u (x)")
+            # Autocommit mode: no transaction is left open.
+            self.assertFalse(await cx.call(lambda cx: cx.in_transaction))
+
+    async def test_executescript(self):
+        await self.cx.executescript("DELETE FROM t; INSERT INTO t VALUES (42);")
+        cursor = await self.cx.execute("SELECT x FROM t")
+        self.assertEqual(await cursor.fetchall(), [(42,)])
+
+    async def test_cancel_interrupts(self):
+        started = threading.Event()
+        await self.cx.call(lambda cx: cx.create_function(
+                           "started", 0, lambda: started.set()))
+        task = asyncio.create_task(self.cx.execute(
+            "WITH RECURSIVE c(x) AS (SELECT started() UNION ALL "
+            "SELECT x + 1 FROM c) SELECT count(*) FROM c"))
+        await asyncio.to_thread(started.wait)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        # The connection is still usable.
+        cursor = await self.cx.execute("SELECT count(*) FROM t")
+        self.assertEqual(await cursor.fetchone(), (10,))
+
+    async def test_close(self):
+        cx = await aio.connect(":memory:")
+        async with cx:
+            cursor = await cx.execute("SELECT 1")
+        with self.assertRaisesRegex(sqlite3.ProgrammingError, "closed"):
+            await cx.execute("SELECT 1")
+        with self.assertRaisesRegex(sqlite3.ProgrammingError, "closed"):
+            await cursor.fetchall()
+        await cx.close()
+        self.assertFalse(cx._worker._thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
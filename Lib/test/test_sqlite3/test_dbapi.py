@@ -30,6 +30,8 @@
 import urllib.parse
 import warnings
 
+from array import array
+
 from test.support import (
     SHORT_TIMEOUT, check_disallow_instantiation, requires_subprocess
 )
@@ -1082,6 +1084,57 @@ def test_fetchall(self):
         res = self.cu.fetchall()
         self.assertEqual(res, [])
 
+    def test_fetchcolumns(self):
+        self.cu.executemany("insert into test(name, income) values (?, ?)",
+                            [("bar", 1.5), ("baz", 2.5)])
+        self.cu.execute("select id, name, income, unique_test from test "
+                        "order by id")
+        id, name, income, unique = self.cu.fetchcolumns()
+        self.assertEqual(id, array("q", [1, 2, 3]))
+        self.assertEqual(name, ["foo", "bar", "baz"])
+        self.assertEqual(income, [None, 1.5, 2.5])
+        self.assertEqual(unique, [None, None, None])
+        self.assertEqual(self.cu.fetchcolumns(), ([], [], [], []))
+
+        self.cu.execute("select income from test where income is not null")
+        self.assertEqual(self.cu.fetchcolumns(), (array("d", [1.5, 2.5]),))
+
+    def test_fetchcolumns_size(self):
+        self.cu.executemany("insert into test(name) values (?)",
+                            [("bar",), ("baz",)])
+        self.cu.execute("select id from test order by id")
+        self.assertEqual(self.cu.fetchone(), (1,))
+        self.assertEqual(self.cu.fetchcolumns(1), (array("q", [2]),))
+        self.assertEqual(self.cu.fetchcolumns(0), ([],))
+        self.assertEqual(self.cu.fetchcolumns(size=5), (array("q", [3]),))
+        self.assertIsNone(self.cu.fetchone())
+
+    def test_fetchcolumns_mixed_types(self):
+        # A column only stays an array while all its values have one type.
+        self.cu.execute("select 1, 1.5 union all select 2.5, 2 "
+                        "union all select 'x', x'00'")
+        self.assertEqual(self.cu.fetchcolumns(),
+                         ([1, 2.5, "x"], [1.5, 2, b"\x00"]))
+
+    def test_fetchcolumns_large(self):
+        n = 10_000
+        self.cu.execute("with recursive c(x) as (select 0 union all "
+                        "select x + 1 from c limit ?) select x, x / 2.0 from c",
+                        (n,))
+        ints, floats = self.cu.fetchcolumns()
+        self.assertEqual(ints, array("q", range(n)))
+        self.assertEqual(floats, array("d", (x / 2 for x in range(n))))
+
+    def test_fetchcolumns_no_statement(self):
+        cu = self.cx.cursor()
+        self.assertEqual(cu.fetchcolumns(), ())
+
+    def test_fetchcolumns_factories(self):
+        self.cx.text_factory = bytes
+        self.cu.row_factory = lambda cursor, row: 1/0
+        self.cu.execute("select name from test")
+        self.assertEqual(self.cu.fetchcolumns(), ([b"foo"],))
+
     def test_setinputsizes(self):
         self.cu.setinputsizes([3, 4, 5])
 
@@ -1740,7 +1793,8 @@ def test_closed(self):
         cur = self.cx.cursor()
         cur.close()
 
-        for method_name in ("execute", "executemany", "executescript", "fetchall", "fetchmany", "fetchone"):
+        for method_name in ("execute", "executemany", "executescript", "fetchall", "fetchmany", "fetchone",
+                            "fetchcolumns"):
             if method_name in ("execute", "executescript"):
                 params = ("select 4 union select 5",)
             elif method_name == "executemany":
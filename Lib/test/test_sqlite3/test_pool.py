@@ -0,0 +1,189 @@
+import asyncio
+import sqlite3
+import threading
+import unittest
+
+from sqlite3.pool import ConnectionPool
+from test.support import threading_helper
+from test.support.os_helper import TESTFN, unlink
+
+
+def tearDownModule():
+    asyncio.events._set_event_loop_policy(None)
+
+
+class ConnectionPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(self.remove_database)
+        self.pool = ConnectionPool(TESTFN)
+        self.addCleanup(self.pool.close)
+        with self.pool.writer() as cx:
+            cx.execute("CREATE TABLE t (x)")
+
+    def remove_database(self):
+        for suffix in ("", "-wal", "-shm"):
+            unlink(TESTFN + suffix)
+
+    def test_wal(self):
+        with self.pool.reader() as cx:
+            mode, = cx.execute("PRAGMA journal_mode").fetchone()
+        self.assertEqual(mode, "wal")
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ConnectionPool(":memory:")
+        with self.assertRaises(TypeError):
+            ConnectionPool(TESTFN, check_same_thread=True)
+        with self.assertRaises(ValueError):
+            ConnectionPool(TESTFN, max_readers=0)
+
+    def test_writer_commits(self):
+        with self.pool.writer() as cx:
+            cx.execute("INSERT INTO t VALUES (1)")
+            with self.pool.writer() as inner:
+                self.assertIs(inner, cx)
+                inner.execute("INSERT INTO t VALUES (2)")
+            self.assertTrue(cx.in_transaction)
+        with self.pool.reader() as cx:
+            rows = cx.execute("SELECT x FROM t ORDER BY x").fetchall()
+        self.assertEqual(rows, [(1,), (2,)])
+
+    def test_writer_rolls_back(self):
+        with self.assertRaises(ZeroDivisionError):
+            with self.pool.writer() as cx:
+                cx.execute("INSERT INTO t VALUES (1)")
+                1/0
+        with self.pool.reader() as cx:
+            self.assertEqual(cx.execute("SELECT * FROM t").fetchall(), [])
+
+    def test_reader_is_read_only(self):
+        with self.pool.reader() as cx:
+            with self.assertRaises(sqlite3.OperationalError):
+                cx.execute("INSERT INTO t VALUES (1)")
+
+    def test_reader_reuse(self):
+        with self.pool.reader() as cx1:
+            with self.pool.reader() as cx2:
+                self.assertIs(cx2, cx1)
+        with self.pool.reader() as cx3:
+            self.assertIs(cx3, cx1)
+
+    def test_reader_sees_committed_data(self):
+        with self.pool.reader() as cx:
+            with self.pool.writer() as w:
+                w.execute("INSERT INTO t VALUES (1)")
+            self.assertEqual(cx.execute("SELECT * FROM t").fetchall(), [(1,)])
+
+    def test_reader_per_task(self):
+        async def read():
+            with self.pool.reader() as cx:
+                await asyncio.sleep(0)
+                return cx
+        async def main():
+            return await asyncio.gather(read(), read())
+        cx1, cx2 = asyncio.run(main())
+        self.assertIsNot(cx1, cx2)
+
+    @threading_helper.requires_working_threading()
+    def test_max_readers(self):
+        pool = ConnectionPool(TESTFN, max_readers=1, acquire_timeout=0.01)
+        self.addCleanup(pool.close)
+        acquired = threading.Event()
+        release = threading.Event()
+        def hold():
+            with pool.reader():
+                acquired.set()
+                release.wait()
+        with threading_helper.start_threads([threading.Thread(target=hold)]):
+            acquired.wait()
+            with self.assertRaises(TimeoutError):
+                with pool.reader():
+                    pass
+            release.set()
+        with pool.reader():
+            pass
+
+    @threading_helper.requires_working_threading()
+    def test_threads(self):
+        with self.pool.writer() as cx:
+            cx.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(10)])
+        results = []
+        def read():
+            with self.pool.reader() as cx:
+                results.append(cx.execute("SELECT sum(x) FROM t").fetchone())
+        def write(i):
+            with self.pool.writer() as cx:
+                cx.execute("INSERT INTO t VALUES (?)", (i,))
+        threads = [threading.Thread(target=read) for _ in range(5)]
+        threads += [threading.Thread(target=write, args=(i,))
+                    for i in range(100, 105)]
+        with threading_helper.start_threads(threads):
+            pass
+        self.assertEqual(len(results), 5)
+        with self.pool.reader() as cx:
+            count, = cx.execute("SELECT count(*) FROM t").fetchone()
+        self.assertEqual(count, 15)
+
+    def test_open_transaction_rolled_back(self):
+        with self.pool.reader() as cx:
+            cx.execute("BEGIN")
+            cx.execute("SELECT * FROM t").fetchall()
+        self.assertFalse(cx.in_transaction)
+
+    def test_warmup(self):
+        pool = ConnectionPool(TESTFN, cached_statements=10,
+                              warmup_reads=["SELECT x FROM t"],
+                              warmup_writes=[("INSERT INTO t VALUES (?)", (1,))])
+        self.addCleanup(pool.close)
+        with pool.writer():
+            pass
+        with pool.reader() as cx:
+            self.assertEqual(cx.execute("SELECT x FROM t").fetchall(), [])
+        with self.assertRaises(sqlite3.OperationalError):
+            ConnectionPool(TESTFN, warmup_writes=["SELECT * FROM missing"])
+
+    def test_check(self):
+        with self.pool.reader() as cx:
+            pass
+        self.assertEqual(self.pool.check(), 0)
+        cx.close()
+        self.assertEqual(self.pool.check(), 1)
+        with self.pool.reader() as cx2:
+            self.assertIsNot(cx2, cx)
+            cx2.execute("SELECT 1")
+
+    def test_stale_reader_replaced(self):
+        pool = ConnectionPool(TESTFN, check_interval=0)
+        self.addCleanup(pool.close)
+        with pool.reader() as cx:
+            pass
+        cx.close()
+        with pool.reader() as cx2:
+            self.assertIsNot(cx2, cx)
+            cx2.execute("SELECT 1")
+
+    def test_close(self):
+        with self.pool.reader() as cx:
+            pass
+        with self.pool as pool:
+            self.assertIs(pool, self.pool)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            cx.execute("SELECT 1")
+        with self.assertRaisesRegex(sqlite3.ProgrammingError, "closed pool"):
+            with self.pool.reader():
+                pass
+        with self.assertRaisesRegex(sqlite3.ProgrammingError, "closed pool"):
+            with self.pool.writer():
+                pass
+        self.pool.close()
+
+    def test_close_while_reading(self):
+        with self.pool.reader() as cx:
+            self.pool.close()
+            cx.execute("SELECT 1")
+        with self.assertRaises(sqlite3.ProgrammingError):
+            cx.execute("SELECT 1")
+
+
+if __name__ == "__main__":
+    unittest.main()
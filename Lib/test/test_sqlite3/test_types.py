@@ -21,6 +21,7 @@
 # 3. This notice may not be removed or altered from any source distribution.
 
 import datetime
+from array import array
 import unittest
 import sqlite3 as sqlite
 import sys
@@ -343,6 +344,15 @@ def test_none(self):
         val = self.cur.fetchone()[0]
         self.assertEqual(val, None)
 
+    def test_fetchcolumns(self):
+        self.cur.executemany("insert into test(x) values (?)", [(1,), (2,)])
+        self.cur.execute('select x as "x [bar]", x from test')
+        self.assertEqual(self.cur.fetchcolumns(),
+                         (["<1>", "<2>"], array("q", [1, 2])))
+        self.cur.execute('select x as "x [exc]" from test')
+        with self.assertRaises(ZeroDivisionError):
+            self.cur.fetchcolumns()
+
     def test_col_name(self):
         self.cur.execute("insert into test(x) values (?)", ("xxx",))
         self.cur.execute('select x as "x y [bar]" from test')
@@ -2564,6 +2564,91 @@ class LzmaAppendTest(LzmaTest, AppendTestBase, unittest.TestCase):
 class ZstdAppendTest(ZstdTest, AppendTestBase, unittest.TestCase):
     pass
 
+class IndexTest(TarTest):
+
+    def test_index(self):
+        with tarfile.open(self.tarname, mode="r:" + self.suffix,
+                          encoding="iso8859-1") as tar:
+            index = tar.build_index()
+            members = {m.name: m for m in tar.getmembers()}
+        self.assertEqual(len(index.members), len(members))
+
+        with io.BytesIO() as f:
+            index.save(f)
+            f.seek(0)
+            index = tarfile.TarIndex.load(f)
+
+        with tarfile.open(self.tarname, index=index,
+                          encoding="iso8859-1") as tar:
+            tarinfo = tar.getmember("ustar/regtype")
+            self.assertFalse(tar._loaded)
+            self.assertEqual(tarinfo.size, 7011)
+            self.assertEqual(tarinfo.offset, members["ustar/regtype"].offset)
+            with tar.extractfile("ustar/regtype") as f:
+                self.assertEqual(sha256sum(f.read()), sha256_regtype)
+            tarinfo = tar.getmember("ustar/dirtype/")
+            self.assertTrue(tarinfo.isdir())
+            self.assertRaises(KeyError, tar.getmember, "missing")
+            self.assertFalse(tar._loaded)
+            self.assertEqual(tar.getnames(), list(members))
+
+    def test_block_size(self):
+        if self.suffix == '':
+            self.skipTest("requires compression")
+        payloads = [os.urandom(1000) * 5 for _ in range(50)]
+        with tarfile.open(tmpname, "w:" + self.suffix, block_size=20000) as tar:
+            for i, data in enumerate(payloads):
+                tarinfo = tarfile.TarInfo("member%d" % i)
+                tarinfo.size = len(data)
+                tar.addfile(tarinfo, io.BytesIO(data))
+            index = tar.build_index()
+        self.assertGreater(len(index.checkpoints), 10)
+
+        # The archive is an ordinary compressed tar file.
+        with self.open(tmpname, "rb") as f:
+            self.assertTrue(tarfile.is_tarfile(io.BytesIO(f.read())))
+
+        index.save(tmpname + ".idx")
+        self.addCleanup(os_helper.unlink, tmpname + ".idx")
+        index = tarfile.TarIndex.load(tmpname + ".idx")
+        with tarfile.open(tmpname, index=index) as tar:
+            self.assertIsInstance(tar.fileobj, tarfile._BlockReader)
+            for i in (40, 3, 49, 0, 25):
+                with tar.extractfile("member%d" % i) as f:
+                    self.assertEqual(f.read(), payloads[i])
+            self.assertFalse(tar._loaded)
+            self.assertEqual(len(tar.getmembers()), len(payloads))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            tarfile.open(self.tarname, "r:" + self.suffix, block_size=1024)
+        with self.assertRaises(ValueError):
+            tarfile.open(tmpname, "w:", block_size=1024)
+        with self.assertRaises(ValueError):
+            tarfile.open(tmpname, "w:" + self.suffix,
+                         index=tarfile.TarIndex())
+        with self.assertRaises(ValueError):
+            tarfile.open(self.tarname, "r|" + self.suffix,
+                         index=tarfile.TarIndex())
+        with self.assertRaises(tarfile.ReadError):
+            tarfile.TarIndex.load(io.BytesIO(b'{"version": 0}'))
+
+class GzipIndexTest(GzipTest, IndexTest, unittest.TestCase):
+    pass
+
+class Bz2IndexTest(Bz2Test, IndexTest, unittest.TestCase):
+    pass
+
+class LzmaIndexTest(LzmaTest, IndexTest, unittest.TestCase):
+    pass
+
+class ZstdIndexTest(ZstdTest, IndexTest, unittest.TestCase):
+    pass
+
+class TarIndexTest(IndexTest, unittest.TestCase):
+    pass
+
+
 class LimitsTest(unittest.TestCase):
 
     def test_ustar_limits(self):
@@ -1341,6 +1341,92 @@ def test_zipwritefile_attrs(self):
             self.assertIs(fid.writable(), True)
             self.assertIs(fid.seekable(), False)
 
+    def test_parallel_writer(self):
+        contents = {f'file{i}': randbytes(i * 1000) + b'x' * i * 5000
+                    for i in range(20)}
+        with temp_dir() as srcdir:
+            for name, data in contents.items():
+                with open(os.path.join(srcdir, name), 'wb') as f:
+                    f.write(data)
+            for f in get_files(self):
+                with zipfile.ZipFile(f, 'w', self.compression) as zipfp:
+                    zipfp.writestr('first', b'1')
+                    with zipfp.parallel_writer(max_workers=4) as writer:
+                        writer.write(srcdir, 'dir')
+                        for name in contents:
+                            writer.write(os.path.join(srcdir, name),
+                                         'dir/' + name)
+                        writer.writestr('text', 'abc' * 1000)
+                    self.assertTrue(writer.closed)
+                    zipfp.writestr('last', b'2')
+
+                if not isinstance(f, str):
+                    f.seek(0)
+                with zipfile.ZipFile(f) as zipfp:
+                    self.assertIsNone(zipfp.testzip())
+                    self.assertEqual(zipfp.namelist(),
+                        ['first', 'dir/']
+                        + ['dir/' + name for name in contents]
+                        + ['text', 'last'])
+                    for name, data in contents.items():
+                        info = zipfp.getinfo('dir/' + name)
+                        self.assertEqual(info.compress_type, self.compression)
+                        self.assertEqual(info.file_size, len(data))
+                        self.assertEqual(zipfp.read('dir/' + name), data)
+                    self.assertEqual(zipfp.read('text'), b'abc' * 1000)
+
+    def test_parallel_writer_unseekable(self):
+        f = Unseekable(io.BytesIO())
+        with zipfile.ZipFile(f, 'w', self.compression) as zipfp:
+            with zipfp.parallel_writer() as writer:
+                writer.writestr('a', b'a' * 10000)
+                writer.writestr('b', b'')
+        with zipfile.ZipFile(f.fp) as zipfp:
+            self.assertIsNone(zipfp.testzip())
+            self.assertEqual(zipfp.read('a'), b'a' * 10000)
+            self.assertEqual(zipfp.read('b'), b'')
+
+    def test_parallel_writer_exclusive(self):
+        with zipfile.ZipFile(io.BytesIO(), 'w', self.compression) as zipfp:
+            writer = zipfp.parallel_writer()
+            self.assertRaises(ValueError, zipfp.writestr, 'a', b'a')
+            self.assertRaises(ValueError, zipfp.open, 'a', 'w')
+            self.assertRaises(ValueError, zipfp.parallel_writer)
+            self.assertRaises(ValueError, zipfp.close)
+            writer.close()
+            writer.close()
+            self.assertRaises(ValueError, writer.writestr, 'a', b'a')
+            zipfp.writestr('a', b'a')
+        with zipfile.ZipFile(io.BytesIO(), 'w') as zipfp:
+            pass
+        self.assertRaises(ValueError, zipfp.parallel_writer)
+
+    def test_parallel_writer_error(self):
+        with temp_dir() as srcdir:
+            f = io.BytesIO()
+            with zipfile.ZipFile(f, 'w', self.compression) as zipfp:
+                with zipfp.parallel_writer() as writer:
+                    writer.writestr('a', b'a' * 1000)
+                    missing = os.path.join(srcdir, 'missing')
+                    self.assertRaises(FileNotFoundError, writer.write,
+                                      missing)
+                with self.assertRaises(FileNotFoundError):
+                    with zipfp.parallel_writer() as writer:
+                        writer.writestr('b', b'b')
+                        # The file is removed before it is compressed.
+                        name = os.path.join(srcdir, 'c')
+                        with open(name, 'wb'):
+                            pass
+                        info = zipfile.ZipInfo.from_file(name, 'c')
+                        os.remove(name)
+                        writer._submit(info, name, None)
+                        writer.writestr('d', b'd')
+                self.assertTrue(writer.closed)
+                zipfp.writestr('e', b'e')
+            with zipfile.ZipFile(f) as zipfp:
+                self.assertIsNone(zipfp.testzip())
+                self.assertEqual(zipfp.namelist(), ['a', 'b', 'e'])
+
 class StoredWriterTests(AbstractWriterTests, unittest.TestCase):
     compression = zipfile.ZIP_STORED
 
@@ -1641,6 +1727,61 @@ def test_extract_all_with_target_pathlike(self):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(FakePath(extdir))
 
+    def test_extract_all_parallel(self):
+        for f in TESTFN2, io.BytesIO():
+            with zipfile.ZipFile(f, 'w', zipfile.ZIP_STORED) as zipfp:
+                zipfp.mkdir('emptydir')
+                for fpath, fdata in SMALL_TEST_DATA:
+                    zipfp.writestr(fpath, fdata)
+                for i in range(50):
+                    zipfp.writestr(f'many/{i}', str(i) * 1000)
+                with self.assertWarns(UserWarning):
+                    zipfp.writestr('_ziptest1', 'overwritten')
+            if not isinstance(f, str):
+                f.seek(0)
+            with temp_dir() as extdir, zipfile.ZipFile(f) as zipfp:
+                zipfp.extractall(extdir, max_workers=4)
+                self.assertTrue(os.path.isdir(os.path.join(extdir, 'emptydir')))
+                self.check_file(os.path.join(extdir, '_ziptest1'),
+                                b'overwritten')
+                for fpath, fdata in SMALL_TEST_DATA[1:]:
+                    self.check_file(os.path.join(extdir, fpath),
+                                    fdata.encode())
+                for i in range(50):
+                    self.check_file(os.path.join(extdir, 'many', str(i)),
+                                    str(i).encode() * 1000)
+        unlink(TESTFN2)
+
+    def test_extract_all_parallel_shared_file(self):
+        # In mode 'a' the workers share self.fp, which must stay open.
+        with zipfile.ZipFile(TESTFN2, 'w', zipfile.ZIP_STORED) as zipfp:
+            for i in range(200):
+                zipfp.writestr(f'many/{i}', str(i) * 100)
+        with temp_dir() as extdir, zipfile.ZipFile(TESTFN2, 'a') as zipfp:
+            for _ in range(5):
+                zipfp.extractall(extdir, max_workers=8)
+                self.assertEqual(zipfp._fileRefCnt, 1)
+                self.assertFalse(zipfp.fp.closed)
+            self.assertEqual(zipfp.read('many/7'), b'7' * 100)
+            for i in range(200):
+                self.check_file(os.path.join(extdir, 'many', str(i)),
+                                str(i).encode() * 100)
+        unlink(TESTFN2)
+
+    def test_extract_all_parallel_members(self):
+        self.make_test_file()
+        with temp_dir() as extdir, zipfile.ZipFile(TESTFN2) as zipfp:
+            names = [fpath for fpath, fdata in SMALL_TEST_DATA[:2]]
+            zipfp.extractall(extdir, [names[0], zipfp.getinfo(names[1])],
+                             max_workers=2)
+            for fpath, fdata in SMALL_TEST_DATA[:2]:
+                self.check_file(os.path.join(extdir, fpath), fdata.encode())
+            self.assertFalse(os.path.exists(
+                os.path.join(extdir, SMALL_TEST_DATA[2][0])))
+            self.assertRaises(KeyError, zipfp.extractall, extdir, ['missing'],
+                              max_workers=2)
+        unlink(TESTFN2)
+
     def check_file(self, filename, content):
         self.assertTrue(os.path.isfile(filename))
         with open(filename, 'rb') as f:
@@ -2617,6 +2758,57 @@ def test_overlap_with_archive_comment(self):
             with self.assertRaisesRegex(zipfile.BadZipFile, 'Overlapped entries'):
                 zipf.read('a')
 
+    def test_lazy_central_directory(self):
+        with zipfile.ZipFile(TESTFN, 'w') as zipf:
+            for i in range(100):
+                zipf.writestr(f'dir/{i}', str(i))
+            zipf.writestr('\u20ac', b'euro')
+            with self.assertWarns(UserWarning):
+                zipf.writestr('dir/5', b'dup')
+        with zipfile.ZipFile(TESTFN) as zipf:
+            names = zipf.namelist()
+            self.assertEqual(len(names), 102)
+            self.assertEqual(names[:3], ['dir/0', 'dir/1', 'dir/2'])
+            self.assertEqual(names[-2:], ['\u20ac', 'dir/5'])
+            # Repeated lookups return the same object.
+            zi = zipf.getinfo('dir/7')
+            self.assertIs(zipf.getinfo('dir/7'), zi)
+            self.assertEqual(zipf.read('dir/7'), b'7')
+            self.assertEqual(zipf.read('\u20ac'), b'euro')
+            self.assertEqual(zipf.read('dir/5'), b'dup')
+            self.assertRaises(KeyError, zipf.getinfo, 'missing')
+            # The ZipInfo objects already created are kept.
+            infos = zipf.infolist()
+            self.assertIs(infos[7], zi)
+            self.assertEqual([x.filename for x in infos], names)
+            self.assertIs(zipf.NameToInfo['dir/7'], zi)
+            self.assertIs(zipf.NameToInfo['dir/5'], infos[-1])
+            self.assertEqual(zipf.namelist(), names)
+            self.assertIs(zipf.getinfo('dir/7'), zi)
+
+    def test_cache_directory(self):
+        with zipfile.ZipFile(TESTFN, 'w') as zipf:
+            zipf.writestr('a', b'1')
+        with zipfile.ZipFile(TESTFN, cache_directory=True) as zipf:
+            self.assertEqual(zipf.namelist(), ['a'])
+            index = zipf._index
+        with zipfile.ZipFile(TESTFN, cache_directory=True) as zipf:
+            self.assertIs(zipf._index, index)
+            self.assertEqual(zipf.read('a'), b'1')
+            zi = zipf.getinfo('a')
+        with zipfile.ZipFile(TESTFN, cache_directory=True) as zipf:
+            # ZipInfo objects are not shared between ZipFile objects.
+            self.assertIsNot(zipf.getinfo('a'), zi)
+        with zipfile.ZipFile(TESTFN) as zipf:
+            self.assertIsNot(zipf._index, index)
+
+        with zipfile.ZipFile(TESTFN, 'a') as zipf:
+            zipf.writestr('b', b'22')
+        with zipfile.ZipFile(TESTFN, cache_directory=True) as zipf:
+            self.assertIsNot(zipf._index, index)
+            self.assertEqual(zipf.namelist(), ['a', 'b'])
+            self.assertEqual(zipf.read('b'), b'22')
+
     def tearDown(self):
         unlink(TESTFN)
         unlink(TESTFN2)
@@ -1012,6 +1012,110 @@ class CompressedZipImportTestCase(UncompressedZipImportTestCase):
     compression = ZIP_DEFLATED
 
 
+class ZipImportCacheTestCase(ImportHooksBaseTestCase):
+
+    def setUp(self):
+        zipimport._zip_directory_cache.clear()
+        zipimport._zip_code_caches.clear()
+        self.addCleanup(zipimport._zip_directory_cache.clear)
+        self.addCleanup(zipimport._zip_code_caches.clear)
+        ImportHooksBaseTestCase.setUp(self)
+        self.tempdir = self.enterContext(os_helper.temp_dir())
+        self.archive = os.path.join(self.tempdir, 'app.pyz')
+
+    def make_archive(self, source='x = 1\n', *, compression=ZIP_STORED):
+        with ZipFile(self.archive, 'w', compression=compression) as z:
+            z.writestr('pkg/__init__.py', '')
+            z.writestr('pkg/mod.py', source)
+        # Set an old mtime, so that the directory index can be cached.
+        mtime = time.time() - 60
+        os.utime(self.archive, (mtime, mtime))
+
+    def new_import_cache(self):
+        external = zipimport._bootstrap_external
+        cache = external._DirectoryCache(os.path.join(self.tempdir, 'cache'))
+        self.enterContext(support.swap_attr(external, '_directory_cache', cache))
+        return cache
+
+    def get_code(self):
+        importer = zipimport.zipimporter(os.path.join(self.archive, 'pkg'))
+        namespace = {}
+        exec(importer.get_code('pkg.mod'), namespace)
+        return namespace['x']
+
+    def test_directory_index(self):
+        self.make_archive()
+        cache = self.new_import_cache()
+        self.assertEqual(self.get_code(), 1)
+        files = zipimport._zip_directory_cache[self.archive]
+        cache.save()
+
+        zipimport._zip_directory_cache.clear()
+        self.new_import_cache()
+        with unittest.mock.patch.object(zipimport, '_read_directory') as m:
+            self.assertEqual(self.get_code(), 1)
+        m.assert_not_called()
+        self.assertEqual(zipimport._zip_directory_cache[self.archive], files)
+
+    def test_directory_index_archive_changed(self):
+        self.make_archive()
+        cache = self.new_import_cache()
+        self.assertEqual(self.get_code(), 1)
+        cache.save()
+
+        self.make_archive('x = 22\n')
+        zipimport._zip_directory_cache.clear()
+        self.new_import_cache()
+        self.assertEqual(self.get_code(), 22)
+
+    def test_directory_index_invalidate_caches(self):
+        self.make_archive()
+        cache = self.new_import_cache()
+        importer = zipimport.zipimporter(self.archive)
+        key = ('zipimport', self.archive)
+        mtime = os.stat(self.archive).st_mtime
+        self.assertIsNotNone(cache.get(key, mtime))
+        importer.invalidate_caches()
+        self.assertIsNone(cache.get(key, mtime))
+
+    def test_code_cache(self):
+        self.make_archive()
+        prefix = os.path.join(self.tempdir, 'pycache')
+        self.enterContext(support.swap_attr(sys, 'pycache_prefix', prefix))
+        self.enterContext(support.swap_attr(sys, 'dont_write_bytecode', False))
+        self.assertEqual(self.get_code(), 1)
+        zipimport._save_code_caches()
+        filename = zipimport._code_cache_filename(self.archive)
+        self.assertTrue(filename.startswith(prefix))
+        self.assertTrue(os.path.exists(filename))
+
+        zipimport._zip_code_caches.clear()
+        with unittest.mock.patch.object(zipimport, '_get_data') as m:
+            self.assertEqual(self.get_code(), 1)
+        m.assert_not_called()
+
+        # The cache file is ignored once the archive is modified.
+        self.make_archive('x = 22\n')
+        zipimport._zip_directory_cache.clear()
+        zipimport._zip_code_caches.clear()
+        self.assertEqual(self.get_code(), 22)
+
+    def test_code_cache_dont_write_bytecode(self):
+        self.make_archive()
+        prefix = os.path.join(self.tempdir, 'pycache')
+        self.enterContext(support.swap_attr(sys, 'pycache_prefix', prefix))
+        self.enterContext(support.swap_attr(sys, 'dont_write_bytecode', True))
+        self.assertEqual(self.get_code(), 1)
+        zipimport._save_code_caches()
+        self.assertFalse(os.path.exists(prefix))
+
+    def test_code_cache_disabled(self):
+        self.make_archive()
+        self.enterContext(support.swap_attr(sys, 'pycache_prefix', None))
+        self.assertEqual(self.get_code(), 1)
+        self.assertEqual(zipimport._zip_code_caches, {})
+
+
 class BadFileZipImportTestCase(unittest.TestCase):
     def assertZipFailure(self, filename):
         self.assertRaises(zipimport.ZipImportError,
@@ -12,6 +12,7 @@
 from test.support.import_helper import import_module
 from test.support import threading_helper
 from test.support import _1M
+from compression._common import _streams
 
 _zstd = import_module("_zstd")
 zstd = import_module("compression.zstd")
@@ -1915,6 +1916,35 @@ def test_read_multistream(self):
         with ZstdFile(io.BytesIO(COMPRESSED_100_PLUS_32KB + COMPRESSED_DAT)) as f:
             self.assertEqual(f.read(), DECOMPRESSED_100_PLUS_32KB + DECOMPRESSED_DAT)
 
+    def test_read_seekable_format_threads(self):
+        frames = [COMPRESSED_100_PLUS_32KB, COMPRESSED_DAT,
+                  COMPRESSED_100_PLUS_32KB]
+        entries = b''.join(
+            len(frame).to_bytes(4, 'little') + len(data).to_bytes(4, 'little')
+            for frame, data in zip(frames, [DECOMPRESSED_100_PLUS_32KB,
+                                            DECOMPRESSED_DAT,
+                                            DECOMPRESSED_100_PLUS_32KB]))
+        footer = (len(frames).to_bytes(4, 'little') + b'\0' +
+                  (0x8F92EAB1).to_bytes(4, 'little'))
+        seek_table = ((0x184D2A5E).to_bytes(4, 'little') +
+                      (len(entries) + len(footer)).to_bytes(4, 'little') +
+                      entries + footer)
+        expected = (DECOMPRESSED_100_PLUS_32KB + DECOMPRESSED_DAT +
+                    DECOMPRESSED_100_PLUS_32KB)
+        with ZstdFile(io.BytesIO(b''.join(frames) + seek_table),
+                      threads=2) as f:
+            self.assertIsInstance(f._buffer.raw,
+                                  _streams.ParallelDecompressReader)
+            self.assertEqual(f.read(), expected)
+            f.seek(len(DECOMPRESSED_100_PLUS_32KB) + 5)
+            self.assertEqual(f.read(10), DECOMPRESSED_DAT[5:15])
+
+        # Without a seek table, the file is read on the calling thread.
+        with ZstdFile(io.BytesIO(b''.join(frames)), threads=2) as f:
+            self.assertNotIsInstance(f._buffer.raw,
+                                     _streams.ParallelDecompressReader)
+            self.assertEqual(f.read(), expected)
+
     def test_read_incomplete(self):
         with ZstdFile(io.BytesIO(DAT_130K_C[:-200])) as f:
             self.assertRaises(EOFError, f.read)
@@ -2077,6 +2107,18 @@ def test_decompress_limited(self):
         self.assertLessEqual(decomp._buffer.raw.tell(), max_decomp,
             "Excessive amount of data was decompressed")
 
+    def test_write_threads(self):
+        raw_data = THIS_FILE_BYTES
+        with self.assertRaises(ValueError):
+            ZstdFile(io.BytesIO(), "w", threads=2,
+                     options={CompressionParameter.nb_workers: 2})
+        if CompressionParameter.nb_workers.bounds()[1] == 0:
+            self.skipTest('libzstd was built without multithreading')
+        with io.BytesIO() as dst:
+            with ZstdFile(dst, "w", threads=2) as f:
+                f.write(raw_data)
+            self.assertEqual(decompress(dst.getvalue()), raw_data)
+
     def test_write(self):
         raw_data = THIS_FILE_BYTES[: len(THIS_FILE_BYTES) // 6]
         with io.BytesIO() as dst:
@@ -3,7 +3,10 @@
 
 XXX references to utf-8 need further investigation.
 """
+import array
 import binascii
+import bisect
+import collections
 import importlib.util
 import io
 import os
@@ -407,6 +410,140 @@ def _sanitize_filename(filename):
     return filename
 
 
+class _DirectoryIndex:
+    """Compact index of the central directory of a ZIP archive.
+
+    Keeps the raw central directory together with arrays of the offsets of
+    its records and of the local file headers, and a mapping from file names
+    to record numbers.  ZipInfo objects are only created on demand.
+    Instances are never modified once created, so they can be shared.
+    """
+
+    def __init__(self, data, size_cd, start_dir, concat,
+                 metadata_encoding=None, debug=0):
+        self._data = data
+        self._start_dir = start_dir
+        self._concat = concat
+        self._metadata_encoding = metadata_encoding
+        self._records = records = array.array('Q')
+        header_offsets = array.array('Q')
+        self.names = names = []
+        self.name_to_index = name_to_index = {}
+        unpack_from = struct.unpack_from
+
+        pos = 0
+        while pos < size_cd:
+            if len(data) - pos < sizeCentralDir:
+                raise BadZipFile("Truncated central directory")
+            centdir = unpack_from(structCentralDir, data, pos)
+            if centdir[_CD_SIGNATURE] != stringCentralDir:
+                raise BadZipFile("Bad magic number for central directory")
+            if debug > 2:
+                print(centdir)
+            if centdir[_CD_EXTRACT_VERSION] > MAX_EXTRACT_VERSION:
+                raise NotImplementedError("zip file version %.1f" %
+                                          (centdir[_CD_EXTRACT_VERSION] / 10))
+            records.append(pos)
+            start = pos + sizeCentralDir
+            extra_start = start + centdir[_CD_FILENAME_LENGTH]
+            extra_end = extra_start + centdir[_CD_EXTRA_FIELD_LENGTH]
+            if self._needs_decoding(data, extra_start, extra_end):
+                # The name or the header offset are in the extra field.
+                x = self.zipinfo(len(records) - 1, end_offset=False)
+                name = x.filename
+                header_offset = x.header_offset
+            else:
+                name = _sanitize_filename(
+                    self._decode_name(data[start:extra_start],
+                                      centdir[_CD_FLAG_BITS]))
+                header_offset = centdir[_CD_LOCAL_HEADER_OFFSET] + concat
+            name_to_index[name] = len(names)
+            names.append(name)
+            header_offsets.append(header_offset)
+            # update total bytes read from central directory
+            pos = extra_end + centdir[_CD_COMMENT_LENGTH]
+            if debug > 2:
+                print("total", pos)
+
+        # Needed to find the end of each member's data.
+        order = sorted(range(len(header_offsets)),
+                       key=header_offsets.__getitem__)
+        self._sorted_offsets = array.array(
+            'Q', [header_offsets[i] for i in order])
+        # If several members share a local header, only the last of them is
+        # considered to end at the next header, the others end immediately.
+        self._last_sharing = {}
+        for a, b in zip(order, order[1:]):
+            if header_offsets[a] == header_offsets[b]:
+                self._last_sharing[header_offsets[b]] = b
+
+    def __len__(self):
+        return len(self._records)
+
+    def _decode_name(self, filename, flags):
+        if flags & _MASK_UTF_FILENAME:
+            # UTF-8 file names extension
+            return filename.decode('utf-8')
+        # Historical ZIP filename encoding
+        return filename.decode(self._metadata_encoding or 'cp437')
+
+    @staticmethod
+    def _needs_decoding(data, pos, end):
+        # Return true if the extra field contains ZIP64 or Unicode Path
+        # records, which ZipInfo._decodeExtra() must handle.
+        while end - pos >= 4:
+            tp, ln = struct.unpack_from('<HH', data, pos)
+            if tp == 0x0001 or tp == 0x7075 or pos + ln + 4 > end:
+                return True
+            pos += ln + 4
+        return False
+
+    def zipinfo(self, i, end_offset=True):
+        """Create the ZipInfo instance for record number i."""
+        data = self._data
+        pos = self._records[i]
+        centdir = struct.unpack_from(structCentralDir, data, pos)
+        pos += sizeCentralDir
+        filename = data[pos:pos + centdir[_CD_FILENAME_LENGTH]]
+        pos += centdir[_CD_FILENAME_LENGTH]
+        orig_filename_crc = crc32(filename)
+        # Create ZipInfo instance to store file information
+        x = ZipInfo(self._decode_name(filename, centdir[_CD_FLAG_BITS]))
+        x.extra = data[pos:pos + centdir[_CD_EXTRA_FIELD_LENGTH]]
+        pos += centdir[_CD_EXTRA_FIELD_LENGTH]
+        x.comment = data[pos:pos + centdir[_CD_COMMENT_LENGTH]]
+        x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
+        (x.create_version, x.create_system, x.extract_version, x.reserved,
+         x.flag_bits, x.compress_type, t, d,
+         x.CRC, x.compress_size, x.file_size) = centdir[1:12]
+        x.volume, x.internal_attr, x.external_attr = centdir[15:18]
+        # Convert date/time code to (year, month, day, hour, min, sec)
+        x._raw_time = t
+        x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
+                        t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
+        x._decodeExtra(orig_filename_crc)
+        x.header_offset = x.header_offset + self._concat
+        if end_offset:
+            x._end_offset = self._end_offset(i, x.header_offset)
+        return x
+
+    def _end_offset(self, i, header_offset):
+        last = self._last_sharing.get(header_offset)
+        if last is not None and last != i:
+            return header_offset
+        offsets = self._sorted_offsets
+        j = bisect.bisect_right(offsets, header_offset)
+        if j < len(offsets):
+            return offsets[j]
+        return self._start_dir
+
+
+# Cache of _DirectoryIndex objects for ZipFile(..., cache_directory=True),
+# keyed by the path, identity, size and modification time of the archive.
+_directory_cache = collections.OrderedDict()
+_DIRECTORY_CACHE_SIZE = 32
+
+
 class ZipInfo:
     """Class with attributes describing each file in the ZIP archive."""
 
@@ -1368,6 +1505,169 @@ def close(self):
 
 
 
+class _ParallelWriter:
+    """Add members to a ZipFile, compressing them in a thread pool.
+
+    Created by ZipFile.parallel_writer().  The compressed data of each
+    member is spooled to memory or a temporary file by a worker thread,
+    then copied to the archive by the thread which added the member, in
+    the order the members were added.
+    """
+
+    # Compressed data larger than this is spooled to a temporary file.
+    _SPOOL_MAX_SIZE = 16 * 1024 * 1024
+    _CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, zf, max_workers=None):
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._zipfile = zf
+        self._executor = ThreadPoolExecutor(max_workers)
+        # Bound the amount of compressed data waiting to be written.
+        self._max_pending = 2 * self._executor._max_workers
+        self._pending = deque()
+        self.closed = False
+        zf._writing = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if type is None:
+            self.close()
+        else:
+            self._abort()
+
+    def write(self, filename, arcname=None,
+              compress_type=None, compresslevel=None):
+        """Put the bytes from filename into the archive under the name
+        arcname."""
+        zf = self._zipfile
+        self._checkclosed()
+        zinfo = ZipInfo.from_file(filename, arcname,
+                                  strict_timestamps=zf._strict_timestamps)
+        if zinfo.is_dir():
+            zinfo.compress_size = 0
+            zinfo.CRC = 0
+            self._pending.append((zinfo, None))
+            self._commit()
+            return
+        zinfo.compress_type = (compress_type if compress_type is not None
+                               else zf.compression)
+        zinfo.compress_level = (compresslevel if compresslevel is not None
+                                else zf.compresslevel)
+        self._submit(zinfo, filename, None)
+
+    def writestr(self, zinfo_or_arcname, data,
+                 compress_type=None, compresslevel=None):
+        """Write a file into the archive.  The contents is 'data', which
+        may be either a 'str' or a 'bytes' instance; if it is a 'str',
+        it is encoded as UTF-8 first."""
+        self._checkclosed()
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if isinstance(zinfo_or_arcname, ZipInfo):
+            zinfo = zinfo_or_arcname
+        else:
+            zinfo = ZipInfo(zinfo_or_arcname)._for_archive(self._zipfile)
+        if compress_type is not None:
+            zinfo.compress_type = compress_type
+        if compresslevel is not None:
+            zinfo.compress_level = compresslevel
+        self._submit(zinfo, None, data)
+
+    def close(self):
+        """Write the remaining members to the archive and release the
+        worker threads."""
+        if self.closed:
+            return
+        try:
+            self._commit(wait=True)
+        except BaseException:
+            self._abort()
+            raise
+        self.closed = True
+        self._executor.shutdown()
+        self._zipfile._writing = False
+
+    def _abort(self):
+        self.closed = True
+        futures = [future for zinfo, future in self._pending
+                   if future is not None]
+        self._pending.clear()
+        for future in futures:
+            future.cancel()
+        self._executor.shutdown()
+        # Discard the data compressed by the jobs which were already running.
+        for future in futures:
+            if not future.cancelled() and future.exception() is None:
+                future.result()[-1].close()
+        self._zipfile._writing = False
+
+    def _checkclosed(self):
+        if self.closed:
+            raise ValueError("I/O operation on closed parallel writer.")
+        if not self._zipfile.fp:
+            raise ValueError(
+                "Attempt to write to ZIP archive that was already closed")
+
+    def _submit(self, zinfo, filename, data):
+        _check_compression(zinfo.compress_type)
+        future = self._executor.submit(self._compress, zinfo.compress_type,
+                                       zinfo.compress_level, filename, data)
+        self._pending.append((zinfo, future))
+        self._commit()
+
+    def _commit(self, wait=False):
+        # Write the members whose data is ready, keeping their order.
+        pending = self._pending
+        while pending:
+            zinfo, future = pending[0]
+            if (future is not None and not future.done() and not wait
+                and len(pending) <= self._max_pending):
+                break
+            pending.popleft()
+            if future is None:
+                self._zipfile.mkdir(zinfo)
+                continue
+            crc, file_size, compress_size, spool = future.result()
+            with spool:
+                zinfo.CRC = crc
+                zinfo.file_size = file_size
+                zinfo.compress_size = compress_size
+                self._zipfile._write_compressed(zinfo, spool)
+
+    @classmethod
+    def _compress(cls, compress_type, compresslevel, filename, data):
+        # Run in a worker thread.
+        import tempfile
+
+        compressor = _get_compressor(compress_type, compresslevel)
+        spool = tempfile.SpooledTemporaryFile(max_size=cls._SPOOL_MAX_SIZE)
+        crc = file_size = 0
+        try:
+            if filename is not None:
+                src = open(filename, "rb")
+            else:
+                src = io.BytesIO(data)
+            with src:
+                while chunk := src.read(cls._CHUNK_SIZE):
+                    file_size += len(chunk)
+                    crc = crc32(chunk, crc)
+                    if compressor:
+                        chunk = compressor.compress(chunk)
+                    spool.write(chunk)
+            if compressor:
+                spool.write(compressor.flush())
+            compress_size = spool.tell()
+            spool.seek(0)
+        except:
+            spool.close()
+            raise
+        return crc, file_size, compress_size, spool
+
+
 class ZipFile:
     """ Class with methods to open, read, write, close, list zip files.
 
@@ -1392,14 +1692,20 @@ class ZipFile:
                    When using ZIP_ZSTANDARD integers -7 though 22 are common,
                    see the CompressionParameter enum in compression.zstd for
                    details.
+    cache_directory: if True and file is a path, the index of the central
+                     directory is kept in a cache shared by the ZipFile
+                     objects of the process and reused as long as the size
+                     and modification time of the file do not change.
 
     """
 
     fp = None                   # Set here since __del__ checks it
+    _index = None
     _windows_illegal_name_trans_table = None
 
     def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
-                 compresslevel=None, *, strict_timestamps=True, metadata_encoding=None):
+                 compresslevel=None, *, strict_timestamps=True, metadata_encoding=None,
+                 cache_directory=False):
         """Open the ZIP file with mode read 'r', write 'w', exclusive create 'x',
         or append 'a'."""
         if mode not in ('r', 'w', 'x', 'a'):
@@ -1410,6 +1716,8 @@ def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
         self._allowZip64 = allowZip64
         self._didModify = False
         self.debug = 0  # Level of printing: 0 through 3
+        self._index = None      # Index of the central directory, if any
+        self._infos = {}        # ZipInfo instances created from the index
         self.NameToInfo = {}    # Find file info given name
         self.filelist = []      # List of ZipInfo instances for archive
         self.compression = compression  # Method of compression
@@ -1419,6 +1727,7 @@ def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
         self._comment = b''
         self._strict_timestamps = strict_timestamps
         self.metadata_encoding = metadata_encoding
+        self._cache_directory = cache_directory
 
         # Check that we don't try to write with nonconforming codecs
         if self.metadata_encoding and mode != 'r':
@@ -1541,63 +1850,69 @@ def _RealGetContents(self):
 
         if self.start_dir < 0:
             raise BadZipFile("Bad offset for central directory")
-        fp.seek(self.start_dir, 0)
         size_cd = endrec[_ECD_SIZE]
+        key = None
+        if self._cache_directory and not self._filePassed:
+            st = os.stat(fp.fileno())
+            key = (os.path.abspath(self.filename), st.st_dev, st.st_ino,
+                   st.st_size, st.st_mtime_ns, self.metadata_encoding)
+            index = _directory_cache.get(key)
+            if index is not None:
+                _directory_cache.move_to_end(key)
+                self._index = index
+                return
+        fp.seek(self.start_dir, 0)
         data = fp.read(size_cd)
-        fp = io.BytesIO(data)
-        total = 0
-        while total < size_cd:
-            centdir = fp.read(sizeCentralDir)
-            if len(centdir) != sizeCentralDir:
-                raise BadZipFile("Truncated central directory")
-            centdir = struct.unpack(structCentralDir, centdir)
-            if centdir[_CD_SIGNATURE] != stringCentralDir:
-                raise BadZipFile("Bad magic number for central directory")
-            if self.debug > 2:
-                print(centdir)
-            filename = fp.read(centdir[_CD_FILENAME_LENGTH])
-            orig_filename_crc = crc32(filename)
-            flags = centdir[_CD_FLAG_BITS]
-            if flags & _MASK_UTF_FILENAME:
-                # UTF-8 file names extension
-                filename = filename.decode('utf-8')
-            else:
-                # Historical ZIP filename encoding
-                filename = filename.decode(self.metadata_encoding or 'cp437')
-            # Create ZipInfo instance to store file information
-            x = ZipInfo(filename)
-            x.extra = fp.read(centdir[_CD_EXTRA_FIELD_LENGTH])
-            x.comment = fp.read(centdir[_CD_COMMENT_LENGTH])
-            x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
-            (x.create_version, x.create_system, x.extract_version, x.reserved,
-             x.flag_bits, x.compress_type, t, d,
-             x.CRC, x.compress_size, x.file_size) = centdir[1:12]
-            if x.extract_version > MAX_EXTRACT_VERSION:
-                raise NotImplementedError("zip file version %.1f" %
-                                          (x.extract_version / 10))
-            x.volume, x.internal_attr, x.external_attr = centdir[15:18]
-            # Convert date/time code to (year, month, day, hour, min, sec)
-            x._raw_time = t
-            x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
-                            t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
-            x._decodeExtra(orig_filename_crc)
-            x.header_offset = x.header_offset + concat
-            self.filelist.append(x)
-            self.NameToInfo[x.filename] = x
-
-            # update total bytes read from central directory
-            total = (total + sizeCentralDir + centdir[_CD_FILENAME_LENGTH]
-                     + centdir[_CD_EXTRA_FIELD_LENGTH]
-                     + centdir[_CD_COMMENT_LENGTH])
+        self._index = _DirectoryIndex(data, size_cd, self.start_dir, concat,
+                                      self.metadata_encoding, self.debug)
+        if key is not None:
+            _directory_cache[key] = self._index
+            if len(_directory_cache) > _DIRECTORY_CACHE_SIZE:
+                _directory_cache.popitem(last=False)
 
-            if self.debug > 2:
-                print("total", total)
+    @property
+    def filelist(self):
+        """List of ZipInfo instances for the files in the archive."""
+        if self._index is not None:
+            self._materialize()
+        return self._filelist
+
+    @filelist.setter
+    def filelist(self, value):
+        if self._index is not None:
+            self._materialize()
+        self._filelist = value
 
-        end_offset = self.start_dir
-        for zinfo in reversed(sorted(self.filelist,
-                                     key=lambda zinfo: zinfo.header_offset)):
-            zinfo._end_offset = end_offset
-            end_offset = zinfo.header_offset
+    @property
+    def NameToInfo(self):
+        """Mapping of file names to ZipInfo instances."""
+        if self._index is not None:
+            self._materialize()
+        return self._NameToInfo
+
+    @NameToInfo.setter
+    def NameToInfo(self, value):
+        if self._index is not None:
+            self._materialize()
+        self._NameToInfo = value
+
+    def _materialize(self):
+        """Replace the central directory index with ZipInfo objects."""
+        with self._lock:
+            index = self._index
+            if index is None:
+                return
+            filelist = [self._getinfo_at(i) for i in range(len(index))]
+            self._filelist = filelist
+            self._NameToInfo = {x.filename: x for x in filelist}
+            self._infos = {}
+            self._index = None
+
+    def _getinfo_at(self, i):
+        x = self._infos.get(i)
+        if x is None:
+            x = self._infos[i] = self._index.zipinfo(i)
+        return x
 
     @property
     def data_offset(self):
@@ -1607,6 +1922,8 @@ def data_offset(self):
 
     def namelist(self):
         """Return a list of file names in the archive."""
+        if self._index is not None:
+            return list(self._index.names)
         return [data.filename for data in self.filelist]
 
     def infolist(self):
@@ -1641,7 +1958,11 @@ def testzip(self):
 
     def getinfo(self, name):
         """Return the instance of ZipInfo given 'name'."""
-        info = self.NameToInfo.get(name)
+        if self._index is not None:
+            i = self._index.name_to_index.get(name)
+            info = None if i is None else self._getinfo_at(i)
+        else:
+            info = self.NameToInfo.get(name)
         if info is None:
             raise KeyError(
                 'There is no item named %r in the archive' % name)
@@ -1726,9 +2047,14 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
                     "Close the writing handle before trying to read.")
 
         # Open for reading:
-        self._fileRefCnt += 1
+        with self._lock:
+            self._fileRefCnt += 1
         zef_file = _SharedFile(self.fp, zinfo.header_offset,
                                self._fpclose, self._lock, lambda: self._writing)
+        return self._open_member(zef_file, zinfo, name, pwd)
+
+    def _open_member(self, zef_file, zinfo, name, pwd):
+        """Return a ZipExtFile reading the member 'zinfo' from 'zef_file'."""
         try:
             # Skip the file header:
             fheader = zef_file.read(sizeFileHeader)
@@ -1787,7 +2113,7 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
             else:
                 pwd = None
 
-            return ZipExtFile(zef_file, mode + 'b', zinfo, pwd, True)
+            return ZipExtFile(zef_file, 'rb', zinfo, pwd, True)
         except:
             zef_file.close()
             raise
@@ -1848,12 +2174,14 @@ def extract(self, member, path=None, pwd=None):
 
         return self._extract_member(member, path, pwd)
 
-    def extractall(self, path=None, members=None, pwd=None):
+    def extractall(self, path=None, members=None, pwd=None, *,
+                   max_workers=None):
         """Extract all members from the archive to the current working
            directory. 'path' specifies a different directory to extract to.
            'members' is optional and must be a subset of the list returned
            by namelist(). You can specify the password to decrypt all files
-           using 'pwd'.
+           using 'pwd'. If 'max_workers' is given, files are extracted
+           concurrently by that many threads.
         """
         if members is None:
             members = self.namelist()
@@ -1863,8 +2191,49 @@ def extractall(self, path=None, members=None, pwd=None):
         else:
             path = os.fspath(path)
 
+        if max_workers is None:
+            for zipinfo in members:
+                self._extract_member(zipinfo, path, pwd)
+        else:
+            self._extractall_parallel(members, path, pwd, max_workers)
+
+    def _extractall_parallel(self, members, path, pwd, max_workers):
+        from concurrent.futures import ThreadPoolExecutor
+
+        members = [m if isinstance(m, ZipInfo) else self.getinfo(m)
+                   for m in members]
+        # When extracting serially, a later member with the same name
+        # overwrites an earlier one: only extract the last of them.
+        members = list({m.filename: m for m in members}.values())
+        # Create the directories first, so that workers only write files.
         for zipinfo in members:
-            self._extract_member(zipinfo, path, pwd)
+            if zipinfo.is_dir():
+                self._extract_member(zipinfo, path, pwd)
+
+        # If the archive was opened by name for reading, every worker
+        # thread reads from its own file handle instead of sharing self.fp.
+        independent = (self.mode == 'r' and not self._filePassed
+                       and self.filename is not None)
+        local = threading.local()
+        handles = []
+
+        def extract(zipinfo):
+            fp = None
+            if independent:
+                fp = getattr(local, 'fp', None)
+                if fp is None:
+                    fp = local.fp = io.open(self.filename, 'rb')
+                    handles.append(fp)
+            self._extract_member(zipinfo, path, pwd, fp)
+
+        try:
+            with ThreadPoolExecutor(max_workers) as executor:
+                for _ in executor.map(extract, [m for m in members
+                                                if not m.is_dir()]):
+                    pass
+        finally:
+            for fp in handles:
+                fp.close()
 
     @classmethod
     def _sanitize_windows_name(cls, arcname, pathsep):
@@ -1881,9 +2250,10 @@ def _sanitize_windows_name(cls, arcname, pathsep):
         arcname = pathsep.join(x for x in arcname if x)
         return arcname
 
-    def _extract_member(self, member, targetpath, pwd):
+    def _extract_member(self, member, targetpath, pwd, fp=None):
         """Extract the ZipInfo object 'member' to a physical
-           file on the path targetpath.
+           file on the path targetpath.  If 'fp' is given, the member
+           is read from that file object instead of self.fp.
         """
         if not isinstance(member, ZipInfo):
             member = self.getinfo(member)
@@ -1924,8 +2294,18 @@ def _extract_member(self, member, targetpath, pwd):
                         raise
             return targetpath
 
-        with self.open(member, pwd=pwd) as source, \
-             open(targetpath, "wb") as target:
+        if fp is None:
+            source = self.open(member, pwd=pwd)
+        else:
+            if not self.fp:
+                raise ValueError(
+                    "Attempt to use ZIP archive that was already closed")
+            zef_file = _SharedFile(fp, member.header_offset,
+                                   lambda fp: None, threading.Lock(),
+                                   lambda: False)
+            source = self._open_member(zef_file, member, member.filename,
+                                       pwd)
+        with source, open(targetpath, "wb") as target:
             shutil.copyfileobj(source, target)
 
         return targetpath
@@ -2019,6 +2399,59 @@ def writestr(self, zinfo_or_arcname, data,
             with self.open(zinfo, mode='w') as dest:
                 dest.write(data)
 
+    def parallel_writer(self, max_workers=None):
+        """Return an object for adding members to the archive, compressing
+        them concurrently in a pool of 'max_workers' threads.
+
+        The returned object has write() and writestr() methods like those
+        of ZipFile.  Members are written to the archive in the order they
+        were added.  It must be closed (or used as a context manager)
+        before the archive can be written to by other means or closed.
+        """
+        if not self.fp:
+            raise ValueError(
+                "Attempt to write to ZIP archive that was already closed")
+        if self.mode not in ('w', 'x', 'a'):
+            raise ValueError("parallel_writer() requires mode 'w', 'x', or 'a'")
+        if self._writing:
+            raise ValueError(
+                "Can't write to ZIP archive while an open writing handle exists"
+            )
+        return _ParallelWriter(self, max_workers)
+
+    def _write_compressed(self, zinfo, source):
+        """Write a member whose data has already been compressed.
+
+        zinfo.CRC, zinfo.file_size and zinfo.compress_size must be set,
+        'source' is a file object positioned at the compressed data.
+        """
+        zinfo.flag_bits = 0x00
+        if zinfo.compress_type == ZIP_LZMA:
+            # Compressed data includes an end-of-stream (EOS) marker
+            zinfo.flag_bits |= _MASK_COMPRESS_OPTION_1
+        if not zinfo.external_attr:
+            zinfo.external_attr = 0o600 << 16  # permissions: ?rw-------
+
+        zip64 = (zinfo.file_size > ZIP64_LIMIT or
+                 zinfo.compress_size > ZIP64_LIMIT)
+        if not self._allowZip64 and zip64:
+            raise LargeZipFile("Filesize would require ZIP64 extensions")
+
+        with self._lock:
+            if self._seekable:
+                self.fp.seek(self.start_dir)
+            zinfo.header_offset = self.fp.tell()
+
+            self._writecheck(zinfo)
+            self._didModify = True
+
+            self.fp.write(zinfo.FileHeader(zip64))
+            shutil.copyfileobj(source, self.fp)
+            self.start_dir = self.fp.tell()
+
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
+
     def mkdir(self, zinfo_or_directory_name, mode=511):
         """Creates a directory inside the zip archive."""
         if isinstance(zinfo_or_directory_name, ZipInfo):
@@ -2177,10 +2610,11 @@ def _write_end_record(self):
         self.fp.flush()
 
     def _fpclose(self, fp):
-        assert self._fileRefCnt > 0
-        self._fileRefCnt -= 1
-        if not self._fileRefCnt and not self._filePassed:
-            fp.close()
+        with self._lock:
+            assert self._fileRefCnt > 0
+            self._fileRefCnt -= 1
+            if not self._fileRefCnt and not self._filePassed:
+                fp.close()
 
 
 class PyZipFile(ZipFile):
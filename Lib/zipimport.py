@@ -34,6 +34,10 @@ class ZipImportError(ImportError):
 # _read_directory() cache
 _zip_directory_cache = {}
 
+# _ZipCodeCache objects, by archive path
+_zip_code_caches = {}
+_zip_code_caches_saved_at_exit = False
+
 _module_type = type(sys)
 
 END_CENTRAL_DIR_SIZE = 22
@@ -92,7 +96,7 @@ def __init__(self, path):
                 break
 
         if path not in _zip_directory_cache:
-            _zip_directory_cache[path] = _read_directory(path)
+            _zip_directory_cache[path] = _get_directory(path, st)
         self.archive = path
         # a prefix directory following the ZIP file path.
         self.prefix = _bootstrap_external._path_join(*prefix[::-1])
@@ -269,7 +273,7 @@ def _get_files(self):
             files = _zip_directory_cache[self.archive]
         except KeyError:
             try:
-                files = _zip_directory_cache[self.archive] = _read_directory(self.archive)
+                files = _zip_directory_cache[self.archive] = _get_directory(self.archive)
             except ZipImportError:
                 files = {}
 
@@ -279,6 +283,10 @@ def _get_files(self):
     def invalidate_caches(self):
         """Invalidates the cache of file data of the archive path."""
         _zip_directory_cache.pop(self.archive, None)
+        _zip_code_caches.pop(self.archive, None)
+        import_cache = _bootstrap_external._directory_cache
+        if import_cache is not None:
+            import_cache.discard(('zipimport', self.archive))
 
 
     def __repr__(self):
@@ -567,6 +575,69 @@ def _read_directory(archive):
                                     count, archive)
     return files
 
+# Return the directory of the archive, like _read_directory().
+#
+# If the import cache of the path based finder is enabled (-X importcache or
+# PYTHONIMPORTCACHE), the directory is stored in it under a
+# ('zipimport', archive) key, as an index of the toc_entries without
+# their __file__, with the mtime and the size of the archive.  Later runs
+# read the index instead of the central directory while the archive has the
+# same mtime and size.  'st' is the stat result of the archive, if known.
+def _get_directory(archive, st=None):
+    import_cache = _bootstrap_external._directory_cache
+    if import_cache is None:
+        return _read_directory(archive)
+    if st is None:
+        try:
+            st = _bootstrap_external._path_stat(archive)
+        except (OSError, ValueError):
+            return _read_directory(archive)
+    key = ('zipimport', archive)
+    index = import_cache.get(key, st.st_mtime)
+    if index is not None:
+        files = _directory_from_index(archive, index, st.st_size)
+        if files is not None:
+            _bootstrap._verbose_message('zipimport: found {} names in the '
+                                        'import cache for {!r}',
+                                        len(files), archive)
+            return files
+    files = _read_directory(archive)
+    import_cache.put(key, st.st_mtime, _index_from_directory(files, st.st_size))
+    return files
+
+# The index of a directory is a tuple (archive size, records), where a
+# record is the name of an implicit directory, or a toc_entry with the name
+# in the archive in place of __file__.
+def _index_from_directory(files, size):
+    records = []
+    for name, toc_entry in files.items():
+        if toc_entry is None:
+            records.append(name)
+        else:
+            records.append((name, *toc_entry[1:]))
+    return (size, tuple(records))
+
+# Return the directory described by an index, or None if the index is
+# invalid or was made for an archive of another size.
+def _directory_from_index(archive, index, size):
+    try:
+        index_size, records = index
+        if index_size != size or type(records) is not tuple:
+            return None
+        files = {}
+        for record in records:
+            if type(record) is str:
+                files[record] = None
+            else:
+                if type(record) is not tuple or len(record) != 8:
+                    return None
+                name = record[0]
+                path = _bootstrap_external._path_join(archive, name)
+                files[name] = (path, *record[1:])
+    except (TypeError, ValueError):
+        return None
+    return files
+
 # During bootstrap, we may need to load the encodings
 # package from a ZIP file. But the cp437 encoding is implemented
 # in Python in the encodings package.
@@ -785,6 +856,155 @@ def _get_pyc_source(self, path):
         return _get_data(self.archive, toc_entry)
 
 
+class _ZipCodeCache:
+    """Cache of the code of the modules imported from an archive.
+
+    The code compiled from the .py files of the archive and the code of its
+    compressed .pyc files are stored marshalled in a single file under
+    sys.pycache_prefix, with the mtime and the size of the archive.  The
+    file is only used while the archive has the same mtime and size, and an
+    entry is only used while the CRC of its file in the archive is the same.
+    New entries are written when Python exits.
+    """
+
+    def __init__(self, archive, filename):
+        self.archive = archive
+        self.filename = filename
+        self._stamp = None
+        self._entries = None
+        self._changed = False
+
+    def _read(self):
+        try:
+            with _io.FileIO(self.filename, 'r') as file:
+                data = file.readall()
+            magic, mtime, size, entries = marshal.loads(data, allow_code=False)
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+        if (magic != _bootstrap_external.MAGIC_NUMBER
+                or (mtime, size) != self._stamp
+                or type(entries) is not dict):
+            return {}
+        return entries
+
+    def _load(self):
+        try:
+            st = _bootstrap_external._path_stat(self.archive)
+        except (OSError, ValueError):
+            self._stamp = (-1, -1)
+            self._entries = {}
+        else:
+            self._stamp = (st.st_mtime, st.st_size)
+            self._entries = self._read()
+
+    def get(self, fullpath, crc):
+        """Return the cached code of a file of the archive, or None."""
+        if self._entries is None:
+            self._load()
+        entry = self._entries.get(fullpath)
+        if type(entry) is not tuple or len(entry) != 2 or entry[0] != crc:
+            return None
+        try:
+            code = marshal.loads(entry[1])
+        except (EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(code, _code_type):
+            return None
+        _bootstrap._verbose_message('code object from {!r}', self.filename,
+                                    verbosity=2)
+        return code
+
+    def put(self, fullpath, crc, code):
+        """Store the code of a file of the archive."""
+        if sys.dont_write_bytecode:
+            return
+        if self._entries is None:
+            self._load()
+        if self._stamp[0] == -1:
+            return
+        self._entries[fullpath] = (crc, marshal.dumps(code))
+        self._changed = True
+
+    def save(self):
+        """Write the cache file if entries were added.
+
+        The entries stored by other processes in the meantime are kept.
+        """
+        if not self._changed:
+            return
+        self._changed = False
+        entries = self._read()
+        entries.update(self._entries)
+        data = marshal.dumps((_bootstrap_external.MAGIC_NUMBER,
+                              *self._stamp, entries))
+        parent, _ = _bootstrap_external._path_split(self.filename)
+        parts = []
+        # Figure out what directories are missing.
+        while parent and not _bootstrap_external._path_isdir(parent):
+            parent, part = _bootstrap_external._path_split(parent)
+            parts.append(part)
+        try:
+            for part in reversed(parts):
+                parent = _bootstrap_external._path_join(parent, part)
+                try:
+                    _bootstrap_external._os.mkdir(parent)
+                except FileExistsError:
+                    # Probably another Python process already created the dir.
+                    pass
+            _bootstrap_external._write_atomic(self.filename, data)
+        except OSError as exc:
+            # The cache is only an optimization.
+            _bootstrap._verbose_message('could not create {!r}: {!r}',
+                                        self.filename, exc)
+        else:
+            _bootstrap._verbose_message('created {!r}', self.filename)
+
+
+# Return the path of the code cache file of the archive, or None if
+# sys.pycache_prefix is not set.  The archive path is mirrored under
+# sys.pycache_prefix, like the paths of source files by cache_from_source().
+def _code_cache_filename(archive):
+    tag = sys.implementation.cache_tag
+    if sys.pycache_prefix is None or tag is None:
+        return None
+    head, tail = _bootstrap_external._path_split(
+        _bootstrap_external._path_abspath(archive))
+    # Strip the drive and the root of the absolute path.
+    if head[1:2] == ':' and head[0] not in _bootstrap_external.path_separators:
+        head = head[2:]
+    if sys.flags.optimize:
+        tag = f'{tag}.{_bootstrap_external._OPT}{sys.flags.optimize}'
+    return _bootstrap_external._path_join(
+        sys.pycache_prefix,
+        head.lstrip(_bootstrap_external.path_separators),
+        f'{tail}.{tag}.zipcache',
+    )
+
+# Return the _ZipCodeCache of the archive, or None if code caching is
+# disabled.
+def _get_code_cache(archive):
+    global _zip_code_caches_saved_at_exit
+    if sys.pycache_prefix is None:
+        return None
+    try:
+        return _zip_code_caches[archive]
+    except KeyError:
+        pass
+    filename = _code_cache_filename(archive)
+    if filename is None:
+        return None
+    code_cache = _zip_code_caches[archive] = _ZipCodeCache(archive, filename)
+    if not _zip_code_caches_saved_at_exit:
+        import atexit
+        atexit.register(_save_code_caches)
+        _zip_code_caches_saved_at_exit = True
+    return code_cache
+
+def _save_code_caches():
+    for code_cache in list(_zip_code_caches.values()):
+        code_cache.save()
+
+
 # Get the code object associated with the module specified by
 # 'fullname'.
 def _get_module_code(self, fullname):
@@ -799,19 +1019,29 @@ def _get_module_code(self, fullname):
             pass
         else:
             modpath = toc_entry[0]
-            data = _get_data(self.archive, toc_entry)
+            crc = toc_entry[7]
+            code_cache = None
+            if toc_entry[1] or not isbytecode:
+                # Uncompressed .pyc files are not worth caching.
+                code_cache = _get_code_cache(self.archive)
             code = None
-            if isbytecode:
-                try:
-                    code = _unmarshal_code(self, modpath, fullpath, fullname, data)
-                except ImportError as exc:
-                    import_error = exc
-            else:
-                code = _compile_source(modpath, data)
+            if code_cache is not None:
+                code = code_cache.get(fullpath, crc)
             if code is None:
-                # bad magic number or non-matching mtime
-                # in byte code, try next
-                continue
+                data = _get_data(self.archive, toc_entry)
+                if isbytecode:
+                    try:
+                        code = _unmarshal_code(self, modpath, fullpath, fullname, data)
+                    except ImportError as exc:
+                        import_error = exc
+                else:
+                    code = _compile_source(modpath, data)
+                if code is None:
+                    # bad magic number or non-matching mtime
+                    # in byte code, try next
+                    continue
+                if code_cache is not None:
+                    code_cache.put(fullpath, crc, code)
             modpath = toc_entry[0]
             return code, ispackage, modpath
     else:
@@ -15,6 +15,7 @@ module instead.
 
 #include "Python.h"
 #include "pycore_pyatomic_ft_wrappers.h"
+#include "pycore_pyerrors.h"      // _PyErr_ChainExceptions1()
 
 #include <stddef.h>               // offsetof()
 #include <stdbool.h>
@@ -1237,22 +1238,15 @@ join_check_rec_size(WriterObj *self, Py_ssize_t rec_len)
 }
 
 static int
-join_append(WriterObj *self, PyObject *field, int quoted)
+join_append_kind(WriterObj *self, int field_kind, const void *field_data,
+                 Py_ssize_t field_len, int null_field, int quoted)
 {
     DialectObj *dialect = self->dialect;
-    int field_kind = -1;
-    const void *field_data = NULL;
-    Py_ssize_t field_len = 0;
     Py_ssize_t rec_len;
 
-    if (field != NULL) {
-        field_kind = PyUnicode_KIND(field);
-        field_data = PyUnicode_DATA(field);
-        field_len = PyUnicode_GET_LENGTH(field);
-    }
     if (!field_len && dialect->delimiter == ' ' && dialect->skipinitialspace) {
         if (dialect->quoting == QUOTE_NONE ||
-            (field == NULL &&
+            (null_field &&
              (dialect->quoting == QUOTE_STRINGS ||
               dialect->quoting == QUOTE_NOTNULL)))
         {
@@ -1279,6 +1273,103 @@ join_append(WriterObj *self, PyObject *field, int quoted)
     return 1;
 }
 
+static int
+join_append(WriterObj *self, PyObject *field, int quoted)
+{
+    if (field == NULL) {
+        return join_append_kind(self, -1, NULL, 0, 1, quoted);
+    }
+    return join_append_kind(self, PyUnicode_KIND(field),
+                            PyUnicode_DATA(field),
+                            PyUnicode_GET_LENGTH(field), 0, quoted);
+}
+
+/* Append an exact int or float field, formatted the same way as str()
+ * would, without creating an intermediate str object.  Return 1 on
+ * success, 0 on error and -1 if the value cannot be formatted here (the
+ * caller must then fall back to PyObject_Str()).
+ */
+static int
+join_append_number(WriterObj *self, PyObject *field, int quoted)
+{
+    char buf[32];
+    int len, ok;
+
+    if (PyLong_CheckExact(field)) {
+        int overflow;
+        long long value = PyLong_AsLongLongAndOverflow(field, &overflow);
+        if (overflow) {
+            return -1;
+        }
+        if (value == -1 && PyErr_Occurred()) {
+            return 0;
+        }
+        len = PyOS_snprintf(buf, sizeof(buf), "%lld", value);
+        return join_append_kind(self, PyUnicode_1BYTE_KIND, buf, len,
+                                0, quoted);
+    }
+    if (PyFloat_CheckExact(field)) {
+        char *repr = PyOS_double_to_string(PyFloat_AS_DOUBLE(field),
+                                           'r', 0, Py_DTSF_ADD_DOT_0, NULL);
+        if (repr == NULL) {
+            PyErr_NoMemory();
+            return 0;
+        }
+        ok = join_append_kind(self, PyUnicode_1BYTE_KIND, repr,
+                              (Py_ssize_t)strlen(repr), 0, quoted);
+        PyMem_Free(repr);
+        return ok;
+    }
+    return -1;
+}
+
+/* Append one field of the current record, converting it to a string
+ * first if necessary.  *null_field* is set if the field was None.
+ */
+static int
+join_field(WriterObj *self, PyObject *field, bool *null_field)
+{
+    DialectObj *dialect = self->dialect;
+    int append_ok;
+    int quoted;
+
+    switch (dialect->quoting) {
+    case QUOTE_NONNUMERIC:
+        quoted = !PyNumber_Check(field);
+        break;
+    case QUOTE_ALL:
+        quoted = 1;
+        break;
+    case QUOTE_STRINGS:
+        quoted = PyUnicode_Check(field);
+        break;
+    case QUOTE_NOTNULL:
+        quoted = field != Py_None;
+        break;
+    default:
+        quoted = 0;
+        break;
+    }
+
+    *null_field = (field == Py_None);
+    if (PyUnicode_Check(field)) {
+        return join_append(self, field, quoted);
+    }
+    if (*null_field) {
+        return join_append(self, NULL, quoted);
+    }
+    append_ok = join_append_number(self, field, quoted);
+    if (append_ok < 0) {
+        PyObject *str = PyObject_Str(field);
+        if (str == NULL) {
+            return 0;
+        }
+        append_ok = join_append(self, str, quoted);
+        Py_DECREF(str);
+    }
+    return append_ok;
+}
+
 static int
 join_append_lineterminator(WriterObj *self)
 {
@@ -1303,18 +1394,40 @@ join_append_lineterminator(WriterObj *self)
     return 1;
 }
 
-PyDoc_STRVAR(csv_writerow_doc,
-"writerow(iterable)\n"
-"\n"
-"Construct and write a CSV record from an iterable of fields.  Non-string\n"
-"elements will be converted to string.");
-
-static PyObject *
-csv_writerow(PyObject *op, PyObject *seq)
+/* Finish the record started at offset *rec_start* of the record buffer. */
+static int
+join_finish_record(WriterObj *self, Py_ssize_t rec_start, bool null_field)
 {
-    WriterObj *self = _WriterObj_CAST(op);
     DialectObj *dialect = self->dialect;
-    PyObject *iter, *field, *line, *result;
+
+    if (self->num_fields > 0 && self->rec_len == rec_start) {
+        if (dialect->quoting == QUOTE_NONE ||
+            (null_field &&
+             (dialect->quoting == QUOTE_STRINGS ||
+              dialect->quoting == QUOTE_NOTNULL)))
+        {
+            PyErr_Format(self->error_obj,
+                "single empty field record must be quoted");
+            return 0;
+        }
+        self->num_fields--;
+        if (!join_append(self, NULL, 1))
+            return 0;
+    }
+
+    /* Add line terminator.
+     */
+    return join_append_lineterminator(self);
+}
+
+/* Append a complete record built from the iterable *seq* to the record
+ * buffer.  On error the buffer is left as it was before the call.
+ */
+static int
+join_record(WriterObj *self, PyObject *seq)
+{
+    PyObject *iter, *field;
+    Py_ssize_t rec_start = self->rec_len;
     bool null_field = false;
 
     iter = PyObject_GetIter(seq);
@@ -1324,87 +1437,46 @@ csv_writerow(PyObject *op, PyObject *seq)
                          "iterable expected, not %.200s",
                          Py_TYPE(seq)->tp_name);
         }
-        return NULL;
+        return 0;
     }
 
     /* Join all fields in internal buffer.
      */
-    join_reset(self);
+    self->num_fields = 0;
     while ((field = PyIter_Next(iter))) {
-        int append_ok;
-        int quoted;
-
-        switch (dialect->quoting) {
-        case QUOTE_NONNUMERIC:
-            quoted = !PyNumber_Check(field);
-            break;
-        case QUOTE_ALL:
-            quoted = 1;
-            break;
-        case QUOTE_STRINGS:
-            quoted = PyUnicode_Check(field);
-            break;
-        case QUOTE_NOTNULL:
-            quoted = field != Py_None;
-            break;
-        default:
-            quoted = 0;
-            break;
-        }
-
-        null_field = (field == Py_None);
-        if (PyUnicode_Check(field)) {
-            append_ok = join_append(self, field, quoted);
-            Py_DECREF(field);
-        }
-        else if (null_field) {
-            append_ok = join_append(self, NULL, quoted);
-            Py_DECREF(field);
-        }
-        else {
-            PyObject *str;
-
-            str = PyObject_Str(field);
-            Py_DECREF(field);
-            if (str == NULL) {
-                Py_DECREF(iter);
-                return NULL;
-            }
-            append_ok = join_append(self, str, quoted);
-            Py_DECREF(str);
-        }
+        int append_ok = join_field(self, field, &null_field);
+        Py_DECREF(field);
         if (!append_ok) {
-            Py_DECREF(iter);
-            return NULL;
+            goto error;
         }
     }
-    Py_DECREF(iter);
     if (PyErr_Occurred())
-        return NULL;
+        goto error;
+    Py_DECREF(iter);
 
-    if (self->num_fields > 0 && self->rec_len == 0) {
-        if (dialect->quoting == QUOTE_NONE ||
-            (null_field &&
-             (dialect->quoting == QUOTE_STRINGS ||
-              dialect->quoting == QUOTE_NOTNULL)))
-        {
-            PyErr_Format(self->error_obj,
-                "single empty field record must be quoted");
-            return NULL;
-        }
-        self->num_fields--;
-        if (!join_append(self, NULL, 1))
-            return NULL;
+    if (!join_finish_record(self, rec_start, null_field)) {
+        self->rec_len = rec_start;
+        return 0;
     }
+    return 1;
 
-    /* Add line terminator.
-     */
-    if (!join_append_lineterminator(self)) {
-        return NULL;
-    }
+error:
+    Py_DECREF(iter);
+    self->rec_len = rec_start;
+    return 0;
+}
+
+/* Pass the contents of the record buffer to the write method and empty
+ * the buffer.
+ */
+static PyObject *
+join_flush(WriterObj *self)
+{
+    PyObject *line, *result;
 
     line = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
                                      (void *) self->rec, self->rec_len);
+    join_reset(self);
     if (line == NULL) {
         return NULL;
     }
@@ -1413,40 +1485,202 @@ csv_writerow(PyObject *op, PyObject *seq)
     return result;
 }
 
+/* Write out the records buffered so far while an exception is set.  If
+ * that fails too, the original exception becomes the context of the new
+ * one.
+ */
+static void
+join_flush_on_error(WriterObj *self)
+{
+    PyObject *exc, *result;
+
+    if (self->rec_len == 0) {
+        return;
+    }
+    exc = PyErr_GetRaisedException();
+    result = join_flush(self);
+    if (result == NULL) {
+        _PyErr_ChainExceptions1(exc);
+        return;
+    }
+    Py_DECREF(result);
+    PyErr_SetRaisedException(exc);
+}
+
+/* Size of the record buffer (in characters) above which writerows() and
+ * writecolumns() pass the buffered records to the write method.
+ */
+#define FLUSH_SIZE MEM_INCR
+
+PyDoc_STRVAR(csv_writerow_doc,
+"writerow(iterable)\n"
+"\n"
+"Construct and write a CSV record from an iterable of fields.  Non-string\n"
+"elements will be converted to string.");
+
+static PyObject *
+csv_writerow(PyObject *op, PyObject *seq)
+{
+    WriterObj *self = _WriterObj_CAST(op);
+
+    join_reset(self);
+    if (!join_record(self, seq)) {
+        return NULL;
+    }
+    return join_flush(self);
+}
+
 PyDoc_STRVAR(csv_writerows_doc,
 "writerows(iterable of iterables)\n"
 "\n"
 "Construct and write a series of iterables to a csv file.  Non-string\n"
-"elements will be converted to string.");
+"elements will be converted to string.  Records are formatted into an\n"
+"internal buffer which is passed to the file's write method in batches.");
 
 static PyObject *
-csv_writerows(PyObject *self, PyObject *seqseq)
+csv_writerows(PyObject *op, PyObject *seqseq)
 {
+    WriterObj *self = _WriterObj_CAST(op);
     PyObject *row_iter, *row_obj, *result;
 
     row_iter = PyObject_GetIter(seqseq);
     if (row_iter == NULL) {
         return NULL;
     }
+    join_reset(self);
     while ((row_obj = PyIter_Next(row_iter))) {
-        result = csv_writerow(self, row_obj);
+        int ok = join_record(self, row_obj);
         Py_DECREF(row_obj);
-        if (!result) {
-            Py_DECREF(row_iter);
+        if (!ok) {
+            goto error;
+        }
+        if (self->rec_len >= FLUSH_SIZE) {
+            result = join_flush(self);
+            if (result == NULL) {
+                goto error;
+            }
+            Py_DECREF(result);
+        }
+    }
+    if (PyErr_Occurred())
+        goto error;
+    Py_DECREF(row_iter);
+    if (self->rec_len > 0) {
+        result = join_flush(self);
+        if (result == NULL) {
             return NULL;
         }
-        else
-             Py_DECREF(result);
+        Py_DECREF(result);
     }
+    Py_RETURN_NONE;
+
+error:
     Py_DECREF(row_iter);
-    if (PyErr_Occurred())
+    join_flush_on_error(self);
+    return NULL;
+}
+
+PyDoc_STRVAR(csv_writecolumns_doc,
+"writecolumns(iterable of iterables)\n"
+"\n"
+"Construct and write records from a series of columns of equal length.\n"
+"The i-th record is made of the i-th element of each column.  Non-string\n"
+"elements will be converted to string.");
+
+static PyObject *
+csv_writecolumns(PyObject *op, PyObject *columns_obj)
+{
+    WriterObj *self = _WriterObj_CAST(op);
+    PyObject *columns, *result;
+    Py_ssize_t ncolumns, nrows = 0, i, j;
+
+    columns = PySequence_List(columns_obj);
+    if (columns == NULL) {
+        if (PyErr_ExceptionMatches(PyExc_TypeError)) {
+            PyErr_Format(self->error_obj,
+                         "iterable expected, not %.200s",
+                         Py_TYPE(columns_obj)->tp_name);
+        }
         return NULL;
+    }
+    /* Take a snapshot of every column, so that converting a field to
+     * a string cannot change the shape of the data while it is written.
+     */
+    ncolumns = PyList_GET_SIZE(columns);
+    for (j = 0; j < ncolumns; j++) {
+        PyObject *column = PyList_GET_ITEM(columns, j);
+        PyObject *items = PySequence_Tuple(column);
+        if (items == NULL) {
+            if (PyErr_ExceptionMatches(PyExc_TypeError)) {
+                PyErr_Format(self->error_obj,
+                             "iterable expected, not %.200s",
+                             Py_TYPE(column)->tp_name);
+            }
+            Py_DECREF(columns);
+            return NULL;
+        }
+        if (j == 0) {
+            nrows = PyTuple_GET_SIZE(items);
+        }
+        else if (PyTuple_GET_SIZE(items) != nrows) {
+            PyErr_Format(PyExc_ValueError,
+                         "column %zd has length %zd, expected %zd",
+                         j, PyTuple_GET_SIZE(items), nrows);
+            Py_DECREF(items);
+            Py_DECREF(columns);
+            return NULL;
+        }
+        PyList_SET_ITEM(columns, j, items);
+        Py_DECREF(column);
+    }
+
+    join_reset(self);
+    for (i = 0; i < nrows; i++) {
+        Py_ssize_t rec_start = self->rec_len;
+        bool null_field = false;
+
+        self->num_fields = 0;
+        for (j = 0; j < ncolumns; j++) {
+            PyObject *items = PyList_GET_ITEM(columns, j);
+            if (!join_field(self, PyTuple_GET_ITEM(items, i), &null_field)) {
+                self->rec_len = rec_start;
+                goto error;
+            }
+        }
+        if (!join_finish_record(self, rec_start, null_field)) {
+            self->rec_len = rec_start;
+            goto error;
+        }
+        if (self->rec_len >= FLUSH_SIZE) {
+            result = join_flush(self);
+            if (result == NULL) {
+                goto error;
+            }
+            Py_DECREF(result);
+        }
+    }
+    Py_DECREF(columns);
+    if (self->rec_len > 0) {
+        result = join_flush(self);
+        if (result == NULL) {
+            return NULL;
+        }
+        Py_DECREF(result);
+    }
     Py_RETURN_NONE;
+
+error:
+    Py_DECREF(columns);
+    join_flush_on_error(self);
+    return NULL;
 }
 
+#undef FLUSH_SIZE
+
 static struct PyMethodDef Writer_methods[] = {
     {"writerow", csv_writerow, METH_O, csv_writerow_doc},
     {"writerows", csv_writerows, METH_O, csv_writerows_doc},
+    {"writecolumns", csv_writecolumns, METH_O, csv_writecolumns_doc},
     {NULL, NULL, 0, NULL}  /* sentinel */
 };
 
@@ -688,6 +688,9 @@ typedef struct UnpicklerObject {
     int proto;                  /* Protocol of the pickle loaded. */
     int fix_imports;            /* Indicate whether Unpickler should fix
                                    the name of globals pickled by Python 2.x. */
+    PyObject *allowed_globals;  /* dict mapping (module, qualname) pairs to
+                                   the only globals that can be loaded, or
+                                   NULL to use find_class(). */
 } UnpicklerObject;
 
 typedef struct {
@@ -1016,16 +1019,22 @@ _Pickler_FlushToFile(PicklerObject *self)
     return (result == NULL) ? -1 : 0;
 }
 
-static int
-_Pickler_OpcodeBoundary(PicklerObject *self)
+/* Return true if the current frame must be committed at the next opcode
+   boundary. */
+static inline int
+_Pickler_FrameIsFull(PicklerObject *self)
 {
-    Py_ssize_t frame_len;
-
     if (!self->framing || self->frame_start == -1) {
         return 0;
     }
-    frame_len = self->output_len - self->frame_start - FRAME_HEADER_SIZE;
-    if (frame_len >= FRAME_SIZE_TARGET) {
+    return (self->output_len - self->frame_start - FRAME_HEADER_SIZE
+            >= FRAME_SIZE_TARGET);
+}
+
+static int
+_Pickler_OpcodeBoundary(PicklerObject *self)
+{
+    if (_Pickler_FrameIsFull(self)) {
         if(_Pickler_CommitFrame(self)) {
             return -1;
         }
@@ -1637,6 +1646,7 @@ _Unpickler_New(PyObject *module)
     self->marks_size = 0;
     self->proto = 0;
     self->fix_imports = 0;
+    self->allowed_globals = NULL;
 
     PyObject_GC_Track(self);
     return self;
@@ -1718,6 +1728,93 @@ _Unpickler_SetBuffers(UnpicklerObject *self, PyObject *buffers)
     return 0;
 }
 
+/* Returns -1 (with an exception set) on failure, 0 on success. This may
+   be called once on a freshly created Unpickler.
+
+   allowed is a mapping of (module, qualname) pairs to objects, or an
+   iterable of objects, keyed by their __module__ and __qualname__.  It is
+   copied, so that globals are looked up in a dict. */
+static int
+_Unpickler_SetAllowedGlobals(UnpicklerObject *self, PyObject *allowed)
+{
+    PyObject *dict, *iter, *item, *key, *value;
+    Py_ssize_t i = 0;
+    int is_mapping;
+
+    if (allowed == NULL || allowed == Py_None) {
+        self->allowed_globals = NULL;
+        return 0;
+    }
+    dict = PyDict_New();
+    if (dict == NULL)
+        return -1;
+
+    is_mapping = PyObject_HasAttrWithError(allowed, &_Py_ID(keys));
+    if (is_mapping < 0)
+        goto error;
+    if (is_mapping) {
+        if (PyDict_Merge(dict, allowed, 1) < 0)
+            goto error;
+        while (PyDict_Next(dict, &i, &key, &value)) {
+            if (!PyTuple_CheckExact(key) || PyTuple_GET_SIZE(key) != 2 ||
+                !PyUnicode_Check(PyTuple_GET_ITEM(key, 0)) ||
+                !PyUnicode_Check(PyTuple_GET_ITEM(key, 1)))
+            {
+                PyErr_Format(PyExc_TypeError,
+                             "allowed_globals keys must be pairs of str, "
+                             "not %R", key);
+                goto error;
+            }
+        }
+    }
+    else {
+        iter = PyObject_GetIter(allowed);
+        if (iter == NULL)
+            goto error;
+        while ((item = PyIter_Next(iter)) != NULL) {
+            PyObject *module_name, *qualname;
+            int err = -1;
+
+            module_name = PyObject_GetAttr(item, &_Py_ID(__module__));
+            qualname = NULL;
+            if (module_name != NULL)
+                qualname = PyObject_GetAttr(item, &_Py_ID(__qualname__));
+            if (qualname != NULL) {
+                if (!PyUnicode_Check(module_name) ||
+                    !PyUnicode_Check(qualname))
+                {
+                    PyErr_Format(PyExc_TypeError,
+                                 "cannot allow %R: its __module__ and "
+                                 "__qualname__ must be str", item);
+                }
+                else {
+                    key = PyTuple_Pack(2, module_name, qualname);
+                    if (key != NULL) {
+                        err = PyDict_SetItem(dict, key, item);
+                        Py_DECREF(key);
+                    }
+                }
+            }
+            Py_XDECREF(module_name);
+            Py_XDECREF(qualname);
+            Py_DECREF(item);
+            if (err < 0) {
+                Py_DECREF(iter);
+                goto error;
+            }
+        }
+        Py_DECREF(iter);
+        if (PyErr_Occurred())
+            goto error;
+    }
+    self->allowed_globals = dict;
+    return 0;
+
+  error:
+    Py_DECREF(dict);
+    return -1;
+}
+
 /* Generate a GET opcode for an object stored in the memo. */
 static int
 memo_get(PickleState *st, PicklerObject *self, PyObject *key)
@@ -2115,6 +2212,42 @@ save_bool(PicklerObject *self, PyObject *obj)
     return 0;
 }
 
+/* Write an int which fits in a signed 4-byte integer. */
+static int
+write_small_long(PicklerObject *self, long val)
+{
+    char pdata[32];
+    Py_ssize_t len = 0;
+
+    if (self->bin) {
+        pdata[1] = (unsigned char)(val & 0xff);
+        pdata[2] = (unsigned char)((val >> 8) & 0xff);
+        pdata[3] = (unsigned char)((val >> 16) & 0xff);
+        pdata[4] = (unsigned char)((val >> 24) & 0xff);
+
+        if ((pdata[4] != 0) || (pdata[3] != 0)) {
+            pdata[0] = BININT;
+            len = 5;
+        }
+        else if (pdata[2] != 0) {
+            pdata[0] = BININT2;
+            len = 3;
+        }
+        else {
+            pdata[0] = BININT1;
+            len = 2;
+        }
+    }
+    else {
+        sprintf(pdata, "%c%ld\n", INT,  val);
+        len = strlen(pdata);
+    }
+    if (_Pickler_Write(self, pdata, len) < 0)
+        return -1;
+
+    return 0;
+}
+
 static int
 save_long(PicklerObject *self, PyObject *obj)
 {
@@ -2137,36 +2270,7 @@ save_long(PicklerObject *self, PyObject *obj)
            so MSVC happily warns us about it.  However, that result would have
            been fine because we guard for sizeof(long) <= 4 which turns the
            condition true in that particular case. */
-        char pdata[32];
-        Py_ssize_t len = 0;
-
-        if (self->bin) {
-            pdata[1] = (unsigned char)(val & 0xff);
-            pdata[2] = (unsigned char)((val >> 8) & 0xff);
-            pdata[3] = (unsigned char)((val >> 16) & 0xff);
-            pdata[4] = (unsigned char)((val >> 24) & 0xff);
-
-            if ((pdata[4] != 0) || (pdata[3] != 0)) {
-                pdata[0] = BININT;
-                len = 5;
-            }
-            else if (pdata[2] != 0) {
-                pdata[0] = BININT2;
-                len = 3;
-            }
-            else {
-                pdata[0] = BININT1;
-                len = 2;
-            }
-        }
-        else {
-            sprintf(pdata, "%c%ld\n", INT,  val);
-            len = strlen(pdata);
-        }
-        if (_Pickler_Write(self, pdata, len) < 0)
-            return -1;
-
-        return 0;
+        return write_small_long(self, val);
     }
     assert(!PyErr_Occurred());
 
@@ -3030,6 +3134,57 @@ batch_list(PickleState *state, PicklerObject *self, PyObject *iter, PyObject *or
     return -1;
 }
 
+/* Writers for the items of lists whose items have the same type, see
+ * list_item_writer().  They produce the same output as save().
+ */
+typedef int (*item_writer)(PicklerObject *self, PyObject *obj);
+
+static int
+write_list_item_long(PicklerObject *self, PyObject *obj)
+{
+    /* Compact ints always fit in a signed 4-byte integer. */
+    if (_PyLong_IsCompact((PyLongObject *)obj)) {
+        return write_small_long(self,
+                                (long)_PyLong_CompactValue((PyLongObject *)obj));
+    }
+    return save_long(self, obj);
+}
+
+static int
+write_list_item_unicode(PicklerObject *self, PyObject *obj)
+{
+    /* Only used when the pickler does not memoize. */
+    assert(self->fast);
+    return write_unicode_binary(self, obj);
+}
+
+/* Return a writer for the items of the list obj which have the same type
+ * as its first item, *ptype, or NULL if they must go through save().
+ *
+ * save() checks whether each object has a persistent ID, whether it is in
+ * the memo and which type it has.  The items of large homogeneous lists of
+ * ints, floats and strs do not need this: ints and floats are never
+ * memoized, and strs are not memoized if the pickler does not memoize.
+ */
+static item_writer
+list_item_writer(PicklerObject *self, PyObject *obj, PyTypeObject **ptype)
+{
+    PyTypeObject *type;
+
+    assert(PyList_GET_SIZE(obj) > 0);
+    if (self->persistent_id != NULL || !self->bin)
+        return NULL;
+    type = Py_TYPE(PyList_GET_ITEM(obj, 0));
+    *ptype = type;
+    if (type == &PyLong_Type)
+        return write_list_item_long;
+    if (type == &PyFloat_Type)
+        return save_float;
+    if (type == &PyUnicode_Type && self->fast)
+        return write_list_item_unicode;
+    return NULL;
+}
+
 /* This is a variant of batch_list() above, specialized for lists (with no
  * support for list subclasses). Like batch_list(), we batch up chunks of
  *     MARK item item ... item APPENDS
@@ -3046,6 +3201,8 @@ batch_list_exact(PickleState *state, PicklerObject *self, PyObject *obj)
 {
     PyObject *item = NULL;
     Py_ssize_t this_batch, total;
+    item_writer writer;
+    PyTypeObject *type = NULL;
 
     const char append_op = APPEND;
     const char appends_op = APPENDS;
@@ -3069,6 +3226,8 @@ batch_list_exact(PickleState *state, PicklerObject *self, PyObject *obj)
         return 0;
     }
 
+    writer = list_item_writer(self, obj, &type);
+
     /* Write in batches of BATCHSIZE. */
     total = 0;
     do {
@@ -3076,10 +3235,28 @@ batch_list_exact(PickleState *state, PicklerObject *self, PyObject *obj)
         if (_Pickler_Write(self, &mark_op, 1) < 0)
             return -1;
         while (total < PyList_GET_SIZE(obj)) {
+            int err;
             item = PyList_GET_ITEM(obj, total);
-            Py_INCREF(item);
-            int err = save(state, self, item, 0);
-            Py_DECREF(item);
+            if (writer != NULL && Py_IS_TYPE(item, type) &&
+                !_Pickler_FrameIsFull(self))
+            {
+                /* Writing an int or a float does not run any Python code
+                   which could free the item, a str can be written to the
+                   file. */
+                if (type == &PyUnicode_Type) {
+                    Py_INCREF(item);
+                    err = writer(self, item);
+                    Py_DECREF(item);
+                }
+                else {
+                    err = writer(self, item);
+                }
+            }
+            else {
+                Py_INCREF(item);
+                err = save(state, self, item, 0);
+                Py_DECREF(item);
+            }
             if (err < 0) {
                 _PyErr_FormatNote("when serializing %T item %zd", obj, total);
                 return -1;
@@ -4800,6 +4977,8 @@ _pickle.Pickler.__init__
   protocol: object = None
   fix_imports: bool = True
   buffer_callback: object = None
+  *
+  memoize: bool = True
 
 This takes a binary file for writing a pickle data stream.
 
@@ -4832,13 +5011,18 @@ buffer is serialized in-band, i.e. inside the pickle stream.
 It is an error if *buffer_callback* is not None and *protocol*
 is None or smaller than 5.
 
+If *memoize* is false, the pickler does not keep track of the objects
+already pickled: shared objects are pickled again each time they are
+seen, and recursive objects cannot be pickled.  This is faster for
+large acyclic data without shared references.
+
 [clinic start generated code]*/
 
 static int
 _pickle_Pickler___init___impl(PicklerObject *self, PyObject *file,
                               PyObject *protocol, int fix_imports,
-                              PyObject *buffer_callback)
-/*[clinic end generated code: output=0abedc50590d259b input=cddc50f66b770002]*/
+                              PyObject *buffer_callback, int memoize)
+/*[clinic end generated code: output=6ebb6baffb55826a input=8975a57d4c2a1533]*/
 {
     /* In case of multiple __init__() calls, clear previous content. */
     if (self->write != NULL)
@@ -4868,7 +5052,7 @@ _pickle_Pickler___init___impl(PicklerObject *self, PyObject *file,
             return -1;
     }
 
-    self->fast = 0;
+    self->fast = !memoize;
     self->fast_nesting = 0;
     self->fast_memo = NULL;
 
@@ -5197,9 +5381,44 @@ static PyType_Spec pickler_type_spec = {
    overridden by a subclass. Although, this could become rather hackish. A
    simpler optimization would be to call the C function when self is not a
    subclass instance. */
+static int
+map_2to3_names(PickleState *st, PyObject **module_name,
+               PyObject **global_name);
+
+/* Look up a global in the allowed_globals dict of the Unpickler, instead of
+   importing it.  Globals which are not in the dict are forbidden. */
+static PyObject *
+find_allowed_global(PickleState *st, UnpicklerObject *self,
+                    PyObject *module_name, PyObject *global_name)
+{
+    PyObject *key, *global;
+
+    if (PySys_Audit("pickle.find_class", "OO",
+                    module_name, global_name) < 0) {
+        return NULL;
+    }
+    if (self->proto < 3 && self->fix_imports) {
+        if (map_2to3_names(st, &module_name, &global_name) < 0)
+            return NULL;
+    }
+    key = PyTuple_Pack(2, module_name, global_name);
+    if (key == NULL)
+        return NULL;
+    if (PyDict_GetItemRef(self->allowed_globals, key, &global) == 0) {
+        PyErr_Format(st->UnpicklingError, "global '%U.%U' is forbidden",
+                     module_name, global_name);
+    }
+    Py_DECREF(key);
+    return global;
+}
+
 static PyObject *
-find_class(UnpicklerObject *self, PyObject *module_name, PyObject *global_name)
+find_class(PickleState *st, UnpicklerObject *self,
+           PyObject *module_name, PyObject *global_name)
 {
+    if (self->allowed_globals != NULL) {
+        return find_allowed_global(st, self, module_name, global_name);
+    }
     return PyObject_CallMethodObjArgs((PyObject *)self, &_Py_ID(find_class),
                                       module_name, global_name, NULL);
 }
@@ -5946,7 +6165,7 @@ load_inst(PickleState *state, UnpicklerObject *self)
         }
         class_name = PyUnicode_DecodeASCII(s, len - 1, "strict");
         if (class_name != NULL) {
-            cls = find_class(self, module_name, class_name);
+            cls = find_class(state, self, module_name, class_name);
             Py_DECREF(class_name);
         }
     }
@@ -6070,7 +6289,7 @@ load_global(PickleState *state, UnpicklerObject *self)
         }
         global_name = PyUnicode_DecodeUTF8(s, len - 1, "strict");
         if (global_name) {
-            global = find_class(self, module_name, global_name);
+            global = find_class(state, self, module_name, global_name);
             Py_DECREF(global_name);
         }
     }
@@ -6106,7 +6325,7 @@ load_stack_global(PickleState *st, UnpicklerObject *self)
         Py_DECREF(module_name);
         return -1;
     }
-    global = find_class(self, module_name, global_name);
+    global = find_class(st, self, module_name, global_name);
     Py_DECREF(global_name);
     Py_DECREF(module_name);
     if (global == NULL)
@@ -6327,11 +6546,15 @@ load_extension(PickleState *st, UnpicklerObject *self, int nbytes)
         return -1;
     }
 
-    /* Look for the code in the cache. */
+    /* Look for the code in the cache.  It is shared by all unpicklers,
+       so it is neither read nor written with allowed globals. */
     py_code = PyLong_FromLong(code);
     if (py_code == NULL)
         return -1;
-    obj = PyDict_GetItemWithError(st->extension_cache, py_code);
+    obj = NULL;
+    if (self->allowed_globals == NULL) {
+        obj = PyDict_GetItemWithError(st->extension_cache, py_code);
+    }
     if (obj != NULL) {
         /* Bingo. */
         Py_DECREF(py_code);
@@ -6371,18 +6594,21 @@ load_extension(PickleState *st, UnpicklerObject *self, int nbytes)
     }
 
     /* Load the object. */
-    obj = find_class(self, module_name, class_name);
+    obj = find_class(st, self, module_name, class_name);
     if (obj == NULL) {
         Py_DECREF(py_code);
         return -1;
     }
     /* Cache code -> obj. */
-    code = PyDict_SetItem(st->extension_cache, py_code, obj);
-    Py_DECREF(py_code);
-    if (code < 0) {
-        Py_DECREF(obj);
-        return -1;
+    if (self->allowed_globals == NULL) {
+        code = PyDict_SetItem(st->extension_cache, py_code, obj);
+        if (code < 0) {
+            Py_DECREF(py_code);
+            Py_DECREF(obj);
+            return -1;
+        }
     }
+    Py_DECREF(py_code);
     PDATA_PUSH(self->stack, obj, -1);
     return 0;
 
@@ -7087,6 +7313,64 @@ _pickle_Unpickler_load_impl(UnpicklerObject *self, PyTypeObject *cls)
     return load(st, unpickler);
 }
 
+/* Map the old names used in Python 2.x to the new ones used in Python 3.x.
+   *module_name and *global_name are replaced with borrowed references.
+   Returns -1 (with an exception set) on failure, 0 on success. */
+static int
+map_2to3_names(PickleState *st, PyObject **module_name,
+               PyObject **global_name)
+{
+    PyObject *key;
+    PyObject *item;
+
+    /* Check if the global (i.e., a function or a class) was renamed
+       or moved to another module. */
+    key = PyTuple_Pack(2, *module_name, *global_name);
+    if (key == NULL)
+        return -1;
+    item = PyDict_GetItemWithError(st->name_mapping_2to3, key);
+    Py_DECREF(key);
+    if (item) {
+        if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 2) {
+            PyErr_Format(PyExc_RuntimeError,
+                         "_compat_pickle.NAME_MAPPING values should be "
+                         "2-tuples, not %.200s", Py_TYPE(item)->tp_name);
+            return -1;
+        }
+        *module_name = PyTuple_GET_ITEM(item, 0);
+        *global_name = PyTuple_GET_ITEM(item, 1);
+        if (!PyUnicode_Check(*module_name) ||
+            !PyUnicode_Check(*global_name)) {
+            PyErr_Format(PyExc_RuntimeError,
+                         "_compat_pickle.NAME_MAPPING values should be "
+                         "pairs of str, not (%.200s, %.200s)",
+                         Py_TYPE(*module_name)->tp_name,
+                         Py_TYPE(*global_name)->tp_name);
+            return -1;
+        }
+    }
+    else if (PyErr_Occurred()) {
+        return -1;
+    }
+    else {
+        /* Check if the module was renamed. */
+        item = PyDict_GetItemWithError(st->import_mapping_2to3, *module_name);
+        if (item) {
+            if (!PyUnicode_Check(item)) {
+                PyErr_Format(PyExc_RuntimeError,
+                            "_compat_pickle.IMPORT_MAPPING values should be "
+                            "strings, not %.200s", Py_TYPE(item)->tp_name);
+                return -1;
+            }
+            *module_name = item;
+        }
+        else if (PyErr_Occurred()) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
 /* The name of find_class() is misleading. In newer pickle protocols, this
    function is used for loading any global (i.e., functions), not just
    classes. The name is kept only for backward compatibility. */
@@ -7128,55 +7412,9 @@ _pickle_Unpickler_find_class_impl(UnpicklerObject *self, PyTypeObject *cls,
        Python 3.x.  We do this only with old pickle protocols and when the
        user has not disabled the feature. */
     if (self->proto < 3 && self->fix_imports) {
-        PyObject *key;
-        PyObject *item;
         PickleState *st = _Pickle_GetStateByClass(cls);
-
-        /* Check if the global (i.e., a function or a class) was renamed
-           or moved to another module. */
-        key = PyTuple_Pack(2, module_name, global_name);
-        if (key == NULL)
-            return NULL;
-        item = PyDict_GetItemWithError(st->name_mapping_2to3, key);
-        Py_DECREF(key);
-        if (item) {
-            if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 2) {
-                PyErr_Format(PyExc_RuntimeError,
-                             "_compat_pickle.NAME_MAPPING values should be "
-                             "2-tuples, not %.200s", Py_TYPE(item)->tp_name);
-                return NULL;
-            }
-            module_name = PyTuple_GET_ITEM(item, 0);
-            global_name = PyTuple_GET_ITEM(item, 1);
-            if (!PyUnicode_Check(module_name) ||
-                !PyUnicode_Check(global_name)) {
-                PyErr_Format(PyExc_RuntimeError,
-                             "_compat_pickle.NAME_MAPPING values should be "
-                             "pairs of str, not (%.200s, %.200s)",
-                             Py_TYPE(module_name)->tp_name,
-                             Py_TYPE(global_name)->tp_name);
-                return NULL;
-            }
-        }
-        else if (PyErr_Occurred()) {
+        if (map_2to3_names(st, &module_name, &global_name) < 0)
             return NULL;
-        }
-        else {
-            /* Check if the module was renamed. */
-            item = PyDict_GetItemWithError(st->import_mapping_2to3, module_name);
-            if (item) {
-                if (!PyUnicode_Check(item)) {
-                    PyErr_Format(PyExc_RuntimeError,
-                                "_compat_pickle.IMPORT_MAPPING values should be "
-                                "strings, not %.200s", Py_TYPE(item)->tp_name);
-                    return NULL;
-                }
-                module_name = item;
-            }
-            else if (PyErr_Occurred()) {
-                return NULL;
-            }
-        }
     }
 
     /*
@@ -7256,6 +7494,7 @@ Unpickler_clear(PyObject *op)
     Py_CLEAR(self->persistent_load);
     Py_CLEAR(self->persistent_load_attr);
     Py_CLEAR(self->buffers);
+    Py_CLEAR(self->allowed_globals);
     if (self->buffer.buf != NULL) {
         PyBuffer_Release(&self->buffer);
         self->buffer.buf = NULL;
@@ -7297,6 +7536,7 @@ Unpickler_traverse(PyObject *op, visitproc visit, void *arg)
     Py_VISIT(self->persistent_load);
     Py_VISIT(self->persistent_load_attr);
     Py_VISIT(self->buffers);
+    Py_VISIT(self->allowed_globals);
     PyObject **memo = self->memo;
     if (memo) {
         Py_ssize_t i = self->memo_size;
@@ -7317,6 +7557,7 @@ _pickle.Unpickler.__init__
   encoding: str = 'ASCII'
   errors: str = 'strict'
   buffers: object(c_default="NULL") = ()
+  allowed_globals: object = None
 
 This takes a binary file for reading a pickle data stream.
 
@@ -7338,13 +7579,19 @@ map the old Python 2 names to the new names used in Python 3.  The
 instances pickled by Python 2; these default to 'ASCII' and 'strict',
 respectively.  The *encoding* can be 'bytes' to read these 8-bit
 string instances as bytes objects.
+
+If *allowed_globals* is not None, it is a mapping of (module, qualname)
+pairs to the only classes and functions which can be loaded, or an
+iterable of these objects.  They are looked up in it instead of being
+imported by find_class(), and any other global is forbidden.
 [clinic start generated code]*/
 
 static int
 _pickle_Unpickler___init___impl(UnpicklerObject *self, PyObject *file,
                                 int fix_imports, const char *encoding,
-                                const char *errors, PyObject *buffers)
-/*[clinic end generated code: output=09f0192649ea3f85 input=ca4c1faea9553121]*/
+                                const char *errors, PyObject *buffers,
+                                PyObject *allowed_globals)
+/*[clinic end generated code: output=cc1fc0747ed60055 input=9a0f1a7141e76696]*/
 {
     /* In case of multiple __init__() calls, clear previous content. */
     if (self->read != NULL)
@@ -7359,6 +7606,9 @@ _pickle_Unpickler___init___impl(UnpicklerObject *self, PyObject *file,
     if (_Unpickler_SetBuffers(self, buffers) < 0)
         return -1;
 
+    if (_Unpickler_SetAllowedGlobals(self, allowed_globals) < 0)
+        return -1;
+
     self->fix_imports = fix_imports;
 
     PyTypeObject *tp = Py_TYPE(self);
@@ -7701,6 +7951,7 @@ _pickle.dump
   *
   fix_imports: bool = True
   buffer_callback: object = None
+  memoize: bool = True
 
 Write a pickled representation of obj to the open file object file.
 
@@ -7729,13 +7980,16 @@ If *buffer_callback* is None (the default), buffer views are serialized
 into *file* as part of the pickle stream.  It is an error if
 *buffer_callback* is not None and *protocol* is None or smaller than 5.
 
+If *memoize* is false, shared objects are pickled again each time they
+are seen, and recursive objects cannot be pickled.
+
 [clinic start generated code]*/
 
 static PyObject *
 _pickle_dump_impl(PyObject *module, PyObject *obj, PyObject *file,
                   PyObject *protocol, int fix_imports,
-                  PyObject *buffer_callback)
-/*[clinic end generated code: output=706186dba996490c input=b89ce8d0e911fd46]*/
+                  PyObject *buffer_callback, int memoize)
+/*[clinic end generated code: output=7c0107c92fde0822 input=29fecc70d9ed6299]*/
 {
     PickleState *state = _Pickle_GetState(module);
     PicklerObject *pickler = _Pickler_New(state);
@@ -7752,6 +8006,8 @@ _pickle_dump_impl(PyObject *module, PyObject *obj, PyObject *file,
     if (_Pickler_SetBufferCallback(pickler, buffer_callback) < 0)
         goto error;
 
+    pickler->fast = !memoize;
+
     if (dump(state, pickler, obj) < 0)
         goto error;
 
@@ -7775,6 +8031,7 @@ _pickle.dumps
   *
   fix_imports: bool = True
   buffer_callback: object = None
+  memoize: bool = True
 
 Return the pickled representation of the object as a bytes object.
 
@@ -7795,12 +8052,15 @@ If *buffer_callback* is None (the default), buffer views are serialized
 into *file* as part of the pickle stream.  It is an error if
 *buffer_callback* is not None and *protocol* is None or smaller than 5.
 
+If *memoize* is false, shared objects are pickled again each time they
+are seen, and recursive objects cannot be pickled.
+
 [clinic start generated code]*/
 
 static PyObject *
 _pickle_dumps_impl(PyObject *module, PyObject *obj, PyObject *protocol,
-                   int fix_imports, PyObject *buffer_callback)
-/*[clinic end generated code: output=fbab0093a5580fdf input=139fc546886c63ac]*/
+                   int fix_imports, PyObject *buffer_callback, int memoize)
+/*[clinic end generated code: output=790234514c393629 input=242a8c2a4b8d95e4]*/
 {
     PyObject *result;
     PickleState *state = _Pickle_GetState(module);
@@ -7815,6 +8075,8 @@ _pickle_dumps_impl(PyObject *module, PyObject *obj, PyObject *protocol,
     if (_Pickler_SetBufferCallback(pickler, buffer_callback) < 0)
         goto error;
 
+    pickler->fast = !memoize;
+
     if (dump(state, pickler, obj) < 0)
         goto error;
 
@@ -7837,6 +8099,7 @@ _pickle.load
   encoding: str = 'ASCII'
   errors: str = 'strict'
   buffers: object(c_default="NULL") = ()
+  allowed_globals: object = None
 
 Read and return an object from the pickle data stored in a file.
 
@@ -7861,13 +8124,18 @@ map the old Python 2 names to the new names used in Python 3.  The
 instances pickled by Python 2; these default to 'ASCII' and 'strict',
 respectively.  The *encoding* can be 'bytes' to read these 8-bit
 string instances as bytes objects.
+
+If *allowed_globals* is not None, it is a mapping of (module, qualname)
+pairs to the only classes and functions which can be loaded, or an
+iterable of these objects.  They are looked up in it instead of being
+imported by find_class(), and any other global is forbidden.
 [clinic start generated code]*/
 
 static PyObject *
 _pickle_load_impl(PyObject *module, PyObject *file, int fix_imports,
                   const char *encoding, const char *errors,
-                  PyObject *buffers)
-/*[clinic end generated code: output=250452d141c23e76 input=46c7c31c92f4f371]*/
+                  PyObject *buffers, PyObject *allowed_globals)
+/*[clinic end generated code: output=48b0602abdea2fd2 input=f09c25a94f89c821]*/
 {
     PyObject *result;
     UnpicklerObject *unpickler = _Unpickler_New(module);
@@ -7884,6 +8152,9 @@ _pickle_load_impl(PyObject *module, PyObject *file, int fix_imports,
     if (_Unpickler_SetBuffers(unpickler, buffers) < 0)
         goto error;
 
+    if (_Unpickler_SetAllowedGlobals(unpickler, allowed_globals) < 0)
+        goto error;
+
     unpickler->fix_imports = fix_imports;
 
     PickleState *state = _Pickle_GetState(module);
@@ -7907,6 +8178,7 @@ _pickle.loads
   encoding: str = 'ASCII'
   errors: str = 'strict'
   buffers: object(c_default="NULL") = ()
+  allowed_globals: object = None
 
 Read and return an object from the given pickle data.
 
@@ -7922,13 +8194,18 @@ map the old Python 2 names to the new names used in Python 3.  The
 instances pickled by Python 2; these default to 'ASCII' and 'strict',
 respectively.  The *encoding* can be 'bytes' to read these 8-bit
 string instances as bytes objects.
+
+If *allowed_globals* is not None, it is a mapping of (module, qualname)
+pairs to the only classes and functions which can be loaded, or an
+iterable of these objects.  They are looked up in it instead of being
+imported by find_class(), and any other global is forbidden.
 [clinic start generated code]*/
 
 static PyObject *
 _pickle_loads_impl(PyObject *module, PyObject *data, int fix_imports,
                    const char *encoding, const char *errors,
-                   PyObject *buffers)
-/*[clinic end generated code: output=82ac1e6b588e6d02 input=b3615540d0535087]*/
+                   PyObject *buffers, PyObject *allowed_globals)
+/*[clinic end generated code: output=b173094156027072 input=6c394955ff74bad6]*/
 {
     PyObject *result;
     UnpicklerObject *unpickler = _Unpickler_New(module);
@@ -7945,6 +8222,9 @@ _pickle_loads_impl(PyObject *module, PyObject *data, int fix_imports,
     if (_Unpickler_SetBuffers(unpickler, buffers) < 0)
         goto error;
 
+    if (_Unpickler_SetAllowedGlobals(unpickler, allowed_globals) < 0)
+        goto error;
+
     unpickler->fix_imports = fix_imports;
 
     PickleState *state = _Pickle_GetState(module);
@@ -255,6 +255,80 @@ pysqlite_cursor_fetchall(PyObject *self, PyObject *Py_UNUSED(ignored))
     return pysqlite_cursor_fetchall_impl((pysqlite_Cursor *)self);
 }
 
+PyDoc_STRVAR(pysqlite_cursor_fetchcolumns__doc__,
+"fetchcolumns($self, /, size=-1)\n"
+"--\n"
+"\n"
+"Fetches rows from the resultset as a tuple of columns.\n"
+"\n"
+"  size\n"
+"    The maximum number of rows to fetch.  All the remaining rows are\n"
+"    fetched if it is negative.\n"
+"\n"
+"A column of integers or of floats is returned as an array.array of type\n"
+"\'q\' or \'d\'; any other column is returned as a list.  The row factory is\n"
+"not used.");
+
+#define PYSQLITE_CURSOR_FETCHCOLUMNS_METHODDEF    \
+    {"fetchcolumns", _PyCFunction_CAST(pysqlite_cursor_fetchcolumns), METH_FASTCALL|METH_KEYWORDS, pysqlite_cursor_fetchcolumns__doc__},
+
+static PyObject *
+pysqlite_cursor_fetchcolumns_impl(pysqlite_Cursor *self, int maxrows);
+
+static PyObject *
+pysqlite_cursor_fetchcolumns(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(size), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"size", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "fetchcolumns",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    int maxrows = -1;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    maxrows = PyLong_AsInt(args[0]);
+    if (maxrows == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = pysqlite_cursor_fetchcolumns_impl((pysqlite_Cursor *)self, maxrows);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(pysqlite_cursor_setinputsizes__doc__,
 "setinputsizes($self, sizes, /)\n"
 "--\n"
@@ -329,4 +403,4 @@ pysqlite_cursor_close(PyObject *self, PyObject *Py_UNUSED(ignored))
 {
     return pysqlite_cursor_close_impl((pysqlite_Cursor *)self);
 }
-/*[clinic end generated code: output=d05c7cbbc8bcab26 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=c87e44ca5c86d1f0 input=a9049054013a1b77]*/
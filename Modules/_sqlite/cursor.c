@@ -320,16 +320,15 @@ _pysqlite_build_column_name(pysqlite_Cursor *self, const char *colname)
 }
 
 /*
- * Returns a row from the currently active SQLite statement
+ * Returns the value of column i of the current row, converted according to
+ * the cursor's converters and the connection's text_factory.
  *
  * Precondidition:
  * - sqlite3_step() has been called before and it returned SQLITE_ROW.
  */
 static PyObject *
-_pysqlite_fetch_one_row(pysqlite_Cursor* self)
+_pysqlite_fetch_one_value(pysqlite_Cursor *self, int i)
 {
-    int i, numcols;
-    PyObject* row;
     int coltype;
     PyObject* converter;
     PyObject* converted;
@@ -338,109 +337,125 @@ _pysqlite_fetch_one_row(pysqlite_Cursor* self)
     const char* colname;
     PyObject* error_msg;
 
-    Py_BEGIN_ALLOW_THREADS
-    numcols = sqlite3_data_count(self->statement->st);
-    Py_END_ALLOW_THREADS
-
-    row = PyTuple_New(numcols);
-    if (!row)
-        return NULL;
-
     sqlite3 *db = self->connection->db;
-    for (i = 0; i < numcols; i++) {
-        if (self->connection->detect_types
-                && self->row_cast_map != NULL
-                && i < PyList_GET_SIZE(self->row_cast_map))
-        {
-            converter = PyList_GET_ITEM(self->row_cast_map, i);
+    if (self->connection->detect_types
+            && self->row_cast_map != NULL
+            && i < PyList_GET_SIZE(self->row_cast_map))
+    {
+        converter = PyList_GET_ITEM(self->row_cast_map, i);
+    }
+    else {
+        converter = Py_None;
+    }
+
+    /*
+     * Note, sqlite3_column_bytes() must come after sqlite3_column_blob()
+     * or sqlite3_column_text().
+     *
+     * See https://sqlite.org/c3ref/column_blob.html for details.
+     */
+    if (converter != Py_None) {
+        const void *blob = sqlite3_column_blob(self->statement->st, i);
+        if (blob == NULL) {
+            if (sqlite3_errcode(db) == SQLITE_NOMEM) {
+                PyErr_NoMemory();
+                return NULL;
+            }
+            converted = Py_NewRef(Py_None);
         }
         else {
-            converter = Py_None;
-        }
-
-        /*
-         * Note, sqlite3_column_bytes() must come after sqlite3_column_blob()
-         * or sqlite3_column_text().
-         *
-         * See https://sqlite.org/c3ref/column_blob.html for details.
-         */
-        if (converter != Py_None) {
-            const void *blob = sqlite3_column_blob(self->statement->st, i);
-            if (blob == NULL) {
-                if (sqlite3_errcode(db) == SQLITE_NOMEM) {
-                    PyErr_NoMemory();
-                    goto error;
-                }
-                converted = Py_NewRef(Py_None);
+            nbytes = sqlite3_column_bytes(self->statement->st, i);
+            PyObject *item = PyBytes_FromStringAndSize(blob, nbytes);
+            if (item == NULL) {
+                return NULL;
             }
-            else {
-                nbytes = sqlite3_column_bytes(self->statement->st, i);
-                PyObject *item = PyBytes_FromStringAndSize(blob, nbytes);
-                if (item == NULL) {
-                    goto error;
-                }
-                converted = PyObject_CallOneArg(converter, item);
-                Py_DECREF(item);
+            converted = PyObject_CallOneArg(converter, item);
+            Py_DECREF(item);
+        }
+    } else {
+        Py_BEGIN_ALLOW_THREADS
+        coltype = sqlite3_column_type(self->statement->st, i);
+        Py_END_ALLOW_THREADS
+        if (coltype == SQLITE_NULL) {
+            converted = Py_NewRef(Py_None);
+        } else if (coltype == SQLITE_INTEGER) {
+            converted = PyLong_FromLongLong(sqlite3_column_int64(self->statement->st, i));
+        } else if (coltype == SQLITE_FLOAT) {
+            converted = PyFloat_FromDouble(sqlite3_column_double(self->statement->st, i));
+        } else if (coltype == SQLITE_TEXT) {
+            const char *text = (const char*)sqlite3_column_text(self->statement->st, i);
+            if (text == NULL && sqlite3_errcode(db) == SQLITE_NOMEM) {
+                PyErr_NoMemory();
+                return NULL;
             }
-        } else {
-            Py_BEGIN_ALLOW_THREADS
-            coltype = sqlite3_column_type(self->statement->st, i);
-            Py_END_ALLOW_THREADS
-            if (coltype == SQLITE_NULL) {
-                converted = Py_NewRef(Py_None);
-            } else if (coltype == SQLITE_INTEGER) {
-                converted = PyLong_FromLongLong(sqlite3_column_int64(self->statement->st, i));
-            } else if (coltype == SQLITE_FLOAT) {
-                converted = PyFloat_FromDouble(sqlite3_column_double(self->statement->st, i));
-            } else if (coltype == SQLITE_TEXT) {
-                const char *text = (const char*)sqlite3_column_text(self->statement->st, i);
-                if (text == NULL && sqlite3_errcode(db) == SQLITE_NOMEM) {
-                    PyErr_NoMemory();
-                    goto error;
-                }
 
-                nbytes = sqlite3_column_bytes(self->statement->st, i);
-                if (self->connection->text_factory == (PyObject*)&PyUnicode_Type) {
-                    converted = PyUnicode_FromStringAndSize(text, nbytes);
-                    if (!converted && PyErr_ExceptionMatches(PyExc_UnicodeDecodeError)) {
-                        PyErr_Clear();
-                        colname = sqlite3_column_name(self->statement->st, i);
-                        if (colname == NULL) {
-                            PyErr_NoMemory();
-                            goto error;
-                        }
-                        PyOS_snprintf(buf, sizeof(buf) - 1, "Could not decode to UTF-8 column '%s' with text '%s'",
-                                     colname , text);
-                        error_msg = PyUnicode_Decode(buf, strlen(buf), "ascii", "replace");
-
-                        PyObject *exc = self->connection->OperationalError;
-                        if (!error_msg) {
-                            PyErr_SetString(exc, "Could not decode to UTF-8");
-                        } else {
-                            PyErr_SetObject(exc, error_msg);
-                            Py_DECREF(error_msg);
-                        }
+            nbytes = sqlite3_column_bytes(self->statement->st, i);
+            if (self->connection->text_factory == (PyObject*)&PyUnicode_Type) {
+                converted = PyUnicode_FromStringAndSize(text, nbytes);
+                if (!converted && PyErr_ExceptionMatches(PyExc_UnicodeDecodeError)) {
+                    PyErr_Clear();
+                    colname = sqlite3_column_name(self->statement->st, i);
+                    if (colname == NULL) {
+                        PyErr_NoMemory();
+                        return NULL;
+                    }
+                    PyOS_snprintf(buf, sizeof(buf) - 1, "Could not decode to UTF-8 column '%s' with text '%s'",
+                                 colname , text);
+                    error_msg = PyUnicode_Decode(buf, strlen(buf), "ascii", "replace");
+
+                    PyObject *exc = self->connection->OperationalError;
+                    if (!error_msg) {
+                        PyErr_SetString(exc, "Could not decode to UTF-8");
+                    } else {
+                        PyErr_SetObject(exc, error_msg);
+                        Py_DECREF(error_msg);
                     }
-                } else if (self->connection->text_factory == (PyObject*)&PyBytes_Type) {
-                    converted = PyBytes_FromStringAndSize(text, nbytes);
-                } else if (self->connection->text_factory == (PyObject*)&PyByteArray_Type) {
-                    converted = PyByteArray_FromStringAndSize(text, nbytes);
-                } else {
-                    converted = PyObject_CallFunction(self->connection->text_factory, "y#", text, nbytes);
                 }
+            } else if (self->connection->text_factory == (PyObject*)&PyBytes_Type) {
+                converted = PyBytes_FromStringAndSize(text, nbytes);
+            } else if (self->connection->text_factory == (PyObject*)&PyByteArray_Type) {
+                converted = PyByteArray_FromStringAndSize(text, nbytes);
             } else {
-                /* coltype == SQLITE_BLOB */
-                const void *blob = sqlite3_column_blob(self->statement->st, i);
-                if (blob == NULL && sqlite3_errcode(db) == SQLITE_NOMEM) {
-                    PyErr_NoMemory();
-                    goto error;
-                }
-
-                nbytes = sqlite3_column_bytes(self->statement->st, i);
-                converted = PyBytes_FromStringAndSize(blob, nbytes);
+                converted = PyObject_CallFunction(self->connection->text_factory, "y#", text, nbytes);
             }
+        } else {
+            /* coltype == SQLITE_BLOB */
+            const void *blob = sqlite3_column_blob(self->statement->st, i);
+            if (blob == NULL && sqlite3_errcode(db) == SQLITE_NOMEM) {
+                PyErr_NoMemory();
+                return NULL;
+            }
+
+            nbytes = sqlite3_column_bytes(self->statement->st, i);
+            converted = PyBytes_FromStringAndSize(blob, nbytes);
         }
+    }
+    return converted;
+}
+
+/*
+ * Returns a row from the currently active SQLite statement
+ *
+ * Precondidition:
+ * - sqlite3_step() has been called before and it returned SQLITE_ROW.
+ */
+static PyObject *
+_pysqlite_fetch_one_row(pysqlite_Cursor* self)
+{
+    int i, numcols;
+    PyObject* row;
+    PyObject* converted;
+
+    Py_BEGIN_ALLOW_THREADS
+    numcols = sqlite3_data_count(self->statement->st);
+    Py_END_ALLOW_THREADS
+
+    row = PyTuple_New(numcols);
+    if (!row)
+        return NULL;
 
+    for (i = 0; i < numcols; i++) {
+        converted = _pysqlite_fetch_one_value(self, i);
         if (!converted) {
             goto error;
         }
@@ -1232,6 +1247,244 @@ pysqlite_cursor_fetchall_impl(pysqlite_Cursor *self)
     }
 }
 
+/* Column storage used by fetchcolumns().  A column starts out empty, keeps
+ * integers and floats in a C array as long as all its values have the same
+ * type, and falls back to a list of objects otherwise. */
+enum {
+    COLUMN_EMPTY,
+    COLUMN_INTEGER,
+    COLUMN_FLOAT,
+    COLUMN_LIST,
+};
+
+typedef struct {
+    int kind;
+    Py_ssize_t len;
+    Py_ssize_t allocated;
+    void *data;
+    PyObject *list;
+} column_buffer;
+
+static int
+column_as_list(column_buffer *col)
+{
+    PyObject *list = PyList_New(col->len);
+    if (list == NULL) {
+        return -1;
+    }
+    for (Py_ssize_t j = 0; j < col->len; j++) {
+        PyObject *item;
+        if (col->kind == COLUMN_INTEGER) {
+            item = PyLong_FromLongLong(((long long *)col->data)[j]);
+        }
+        else {
+            item = PyFloat_FromDouble(((double *)col->data)[j]);
+        }
+        if (item == NULL) {
+            Py_DECREF(list);
+            return -1;
+        }
+        PyList_SET_ITEM(list, j, item);
+    }
+    PyMem_Free(col->data);
+    col->data = NULL;
+    col->list = list;
+    col->kind = COLUMN_LIST;
+    return 0;
+}
+
+static int
+column_append(pysqlite_Cursor *self, column_buffer *col, int i)
+{
+    sqlite3_stmt *stmt = self->statement->st;
+    int coltype = SQLITE_NULL;
+    int kind = COLUMN_LIST;
+
+    if (col->kind != COLUMN_LIST
+        && !(self->connection->detect_types
+             && self->row_cast_map != NULL
+             && i < PyList_GET_SIZE(self->row_cast_map)
+             && PyList_GET_ITEM(self->row_cast_map, i) != Py_None))
+    {
+        coltype = sqlite3_column_type(stmt, i);
+        if (coltype == SQLITE_INTEGER) {
+            kind = COLUMN_INTEGER;
+        }
+        else if (coltype == SQLITE_FLOAT) {
+            kind = COLUMN_FLOAT;
+        }
+    }
+    if (col->kind == COLUMN_EMPTY) {
+        col->kind = kind;
+        if (kind == COLUMN_LIST) {
+            col->list = PyList_New(0);
+            if (col->list == NULL) {
+                return -1;
+            }
+        }
+    }
+    else if (col->kind != kind && col->kind != COLUMN_LIST) {
+        if (column_as_list(col) < 0) {
+            return -1;
+        }
+    }
+
+    if (col->kind == COLUMN_LIST) {
+        PyObject *value = _pysqlite_fetch_one_value(self, i);
+        if (value == NULL) {
+            return -1;
+        }
+        int rc = PyList_Append(col->list, value);
+        Py_DECREF(value);
+        return rc;
+    }
+
+    if (col->len == col->allocated) {
+        Py_ssize_t allocated = col->allocated ? col->allocated * 2 : 64;
+        /* long long and double have the same size. */
+        void *data = PyMem_Realloc(col->data, allocated * sizeof(double));
+        if (data == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        col->data = data;
+        col->allocated = allocated;
+    }
+    if (kind == COLUMN_INTEGER) {
+        ((long long *)col->data)[col->len++] = sqlite3_column_int64(stmt, i);
+    }
+    else {
+        ((double *)col->data)[col->len++] = sqlite3_column_double(stmt, i);
+    }
+    return 0;
+}
+
+static PyObject *
+column_result(column_buffer *col, PyObject *array_type)
+{
+    if (col->kind == COLUMN_LIST) {
+        return Py_NewRef(col->list);
+    }
+    if (col->kind == COLUMN_EMPTY) {
+        return PyList_New(0);
+    }
+    const char *typecode = col->kind == COLUMN_INTEGER ? "q" : "d";
+    PyObject *array = PyObject_CallFunction(array_type, "s", typecode);
+    if (array == NULL) {
+        return NULL;
+    }
+    PyObject *view = PyMemoryView_FromMemory(col->data,
+                                             col->len * sizeof(double),
+                                             PyBUF_READ);
+    if (view == NULL) {
+        Py_DECREF(array);
+        return NULL;
+    }
+    PyObject *res = PyObject_CallMethod(array, "frombytes", "O", view);
+    Py_DECREF(view);
+    if (res == NULL) {
+        Py_DECREF(array);
+        return NULL;
+    }
+    Py_DECREF(res);
+    return array;
+}
+
+/*[clinic input]
+_sqlite3.Cursor.fetchcolumns as pysqlite_cursor_fetchcolumns
+
+    size as maxrows: int = -1
+        The maximum number of rows to fetch.  All the remaining rows are
+        fetched if it is negative.
+
+Fetches rows from the resultset as a tuple of columns.
+
+A column of integers or of floats is returned as an array.array of type
+'q' or 'd'; any other column is returned as a list.  The row factory is
+not used.
+[clinic start generated code]*/
+
+static PyObject *
+pysqlite_cursor_fetchcolumns_impl(pysqlite_Cursor *self, int maxrows)
+/*[clinic end generated code: output=781d71c1122c0ace input=4003b9f06c546f59]*/
+{
+    if (!check_cursor(self)) {
+        return NULL;
+    }
+
+    Py_ssize_t numcols = 0;
+    if (self->statement != NULL) {
+        numcols = sqlite3_data_count(self->statement->st);
+    }
+    else if (PyTuple_Check(self->description)) {
+        numcols = PyTuple_GET_SIZE(self->description);
+    }
+
+    PyObject *array_type = NULL;
+    PyObject *result = NULL;
+    column_buffer *cols = PyMem_Calloc(numcols ? numcols : 1,
+                                       sizeof(column_buffer));
+    if (cols == NULL) {
+        return PyErr_NoMemory();
+    }
+
+    self->locked = 1;  // GH-80254: Prevent recursive use of cursors.
+    for (int nrows = 0;
+         self->statement != NULL && (maxrows < 0 || nrows < maxrows);
+         nrows++)
+    {
+        sqlite3_stmt *stmt = self->statement->st;
+        for (Py_ssize_t i = 0; i < numcols; i++) {
+            if (column_append(self, &cols[i], (int)i) < 0) {
+                self->locked = 0;
+                goto done;
+            }
+        }
+        int rc = stmt_step(stmt);
+        if (rc == SQLITE_DONE) {
+            if (self->statement->is_dml) {
+                self->rowcount = (long)sqlite3_changes(self->connection->db);
+            }
+            (void)stmt_reset(self->statement);
+            Py_CLEAR(self->statement);
+        }
+        else if (rc != SQLITE_ROW) {
+            set_error_from_db(self->connection->state, self->connection->db);
+            (void)stmt_reset(self->statement);
+            Py_CLEAR(self->statement);
+            self->locked = 0;
+            goto done;
+        }
+    }
+    self->locked = 0;
+
+    array_type = PyImport_ImportModuleAttrString("array", "array");
+    if (array_type == NULL) {
+        goto done;
+    }
+    result = PyTuple_New(numcols);
+    if (result == NULL) {
+        goto done;
+    }
+    for (Py_ssize_t i = 0; i < numcols; i++) {
+        PyObject *column = column_result(&cols[i], array_type);
+        if (column == NULL) {
+            Py_CLEAR(result);
+            goto done;
+        }
+        PyTuple_SET_ITEM(result, i, column);
+    }
+
+done:
+    for (Py_ssize_t i = 0; i < numcols; i++) {
+        PyMem_Free(cols[i].data);
+        Py_XDECREF(cols[i].list);
+    }
+    PyMem_Free(cols);
+    Py_XDECREF(array_type);
+    return result;
+}
+
 /*[clinic input]
 _sqlite3.Cursor.setinputsizes as pysqlite_cursor_setinputsizes
 
@@ -1307,6 +1560,7 @@ static PyMethodDef cursor_methods[] = {
     PYSQLITE_CURSOR_EXECUTESCRIPT_METHODDEF
     PYSQLITE_CURSOR_EXECUTE_METHODDEF
     PYSQLITE_CURSOR_FETCHALL_METHODDEF
+    PYSQLITE_CURSOR_FETCHCOLUMNS_METHODDEF
     PYSQLITE_CURSOR_FETCHMANY_METHODDEF
     PYSQLITE_CURSOR_FETCHONE_METHODDEF
     PYSQLITE_CURSOR_SETINPUTSIZES_METHODDEF
@@ -9,7 +9,8 @@ preserve
 #include "pycore_modsupport.h"    // _PyArg_UnpackKeywords()
 
 PyDoc_STRVAR(marshal_dump__doc__,
-"dump($module, value, file, version=version, /, *, allow_code=True)\n"
+"dump($module, value, file, version=version, /, *, allow_code=True,\n"
+"     framed=False)\n"
 "--\n"
 "\n"
 "Write the value on the open file.\n"
@@ -22,6 +23,9 @@ PyDoc_STRVAR(marshal_dump__doc__,
 "    Indicates the data format that dump should use.\n"
 "  allow_code\n"
 "    Allow to write code objects.\n"
+"  framed\n"
+"    Precede the data with its size, so that load(framed=True) can read\n"
+"    it at once.\n"
 "\n"
 "If the value has (or contains an object that has) an unsupported type, a\n"
 "ValueError exception is raised - but garbage data will also be written\n"
@@ -32,7 +36,7 @@ PyDoc_STRVAR(marshal_dump__doc__,
 
 static PyObject *
 marshal_dump_impl(PyObject *module, PyObject *value, PyObject *file,
-                  int version, int allow_code);
+                  int version, int allow_code, int framed);
 
 static PyObject *
 marshal_dump(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
@@ -40,7 +44,7 @@ marshal_dump(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject
     PyObject *return_value = NULL;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
 
-    #define NUM_KEYWORDS 1
+    #define NUM_KEYWORDS 2
     static struct {
         PyGC_Head _this_is_not_used;
         PyObject_VAR_HEAD
@@ -49,7 +53,7 @@ marshal_dump(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject
     } _kwtuple = {
         .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
         .ob_hash = -1,
-        .ob_item = { &_Py_ID(allow_code), },
+        .ob_item = { &_Py_ID(allow_code), &_Py_ID(framed), },
     };
     #undef NUM_KEYWORDS
     #define KWTUPLE (&_kwtuple.ob_base.ob_base)
@@ -58,19 +62,20 @@ marshal_dump(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject
     #  define KWTUPLE NULL
     #endif  // !Py_BUILD_CORE
 
-    static const char * const _keywords[] = {"", "", "", "allow_code", NULL};
+    static const char * const _keywords[] = {"", "", "", "allow_code", "framed", NULL};
     static _PyArg_Parser _parser = {
         .keywords = _keywords,
         .fname = "dump",
         .kwtuple = KWTUPLE,
     };
     #undef KWTUPLE
-    PyObject *argsbuf[4];
+    PyObject *argsbuf[5];
     Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 2;
     PyObject *value;
     PyObject *file;
     int version = Py_MARSHAL_VERSION;
     int allow_code = 1;
+    int framed = 0;
 
     args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
             /*minpos*/ 2, /*maxpos*/ 3, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
@@ -91,19 +96,28 @@ skip_optional_posonly:
     if (!noptargs) {
         goto skip_optional_kwonly;
     }
-    allow_code = PyObject_IsTrue(args[3]);
-    if (allow_code < 0) {
+    if (args[3]) {
+        allow_code = PyObject_IsTrue(args[3]);
+        if (allow_code < 0) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_kwonly;
+        }
+    }
+    framed = PyObject_IsTrue(args[4]);
+    if (framed < 0) {
         goto exit;
     }
 skip_optional_kwonly:
-    return_value = marshal_dump_impl(module, value, file, version, allow_code);
+    return_value = marshal_dump_impl(module, value, file, version, allow_code, framed);
 
 exit:
     return return_value;
 }
 
 PyDoc_STRVAR(marshal_load__doc__,
-"load($module, file, /, *, allow_code=True)\n"
+"load($module, file, /, *, allow_code=True, framed=False)\n"
 "--\n"
 "\n"
 "Read one value from the open file and return it.\n"
@@ -112,6 +126,8 @@ PyDoc_STRVAR(marshal_load__doc__,
 "    Must be readable binary file.\n"
 "  allow_code\n"
 "    Allow to load code objects.\n"
+"  framed\n"
+"    Read a value written with framed=True.\n"
 "\n"
 "If no valid value is read (e.g. because the data has a different Python\n"
 "version\'s incompatible marshal format), raise EOFError, ValueError or\n"
@@ -124,7 +140,8 @@ PyDoc_STRVAR(marshal_load__doc__,
     {"load", _PyCFunction_CAST(marshal_load), METH_FASTCALL|METH_KEYWORDS, marshal_load__doc__},
 
 static PyObject *
-marshal_load_impl(PyObject *module, PyObject *file, int allow_code);
+marshal_load_impl(PyObject *module, PyObject *file, int allow_code,
+                  int framed);
 
 static PyObject *
 marshal_load(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
@@ -132,7 +149,7 @@ marshal_load(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject
     PyObject *return_value = NULL;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
 
-    #define NUM_KEYWORDS 1
+    #define NUM_KEYWORDS 2
     static struct {
         PyGC_Head _this_is_not_used;
         PyObject_VAR_HEAD
@@ -141,7 +158,7 @@ marshal_load(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject
     } _kwtuple = {
         .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
         .ob_hash = -1,
-        .ob_item = { &_Py_ID(allow_code), },
+        .ob_item = { &_Py_ID(allow_code), &_Py_ID(framed), },
     };
     #undef NUM_KEYWORDS
     #define KWTUPLE (&_kwtuple.ob_base.ob_base)
@@ -150,17 +167,18 @@ marshal_load(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject
     #  define KWTUPLE NULL
     #endif  // !Py_BUILD_CORE
 
-    static const char * const _keywords[] = {"", "allow_code", NULL};
+    static const char * const _keywords[] = {"", "allow_code", "framed", NULL};
     static _PyArg_Parser _parser = {
         .keywords = _keywords,
         .fname = "load",
         .kwtuple = KWTUPLE,
     };
     #undef KWTUPLE
-    PyObject *argsbuf[2];
+    PyObject *argsbuf[3];
     Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
     PyObject *file;
     int allow_code = 1;
+    int framed = 0;
 
     args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
             /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
@@ -171,19 +189,29 @@ marshal_load(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject
     if (!noptargs) {
         goto skip_optional_kwonly;
     }
-    allow_code = PyObject_IsTrue(args[1]);
-    if (allow_code < 0) {
+    if (args[1]) {
+        allow_code = PyObject_IsTrue(args[1]);
+        if (allow_code < 0) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_kwonly;
+        }
+    }
+    framed = PyObject_IsTrue(args[2]);
+    if (framed < 0) {
         goto exit;
     }
 skip_optional_kwonly:
-    return_value = marshal_load_impl(module, file, allow_code);
+    return_value = marshal_load_impl(module, file, allow_code, framed);
 
 exit:
     return return_value;
 }
 
 PyDoc_STRVAR(marshal_dumps__doc__,
-"dumps($module, value, version=version, /, *, allow_code=True)\n"
+"dumps($module, value, version=version, /, *, allow_code=True,\n"
+"      framed=False)\n"
 "--\n"
 "\n"
 "Return the bytes object that would be written to a file by dump(value, file).\n"
@@ -194,6 +222,8 @@ PyDoc_STRVAR(marshal_dumps__doc__,
 "    Indicates the data format that dumps should use.\n"
 "  allow_code\n"
 "    Allow to write code objects.\n"
+"  framed\n"
+"    Precede the data with its size.\n"
 "\n"
 "Raise a ValueError exception if value has (or contains an object that has) an\n"
 "unsupported type.");
@@ -203,7 +233,7 @@ PyDoc_STRVAR(marshal_dumps__doc__,
 
 static PyObject *
 marshal_dumps_impl(PyObject *module, PyObject *value, int version,
-                   int allow_code);
+                   int allow_code, int framed);
 
 static PyObject *
 marshal_dumps(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
@@ -211,7 +241,7 @@ marshal_dumps(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
     PyObject *return_value = NULL;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
 
-    #define NUM_KEYWORDS 1
+    #define NUM_KEYWORDS 2
     static struct {
         PyGC_Head _this_is_not_used;
         PyObject_VAR_HEAD
@@ -220,7 +250,7 @@ marshal_dumps(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
     } _kwtuple = {
         .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
         .ob_hash = -1,
-        .ob_item = { &_Py_ID(allow_code), },
+        .ob_item = { &_Py_ID(allow_code), &_Py_ID(framed), },
     };
     #undef NUM_KEYWORDS
     #define KWTUPLE (&_kwtuple.ob_base.ob_base)
@@ -229,18 +259,19 @@ marshal_dumps(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
     #  define KWTUPLE NULL
     #endif  // !Py_BUILD_CORE
 
-    static const char * const _keywords[] = {"", "", "allow_code", NULL};
+    static const char * const _keywords[] = {"", "", "allow_code", "framed", NULL};
     static _PyArg_Parser _parser = {
         .keywords = _keywords,
         .fname = "dumps",
         .kwtuple = KWTUPLE,
     };
     #undef KWTUPLE
-    PyObject *argsbuf[3];
+    PyObject *argsbuf[4];
     Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
     PyObject *value;
     int version = Py_MARSHAL_VERSION;
     int allow_code = 1;
+    int framed = 0;
 
     args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
             /*minpos*/ 1, /*maxpos*/ 2, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
@@ -260,25 +291,36 @@ skip_optional_posonly:
     if (!noptargs) {
         goto skip_optional_kwonly;
     }
-    allow_code = PyObject_IsTrue(args[2]);
-    if (allow_code < 0) {
+    if (args[2]) {
+        allow_code = PyObject_IsTrue(args[2]);
+        if (allow_code < 0) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_kwonly;
+        }
+    }
+    framed = PyObject_IsTrue(args[3]);
+    if (framed < 0) {
         goto exit;
     }
 skip_optional_kwonly:
-    return_value = marshal_dumps_impl(module, value, version, allow_code);
+    return_value = marshal_dumps_impl(module, value, version, allow_code, framed);
 
 exit:
     return return_value;
 }
 
 PyDoc_STRVAR(marshal_loads__doc__,
-"loads($module, bytes, /, *, allow_code=True)\n"
+"loads($module, bytes, /, *, allow_code=True, framed=False)\n"
 "--\n"
 "\n"
 "Convert the bytes-like object to a value.\n"
 "\n"
 "  allow_code\n"
 "    Allow to load code objects.\n"
+"  framed\n"
+"    Read a value written with framed=True.\n"
 "\n"
 "If no valid value is found, raise EOFError, ValueError or TypeError.  Extra\n"
 "bytes in the input are ignored.");
@@ -287,7 +329,8 @@ PyDoc_STRVAR(marshal_loads__doc__,
     {"loads", _PyCFunction_CAST(marshal_loads), METH_FASTCALL|METH_KEYWORDS, marshal_loads__doc__},
 
 static PyObject *
-marshal_loads_impl(PyObject *module, Py_buffer *bytes, int allow_code);
+marshal_loads_impl(PyObject *module, Py_buffer *bytes, int allow_code,
+                   int framed);
 
 static PyObject *
 marshal_loads(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
@@ -295,7 +338,7 @@ marshal_loads(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
     PyObject *return_value = NULL;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
 
-    #define NUM_KEYWORDS 1
+    #define NUM_KEYWORDS 2
     static struct {
         PyGC_Head _this_is_not_used;
         PyObject_VAR_HEAD
@@ -304,7 +347,7 @@ marshal_loads(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
     } _kwtuple = {
         .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
         .ob_hash = -1,
-        .ob_item = { &_Py_ID(allow_code), },
+        .ob_item = { &_Py_ID(allow_code), &_Py_ID(framed), },
     };
     #undef NUM_KEYWORDS
     #define KWTUPLE (&_kwtuple.ob_base.ob_base)
@@ -313,17 +356,18 @@ marshal_loads(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
     #  define KWTUPLE NULL
     #endif  // !Py_BUILD_CORE
 
-    static const char * const _keywords[] = {"", "allow_code", NULL};
+    static const char * const _keywords[] = {"", "allow_code", "framed", NULL};
     static _PyArg_Parser _parser = {
         .keywords = _keywords,
         .fname = "loads",
         .kwtuple = KWTUPLE,
     };
     #undef KWTUPLE
-    PyObject *argsbuf[2];
+    PyObject *argsbuf[3];
     Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
     Py_buffer bytes = {NULL, NULL};
     int allow_code = 1;
+    int framed = 0;
 
     args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
             /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
@@ -336,12 +380,21 @@ marshal_loads(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
     if (!noptargs) {
         goto skip_optional_kwonly;
     }
-    allow_code = PyObject_IsTrue(args[1]);
-    if (allow_code < 0) {
+    if (args[1]) {
+        allow_code = PyObject_IsTrue(args[1]);
+        if (allow_code < 0) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_kwonly;
+        }
+    }
+    framed = PyObject_IsTrue(args[2]);
+    if (framed < 0) {
         goto exit;
     }
 skip_optional_kwonly:
-    return_value = marshal_loads_impl(module, &bytes, allow_code);
+    return_value = marshal_loads_impl(module, &bytes, allow_code, framed);
 
 exit:
     /* Cleanup for bytes */
@@ -351,4 +404,80 @@ exit:
 
     return return_value;
 }
-/*[clinic end generated code: output=3e4bfc070a3c78ac input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(marshal_iterload__doc__,
+"iterload($module, file, /, *, allow_code=True)\n"
+"--\n"
+"\n"
+"Return an iterator over the values read from the open file.\n"
+"\n"
+"  file\n"
+"    Must be readable binary file.\n"
+"  allow_code\n"
+"    Allow to load code objects.\n"
+"\n"
+"The values must have been written with dump(framed=True).  The iteration\n"
+"stops at the end of the file; EOFError is raised if it ends within a frame.");
+
+#define MARSHAL_ITERLOAD_METHODDEF    \
+    {"iterload", _PyCFunction_CAST(marshal_iterload), METH_FASTCALL|METH_KEYWORDS, marshal_iterload__doc__},
+
+static PyObject *
+marshal_iterload_impl(PyObject *module, PyObject *file, int allow_code);
+
+static PyObject *
+marshal_iterload(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(allow_code), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"", "allow_code", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "iterload",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[2];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    PyObject *file;
+    int allow_code = 1;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    file = args[0];
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    allow_code = PyObject_IsTrue(args[1]);
+    if (allow_code < 0) {
+        goto exit;
+    }
+skip_optional_kwonly:
+    return_value = marshal_iterload_impl(module, file, allow_code);
+
+exit:
+    return return_value;
+}
+/*[clinic end generated code: output=cb5a2d5ebf2683b5 input=a9049054013a1b77]*/
@@ -312,10 +312,14 @@ The following implementation-specific options are available:\n\
 "-X gil=[0|1]: enable (1) or disable (0) the GIL; also PYTHON_GIL\n"
 #endif
 "\
+-X importcache=FILE: keep the directory listings made by imports in FILE\n\
+         for later runs; also PYTHONIMPORTCACHE\n\
 -X importtime[=2]: show how long each import takes; use -X importtime=2 to\n\
          log imports of already-loaded modules; also PYTHONPROFILEIMPORTTIME\n\
 -X int_max_str_digits=N: limit the size of int<->str conversions;\n\
          0 disables the limit; also PYTHONINTMAXSTRDIGITS\n\
+-X lazyimports=MODULES: make the imports of the comma-separated MODULES and\n\
+         of their submodules lazy; also PYTHONLAZYIMPORTS\n\
 -X no_debug_ranges: don't include extra location information in code objects;\n\
          also PYTHONNODEBUGRANGES\n\
 -X perf: support the Linux \"perf\" profiler; also PYTHONPERFSUPPORT=1\n\
@@ -427,6 +431,10 @@ static const char usage_envvars[] =
 #ifdef Py_DEBUG
 "PYTHON_PRESITE: import this module before site (-X presite)\n"
 #endif
+"PYTHONIMPORTCACHE: file keeping the directory listings made by imports\n"
+"                  for later runs (-X importcache)\n"
+"PYTHONLAZYIMPORTS: comma-separated modules whose imports are lazy\n"
+"                  (-X lazyimports)\n"
 "PYTHONPROFILEIMPORTTIME: show how long each import takes (-X importtime)\n"
 "PYTHONPYCACHEPREFIX: root directory for bytecode cache (pyc) files\n"
 "                  (-X pycache_prefix)\n"
@@ -248,7 +248,8 @@ w_short_pstring(const void *s, Py_ssize_t n, WFILE *p)
 } while(0)
 
 static PyObject *
-_PyMarshal_WriteObjectToString(PyObject *x, int version, int allow_code);
+_PyMarshal_WriteObjectToString(PyObject *x, int version, int allow_code,
+                               int framed);
 
 #define _r_digits(bitsize)                                                \
 static void                                                               \
@@ -606,7 +607,7 @@ w_complex_object(PyObject *v, char flag, WFILE *p)
         Py_BEGIN_CRITICAL_SECTION(v);
         while (_PySet_NextEntryRef(v, &pos, &value, &hash)) {
             PyObject *dump = _PyMarshal_WriteObjectToString(value,
-                                    p->version, p->allow_code);
+                                    p->version, p->allow_code, 0);
             if (dump == NULL) {
                 p->error = WFERR_UNMARSHALLABLE;
                 Py_DECREF(value);
@@ -1836,8 +1837,41 @@ PyMarshal_ReadObjectFromString(const char *str, Py_ssize_t len)
     return result;
 }
 
+/* A frame is the marshal data of one value preceded by its size, as a 4-byte
+   little-endian unsigned integer. */
+#define FRAME_HEADER_SIZE 4
+/* Initial size of the buffer of a frame read from a file */
+#define FRAME_READ_CHUNK (64 * 1024)
+#define FRAME_SIZE_MAX 0xFFFFFFFFU
+
+/* Read the value from the data of a frame, which must be used entirely. */
 static PyObject *
-_PyMarshal_WriteObjectToString(PyObject *x, int version, int allow_code)
+read_framed_payload(const char *data, Py_ssize_t size, int allow_code)
+{
+    RFILE rf;
+    PyObject *result;
+    rf.allow_code = allow_code;
+    rf.fp = NULL;
+    rf.readable = NULL;
+    rf.ptr = data;
+    rf.end = data + size;
+    rf.buf = NULL;
+    rf.depth = 0;
+    if ((rf.refs = PyList_New(0)) == NULL)
+        return NULL;
+    result = read_object(&rf);
+    Py_DECREF(rf.refs);
+    if (result != NULL && rf.ptr != rf.end) {
+        Py_DECREF(result);
+        PyErr_SetString(PyExc_ValueError, "extra data in marshal frame");
+        return NULL;
+    }
+    return result;
+}
+
+static PyObject *
+_PyMarshal_WriteObjectToString(PyObject *x, int version, int allow_code,
+                               int framed)
 {
     WFILE wf;
 
@@ -1857,10 +1891,26 @@ _PyMarshal_WriteObjectToString(PyObject *x, int version, int allow_code)
         Py_DECREF(wf.str);
         return NULL;
     }
+    if (framed) {
+        /* Reserve the header, it is filled in below. */
+        wf.ptr += FRAME_HEADER_SIZE;
+    }
     w_object(x, &wf);
     w_clear_refs(&wf);
     if (wf.str != NULL) {
-        const char *base = PyBytes_AS_STRING(wf.str);
+        char *base = PyBytes_AS_STRING(wf.str);
+        if (framed && wf.error == WFERR_OK) {
+            Py_ssize_t size = wf.ptr - base - FRAME_HEADER_SIZE;
+            if ((size_t)size > FRAME_SIZE_MAX) {
+                Py_DECREF(wf.str);
+                PyErr_SetString(PyExc_ValueError,
+                                "marshal data too large for a frame");
+                return NULL;
+            }
+            for (int i = 0; i < FRAME_HEADER_SIZE; i++) {
+                base[i] = (char)(size >> (8 * i));
+            }
+        }
         if (_PyBytes_Resize(&wf.str, (Py_ssize_t)(wf.ptr - base)) < 0)
             return NULL;
     }
@@ -1892,7 +1942,109 @@ _PyMarshal_WriteObjectToString(PyObject *x, int version, int allow_code)
 PyObject *
 PyMarshal_WriteObjectToString(PyObject *x, int version)
 {
-    return _PyMarshal_WriteObjectToString(x, version, 1);
+    return _PyMarshal_WriteObjectToString(x, version, 1, 0);
+}
+
+/* Read exactly n bytes from the stream into buf, unless the end of the
+   stream is reached.  Return the number of bytes read, or -1 on error. */
+static Py_ssize_t
+read_exactly(PyObject *file, char *buf, Py_ssize_t n)
+{
+    Py_ssize_t total = 0;
+    while (total < n) {
+        PyObject *mview, *res;
+        Py_ssize_t read;
+
+        mview = PyMemoryView_FromMemory(buf + total, n - total, PyBUF_WRITE);
+        if (mview == NULL)
+            return -1;
+        res = PyObject_CallMethodOneArg(file, &_Py_ID(readinto), mview);
+        Py_DECREF(mview);
+        if (res == NULL)
+            return -1;
+        read = PyNumber_AsSsize_t(res, PyExc_ValueError);
+        Py_DECREF(res);
+        if (read == -1 && PyErr_Occurred())
+            return -1;
+        if (read < 0 || read > n - total) {
+            PyErr_Format(PyExc_ValueError,
+                         "readinto() returned %zd outside of the range "
+                         "0-%zd", read, n - total);
+            return -1;
+        }
+        if (read == 0)
+            break;
+        total += read;
+    }
+    return total;
+}
+
+/* Read a frame from the stream and the value in it.  Short reads are
+   retried, so that the stream can be a socket.  If eof_ok is true and the
+   stream is at its end, return NULL without setting an exception. */
+static PyObject *
+read_framed_object(PyObject *file, int allow_code, int eof_ok)
+{
+    unsigned char header[FRAME_HEADER_SIZE];
+    Py_ssize_t n;
+    size_t size = 0, allocated, total = 0;
+    PyObject *result;
+    char *buf;
+
+    n = read_exactly(file, (char *)header, FRAME_HEADER_SIZE);
+    if (n < 0)
+        return NULL;
+    if (n == 0 && eof_ok)
+        return NULL;
+    if (n < FRAME_HEADER_SIZE) {
+        PyErr_SetString(PyExc_EOFError, "EOF read where frame expected");
+        return NULL;
+    }
+    for (int i = FRAME_HEADER_SIZE; --i >= 0; ) {
+        size = (size << 8) | header[i];
+    }
+    if (size > (size_t)PY_SSIZE_T_MAX) {
+        PyErr_SetString(PyExc_OverflowError, "marshal frame too large");
+        return NULL;
+    }
+    /* Do not trust the size in the header: the buffer only grows as the
+       payload actually arrives. */
+    allocated = Py_MIN(size, FRAME_READ_CHUNK);
+    buf = PyMem_Malloc(allocated ? allocated : 1);
+    if (buf == NULL) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    while (total < size) {
+        if (total == allocated) {
+            size_t newsize = Py_MIN(size, allocated * 2);
+            char *newbuf = PyMem_Realloc(buf, newsize);
+            if (newbuf == NULL) {
+                PyMem_Free(buf);
+                PyErr_NoMemory();
+                return NULL;
+            }
+            buf = newbuf;
+            allocated = newsize;
+        }
+        n = read_exactly(file, buf + total, (Py_ssize_t)(allocated - total));
+        if (n < 0) {
+            PyMem_Free(buf);
+            return NULL;
+        }
+        if (n == 0) {
+            break;
+        }
+        total += (size_t)n;
+    }
+    if (total < size) {
+        PyMem_Free(buf);
+        PyErr_SetString(PyExc_EOFError, "marshal frame truncated");
+        return NULL;
+    }
+    result = read_framed_payload(buf, (Py_ssize_t)size, allow_code);
+    PyMem_Free(buf);
+    return result;
 }
 
 /* And an interface for Python programs... */
@@ -1909,6 +2061,9 @@ marshal.dump
     *
     allow_code: bool = True
         Allow to write code objects.
+    framed: bool = False
+        Precede the data with its size, so that load(framed=True) can read
+        it at once.
 
 Write the value on the open file.
 
@@ -1919,14 +2074,14 @@ to the file. The object will not be properly read back by load().
 
 static PyObject *
 marshal_dump_impl(PyObject *module, PyObject *value, PyObject *file,
-                  int version, int allow_code)
-/*[clinic end generated code: output=429e5fd61c2196b9 input=041f7f6669b0aafb]*/
+                  int version, int allow_code, int framed)
+/*[clinic end generated code: output=86cf53dd124833e4 input=e6b9945be494b1db]*/
 {
     /* XXX Quick hack -- need to do this differently */
     PyObject *s;
     PyObject *res;
 
-    s = _PyMarshal_WriteObjectToString(value, version, allow_code);
+    s = _PyMarshal_WriteObjectToString(value, version, allow_code, framed);
     if (s == NULL)
         return NULL;
     res = PyObject_CallMethodOneArg(file, &_Py_ID(write), s);
@@ -1943,6 +2098,8 @@ marshal.load
     *
     allow_code: bool = True
         Allow to load code objects.
+    framed: bool = False
+        Read a value written with framed=True.
 
 Read one value from the open file and return it.
 
@@ -1955,12 +2112,18 @@ dump(), load() will substitute None for the unmarshallable type.
 [clinic start generated code]*/
 
 static PyObject *
-marshal_load_impl(PyObject *module, PyObject *file, int allow_code)
-/*[clinic end generated code: output=0c1aaf3546ae3ed3 input=2dca7b570653b82f]*/
+marshal_load_impl(PyObject *module, PyObject *file, int allow_code,
+                  int framed)
+/*[clinic end generated code: output=307087aa8a3fd006 input=631e952ef93375e7]*/
 {
     PyObject *data, *result;
     RFILE rf;
 
+    if (framed) {
+        /* The data of the frame is audited as marshal.loads. */
+        return read_framed_object(file, allow_code, 0);
+    }
+
     /*
      * Make a call to the read method, but read zero bytes.
      * This is to ensure that the object passed in at least
@@ -2007,6 +2170,8 @@ marshal.dumps
     *
     allow_code: bool = True
         Allow to write code objects.
+    framed: bool = False
+        Precede the data with its size.
 
 Return the bytes object that would be written to a file by dump(value, file).
 
@@ -2016,10 +2181,10 @@ unsupported type.
 
 static PyObject *
 marshal_dumps_impl(PyObject *module, PyObject *value, int version,
-                   int allow_code)
-/*[clinic end generated code: output=115f90da518d1d49 input=167eaecceb63f0a8]*/
+                   int allow_code, int framed)
+/*[clinic end generated code: output=c721681728d48906 input=d0cab9db2b31990a]*/
 {
-    return _PyMarshal_WriteObjectToString(value, version, allow_code);
+    return _PyMarshal_WriteObjectToString(value, version, allow_code, framed);
 }
 
 /*[clinic input]
@@ -2030,6 +2195,8 @@ marshal.loads
     *
     allow_code: bool = True
         Allow to load code objects.
+    framed: bool = False
+        Read a value written with framed=True.
 
 Convert the bytes-like object to a value.
 
@@ -2038,13 +2205,31 @@ bytes in the input are ignored.
 [clinic start generated code]*/
 
 static PyObject *
-marshal_loads_impl(PyObject *module, Py_buffer *bytes, int allow_code)
-/*[clinic end generated code: output=62c0c538d3edc31f input=14de68965b45aaa7]*/
+marshal_loads_impl(PyObject *module, Py_buffer *bytes, int allow_code,
+                   int framed)
+/*[clinic end generated code: output=1037b351b17ccdd0 input=865b78c53e60d6a6]*/
 {
     RFILE rf;
     char *s = bytes->buf;
     Py_ssize_t n = bytes->len;
     PyObject* result;
+
+    if (framed) {
+        size_t size = 0;
+        if (n < FRAME_HEADER_SIZE) {
+            PyErr_SetString(PyExc_EOFError, "marshal data too short");
+            return NULL;
+        }
+        for (int i = FRAME_HEADER_SIZE; --i >= 0; ) {
+            size = (size << 8) | (unsigned char)s[i];
+        }
+        if (size > (size_t)(n - FRAME_HEADER_SIZE)) {
+            PyErr_SetString(PyExc_EOFError, "marshal frame truncated");
+            return NULL;
+        }
+        return read_framed_payload(s + FRAME_HEADER_SIZE, (Py_ssize_t)size,
+                                   allow_code);
+    }
     rf.allow_code = allow_code;
     rf.fp = NULL;
     rf.readable = NULL;
@@ -2058,11 +2243,122 @@ marshal_loads_impl(PyObject *module, Py_buffer *bytes, int allow_code)
     return result;
 }
 
+/* Iterator over the frames of a stream */
+
+typedef struct {
+    PyTypeObject *load_iterator_type;
+} marshal_state;
+
+static inline marshal_state *
+get_marshal_state(PyObject *module)
+{
+    void *state = PyModule_GetState(module);
+    assert(state != NULL);
+    return (marshal_state *)state;
+}
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *file;     /* NULL once the end of the stream is reached */
+    int allow_code;
+} loaditerobject;
+
+#define loaditerobject_CAST(op)     ((loaditerobject *)(op))
+
+static void
+loaditer_dealloc(PyObject *op)
+{
+    loaditerobject *self = loaditerobject_CAST(op);
+    PyTypeObject *tp = Py_TYPE(self);
+    PyObject_GC_UnTrack(self);
+    Py_XDECREF(self->file);
+    PyObject_GC_Del(self);
+    Py_DECREF(tp);
+}
+
+static int
+loaditer_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    loaditerobject *self = loaditerobject_CAST(op);
+    Py_VISIT(Py_TYPE(self));
+    Py_VISIT(self->file);
+    return 0;
+}
+
+static PyObject *
+loaditer_iternext(PyObject *op)
+{
+    loaditerobject *self = loaditerobject_CAST(op);
+    PyObject *file, *result;
+
+    if (self->file == NULL)
+        return NULL;
+    /* The file may be released by a reentrant call. */
+    file = Py_NewRef(self->file);
+    result = read_framed_object(file, self->allow_code, 1);
+    if (result == NULL) {
+        Py_CLEAR(self->file);
+    }
+    Py_DECREF(file);
+    return result;
+}
+
+static PyType_Slot loaditer_type_slots[] = {
+    {Py_tp_dealloc, loaditer_dealloc},
+    {Py_tp_getattro, PyObject_GenericGetAttr},
+    {Py_tp_traverse, loaditer_traverse},
+    {Py_tp_iter, PyObject_SelfIter},
+    {Py_tp_iternext, loaditer_iternext},
+    {0, 0},
+};
+
+static PyType_Spec loaditer_type_spec = {
+    "marshal.load_iterator",
+    sizeof(loaditerobject),
+    0,
+    (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+     Py_TPFLAGS_IMMUTABLETYPE | Py_TPFLAGS_DISALLOW_INSTANTIATION),
+    loaditer_type_slots
+};
+
+/*[clinic input]
+marshal.iterload
+
+    file: object
+        Must be readable binary file.
+    /
+    *
+    allow_code: bool = True
+        Allow to load code objects.
+
+Return an iterator over the values read from the open file.
+
+The values must have been written with dump(framed=True).  The iteration
+stops at the end of the file; EOFError is raised if it ends within a frame.
+[clinic start generated code]*/
+
+static PyObject *
+marshal_iterload_impl(PyObject *module, PyObject *file, int allow_code)
+/*[clinic end generated code: output=e0ca70311c111c96 input=78772ab41764cb95]*/
+{
+    marshal_state *state = get_marshal_state(module);
+    loaditerobject *iter;
+
+    iter = PyObject_GC_New(loaditerobject, state->load_iterator_type);
+    if (iter == NULL)
+        return NULL;
+    iter->file = Py_NewRef(file);
+    iter->allow_code = allow_code;
+    PyObject_GC_Track(iter);
+    return (PyObject *)iter;
+}
+
 static PyMethodDef marshal_methods[] = {
     MARSHAL_DUMP_METHODDEF
     MARSHAL_LOAD_METHODDEF
     MARSHAL_DUMPS_METHODDEF
     MARSHAL_LOADS_METHODDEF
+    MARSHAL_ITERLOAD_METHODDEF
     {NULL,              NULL}           /* sentinel */
 };
 
@@ -2094,18 +2390,48 @@ Functions:\n\
 dump() -- write value to a file\n\
 load() -- read value from a file\n\
 dumps() -- marshal value as a bytes object\n\
-loads() -- read value from a bytes-like object");
+loads() -- read value from a bytes-like object\n\
+iterload() -- iterate over the framed values of a file");
 
 
 static int
 marshal_module_exec(PyObject *mod)
 {
+    marshal_state *state = get_marshal_state(mod);
+
     if (PyModule_AddIntConstant(mod, "version", Py_MARSHAL_VERSION) < 0) {
         return -1;
     }
+    state->load_iterator_type = (PyTypeObject *)PyType_FromModuleAndSpec(
+        mod, &loaditer_type_spec, NULL);
+    if (state->load_iterator_type == NULL) {
+        return -1;
+    }
     return 0;
 }
 
+static int
+marshal_module_traverse(PyObject *mod, visitproc visit, void *arg)
+{
+    marshal_state *state = get_marshal_state(mod);
+    Py_VISIT(state->load_iterator_type);
+    return 0;
+}
+
+static int
+marshal_module_clear(PyObject *mod)
+{
+    marshal_state *state = get_marshal_state(mod);
+    Py_CLEAR(state->load_iterator_type);
+    return 0;
+}
+
+static void
+marshal_module_free(void *mod)
+{
+    (void)marshal_module_clear((PyObject *)mod);
+}
+
 static PyModuleDef_Slot marshalmodule_slots[] = {
     {Py_mod_exec, marshal_module_exec},
     {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
@@ -2117,8 +2443,12 @@ static struct PyModuleDef marshalmodule = {
     PyModuleDef_HEAD_INIT,
     .m_name = "marshal",
     .m_doc = module_doc,
+    .m_size = sizeof(marshal_state),
     .m_methods = marshal_methods,
     .m_slots = marshalmodule_slots,
+    .m_traverse = marshal_module_traverse,
+    .m_clear = marshal_module_clear,
+    .m_free = marshal_module_free,
 };
 
 PyMODINIT_FUNC
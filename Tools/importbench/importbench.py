@@ -8,21 +8,24 @@
 import decimal
 from importlib.util import cache_from_source
 import importlib
+import importlib._bootstrap_external
 import importlib.machinery
 import json
 import os
 import py_compile
 import sys
 import tabnanny
+import tempfile
 import timeit
 import types
 
 
-def bench(name, cleanup=lambda: None, *, seconds=1, repeat=3):
+def bench(name, cleanup=lambda: None, *, seconds=1, repeat=3, timer=None):
     """Bench the given statement as many times as necessary until total
     executions take one second."""
-    stmt = "__import__({!r})".format(name)
-    timer = timeit.Timer(stmt)
+    if timer is None:
+        stmt = "__import__({!r})".format(name)
+        timer = timeit.Timer(stmt)
     for x in range(repeat):
         total_time = 0
         count = 0
@@ -163,6 +166,47 @@ def using_bytecode_benchmark(seconds, repeat):
 decimal_using_bytecode = _using_bytecode(decimal)
 
 
+def _cold_path(import_cache):
+    def cold_path_benchmark(seconds, repeat):
+        """Cold sys.path search: {}"""
+        # Search a missing module with new path entry finders, as in a new
+        # interpreter: each of them lists its directory, unless the listing
+        # was stored in the persistent import cache by a previous run.
+        name = '__importlib_test_benchmark_missing__'
+        bootstrap_external = importlib._bootstrap_external
+        finder = importlib.machinery.PathFinder
+        saved_finders = sys.path_importer_cache.copy()
+        saved_cache = bootstrap_external._directory_cache
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                filename = os.path.join(tmpdir, 'importcache')
+                if import_cache:
+                    cache = bootstrap_external._DirectoryCache(filename)
+                    bootstrap_external._directory_cache = cache
+                    sys.path_importer_cache.clear()
+                    assert finder.find_spec(name) is None
+                    cache.save()
+                    assert os.path.exists(filename)
+                    bootstrap_external._directory_cache = (
+                        bootstrap_external._DirectoryCache(filename))
+                else:
+                    bootstrap_external._directory_cache = None
+                timer = timeit.Timer(lambda: finder.find_spec(name))
+                yield from bench(name, sys.path_importer_cache.clear,
+                                 repeat=repeat, seconds=seconds, timer=timer)
+        finally:
+            bootstrap_external._directory_cache = saved_cache
+            sys.path_importer_cache.clear()
+            sys.path_importer_cache.update(saved_finders)
+
+    cold_path_benchmark.__doc__ = cold_path_benchmark.__doc__.format(
+        'w/ import cache' if import_cache else 'w/o import cache')
+    return cold_path_benchmark
+
+cold_path_wo_import_cache = _cold_path(False)
+cold_path_w_import_cache = _cold_path(True)
+
+
 def main(import_, options):
     if options.source_file:
         with open(options.source_file, 'r', encoding='utf-8') as source_file:
@@ -177,6 +221,7 @@ def main(import_, options):
                   tabnanny_wo_bytecode, tabnanny_using_bytecode,
                   decimal_writing_bytecode,
                   decimal_wo_bytecode, decimal_using_bytecode,
+                  cold_path_wo_import_cache, cold_path_w_import_cache,
                 )
     if options.benchmark:
         for b in benchmarks:
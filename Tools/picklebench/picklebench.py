@@ -0,0 +1,99 @@
+# Measure the speed of pickle.dumps() with and without the memo on large
+# acyclic payloads.
+#
+# Usage: python Tools/picklebench/picklebench.py [-n SIZE] [-p PROTOCOL]
+#                                                [--python] [BENCHMARK ...]
+#
+# Each payload is pickled with memoize=True (the default) and with
+# memoize=False.  The pickles are checked with pickletools: the
+# memoize=False pickle must contain no memo opcodes and must load back to
+# an object equal to the payload.
+
+import argparse
+import pickle
+import pickletools
+import time
+
+ALL_BENCHMARKS = {}
+
+MEMO_OPCODES = {'PUT', 'BINPUT', 'LONG_BINPUT', 'MEMOIZE',
+                'GET', 'BINGET', 'LONG_BINGET'}
+
+
+def register_benchmark(func):
+    ALL_BENCHMARKS[func.__name__] = func
+    return func
+
+@register_benchmark
+def ints(n):
+    return list(range(-n // 2, n // 2))
+
+@register_benchmark
+def floats(n):
+    return [i / 7 for i in range(n)]
+
+@register_benchmark
+def strs(n):
+    return [f'item-{i}' for i in range(n)]
+
+@register_benchmark
+def tuples(n):
+    return [(i, i / 7, f'item-{i}') for i in range(n // 3)]
+
+@register_benchmark
+def records(n):
+    return [{'id': i, 'score': i / 7, 'name': f'item-{i}', 'tags': ['a', 'b']}
+            for i in range(n // 8)]
+
+
+def check(payload, data, memoize):
+    ops = {op.name for op, arg, pos in pickletools.genops(data)}
+    if not memoize and ops & MEMO_OPCODES:
+        raise AssertionError(f'memo opcodes in pickle: {ops & MEMO_OPCODES}')
+    if pickle.loads(data) != payload:
+        raise AssertionError('pickle does not round-trip')
+
+
+def bench(dumps, payload, protocol, memoize, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        data = dumps(payload, protocol, memoize=memoize)
+        best = min(best, time.perf_counter() - t0)
+    return best, data
+
+
+def main(opts):
+    dumps = pickle._dumps if opts.python else pickle.dumps
+    names = opts.benchmarks or ALL_BENCHMARKS.keys()
+    print(f"{'Benchmark':<10}{'memoize (ms)':>14}{'no memo (ms)':>14}"
+          f"{'speedup':>10}{'size ratio':>12}")
+    for name in names:
+        payload = ALL_BENCHMARKS[name](opts.size)
+        results = {}
+        for memoize in True, False:
+            elapsed, data = bench(dumps, payload, opts.protocol, memoize,
+                                  opts.repeat)
+            check(payload, data, memoize)
+            results[memoize] = elapsed, len(data)
+        (t1, size1), (t2, size2) = results[True], results[False]
+        print(f"{name:<10}{t1 * 1e3:>14.1f}{t2 * 1e3:>14.1f}"
+              f"{t1 / t2:>9.2f}x{size2 / size1:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--size", type=int, default=1_000_000,
+                        help="number of atoms in each payload "
+                             "(default=1000000)")
+    parser.add_argument("-p", "--protocol", type=int,
+                        default=pickle.HIGHEST_PROTOCOL,
+                        help="pickle protocol (default=highest)")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="number of runs, the best is reported "
+                             "(default=5)")
+    parser.add_argument("--python", default=False, action="store_true",
+                        help="benchmark the pure Python pickler")
+    parser.add_argument("benchmarks", nargs="*",
+                        help="benchmarks to run")
+    main(parser.parse_args())